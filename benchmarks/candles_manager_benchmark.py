@@ -0,0 +1,127 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Compares the CandlesManager candles buffer with the previous storage which shifted each of its 6 data arrays
+on every new candle once max_candles_count was reached and scanned its open times array to find already
+stored candles.
+Run from the repository root: python -m benchmarks.candles_manager_benchmark
+"""
+import time
+
+import numpy as np
+
+import octobot_commons.data_util as data_util
+import octobot_commons.enums as enums
+
+import octobot_trading.exchange_data as exchange_data
+
+CANDLES_COUNTS = (1000, 10000, 100000)
+GETTER_CALLS = 1000
+# candles in each partial update, as pushed by OHLCVUpdater
+PARTIAL_UPDATE_SIZE = 5
+
+
+class ShiftedArraysCandlesManager:
+    """
+    Previous CandlesManager storage: one array per price index, shifted when full, copied by getters
+    """
+    def __init__(self, max_candles_count):
+        self.max_candles_count = max_candles_count
+        self.index = 0
+        self.reached_max = False
+        self.arrays = [
+            np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
+            for _ in enums.PriceIndexes
+        ]
+
+    def add_new_candle(self, new_candle_data):
+        if new_candle_data[enums.PriceIndexes.IND_PRICE_TIME.value] not in \
+                self.arrays[enums.PriceIndexes.IND_PRICE_TIME.value]:
+            if self.reached_max:
+                self.arrays = [
+                    data_util.shift_value_array(array, -1, np.nan, np.float64)
+                    for array in self.arrays
+                ]
+            for price_index in enums.PriceIndexes:
+                self.arrays[price_index.value][self.index] = new_candle_data[price_index.value]
+            if self.index < self.max_candles_count - 1:
+                self.index += 1
+            else:
+                self.reached_max = True
+
+    def add_old_and_new_candles(self, candles_data):
+        for candle in candles_data:
+            self.add_new_candle(candle)
+
+    def get_symbol_close_candles(self, limit=-1):
+        max_handled_limit = self.max_candles_count if self.reached_max else self.index
+        data = self.arrays[enums.PriceIndexes.IND_PRICE_CLOSE.value]
+        if limit == -1:
+            return np.array(data[:max_handled_limit])
+        return np.array(data[max(0, max_handled_limit - limit): max_handled_limit])
+
+
+def _generate_candles(count):
+    return [
+        [float(seed * 60), seed + 1.0, seed + 2.0, seed + 0.5, seed + 1.5, seed * 10.0]
+        for seed in range(count)
+    ]
+
+
+def _time_adds(manager, candles):
+    start = time.perf_counter()
+    for candle in candles:
+        manager.add_new_candle(candle)
+    return time.perf_counter() - start
+
+
+def _time_partial_updates(manager, candles):
+    start = time.perf_counter()
+    for index in range(PARTIAL_UPDATE_SIZE, len(candles)):
+        manager.add_old_and_new_candles(candles[index - PARTIAL_UPDATE_SIZE:index])
+    return time.perf_counter() - start
+
+
+def _time_getters(manager, **kwargs):
+    start = time.perf_counter()
+    for _ in range(GETTER_CALLS):
+        manager.get_symbol_close_candles(200, **kwargs)
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"{'candles':>8} | {'manager':<22} | {'candles/s':>12} | {'partial/s':>12} | {'get(200) us':>11}")
+    for candles_count in CANDLES_COUNTS:
+        candles = _generate_candles(candles_count)
+        results = (
+            ("shifted arrays", ShiftedArraysCandlesManager, {}),
+            ("candles buffer (copy)", exchange_data.CandlesManager, {}),
+            ("candles buffer (view)", exchange_data.CandlesManager, {"copy": False}),
+        )
+        for name, manager_class, getter_kwargs in results:
+            manager = manager_class(exchange_data.CandlesManager.MAX_CANDLES_COUNT)
+            add_duration = _time_adds(manager, candles)
+            get_duration = _time_getters(manager, **getter_kwargs)
+            partial_duration = _time_partial_updates(
+                manager_class(exchange_data.CandlesManager.MAX_CANDLES_COUNT), candles
+            )
+            print(f"{candles_count:>8} | {name:<22} | {candles_count / add_duration:>12.0f} | "
+                  f"{(candles_count - PARTIAL_UPDATE_SIZE) / partial_duration:>12.0f} | "
+                  f"{get_duration / GETTER_CALLS * 1e6:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Compares decimal_check_and_adapt_order_details_if_necessary when market status limits and precision are parsed at
+each call (previous behavior) and when they are read from the cached SymbolOrderRules of the market status.
+Run from the repository root: python -m benchmarks.decimal_order_adapter_benchmark
+"""
+import decimal
+import math
+import random
+import time
+
+import octobot_trading.constants as constants
+import octobot_trading.exchanges as exchanges
+import octobot_trading.personal_data as personal_data
+from octobot_trading.enums import ExchangeConstantsMarketStatusColumns as Ecmsc
+
+CALLS_COUNT = 50000
+
+SYMBOL_MARKET = {
+    Ecmsc.LIMITS.value: {
+        Ecmsc.LIMITS_AMOUNT.value: {
+            Ecmsc.LIMITS_AMOUNT_MIN.value: 0.0001,
+            Ecmsc.LIMITS_AMOUNT_MAX.value: 9000,
+        },
+        Ecmsc.LIMITS_COST.value: {
+            Ecmsc.LIMITS_COST_MIN.value: 10,
+            Ecmsc.LIMITS_COST_MAX.value: None
+        },
+        Ecmsc.LIMITS_PRICE.value: {
+            Ecmsc.LIMITS_PRICE_MIN.value: 0.01,
+            Ecmsc.LIMITS_PRICE_MAX.value: 1000000
+        },
+    },
+    Ecmsc.PRECISION.value: {
+        Ecmsc.PRECISION_PRICE.value: 2,
+        Ecmsc.PRECISION_AMOUNT.value: 5
+    }
+}
+
+
+def _reference_adapt_price(symbol_market, price, truncate=True):
+    maximal_price_digits = symbol_market[Ecmsc.PRECISION.value].get(
+        Ecmsc.PRECISION_PRICE.value, constants.CURRENCY_DEFAULT_MAX_PRICE_DIGITS)
+    return personal_data.decimal_trunc_with_n_decimal_digits(price, maximal_price_digits, truncate)
+
+
+def _reference_adapt_quantity(symbol_market, quantity, truncate=True):
+    maximal_volume_digits = symbol_market[Ecmsc.PRECISION.value].get(Ecmsc.PRECISION_AMOUNT.value, 0)
+    return personal_data.decimal_trunc_with_n_decimal_digits(quantity, maximal_volume_digits, truncate)
+
+
+def reference_check_and_adapt_order_details_if_necessary(quantity, price, symbol_market, fixed_symbol_data=False,
+                                                         truncate=True):
+    """
+    Previous implementation: limits and precision are parsed at each call (without order splits)
+    """
+    if quantity.is_nan() or price.is_nan() or price == constants.ZERO:
+        return []
+
+    symbol_market_limits = symbol_market[Ecmsc.LIMITS.value]
+    limit_amount = symbol_market_limits[Ecmsc.LIMITS_AMOUNT.value]
+    limit_cost = symbol_market_limits[Ecmsc.LIMITS_COST.value]
+    limit_price = symbol_market_limits[Ecmsc.LIMITS_PRICE.value]
+
+    if personal_data.is_valid(limit_amount, Ecmsc.LIMITS_AMOUNT_MIN.value):
+        min_quantity = decimal.Decimal(str(limit_amount.get(Ecmsc.LIMITS_AMOUNT_MIN.value, math.nan)))
+        max_quantity = None
+        if personal_data.is_valid(limit_amount, Ecmsc.LIMITS_AMOUNT_MAX.value):
+            max_quantity = decimal.Decimal(str(limit_amount.get(Ecmsc.LIMITS_AMOUNT_MAX.value, math.nan)))
+        valid_quantity = _reference_adapt_quantity(symbol_market, quantity, truncate)
+        valid_price = _reference_adapt_price(symbol_market, price, truncate)
+        total_order_price = valid_quantity * valid_price
+        if valid_quantity < min_quantity:
+            return []
+        if personal_data.is_valid(limit_cost, Ecmsc.LIMITS_COST_MIN.value):
+            min_cost = decimal.Decimal(str(limit_cost.get(Ecmsc.LIMITS_COST_MIN.value, math.nan)))
+            max_cost = None
+            if personal_data.is_valid(limit_cost, Ecmsc.LIMITS_COST_MAX.value):
+                max_cost = decimal.Decimal(str(limit_cost.get(Ecmsc.LIMITS_COST_MAX.value, math.nan)))
+            if not personal_data.check_cost(float(total_order_price), min_cost):
+                return []
+            elif (max_cost is not None and total_order_price > max_cost) or \
+                    (max_quantity is not None and valid_quantity > max_quantity):
+                raise NotImplementedError("order splits are not benchmarked")
+            return [(valid_quantity, valid_price)]
+        elif personal_data.is_valid(limit_price, Ecmsc.LIMITS_PRICE_MIN.value):
+            raise NotImplementedError("price limits are not benchmarked")
+    if not fixed_symbol_data:
+        fixed_data = exchanges.ExchangeMarketStatusFixer(symbol_market, float(price)).market_status
+        return reference_check_and_adapt_order_details_if_necessary(quantity, price, fixed_data,
+                                                                    fixed_symbol_data=True, truncate=truncate)
+    return []
+
+
+def _generate_orders():
+    rand = random.Random(0)
+    return [
+        (decimal.Decimal(str(rand.uniform(0.001, 5))), decimal.Decimal(str(rand.uniform(20000, 30000))))
+        for _ in range(CALLS_COUNT)
+    ]
+
+
+def _time_adapt(adapt_function, orders):
+    start = time.perf_counter()
+    adapted_orders = [
+        adapt_function(quantity, price, SYMBOL_MARKET)
+        for quantity, price in orders
+    ]
+    return time.perf_counter() - start, adapted_orders
+
+
+def main():
+    orders = _generate_orders()
+    results = {}
+    print(f"{'implementation':<22} | {'total ms':>9} | {'us/call':>8}")
+    for name, adapt_function in (
+        ("parsed at each call", reference_check_and_adapt_order_details_if_necessary),
+        ("symbol order rules", personal_data.decimal_check_and_adapt_order_details_if_necessary),
+    ):
+        duration, results[name] = _time_adapt(adapt_function, orders)
+        print(f"{name:<22} | {duration * 1000:>9.1f} | {duration / CALLS_COUNT * 1000000:>8.2f}")
+    assert len(set(str(result) for result in results.values())) == 1, "adapted orders are different"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Compares ExchangeSimulator simulated fills/second when fees and market status are rebuilt from the configuration on
+each fill and when they are read from the per-symbol fees cache and the shared market status.
+A simulated fill reads the symbol market status to adapt the order, the symbol fees and computes the trade fee.
+Run from the repository root: python -m benchmarks.exchange_simulator_benchmark
+"""
+import time
+import types
+
+import octobot_commons.constants as commons_constants
+import octobot_commons.symbols as symbol_util
+
+import octobot_trading.enums as enums
+import octobot_trading.exchanges.connectors.exchange_simulator as exchange_simulator
+
+SYMBOLS = [f"COIN{index}/USDT" for index in range(20)]
+FILLS_COUNT = 100000
+ORDER_TYPES = (enums.TraderOrderType.BUY_MARKET, enums.TraderOrderType.SELL_LIMIT)
+
+
+class UncachedExchangeSimulator(exchange_simulator.ExchangeSimulator):
+    """
+    Previous ExchangeSimulator: fees, market status and symbols split computed on each call
+    """
+    def _get_symbol_market_status(self, symbol):
+        return self._create_market_status()
+
+    def _get_symbol_fees(self, symbol):
+        return self._create_fees()
+
+    def get_split_pair_from_exchange(self, pair) -> (str, str):
+        return symbol_util.parse_symbol(pair).base_and_quote()
+
+
+def _create_simulator(simulator_class):
+    config = {
+        commons_constants.CONFIG_SIMULATOR: {
+            commons_constants.CONFIG_SIMULATOR_FEES: {
+                commons_constants.CONFIG_SIMULATOR_FEES_MAKER: 0.05,
+                commons_constants.CONFIG_SIMULATOR_FEES_TAKER: 0.1,
+            }
+        }
+    }
+    exchange_manager = types.SimpleNamespace(exchange_class_string="binance", tentacles_setup_config=None)
+    return simulator_class(config, exchange_manager, None)
+
+
+def _time_fills(simulator):
+    start = time.perf_counter()
+    for index in range(FILLS_COUNT):
+        symbol = SYMBOLS[index % len(SYMBOLS)]
+        simulator.get_market_status(symbol, with_fixer=False)
+        simulator.get_fees(symbol)
+        simulator.get_trade_fee(symbol, ORDER_TYPES[index % 2], 1.5, 1000.5,
+                                enums.ExchangeConstantsMarketPropertyColumns.TAKER.value)
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"{'simulator':<10} | {'fills/s':>10}")
+    for name, simulator_class in (
+        ("uncached", UncachedExchangeSimulator),
+        ("cached", exchange_simulator.ExchangeSimulator),
+    ):
+        duration = _time_fills(_create_simulator(simulator_class))
+        print(f"{name:<10} | {FILLS_COUNT / duration:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
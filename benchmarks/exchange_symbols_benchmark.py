@@ -0,0 +1,102 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Compares ExchangeManager symbol lookups on a 3000 markets exchange when client_symbols is scanned at each call
+(previous behavior) and when lookups use the client symbols set and quote currency index.
+Run from the repository root: python -m benchmarks.exchange_symbols_benchmark
+"""
+import random
+import time
+
+import octobot_commons.symbols as symbol_util
+import octobot_commons.tests.test_config as test_config
+
+import octobot_trading.exchanges as exchanges
+
+MARKETS_COUNT = 3000
+QUOTES = ["USDT", "BTC", "ETH", "BUSD", "EUR", "TRY"]
+LOOKUPS_COUNT = 10000
+WILDCARD_LISTS_COUNT = 20
+
+
+class ScanExchangeManager(exchanges.ExchangeManager):
+    """
+    Previous lookups: client_symbols is scanned and every symbol is parsed
+    """
+    def symbol_exists(self, symbol):
+        return symbol in self.client_symbols
+
+    def get_symbols_by_quote(self, quote):
+        return [
+            symbol
+            for symbol in self.client_symbols
+            if symbol_util.parse_symbol(symbol).quote == quote
+        ]
+
+
+def _generate_symbols():
+    rand = random.Random(0)
+    symbols = []
+    base_index = 0
+    while len(symbols) < MARKETS_COUNT:
+        base = f"COIN{base_index}"
+        symbols += [symbol_util.merge_currencies(base, quote) for quote in rand.sample(QUOTES, rand.randint(1, 3))]
+        base_index += 1
+    return symbols[:MARKETS_COUNT], base_index
+
+
+def _time_exchange_manager(exchange_manager_class, symbols, looked_up_currencies):
+    exchange_manager = exchange_manager_class(test_config.load_test_config(), "binance")
+    exchange_manager.client_symbols = list(symbols)
+    exchange_manager.symbol_exists(symbols[0])   # build lookups, as after markets load
+    start = time.perf_counter()
+    # as in PortfolioValueHolder: look for the currency / reference market symbol or its reverse
+    value_holder_symbols = [
+        symbol_util.merge_currencies(currency, "USDT")
+        if exchange_manager.symbol_exists(symbol_util.merge_currencies(currency, "USDT"))
+        else symbol_util.merge_currencies("USDT", currency)
+        if exchange_manager.symbol_exists(symbol_util.merge_currencies("USDT", currency))
+        else None
+        for currency in looked_up_currencies
+    ]
+    lookups_duration = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(WILDCARD_LISTS_COUNT):
+        wildcard_symbols = [exchange_manager.get_symbols_by_quote(quote) for quote in QUOTES]
+    wildcard_duration = time.perf_counter() - start
+    return lookups_duration, wildcard_duration, (value_holder_symbols, wildcard_symbols)
+
+
+def main():
+    symbols, bases_count = _generate_symbols()
+    rand = random.Random(1)
+    # some looked up currencies are not on the exchange
+    looked_up_currencies = [f"COIN{rand.randrange(2 * bases_count)}" for _ in range(LOOKUPS_COUNT)]
+    results = {}
+    print(f"{'implementation':<16} | {'us/value holder lookup':>22} | {'ms/wildcard lists':>17}")
+    for name, exchange_manager_class in (
+        ("scan", ScanExchangeManager),
+        ("lookups", exchanges.ExchangeManager),
+    ):
+        lookups_duration, wildcard_duration, results[name] = \
+            _time_exchange_manager(exchange_manager_class, symbols, looked_up_currencies)
+        print(f"{name:<16} | {lookups_duration / LOOKUPS_COUNT * 1000000:>22.2f} | "
+              f"{wildcard_duration / WILDCARD_LISTS_COUNT * 1000:>17.2f}")
+    assert results["scan"] == results["lookups"], "lookup results are different"
+
+
+if __name__ == "__main__":
+    main()
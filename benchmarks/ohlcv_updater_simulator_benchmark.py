@@ -0,0 +1,121 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Compares OHLCVUpdaterSimulator.handle_timestamp ticks/second when reading candles from the exchange data importer
+on each tick and when reading them from preloaded candles.
+The importer is simulated with the ChronologicalReadDatabaseCache used by ExchangeDataImporter once its data are
+read from database: database reads are not included.
+Run from the repository root: python -m benchmarks.ohlcv_updater_simulator_benchmark
+"""
+import asyncio
+import time
+import types
+
+import mock
+
+import octobot_commons.databases as databases
+import octobot_commons.enums as commons_enums
+
+import octobot_trading.exchange_data.ohlcv.channel.ohlcv_updater_simulator as ohlcv_updater_simulator
+import octobot_trading.exchanges.config.backtesting_exchange_config as backtesting_exchange_config
+
+EXCHANGE_NAME = "binance"
+PAIRS_COUNT = 50
+TICKS_COUNT = 2000
+TIME_FRAMES = [commons_enums.TimeFrames.ONE_HOUR, commons_enums.TimeFrames.ONE_MINUTE]
+
+
+def _create_importer(symbols):
+    rows_by_symbol_by_time_frame = {
+        symbol: {
+            time_frame: [
+                [candle_time, EXCHANGE_NAME, symbol.split("/")[0], symbol, time_frame.value,
+                 [candle_time, 1.5, 3.0, 1.0, 2.25, 100.0]]
+                for candle_time in range(
+                    0,
+                    60 * (TICKS_COUNT + 1),
+                    commons_enums.TimeFramesMinutes[time_frame] * 60
+                )
+            ]
+            for time_frame in TIME_FRAMES
+        }
+        for symbol in symbols
+    }
+    cache = databases.ChronologicalReadDatabaseCache()
+
+    async def _get_ohlcv_from_timestamps(exchange_name=None, symbol=None, time_frame=None,
+                                         inferior_timestamp=-1, superior_timestamp=-1):
+        if not cache.has((exchange_name, symbol, time_frame)):
+            cache.set(rows_by_symbol_by_time_frame[symbol][time_frame], 0, (exchange_name, symbol, time_frame))
+        return cache.get(inferior_timestamp, superior_timestamp, (exchange_name, symbol, time_frame))
+
+    async def _get_ohlcv(exchange_name=None, symbol=None, time_frame=None, limit=-1, timestamps=None,
+                         operations=None):
+        return rows_by_symbol_by_time_frame[symbol][time_frame]
+
+    return types.SimpleNamespace(
+        symbols=symbols,
+        file_path="ExchangeHistoryDataCollector_benchmark.data",
+        get_ohlcv_from_timestamps=_get_ohlcv_from_timestamps,
+        get_ohlcv=_get_ohlcv,
+    )
+
+
+def _create_updater(importer, preload_candles):
+    config = backtesting_exchange_config.BacktestingExchangeConfig()
+    config.preload_candles = preload_candles
+    current_future_candles = {symbol: {} for symbol in importer.symbols}
+    channel = types.SimpleNamespace(
+        exchange_manager=types.SimpleNamespace(
+            exchange_name=EXCHANGE_NAME,
+            exchange_config=types.SimpleNamespace(
+                backtesting_exchange_config=config,
+                get_shortest_time_frame=lambda: commons_enums.TimeFrames.ONE_MINUTE
+            ),
+            exchange=types.SimpleNamespace(is_unreachable=False, backtesting=None)
+        ),
+        exchange=types.SimpleNamespace(
+            get_time_frames=lambda _: TIME_FRAMES,
+            get_current_future_candles=lambda: current_future_candles
+        )
+    )
+    with mock.patch.object(ohlcv_updater_simulator.api, "get_backtesting_current_time", mock.Mock(return_value=0)):
+        updater = ohlcv_updater_simulator.OHLCVUpdaterSimulator(channel, importer)
+
+    async def _push(*_, **__):
+        pass
+    updater.push = _push
+    return updater
+
+
+async def _run_ticks(preload_candles):
+    updater = _create_updater(_create_importer([f"C{index}/USDT" for index in range(PAIRS_COUNT)]), preload_candles)
+    if preload_candles:
+        await updater._preload_candles()
+    start = time.perf_counter()
+    for timestamp in range(0, 60 * TICKS_COUNT, 60):
+        await updater.handle_timestamp(timestamp)
+    return TICKS_COUNT / (time.perf_counter() - start)
+
+
+async def main():
+    print(f"{PAIRS_COUNT} pairs, {len(TIME_FRAMES)} time frames, {TICKS_COUNT} ticks")
+    print(f"importer reads:    {await _run_ticks(False):>10.0f} ticks/s")
+    print(f"preloaded candles: {await _run_ticks(True):>10.0f} ticks/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
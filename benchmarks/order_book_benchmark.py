@@ -0,0 +1,114 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Compares OrderBookManager, which rebuilds its whole book from each snapshot, with FlatOrderBook snapshots and
+level deltas on 1000 levels books.
+Run from the repository root: python -m benchmarks.order_book_benchmark
+"""
+import asyncio
+import random
+import time
+
+import octobot_trading.enums as enums
+import octobot_trading.exchange_data as exchange_data
+
+LEVELS_COUNT = 1000
+UPDATES_COUNT = 500
+# changed levels in each delta update
+DELTA_SIZE = 10
+# updates per second to handle for each symbol
+SYMBOL_UPDATE_RATE = 100
+QUERIES_COUNT = 1000
+MID_PRICE = 10000
+TICK_SIZE = 0.5
+
+
+def _generate_side(first_price, direction):
+    return [
+        [first_price + direction * index * TICK_SIZE, round(random.uniform(0.01, 5), 4)]
+        for index in range(LEVELS_COUNT)
+    ]
+
+
+def _generate_snapshots():
+    return [
+        (_generate_side(MID_PRICE + TICK_SIZE, 1), _generate_side(MID_PRICE, -1))
+        for _ in range(UPDATES_COUNT)
+    ]
+
+
+def _generate_delta(first_price, direction):
+    # updates are mostly close to the top of the book
+    return [
+        [first_price + direction * int(random.expovariate(0.05)) % LEVELS_COUNT * TICK_SIZE,
+         0 if random.random() < 0.2 else round(random.uniform(0.01, 5), 4)]
+        for _ in range(DELTA_SIZE)
+    ]
+
+
+def _generate_deltas():
+    return [
+        (_generate_delta(MID_PRICE + TICK_SIZE, 1), _generate_delta(MID_PRICE, -1))
+        for _ in range(UPDATES_COUNT)
+    ]
+
+
+def _time_updates(handler, updates):
+    start = time.perf_counter()
+    for asks, bids in updates:
+        handler(asks, bids)
+    return (time.perf_counter() - start) / len(updates)
+
+
+def _time_queries(query):
+    start = time.perf_counter()
+    for _ in range(QUERIES_COUNT):
+        query()
+    return (time.perf_counter() - start) / QUERIES_COUNT
+
+
+def _print_update(name, duration):
+    print(f"{name:<34} | {duration * 1e6:>10.1f} | {1 / (duration * SYMBOL_UPDATE_RATE):>14.0f}")
+
+
+def main():
+    random.seed(42)
+    snapshots = _generate_snapshots()
+    deltas = _generate_deltas()
+    order_book_manager = exchange_data.OrderBookManager()
+    asyncio.run(order_book_manager.initialize())
+    flat_order_book = exchange_data.FlatOrderBook()
+
+    print(f"{LEVELS_COUNT} levels books, {DELTA_SIZE} levels deltas")
+    print(f"{'update':<34} | {'us/update':>10} | {'symbols at ' + str(SYMBOL_UPDATE_RATE) + '/s':>14}")
+    _print_update("OrderBookManager snapshot", _time_updates(order_book_manager.handle_new_books, snapshots))
+    _print_update("FlatOrderBook snapshot", _time_updates(flat_order_book.handle_new_books, snapshots))
+    _print_update("FlatOrderBook delta", _time_updates(flat_order_book.handle_book_deltas, deltas))
+
+    flat_order_book.handle_new_books(*snapshots[0])
+    print(f"{'query':<34} | {'us/query':>10}")
+    for name, query in (
+        ("OrderBookManager best ask", order_book_manager.get_ask),
+        ("FlatOrderBook best ask", flat_order_book.get_ask),
+        ("FlatOrderBook depth(20)", lambda: flat_order_book.get_depth(20)),
+        ("FlatOrderBook vwap(50)",
+         lambda: flat_order_book.get_vwap_for_quantity(enums.TradeOrderSide.BUY, 50)),
+    ):
+        print(f"{name:<34} | {_time_queries(query) * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Compares OrdersManager queries at 10000 orders across 50 symbols when every order is filtered at each call (previous
+behavior) and when orders are selected from the status, symbol, tag and group indexes.
+Run from the repository root: python -m benchmarks.orders_manager_benchmark
+"""
+import random
+import time
+
+import octobot_trading.enums as enums
+import octobot_trading.exchanges  # import exchanges first to load personal_data without circular import
+import octobot_trading.personal_data as personal_data
+
+ORDERS_COUNT = 10000
+SYMBOLS = [f"COIN{index}/USDT" for index in range(50)]
+TAGS = ["entry", "exit", None]
+GROUPED_ORDERS_RATIO = 0.2
+LOOKUPS_COUNT = 1000
+
+
+class ScanOrdersManager(personal_data.OrdersManager):
+    """
+    Previous queries: orders are not indexed and every order is filtered
+    """
+    def _add_to_indexes(self, order_id, order):
+        pass
+
+    def _remove_from_indexes(self, order_id):
+        pass
+
+    def update_order_indexes(self, order):
+        pass
+
+    def get_order_from_group(self, group_name):
+        return [
+            order
+            for order in self.orders.values()
+            if order.order_group is not None and order.order_group.name == group_name
+        ]
+
+    def has_order(self, order_id) -> bool:
+        return order_id in set(self.orders.keys())
+
+    def _select_orders(self, state=None, symbol=None, since=-1, limit=-1, tag=None):
+        orders = [
+            order
+            for order in self.orders.values()
+            if (
+                    (state is None or order.status == state) and
+                    (symbol is None or (symbol and order.symbol == symbol)) and
+                    (since == -1 or (since and order.timestamp < since)) and
+                    (tag is None or order.tag == tag)
+            )
+        ]
+        return orders if limit == -1 else orders[0:limit]
+
+
+class FakeExchange:
+    @staticmethod
+    def get_exchange_current_time():
+        return 0
+
+
+class FakeExchangePersonalData:
+    def __init__(self):
+        self.orders_manager = None
+
+
+class FakeExchangeManager:
+    def __init__(self):
+        self.exchange = FakeExchange()
+        self.exchange_personal_data = FakeExchangePersonalData()
+
+
+class FakeTrader:
+    def __init__(self):
+        self.exchange_manager = FakeExchangeManager()
+        self.simulate = True
+
+    @staticmethod
+    def parse_order_id(order_id):
+        return order_id
+
+
+def _create_orders(manager):
+    rand = random.Random(0)
+    trader = manager.trader
+    orders = []
+    group = None
+    for index in range(ORDERS_COUNT):
+        order = personal_data.BuyLimitOrder(trader)
+        order.order_id = str(index)
+        order.symbol = SYMBOLS[rand.randrange(len(SYMBOLS))]
+        order.tag = TAGS[index % len(TAGS)]
+        if rand.random() < GROUPED_ORDERS_RATIO:
+            # groups of 2 orders, as for stop loss and take profit
+            if group is None:
+                group = manager.create_group(personal_data.OneCancelsTheOtherOrderGroup, f"group_{index}")
+                order.add_to_order_group(group)
+            else:
+                order.add_to_order_group(group)
+                group = None
+        orders.append(order)
+    return orders
+
+
+def _time_manager(manager_class, lookups):
+    trader = FakeTrader()
+    manager = manager_class(trader)
+    trader.exchange_manager.exchange_personal_data.orders_manager = manager
+    orders = _create_orders(manager)
+    durations = {}
+    start = time.perf_counter()
+    for order in orders:
+        manager._add_order(order.order_id, order)
+    durations["insert"] = time.perf_counter() - start
+    symbols, tags, group_names, order_ids, updated_orders = lookups
+    start = time.perf_counter()
+    open_orders = [[order.order_id for order in manager.get_open_orders(symbol=symbol)] for symbol in symbols]
+    durations["open orders"] = time.perf_counter() - start
+    start = time.perf_counter()
+    tagged_orders = [
+        [order.order_id for order in manager.get_open_orders(symbol=symbol, tag=tag)]
+        for symbol, tag in zip(symbols, tags)
+    ]
+    durations["tagged orders"] = time.perf_counter() - start
+    start = time.perf_counter()
+    group_orders = [[order.order_id for order in manager.get_order_from_group(name)] for name in group_names]
+    durations["group orders"] = time.perf_counter() - start
+    start = time.perf_counter()
+    known_orders = [manager.has_order(order_id) for order_id in order_ids]
+    durations["has order"] = time.perf_counter() - start
+    start = time.perf_counter()
+    for index in updated_orders:
+        orders[index].status = enums.OrderStatus.PENDING_CANCEL
+    durations["status updates"] = time.perf_counter() - start
+    closed_orders = [order.order_id for order in manager.get_all_orders() if order.status is not enums.OrderStatus.OPEN]
+    return durations, (open_orders, tagged_orders, group_orders, known_orders, closed_orders)
+
+
+def main():
+    rand = random.Random(1)
+    lookups = (
+        [rand.choice(SYMBOLS) for _ in range(LOOKUPS_COUNT)],
+        [rand.choice(TAGS[:2]) for _ in range(LOOKUPS_COUNT)],
+        [f"group_{rand.randrange(ORDERS_COUNT)}" for _ in range(LOOKUPS_COUNT)],
+        # half of the looked up orders are unknown, as for orders fetched from exchange
+        [str(rand.randrange(2 * ORDERS_COUNT)) for _ in range(LOOKUPS_COUNT)],
+        [rand.randrange(ORDERS_COUNT) for _ in range(LOOKUPS_COUNT)],
+    )
+    results = {}
+    columns = ("insert", "open orders", "tagged orders", "group orders", "has order", "status updates")
+    print(f"{'implementation':<16} | " + " | ".join(f"{column + ' us':>17}" for column in columns))
+    for name, manager_class in (
+        ("scan", ScanOrdersManager),
+        ("indexes", personal_data.OrdersManager),
+    ):
+        durations, results[name] = _time_manager(manager_class, lookups)
+        print(f"{name:<16} | " + " | ".join(
+            f"{durations[column] / (ORDERS_COUNT if column == 'insert' else LOOKUPS_COUNT) * 1000000:>17.2f}"
+            for column in columns
+        ))
+    assert results["scan"] == results["indexes"], "query results are different"
+
+
+if __name__ == "__main__":
+    main()
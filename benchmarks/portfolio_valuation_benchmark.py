@@ -0,0 +1,108 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Compares portfolio profitability updates on mark price updates of a 100 pairs portfolio when every currency is
+reevaluated at each update (previous behavior) and when only the currency valued using the updated pair is.
+Run from the repository root: python -m benchmarks.portfolio_valuation_benchmark
+"""
+import decimal
+import random
+import time
+import types
+
+import octobot_commons.symbols as symbol_util
+import octobot_commons.tests.test_config as test_config
+
+import octobot_trading.exchanges as exchanges
+import octobot_trading.personal_data as personal_data
+
+PAIRS_COUNT = 100
+REFERENCE_MARKET = "USDT"
+MARK_PRICE_UPDATES_COUNT = 20000
+
+
+class FullRecalculationPortfolioValueHolder(personal_data.PortfolioValueHolder):
+    """
+    Previous valuation: every currency is reevaluated on each mark price update
+    """
+    def update_current_values_from_symbol(self, symbol):
+        return None
+
+
+def _create_portfolio_manager(value_holder_class, symbols):
+    config = test_config.load_test_config()
+    config["trading"]["reference-market"] = REFERENCE_MARKET
+    exchange_manager = exchanges.ExchangeManager(config, "binance")
+    exchange_manager.is_backtesting = True
+    exchange_manager.client_symbols = list(symbols)
+    exchange_manager.exchange_config.all_config_symbol_pairs = list(symbols)
+    portfolio_manager = personal_data.PortfolioManager(config, types.SimpleNamespace(is_enabled=False),
+                                                       exchange_manager)
+    portfolio_manager.reference_market = REFERENCE_MARKET
+    portfolio_manager.portfolio = personal_data.SpotPortfolio(exchange_manager.get_exchange_name())
+    portfolio_manager.portfolio.update_portfolio_from_balance({
+        currency: {"available": decimal.Decimal(10), "total": decimal.Decimal(10)}
+        for currency in [REFERENCE_MARKET] + [symbol_util.parse_symbol(symbol).base for symbol in symbols]
+    }, True)
+    portfolio_manager.portfolio_value_holder = value_holder_class(portfolio_manager)
+    portfolio_manager.portfolio_profitability = personal_data.PortfolioProfitability(portfolio_manager)
+    return portfolio_manager
+
+
+def _time_portfolio_valuation(value_holder_class, symbols, mark_prices):
+    portfolio_manager = _create_portfolio_manager(value_holder_class, symbols)
+    for symbol in symbols:
+        portfolio_manager.portfolio_value_holder.update_origin_crypto_currencies_values(symbol, decimal.Decimal(1))
+    portfolio_manager.handle_balance_updated()
+    start = time.perf_counter()
+    for symbol, mark_price in mark_prices:
+        portfolio_manager.handle_mark_price_update(symbol, mark_price)
+    duration = time.perf_counter() - start
+    profitability = portfolio_manager.portfolio_profitability
+    return duration, (
+        portfolio_manager.portfolio_value_holder.portfolio_current_value,
+        profitability.profitability,
+        profitability.profitability_percent,
+        profitability.market_profitability_percent,
+        profitability.initial_portfolio_current_profitability,
+    )
+
+
+def main():
+    symbols = [symbol_util.merge_currencies(f"COIN{index}", REFERENCE_MARKET) for index in range(PAIRS_COUNT)]
+    rand = random.Random(0)
+    prices = {symbol: decimal.Decimal(1) for symbol in symbols}
+    mark_prices = []
+    for _ in range(MARK_PRICE_UPDATES_COUNT):
+        symbol = rand.choice(symbols)
+        prices[symbol] *= decimal.Decimal(str(round(rand.uniform(0.99, 1.01), 6)))
+        mark_prices.append((symbol, prices[symbol]))
+    results = {}
+    print(f"{'implementation':<16} | {'us/mark price update':>20}")
+    for name, value_holder_class in (
+        ("full", FullRecalculationPortfolioValueHolder),
+        ("incremental", personal_data.PortfolioValueHolder),
+    ):
+        duration, results[name] = _time_portfolio_valuation(value_holder_class, symbols, mark_prices)
+        print(f"{name:<16} | {duration / MARK_PRICE_UPDATES_COUNT * 1000000:>20.2f}")
+    assert all(
+        abs(full_value - incremental_value) <= decimal.Decimal("1e-18")
+        for full_value, incremental_value in zip(results["full"], results["incremental"])
+    ), "valuation results are different"
+
+
+if __name__ == "__main__":
+    main()
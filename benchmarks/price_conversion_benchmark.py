@@ -0,0 +1,119 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Compares PortfolioValueHolder currencies conversions using 1000 last prices when only the direct and reversed symbols
+are used and every symbol is parsed on a miss (previous behavior) and when using the price conversion graph.
+Run from the repository root: python -m benchmarks.price_conversion_benchmark
+"""
+import decimal
+import random
+import time
+import types
+
+import octobot_commons.symbols as symbol_util
+
+import octobot_trading.constants as constants
+import octobot_trading.errors as errors
+import octobot_trading.exchanges  # import exchanges first to load personal_data without circular import
+import octobot_trading.personal_data as personal_data
+
+SYMBOLS_COUNT = 1000
+TARGET_CURRENCY = "USDT"
+CONVERSIONS_COUNT = 10000
+
+
+class ScanPortfolioValueHolder(personal_data.PortfolioValueHolder):
+    """
+    Previous conversion: direct or reversed symbol only, every last prices symbol is parsed on a miss
+    """
+    def convert_currency_value_using_last_prices(self, quantity, current_currency, target_currency):
+        try:
+            symbol = symbol_util.merge_currencies(current_currency, target_currency)
+            if self._get_last_price_data(symbol) is not constants.ZERO:
+                return quantity * self._get_last_price_data(symbol)
+        except KeyError:
+            pass
+        try:
+            reversed_symbol = symbol_util.merge_currencies(target_currency, current_currency)
+            return quantity / self._get_last_price_data(reversed_symbol)
+        except decimal.DivisionByZero:
+            pass
+        except KeyError:
+            pass
+        raise errors.MissingPriceDataError(f"no price data to evaluate {current_currency} price in {target_currency}")
+
+    def _get_last_price_data(self, symbol):
+        try:
+            return self.last_prices_by_trading_pair[symbol]
+        except KeyError:
+            to_find_symbol = symbol_util.parse_symbol(symbol)
+            for symbol_key in self.last_prices_by_trading_pair:
+                if symbol_util.parse_symbol(symbol_key).is_same_base_and_quote(to_find_symbol):
+                    return self.last_prices_by_trading_pair[symbol_key]
+        raise KeyError(symbol)
+
+
+def _generate_last_prices():
+    rand = random.Random(0)
+    last_prices = {"BTC/USDT": decimal.Decimal(20000)}
+    index = 0
+    while len(last_prices) < SYMBOLS_COUNT:
+        # a third of currencies only have a BTC symbol, a third a settlement specific USDT symbol
+        quote = rand.choice(("BTC", "USDT", "USDT:USDT"))
+        last_prices[f"COIN{index}/{quote}"] = decimal.Decimal(str(round(rand.uniform(0.0001, 10), 4)))
+        index += 1
+    return last_prices, index
+
+
+def _time_conversions(value_holder_class, last_prices, currencies):
+    portfolio_manager = types.SimpleNamespace(exchange_manager=types.SimpleNamespace(exchange_name="binance"))
+    value_holder = value_holder_class(portfolio_manager)
+    value_holder.last_prices_by_trading_pair.update(last_prices)
+    converted_values = []
+    start = time.perf_counter()
+    for currency in currencies:
+        try:
+            converted_values.append(
+                value_holder.convert_currency_value_using_last_prices(constants.ONE, currency, TARGET_CURRENCY)
+            )
+        except errors.MissingPriceDataError:
+            converted_values.append(None)
+    return time.perf_counter() - start, converted_values
+
+
+def main():
+    last_prices, currencies_count = _generate_last_prices()
+    rand = random.Random(1)
+    currencies = [f"COIN{rand.randrange(currencies_count)}" for _ in range(CONVERSIONS_COUNT)]
+    results = {}
+    print(f"{'implementation':<16} | {'us/conversion':>13} | {'valued currencies':>17}")
+    for name, value_holder_class in (
+        ("scan", ScanPortfolioValueHolder),
+        ("graph", personal_data.PortfolioValueHolder),
+    ):
+        duration, results[name] = _time_conversions(value_holder_class, last_prices, currencies)
+        valued_currencies = len(set(
+            currency for currency, value in zip(currencies, results[name]) if value is not None
+        ))
+        print(f"{name:<16} | {duration / CONVERSIONS_COUNT * 1000000:>13.2f} | {valued_currencies:>17}")
+    assert all(
+        scan_value is None or scan_value == graph_value
+        for scan_value, graph_value in zip(results["scan"], results["graph"])
+    ), "conversion results are different"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Compares simulated limit orders triggering when each open order awaits its price event in a dedicated asyncio task
+(previous LimitOrder behavior) and when the price events manager calls the fill callback of triggered events.
+Run from the repository root: python -m benchmarks.price_events_callbacks_benchmark
+"""
+import asyncio
+import decimal
+import random
+import time
+
+import octobot_commons.asyncio_tools as asyncio_tools
+
+import octobot_trading.exchange_data as exchange_data
+
+RESTING_ORDERS_COUNT = 5000
+PRICE_UPDATES_COUNT = 500
+BASE_PRICE = 10000
+
+
+class FakeOrder:
+    def __init__(self):
+        self.filled = False
+
+    async def on_fill(self):
+        self.filled = True
+
+
+class TaskWaitingOrder(FakeOrder):
+    """
+    Previous LimitOrder price hit handling: a task awaits the price event
+    """
+    def __init__(self, price_events_manager, price, trigger_above):
+        super().__init__()
+        self.price_events_manager = price_events_manager
+        self.event = price_events_manager.new_event(price, 0, trigger_above, allow_instant_fill=False)
+        self.wait_for_hit_event_task = asyncio.create_task(self._wait_for_price_hit())
+
+    async def _wait_for_price_hit(self):
+        await asyncio.wait_for(self.event.wait(), timeout=None)
+        await self.on_fill()
+
+    def cancel(self):
+        if not self.event.is_set():
+            self.wait_for_hit_event_task.cancel()
+        self.price_events_manager.remove_event(self.event)
+
+
+class CallbackOrder(FakeOrder):
+    """
+    Current LimitOrder price hit handling: the price events manager calls on_fill
+    """
+    def __init__(self, price_events_manager, price, trigger_above):
+        super().__init__()
+        self.price_events_manager = price_events_manager
+        self.event = price_events_manager.new_event(price, 0, trigger_above, allow_instant_fill=False,
+                                                    callback=self.on_fill)
+
+    def cancel(self):
+        self.price_events_manager.remove_event(self.event)
+
+
+def _generate_orders_prices():
+    # grid of resting orders on both sides of the current price
+    return [
+        (decimal.Decimal(BASE_PRICE + random.randint(1, BASE_PRICE // 10)), True)
+        if index % 2 else
+        (decimal.Decimal(BASE_PRICE - random.randint(1, BASE_PRICE // 10)), False)
+        for index in range(RESTING_ORDERS_COUNT)
+    ]
+
+
+def _generate_prices():
+    # prices oscillating around the base price, crossing more resting orders at each update: about half of the
+    # orders are filled, the other half is cancelled
+    step = BASE_PRICE // 20 / PRICE_UPDATES_COUNT
+    return [
+        decimal.Decimal(str(BASE_PRICE + (index * step if index % 2 else -index * step)))
+        for index in range(PRICE_UPDATES_COUNT)
+    ]
+
+
+async def _time_run(order_class, orders_prices, prices):
+    price_events_manager = exchange_data.PriceEventsManager()
+    start = time.perf_counter()
+    orders = [order_class(price_events_manager, price, trigger_above) for price, trigger_above in orders_prices]
+    await asyncio_tools.wait_asyncio_next_cycle()
+    creation_duration = time.perf_counter() - start
+    start = time.perf_counter()
+    for timestamp, price in enumerate(prices):
+        price_events_manager.handle_price(price, timestamp + 1)
+        await asyncio_tools.wait_asyncio_next_cycle()
+    prices_duration = time.perf_counter() - start
+    open_orders = [order for order in orders if not order.filled]
+    start = time.perf_counter()
+    for order in open_orders:
+        order.cancel()
+    await asyncio_tools.wait_asyncio_next_cycle()
+    cancel_duration = time.perf_counter() - start
+    return creation_duration, prices_duration, cancel_duration, len(orders) - len(open_orders)
+
+
+async def main():
+    random.seed(42)
+    orders_prices = _generate_orders_prices()
+    prices = _generate_prices()
+    print(f"{'orders':<14} | {'create ms':>10} | {'prices/s':>10} | {'cancel ms':>10} | {'filled':>7}")
+    for name, order_class in (
+        ("task per order", TaskWaitingOrder),
+        ("callbacks", CallbackOrder),
+    ):
+        creation_duration, prices_duration, cancel_duration, filled = \
+            await _time_run(order_class, orders_prices, prices)
+        print(f"{name:<14} | {creation_duration * 1000:>10.1f} | {PRICE_UPDATES_COUNT / prices_duration:>10.0f} | "
+              f"{cancel_duration * 1000:>10.1f} | {filled:>7}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
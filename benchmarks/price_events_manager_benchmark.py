@@ -0,0 +1,126 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Compares the PriceEventsManager price-sorted events with the previous storage which scanned every registered
+event on each price of each recent trades batch and scanned the events list to remove an event.
+Run from the repository root: python -m benchmarks.price_events_manager_benchmark
+"""
+import asyncio
+import decimal
+import random
+import time
+
+import octobot_trading.exchange_data as exchange_data
+from octobot_trading.enums import ExchangeConstantsOrderColumns as ECOC
+
+EVENTS_COUNTS = (100, 1000, 10000)
+RECENT_TRADES_BATCHES = 200
+RECENT_TRADES_BATCH_SIZE = 20
+BASE_PRICE = 1000
+
+
+class ListScanPriceEventsManager:
+    """
+    Previous PriceEventsManager storage: a list of price events scanned for each price
+    """
+    def __init__(self):
+        self.events = []
+
+    def new_event(self, price, timestamp, trigger_above, allow_instant_fill=True):
+        price_event_tuple = (price, timestamp, asyncio.Event(), trigger_above)
+        self.events.append(price_event_tuple)
+        return price_event_tuple[2]
+
+    def handle_recent_trades(self, recent_trades):
+        for recent_trade in recent_trades:
+            price = decimal.Decimal(str(recent_trade[ECOC.PRICE.value]))
+            timestamp = recent_trade[ECOC.TIMESTAMP.value]
+            for event_to_set in self._check_events(price, timestamp):
+                event_to_set.set()
+                self.remove_event(event_to_set)
+
+    def remove_event(self, event_to_remove):
+        for price_event_data in self.events:
+            if event_to_remove in price_event_data:
+                return self.events.remove(price_event_data)
+
+    def _check_events(self, price, timestamp):
+        return [
+            event
+            for event_price, event_timestamp, event, trigger_above in self.events
+            if event_timestamp <= timestamp and
+            (
+                (trigger_above and event_price <= price) or
+                (not trigger_above and event_price >= price)
+            )
+        ]
+
+
+def _generate_events_prices(count):
+    # resting orders spread on both sides of the current price
+    return [
+        (decimal.Decimal(str(BASE_PRICE + random.randint(1, BASE_PRICE // 2))), True)
+        if index % 2 else
+        (decimal.Decimal(str(BASE_PRICE - random.randint(1, BASE_PRICE // 2))), False)
+        for index in range(count)
+    ]
+
+
+def _generate_recent_trades_batches():
+    # prices slowly drift around the base price, crossing a few events
+    price = BASE_PRICE
+    batches = []
+    for batch_index in range(RECENT_TRADES_BATCHES):
+        batch = []
+        for trade_index in range(RECENT_TRADES_BATCH_SIZE):
+            price += random.uniform(-1, 1)
+            batch.append({
+                ECOC.PRICE.value: price,
+                ECOC.TIMESTAMP.value: batch_index * RECENT_TRADES_BATCH_SIZE + trade_index + 1,
+            })
+        batches.append(batch)
+    return batches
+
+
+def _time_run(manager, events_prices, recent_trades_batches):
+    start = time.perf_counter()
+    events = [manager.new_event(price, 0, trigger_above) for price, trigger_above in events_prices]
+    for recent_trades in recent_trades_batches:
+        manager.handle_recent_trades(recent_trades)
+    handle_duration = time.perf_counter() - start
+    start = time.perf_counter()
+    for event in events:
+        manager.remove_event(event)
+    return handle_duration, time.perf_counter() - start
+
+
+def main():
+    random.seed(42)
+    print(f"{'events':>8} | {'manager':<16} | {'batches/s':>10} | {'remove us':>10}")
+    recent_trades_batches = _generate_recent_trades_batches()
+    for events_count in EVENTS_COUNTS:
+        events_prices = _generate_events_prices(events_count)
+        for name, manager_class in (
+            ("list scan", ListScanPriceEventsManager),
+            ("price-sorted", exchange_data.PriceEventsManager),
+        ):
+            handle_duration, remove_duration = _time_run(manager_class(), events_prices, recent_trades_batches)
+            print(f"{events_count:>8} | {name:<16} | {RECENT_TRADES_BATCHES / handle_duration:>10.0f} | "
+                  f"{remove_duration / events_count * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Compares trading signal bundles building when order signals are looked up by scanning registered signals (previous
+TradingSignalBundleBuilder behavior) and when they are looked up from the shared_signal_order_id index.
+Run from the repository root: python -m benchmarks.signal_bundle_builder_benchmark
+"""
+import time
+
+import octobot_trading.enums as enums
+import octobot_trading.errors as errors
+import octobot_trading.exchanges  # import exchanges first to load signals without circular import
+import octobot_trading.signals as signals
+
+BUNDLE_ORDERS_COUNT = 1000
+CANCELLED_ORDERS_COUNT = 100
+ITERATIONS = 5
+
+
+class LinearScanBundleBuilder(signals.TradingSignalBundleBuilder):
+    """
+    Previous order signals lookup: scan registered signals
+    """
+    def _get_order_description_from_local_orders(self, shared_signal_order_id):
+        for index, signal in enumerate(self.signals):
+            if signal.content[enums.TradingSignalOrdersAttrs.SHARED_SIGNAL_ORDER_ID.value] == \
+                    shared_signal_order_id:
+                return index, signal.content
+        raise errors.OrderDescriptionNotFoundError(
+            f"order not found (shared_signal_order_id: {shared_signal_order_id})"
+        )
+
+
+class FakeOrder:
+    def __init__(self, shared_signal_order_id):
+        self.shared_signal_order_id = shared_signal_order_id
+
+
+def _order_content(shared_signal_order_id, chained_to=None, group_id=None):
+    return {
+        enums.TradingSignalCommonsAttrs.ACTION.value: enums.TradingSignalOrdersActions.CREATE.value,
+        enums.TradingSignalOrdersAttrs.SHARED_SIGNAL_ORDER_ID.value: shared_signal_order_id,
+        enums.TradingSignalOrdersAttrs.BUNDLED_WITH.value: None,
+        enums.TradingSignalOrdersAttrs.CHAINED_TO.value: chained_to,
+        enums.TradingSignalOrdersAttrs.GROUP_ID.value: group_id,
+        enums.TradingSignalOrdersAttrs.ADDITIONAL_ORDERS.value: [],
+    }
+
+
+def _fill_bundle(builder):
+    # grid like bundle: entry orders, each with a chained take profit and stop loss grouped together
+    for index in range(BUNDLE_ORDERS_COUNT // 3):
+        builder.register_signal(enums.TradingSignalTopics.ORDERS.value, _order_content(f"entry-{index}"))
+        for exit_order in ("take-profit", "stop-loss"):
+            builder.register_signal(
+                enums.TradingSignalTopics.ORDERS.value,
+                _order_content(f"{exit_order}-{index}", chained_to=f"entry-{index}", group_id=f"group-{index}")
+            )
+    # cancel pending entry orders that have no exit order
+    for index in range(CANCELLED_ORDERS_COUNT):
+        builder.register_signal(enums.TradingSignalTopics.ORDERS.value, _order_content(f"cancelled-{index}"))
+    for index in range(CANCELLED_ORDERS_COUNT):
+        builder.add_cancelled_order(FakeOrder(f"cancelled-{index}"), None)
+
+
+def _time_build(builder_class):
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        builder = builder_class("identifier", "strategy")
+        _fill_bundle(builder)
+        bundle = builder.build()
+    return (time.perf_counter() - start) / ITERATIONS, len(bundle.signals)
+
+
+def main():
+    print(f"{'lookup':<12} | {'build ms':>9} | {'signals':>7}")
+    for name, builder_class in (
+        ("linear scan", LinearScanBundleBuilder),
+        ("index", signals.TradingSignalBundleBuilder),
+    ):
+        duration, signals_count = _time_build(builder_class)
+        print(f"{name:<12} | {duration * 1000:>9.1f} | {signals_count:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Compares TradesManager lookups at 100000 trades when trades are scanned at each call (previous behavior) and when they
+are read from the origin order id index and the incrementally updated paid fees totals.
+Run from the repository root: python -m benchmarks.trades_manager_benchmark
+"""
+import decimal
+import random
+import time
+
+import octobot_trading.enums as enums
+import octobot_trading.exchanges  # import exchanges first to load personal_data without circular import
+import octobot_trading.personal_data as personal_data
+
+TRADES_COUNT = 100000
+ORDER_LOOKUPS_COUNT = 1000
+FEES_LOOKUPS_COUNT = 100
+SYMBOLS = ["BTC/USDT", "ETH/USDT", "ETH/BTC", "SOL/USDT"]
+
+
+class ScanTradesManager(personal_data.TradesManager):
+    """
+    Previous lookups: trades are not indexed and every trade is scanned
+    """
+    def _add_to_indexes(self, trade):
+        pass
+
+    def has_closing_trade_with_order_id(self, order_id) -> bool:
+        for trade in self.trades.values():
+            if trade.origin_order_id == order_id and trade.is_closing_order:
+                return True
+        return False
+
+    def get_total_paid_fees(self):
+        total_fees = {}
+        for trade in self.trades.values():
+            if trade.fee is not None:
+                fee_cost = trade.fee[enums.FeePropertyColumns.COST.value]
+                fee_currency = trade.fee[enums.FeePropertyColumns.CURRENCY.value]
+                if fee_currency in total_fees:
+                    total_fees[fee_currency] += fee_cost
+                else:
+                    total_fees[fee_currency] = fee_cost
+        return total_fees
+
+
+class FakeExchange:
+    @staticmethod
+    def get_exchange_current_time():
+        return 0
+
+
+class FakeExchangeManager:
+    def __init__(self):
+        self.exchange = FakeExchange()
+
+
+class FakeTrader:
+    def __init__(self):
+        self.exchange_manager = FakeExchangeManager()
+        self.simulate = True
+
+    @staticmethod
+    def parse_order_id(order_id):
+        return order_id
+
+
+def _generate_trades(trader):
+    rand = random.Random(0)
+    trades = []
+    for index in range(TRADES_COUNT):
+        trade = personal_data.Trade(trader)
+        trade.trade_id = str(index)
+        trade.origin_order_id = f"order_{index}"
+        trade.is_closing_order = True
+        trade.symbol = SYMBOLS[index % len(SYMBOLS)]
+        trade.executed_time = 1600000000 + index * 60 + rand.randint(0, 59)
+        trade.status = enums.OrderStatus.FILLED
+        trade.fee = {
+            enums.FeePropertyColumns.COST.value: decimal.Decimal(str(rand.uniform(0.01, 1))),
+            enums.FeePropertyColumns.CURRENCY.value: trade.symbol.split("/")[1],
+        }
+        trades.append(trade)
+    return trades
+
+
+def _time_manager(manager_class, trades, looked_up_order_ids):
+    manager = manager_class(FakeTrader())
+    start = time.perf_counter()
+    for trade in trades:
+        manager.upsert_trade_instance(trade)
+    insert_duration = time.perf_counter() - start
+    start = time.perf_counter()
+    closing_trades = [
+        manager.has_closing_trade_with_order_id(order_id)
+        for order_id in looked_up_order_ids
+    ]
+    order_lookup_duration = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(FEES_LOOKUPS_COUNT):
+        total_fees = manager.get_total_paid_fees()
+    fees_lookup_duration = time.perf_counter() - start
+    return insert_duration, order_lookup_duration, fees_lookup_duration, (closing_trades, total_fees)
+
+
+def main():
+    trader = FakeTrader()
+    trades = _generate_trades(trader)
+    rand = random.Random(1)
+    # half of the looked up orders have no trade, as for most open orders updates
+    looked_up_order_ids = [
+        f"order_{rand.randint(0, 2 * TRADES_COUNT)}"
+        for _ in range(ORDER_LOOKUPS_COUNT)
+    ]
+    results = {}
+    print(f"{'implementation':<16} | {'insert ms':>9} | {'us/order lookup':>15} | {'us/fees lookup':>14}")
+    for name, manager_class in (
+        ("scan", ScanTradesManager),
+        ("indexes", personal_data.TradesManager),
+    ):
+        insert_duration, order_lookup_duration, fees_lookup_duration, results[name] = \
+            _time_manager(manager_class, trades, looked_up_order_ids)
+        print(f"{name:<16} | {insert_duration * 1000:>9.1f} | "
+              f"{order_lookup_duration / ORDER_LOOKUPS_COUNT * 1000000:>15.2f} | "
+              f"{fees_lookup_duration / FEES_LOOKUPS_COUNT * 1000000:>14.2f}")
+    assert results["scan"] == results["indexes"], "lookup results are different"
+
+
+if __name__ == "__main__":
+    main()
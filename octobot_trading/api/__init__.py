@@ -41,6 +41,7 @@ from octobot_trading.api.symbol_data import (
     get_symbol_low_candles,
     get_symbol_volume_candles,
     get_symbol_time_candles,
+    get_symbol_ohlcv,
     create_new_candles_manager,
     force_set_mark_price,
     is_mark_price_initialized,
@@ -197,6 +198,7 @@ __all__ = [
     "get_symbol_low_candles",
     "get_symbol_volume_candles",
     "get_symbol_time_candles",
+    "get_symbol_ohlcv",
     "create_new_candles_manager",
     "force_set_mark_price",
     "is_mark_price_initialized",
@@ -82,6 +82,10 @@ def get_symbol_time_candles(symbol_data, time_frame, limit=-1, include_in_constr
     return exchange_data.get_symbol_time_candles(symbol_data, time_frame, limit, include_in_construction)
 
 
+def get_symbol_ohlcv(symbol_data, time_frame, limit=-1, include_in_construction=False):
+    return exchange_data.get_symbol_ohlcv(symbol_data, time_frame, limit, include_in_construction)
+
+
 def create_new_candles_manager(candles=None, max_candles_count=None) -> exchange_data.CandlesManager:
     manager = exchange_data.CandlesManager(max_candles_count=max_candles_count)
     if candles is not None:
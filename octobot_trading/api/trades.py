@@ -20,8 +20,10 @@ import octobot_trading.personal_data as personal_data
 
 
 def get_trade_history(exchange_manager, symbol=None, since=None, as_dict=False, include_cancelled=False) -> list:
+    trades_manager = exchange_manager.exchange_personal_data.trades_manager
     return [trade.to_dict() if as_dict else trade
-            for trade in exchange_manager.exchange_personal_data.trades_manager.trades.values()
+            for trade in (trades_manager.trades.values() if symbol is None
+                          else trades_manager.get_symbol_trades(symbol))
             if _trade_filter(trade, symbol, since, include_cancelled)]
 
 
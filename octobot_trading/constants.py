@@ -33,6 +33,8 @@ CURRENCY_DEFAULT_MAX_PRICE_DIGITS = 8
 
 # Order creation
 ORDER_DATA_FETCHING_TIMEOUT = 60
+# maximum number of cached symbol order rules before clearing the cache
+SYMBOL_ORDER_RULES_CACHE_MAX_SIZE = 1000
 
 # Tentacles
 TRADING_MODE_REQUIRED_STRATEGIES = "required_strategies"
@@ -99,6 +101,12 @@ POSITIONS_CHANNEL = "Positions"
 # History
 DEFAULT_SAVED_HISTORICAL_TIMEFRAMES = [commons_enums.TimeFrames.ONE_DAY]
 
+# Storage
+# maximum delay before a modified database is flushed (in seconds)
+DATABASES_FLUSH_INTERVAL = 10
+# number of modified databases triggering an early flush
+DATABASES_FLUSH_MAX_PENDING_DATABASES = 20
+
 # 946742400 is 01/01/2000, if trade time is lower, there is an issue.
 MINIMUM_VAL_TRADE_TIME = 946688400
 
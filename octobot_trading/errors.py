@@ -170,6 +170,12 @@ class UnreachableExchange(Exception):
     """
 
 
+class NotEnoughLiquidityError(Exception):
+    """
+    Raised when an order book does not hold enough liquidity for the requested quantity
+    """
+
+
 class InvalidArgumentError(Exception):
     """
     Raised when a keyword is called with invalid arguments
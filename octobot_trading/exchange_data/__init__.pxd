@@ -41,10 +41,15 @@ from octobot_trading.exchange_data.ohlcv cimport (
     get_symbol_low_candles,
     get_symbol_volume_candles,
     get_symbol_time_candles,
+    get_symbol_ohlcv,
+    CandlesAggregator,
+    is_derivable_time_frame,
+    get_derivable_time_frames,
     OHLCVUpdaterSimulator,
     OHLCVProducer,
     OHLCVChannel,
     OHLCVUpdater,
+    OHLCVRefreshScheduler,
 )
 
 from octobot_trading.exchange_data cimport order_book
@@ -55,6 +60,7 @@ from octobot_trading.exchange_data.order_book cimport (
     OrderBookTickerProducer,
     OrderBookTickerChannel,
     OrderBookManager,
+    FlatOrderBook,
     OrderBookUpdaterSimulator,
 )
 
@@ -123,16 +129,22 @@ __all__ = [
     "get_symbol_low_candles",
     "get_symbol_volume_candles",
     "get_symbol_time_candles",
+    "get_symbol_ohlcv",
+    "CandlesAggregator",
+    "is_derivable_time_frame",
+    "get_derivable_time_frames",
     "OHLCVUpdaterSimulator",
     "OHLCVProducer",
     "OHLCVChannel",
     "OHLCVUpdater",
+    "OHLCVRefreshScheduler",
     "OrderBookUpdater",
     "OrderBookProducer",
     "OrderBookChannel",
     "OrderBookTickerProducer",
     "OrderBookTickerChannel",
     "OrderBookManager",
+    "FlatOrderBook",
     "OrderBookUpdaterSimulator",
     "MarkPriceUpdaterSimulator",
     "MarkPriceProducer",
@@ -39,11 +39,16 @@ from octobot_trading.exchange_data.ohlcv import (
     get_symbol_low_candles,
     get_symbol_volume_candles,
     get_symbol_time_candles,
+    get_symbol_ohlcv,
     get_candle_as_list,
+    CandlesAggregator,
+    is_derivable_time_frame,
+    get_derivable_time_frames,
     OHLCVUpdaterSimulator,
     OHLCVProducer,
     OHLCVChannel,
     OHLCVUpdater,
+    OHLCVRefreshScheduler,
 )
 from octobot_trading.exchange_data import order_book
 from octobot_trading.exchange_data.order_book import (
@@ -53,6 +58,7 @@ from octobot_trading.exchange_data.order_book import (
     OrderBookTickerProducer,
     OrderBookTickerChannel,
     OrderBookManager,
+    FlatOrderBook,
     OrderBookUpdaterSimulator,
 )
 from octobot_trading.exchange_data import prices
@@ -154,17 +160,23 @@ __all__ = [
     "get_symbol_low_candles",
     "get_symbol_volume_candles",
     "get_symbol_time_candles",
+    "get_symbol_ohlcv",
     "get_candle_as_list",
+    "CandlesAggregator",
+    "is_derivable_time_frame",
+    "get_derivable_time_frames",
     "OHLCVUpdaterSimulator",
     "OHLCVProducer",
     "OHLCVChannel",
     "OHLCVUpdater",
+    "OHLCVRefreshScheduler",
     "OrderBookUpdater",
     "OrderBookProducer",
     "OrderBookChannel",
     "OrderBookTickerProducer",
     "OrderBookTickerChannel",
     "OrderBookManager",
+    "FlatOrderBook",
     "OrderBookUpdaterSimulator",
     "MarkPriceUpdaterSimulator",
     "MarkPriceProducer",
@@ -29,6 +29,8 @@ cdef class ExchangeSymbolData:
 
     cdef public dict symbol_candles
     cdef public dict symbol_klines
+    cdef public object derivation_base_time_frame
+    cdef public dict candles_aggregators
 
     cdef public price_events_manager.PriceEventsManager price_events_manager
     cdef public order_book_manager.OrderBookManager order_book_manager
@@ -37,10 +39,14 @@ cdef class ExchangeSymbolData:
     cdef public ticker_manager.TickerManager ticker_manager
     cdef public funding_manager.FundingManager funding_manager
 
+    cpdef void set_derived_time_frames(self, object base_time_frame, list derived_time_frames)
     cpdef list handle_recent_trade_update(self, list recent_trades, bint replace_all=*)
     cpdef void handle_order_book_update(self, list asks, list bids)
+    cpdef void handle_order_book_delta(self, list asks, list bids)
     cpdef void handle_order_book_ticker_update(self, double ask_quantity, double ask_price,
                                                double bid_quantity, double bid_price)
     cpdef bint handle_mark_price_update(self, object mark_price, str mark_price_source)
     cpdef void handle_ticker_update(self, dict ticker)
     cpdef void handle_mini_ticker_update(self, dict mini_ticker)
+
+    cdef dict _update_derived_candles(self, object time_frame, object new_symbol_candles_data, bint replace_all)
@@ -19,6 +19,7 @@ import octobot_commons.tree as commons_tree
 import octobot_commons.enums as commons_enums
 
 import octobot_trading.exchange_data.ohlcv.candles_manager as candles_manager
+import octobot_trading.exchange_data.ohlcv.candles_aggregator as candles_aggregator
 import octobot_trading.exchange_data.ticker.ticker_manager as ticker_manager
 import octobot_trading.exchange_data.order_book.order_book_manager as order_book_manager
 import octobot_trading.exchange_data.kline.kline_manager as kline_manager
@@ -46,11 +47,33 @@ class ExchangeSymbolData:
 
         self.symbol_candles = {}
         self.symbol_klines = {}
+        # derived time frames candles are aggregated from derivation_base_time_frame candles instead of being fetched
+        self.derivation_base_time_frame = None
+        self.candles_aggregators = {}
 
         self.logger = logging.get_logger(f"{self.__class__.__name__} - {self.symbol}")
 
     # candle functions
+    def set_derived_time_frames(self, base_time_frame, derived_time_frames):
+        """
+        Builds derived_time_frames candles and klines from base_time_frame ones
+        :param base_time_frame: the time frame to aggregate candles from
+        :param derived_time_frames: time frames which candles are exact aggregations of base_time_frame candles
+        """
+        self.derivation_base_time_frame = base_time_frame if derived_time_frames else None
+        self.candles_aggregators = {
+            time_frame: candles_aggregator.CandlesAggregator(base_time_frame, time_frame)
+            for time_frame in derived_time_frames
+        }
+        if base_time_frame in self.symbol_candles:
+            base_candles = self.symbol_candles[base_time_frame].get_candles()
+            for aggregator in self.candles_aggregators.values():
+                aggregator.initialize(base_candles)
+
     async def handle_candles_update(self, time_frame, new_symbol_candles_data, replace_all=False, partial=False):
+        """
+        :return: the derived time frames candles completed by this update, by time frame
+        """
         try:
             symbol_candles = self.symbol_candles[time_frame]
         except KeyError:
@@ -68,7 +91,9 @@ class ExchangeSymbolData:
                 commons_enums.InitializationEventExchangeTopics.CANDLES.value,
                 time_frame.value
             )
-            return
+            if replace_all:
+                return self._update_derived_candles(time_frame, new_symbol_candles_data, True)
+            return {}
 
         if partial:
             symbol_candles.add_old_and_new_candles(new_symbol_candles_data)
@@ -76,6 +101,28 @@ class ExchangeSymbolData:
             symbol_candles.replace_all_candles(new_symbol_candles_data)
         else:
             symbol_candles.add_new_candle(new_symbol_candles_data)
+        return self._update_derived_candles(time_frame, new_symbol_candles_data, replace_all)
+
+    def _update_derived_candles(self, time_frame, new_symbol_candles_data, replace_all):
+        if time_frame is not self.derivation_base_time_frame or not new_symbol_candles_data:
+            return {}
+        base_candles = new_symbol_candles_data if isinstance(new_symbol_candles_data[-1], list) \
+            else [new_symbol_candles_data]
+        if replace_all:
+            for aggregator in self.candles_aggregators.values():
+                aggregator.initialize(base_candles)
+            return {}
+        derived_candles = {}
+        for derived_time_frame, aggregator in self.candles_aggregators.items():
+            completed_candles = aggregator.add_candles(base_candles)
+            if completed_candles:
+                try:
+                    self.symbol_candles[derived_time_frame].add_candles(completed_candles)
+                except KeyError:
+                    # derived time frame candles history is not initialized yet
+                    continue
+                derived_candles[derived_time_frame] = completed_candles
+        return derived_candles
 
     def handle_recent_trade_update(self, recent_trades, replace_all=False):
         if replace_all:
@@ -114,6 +161,9 @@ class ExchangeSymbolData:
         if trigger_init_event:
             self._set_initialized_event(commons_enums.InitializationEventExchangeTopics.ORDER_BOOK.value)
 
+    def handle_order_book_delta(self, asks, bids):
+        self.order_book_manager.handle_book_level_deltas(asks, bids)
+
     def handle_order_book_ticker_update(self, ask_quantity, ask_price, bid_quantity, bid_price):
         self.order_book_manager.order_book_ticker_update(ask_quantity, ask_price, bid_quantity, bid_price)
 
@@ -124,6 +174,20 @@ class ExchangeSymbolData:
         self.ticker_manager.mini_ticker_update(mini_ticker)
 
     async def handle_kline_update(self, time_frame, kline):
+        """
+        :return: the derived time frames klines updated by this kline, by time frame
+        """
+        await self._update_kline(time_frame, kline)
+        derived_klines = {}
+        if time_frame is self.derivation_base_time_frame:
+            for derived_time_frame, aggregator in self.candles_aggregators.items():
+                derived_kline = aggregator.get_kline(kline)
+                if derived_kline is not None:
+                    await self._update_kline(derived_time_frame, derived_kline)
+                    derived_klines[derived_time_frame] = derived_kline
+        return derived_klines
+
+    async def _update_kline(self, time_frame, kline):
         try:
             symbol_klines = self.symbol_klines[time_frame]
         except KeyError:
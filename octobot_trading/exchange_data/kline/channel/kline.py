@@ -26,14 +26,22 @@ class KlineProducer(exchanges_channel.ExchangeChannelProducer):
 
     async def perform(self, time_frame, symbol, kline):
         try:
-            if self.channel.get_filtered_consumers(symbol=constants.CHANNEL_WILDCARD) or \
+            symbol_data = self.channel.exchange_manager.get_symbol_data(symbol)
+            # derived time frames klines are built from this time frame ones
+            if time_frame is symbol_data.derivation_base_time_frame or \
+                    self.channel.get_filtered_consumers(symbol=constants.CHANNEL_WILDCARD) or \
                     self.channel.get_filtered_consumers(symbol=symbol, time_frame=time_frame.value):
-                await self.channel.exchange_manager.get_symbol_data(symbol).handle_kline_update(time_frame, kline)
-                await self.send(cryptocurrency=self.channel.exchange_manager.exchange.
-                                get_pair_cryptocurrency(symbol),
+                derived_klines = await symbol_data.handle_kline_update(time_frame, kline)
+                cryptocurrency = self.channel.exchange_manager.exchange.get_pair_cryptocurrency(symbol)
+                await self.send(cryptocurrency=cryptocurrency,
                                 symbol=symbol,
                                 time_frame=time_frame.value,
                                 kline=kline)
+                for derived_time_frame, derived_kline in derived_klines.items():
+                    await self.send(cryptocurrency=cryptocurrency,
+                                    symbol=symbol,
+                                    time_frame=derived_time_frame.value,
+                                    kline=derived_kline)
         except KeyError:
             pass
         except asyncio.CancelledError:
@@ -20,3 +20,5 @@ cimport octobot_trading.exchange_data.kline.channel.kline as kline_channel
 cdef class KlineUpdater(kline_channel.KlineProducer):
     cdef list tasks
     cdef int refresh_time
+
+    cdef list _get_refreshed_time_frames(self)
@@ -48,7 +48,16 @@ class KlineUpdater(kline_channel.KlineProducer):
         else:
             self.tasks = [
                 asyncio.create_task(self.time_frame_watcher(time_frame))
-                for time_frame in self.channel.exchange_manager.exchange_config.traded_time_frames]
+                for time_frame in self._get_refreshed_time_frames()]
+
+    def _get_refreshed_time_frames(self):
+        # derived time frames klines are built from the shortest time frame klines
+        derived_time_frames = self.channel.exchange_manager.exchange_config.get_derived_time_frames()
+        return [
+            time_frame
+            for time_frame in self.channel.exchange_manager.exchange_config.traded_time_frames
+            if time_frame not in derived_time_frames
+        ]
 
     async def time_frame_watcher(self, time_frame):
         """
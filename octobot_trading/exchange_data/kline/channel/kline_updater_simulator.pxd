@@ -25,5 +25,6 @@ cdef class KlineUpdaterSimulator(kline_updater.KlineUpdater):
     cdef str exchange_name
 
     cdef double last_timestamp_pushed
+    cdef list refreshed_time_frames
 
     cdef public consumer.Consumer time_consumer
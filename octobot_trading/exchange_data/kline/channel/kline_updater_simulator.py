@@ -30,13 +30,15 @@ class KlineUpdaterSimulator(kline_updater.KlineUpdater):
 
         self.last_timestamp_pushed = 0
         self.time_consumer = None
+        self.refreshed_time_frames = []
 
     async def start(self):
+        self.refreshed_time_frames = self._get_refreshed_time_frames()
         await self.resume()
 
     async def handle_timestamp(self, timestamp, **kwargs):
         try:
-            for time_frame in self.channel.exchange_manager.exchange_config.traded_time_frames:
+            for time_frame in self.refreshed_time_frames:
                 for pair in self.channel.exchange_manager.exchange_config.traded_symbol_pairs:
                     kline_data = await self.exchange_data_importer.get_kline_from_timestamps(
                         exchange_name=self.exchange_name,
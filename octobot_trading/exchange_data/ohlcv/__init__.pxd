@@ -16,6 +16,7 @@
 
 from octobot_trading.exchange_data.ohlcv cimport candles_manager
 from octobot_trading.exchange_data.ohlcv cimport candles_adapter
+from octobot_trading.exchange_data.ohlcv cimport candles_aggregator
 from octobot_trading.exchange_data.ohlcv cimport channel
 
 from octobot_trading.exchange_data.ohlcv.candles_manager cimport (
@@ -28,9 +29,16 @@ from octobot_trading.exchange_data.ohlcv.candles_adapter cimport (
     get_symbol_low_candles,
     get_symbol_volume_candles,
     get_symbol_time_candles,
+    get_symbol_ohlcv,
+)
+from octobot_trading.exchange_data.ohlcv.candles_aggregator cimport (
+    CandlesAggregator,
+    is_derivable_time_frame,
+    get_derivable_time_frames,
 )
 from octobot_trading.exchange_data.ohlcv.channel cimport (
     OHLCVUpdaterSimulator,
+    OHLCVRefreshScheduler,
     OHLCVProducer,
     OHLCVChannel,
 )
@@ -46,8 +54,13 @@ __all__ = [
     "get_symbol_low_candles",
     "get_symbol_volume_candles",
     "get_symbol_time_candles",
+    "get_symbol_ohlcv",
+    "CandlesAggregator",
+    "is_derivable_time_frame",
+    "get_derivable_time_frames",
     "OHLCVUpdaterSimulator",
     "OHLCVProducer",
     "OHLCVChannel",
     "OHLCVUpdater",
+    "OHLCVRefreshScheduler",
 ]
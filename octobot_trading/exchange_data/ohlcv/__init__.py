@@ -16,6 +16,7 @@
 
 from octobot_trading.exchange_data.ohlcv import candles_manager
 from octobot_trading.exchange_data.ohlcv import candles_adapter
+from octobot_trading.exchange_data.ohlcv import candles_aggregator
 from octobot_trading.exchange_data.ohlcv import channel
 
 from octobot_trading.exchange_data.ohlcv.candles_manager import (
@@ -28,10 +29,17 @@ from octobot_trading.exchange_data.ohlcv.candles_adapter import (
     get_symbol_low_candles,
     get_symbol_volume_candles,
     get_symbol_time_candles,
+    get_symbol_ohlcv,
     get_candle_as_list,
 )
+from octobot_trading.exchange_data.ohlcv.candles_aggregator import (
+    CandlesAggregator,
+    is_derivable_time_frame,
+    get_derivable_time_frames,
+)
 from octobot_trading.exchange_data.ohlcv.channel import (
     OHLCVUpdaterSimulator,
+    OHLCVRefreshScheduler,
     OHLCVProducer,
     OHLCVChannel,
 )
@@ -47,9 +55,14 @@ __all__ = [
     "get_symbol_low_candles",
     "get_symbol_volume_candles",
     "get_symbol_time_candles",
+    "get_symbol_ohlcv",
     "get_candle_as_list",
+    "CandlesAggregator",
+    "is_derivable_time_frame",
+    "get_derivable_time_frames",
     "OHLCVUpdaterSimulator",
     "OHLCVProducer",
     "OHLCVChannel",
     "OHLCVUpdater",
+    "OHLCVRefreshScheduler",
 ]
@@ -25,5 +25,7 @@ cpdef np.ndarray get_symbol_high_candles(exchange_symbol_data.ExchangeSymbolData
 cpdef np.ndarray get_symbol_low_candles(exchange_symbol_data.ExchangeSymbolData symbol_data, str time_frame, int limit, bint include_in_construction)
 cpdef np.ndarray get_symbol_volume_candles(exchange_symbol_data.ExchangeSymbolData symbol_data, str time_frame, int limit, bint include_in_construction)
 cpdef np.ndarray get_symbol_time_candles(exchange_symbol_data.ExchangeSymbolData symbol_data, str time_frame, int limit, bint include_in_construction)
+cpdef np.ndarray get_symbol_ohlcv(exchange_symbol_data.ExchangeSymbolData symbol_data, str time_frame, int limit, bint include_in_construction)
 
-cdef np.ndarray _add_in_construction_data(np.ndarray candles, exchange_symbol_data.ExchangeSymbolData symbol_data, object time_frame, int data_type)
\ No newline at end of file
+cdef np.ndarray _add_in_construction_data(np.ndarray candles, exchange_symbol_data.ExchangeSymbolData symbol_data, object time_frame, int data_type)
+cdef np.ndarray _shift_with_last_value(np.ndarray candles, object last_value)
@@ -15,7 +15,6 @@
 #  License along with this library.
 import numpy as np
 
-import octobot_commons.data_util as data_util
 import octobot_commons.enums as enums
 
 
@@ -23,7 +22,7 @@ def get_symbol_close_candles(symbol_data, time_frame, limit, include_in_construc
     tf = enums.TimeFrames(time_frame)
     if include_in_construction:
         return _add_in_construction_data(
-            symbol_data.symbol_candles[tf].get_symbol_close_candles(limit),
+            symbol_data.symbol_candles[tf].get_symbol_close_candles(limit, copy=False),
             symbol_data,
             tf,
             enums.PriceIndexes.IND_PRICE_CLOSE.value)
@@ -34,7 +33,7 @@ def get_symbol_open_candles(symbol_data, time_frame, limit, include_in_construct
     tf = enums.TimeFrames(time_frame)
     if include_in_construction:
         return _add_in_construction_data(
-            symbol_data.symbol_candles[tf].get_symbol_open_candles(limit),
+            symbol_data.symbol_candles[tf].get_symbol_open_candles(limit, copy=False),
             symbol_data,
             tf,
             enums.PriceIndexes.IND_PRICE_OPEN.value)
@@ -45,7 +44,7 @@ def get_symbol_high_candles(symbol_data, time_frame, limit, include_in_construct
     tf = enums.TimeFrames(time_frame)
     if include_in_construction:
         return _add_in_construction_data(
-            symbol_data.symbol_candles[tf].get_symbol_high_candles(limit),
+            symbol_data.symbol_candles[tf].get_symbol_high_candles(limit, copy=False),
             symbol_data,
             tf,
             enums.PriceIndexes.IND_PRICE_HIGH.value)
@@ -56,7 +55,7 @@ def get_symbol_low_candles(symbol_data, time_frame, limit, include_in_constructi
     tf = enums.TimeFrames(time_frame)
     if include_in_construction:
         return _add_in_construction_data(
-            symbol_data.symbol_candles[tf].get_symbol_low_candles(limit),
+            symbol_data.symbol_candles[tf].get_symbol_low_candles(limit, copy=False),
             symbol_data,
             tf,
             enums.PriceIndexes.IND_PRICE_LOW.value)
@@ -67,7 +66,7 @@ def get_symbol_volume_candles(symbol_data, time_frame, limit, include_in_constru
     tf = enums.TimeFrames(time_frame)
     if include_in_construction:
         return _add_in_construction_data(
-            symbol_data.symbol_candles[tf].get_symbol_volume_candles(limit),
+            symbol_data.symbol_candles[tf].get_symbol_volume_candles(limit, copy=False),
             symbol_data,
             tf,
             enums.PriceIndexes.IND_PRICE_VOL.value)
@@ -78,13 +77,29 @@ def get_symbol_time_candles(symbol_data, time_frame, limit, include_in_construct
     tf = enums.TimeFrames(time_frame)
     if include_in_construction:
         return _add_in_construction_data(
-            symbol_data.symbol_candles[tf].get_symbol_time_candles(limit),
+            symbol_data.symbol_candles[tf].get_symbol_time_candles(limit, copy=False),
             symbol_data,
             tf,
             enums.PriceIndexes.IND_PRICE_TIME.value)
     return symbol_data.symbol_candles[tf].get_symbol_time_candles(limit)
 
 
+def get_symbol_ohlcv(symbol_data, time_frame, limit, include_in_construction):
+    """
+    :return: a 2D array of every candles values: rows are enums.PriceIndexes values, columns are candles.
+    When include_in_construction is True, the in construction candle replaces the oldest candle as last candle
+    """
+    tf = enums.TimeFrames(time_frame)
+    if include_in_construction:
+        try:
+            in_construction_candle = symbol_data.symbol_klines[tf].kline
+        except KeyError:
+            return symbol_data.symbol_candles[tf].get_symbol_ohlcv(limit)
+        return _shift_with_last_value(symbol_data.symbol_candles[tf].get_symbol_ohlcv(limit, copy=False),
+                                      in_construction_candle)
+    return symbol_data.symbol_candles[tf].get_symbol_ohlcv(limit)
+
+
 def get_candle_as_list(candle_arrays_dict: dict, candle_index: int) -> list:
     candle = [None] * len(enums.PriceIndexes)
     candle[enums.PriceIndexes.IND_PRICE_TIME.value] = candle_arrays_dict[enums.PriceIndexes.IND_PRICE_TIME.value][candle_index]
@@ -98,8 +113,16 @@ def get_candle_as_list(candle_arrays_dict: dict, candle_index: int) -> list:
 
 def _add_in_construction_data(candles, symbol_data, time_frame, data_type):
     try:
-        return np.array(data_util.shift_value_array(candles,
-                                                    fill_value=symbol_data.symbol_klines[time_frame].kline[data_type]),
-                        dtype=np.float64)
+        in_construction_value = symbol_data.symbol_klines[time_frame].kline[data_type]
     except KeyError:
-        return candles
+        return np.array(candles)
+    return _shift_with_last_value(candles, in_construction_value)
+
+
+def _shift_with_last_value(candles, last_value):
+    # copy candles shifted by one candle in a single allocation, candles can be a read-only view
+    shifted_candles = np.empty_like(candles, dtype=np.float64)
+    if candles.shape[-1]:
+        shifted_candles[..., :-1] = candles[..., 1:]
+        shifted_candles[..., -1] = last_value
+    return shifted_candles
@@ -0,0 +1,38 @@
+# cython: language_level=3
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+cdef class CandlesAggregator:
+    cdef public object base_time_frame
+    cdef public object time_frame
+    cdef public double base_time_frame_seconds
+    cdef public double time_frame_seconds
+
+    cdef public object candle_start_time
+    cdef public list candle
+    cdef public object last_base_candle_time
+
+    cpdef void reset(self)
+    cpdef void initialize(self, list base_candles)
+    cpdef list add_candles(self, object base_candles)
+    cpdef object get_kline(self, object base_kline)
+
+    cdef void _add_candle(self, object base_candle, list completed_candles)
+    cdef bint _is_tracked_from_start(self, object base_candle_time, object candle_start_time)
+    cdef object _get_candle_start_time(self, object base_candle_time)
+
+cpdef bint is_derivable_time_frame(object base_time_frame, object time_frame)
+cpdef list get_derivable_time_frames(object base_time_frame, object time_frames)
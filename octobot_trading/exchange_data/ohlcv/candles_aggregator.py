@@ -0,0 +1,167 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import octobot_commons.constants as commons_constants
+import octobot_commons.enums as enums
+
+TIME_INDEX = enums.PriceIndexes.IND_PRICE_TIME.value
+OPEN_INDEX = enums.PriceIndexes.IND_PRICE_OPEN.value
+HIGH_INDEX = enums.PriceIndexes.IND_PRICE_HIGH.value
+LOW_INDEX = enums.PriceIndexes.IND_PRICE_LOW.value
+CLOSE_INDEX = enums.PriceIndexes.IND_PRICE_CLOSE.value
+VOLUME_INDEX = enums.PriceIndexes.IND_PRICE_VOL.value
+PRICE_INDEXES_COUNT = len(enums.PriceIndexes)
+# exchanges candles of a time frame dividing a day start at a multiple of this time frame since epoch
+ONE_DAY_MINUTES = enums.TimeFramesMinutes[enums.TimeFrames.ONE_DAY]
+
+
+class CandlesAggregator:
+    """
+    Incrementally builds time_frame candles from the closed base_time_frame candles they are made of.
+    A time_frame candle is only built when its base_time_frame candles are known from its first one, which makes
+    built candles identical to the exchange ones.
+    Base candles missing between given base candles are considered as missing on exchange (no trade during this
+    time): time_frame candles are built without them, as exchanges do. A time_frame candle which last base candles
+    are missing is completed when the first base candle of a next time_frame candle is given.
+    """
+    def __init__(self, base_time_frame, time_frame):
+        self.base_time_frame = base_time_frame
+        self.time_frame = time_frame
+        self.base_time_frame_seconds = enums.TimeFramesMinutes[base_time_frame] * commons_constants.MINUTE_TO_SECONDS
+        self.time_frame_seconds = enums.TimeFramesMinutes[time_frame] * commons_constants.MINUTE_TO_SECONDS
+
+        # open time of the time_frame candle the last given base candle belongs to
+        self.candle_start_time = None
+        # time_frame candle being built, None when its first base candles have not been given
+        self.candle = None
+        # open time of the last given base candle
+        self.last_base_candle_time = None
+
+    def reset(self):
+        self.candle_start_time = None
+        self.candle = None
+        self.last_base_candle_time = None
+
+    def initialize(self, base_candles):
+        """
+        Resets the aggregation state from the given base candles history
+        :param base_candles: chronologically ordered closed base candles
+        """
+        self.reset()
+        if not base_candles:
+            return
+        # only the base candles of the last time_frame candle are required
+        last_candle_start_time = self._get_candle_start_time(base_candles[-1][TIME_INDEX])
+        first_index = len(base_candles) - 1
+        while first_index > 0 and base_candles[first_index - 1][TIME_INDEX] >= last_candle_start_time:
+            first_index -= 1
+        if first_index > 0:
+            # previous base candles have been given: the last time_frame candle is complete
+            self.last_base_candle_time = base_candles[first_index - 1][TIME_INDEX]
+        self.add_candles(base_candles[first_index:])
+
+    def add_candles(self, base_candles):
+        """
+        :param base_candles: chronologically ordered closed base candles
+        :return: the list of time_frame candles completed by the given base candles
+        """
+        completed_candles = []
+        for base_candle in base_candles:
+            self._add_candle(base_candle, completed_candles)
+        return completed_candles
+
+    def get_kline(self, base_kline):
+        """
+        :param base_kline: the in construction base candle
+        :return: the in construction time_frame candle including base_kline, None when it can't be built
+        """
+        base_kline_time = base_kline[TIME_INDEX]
+        candle_start_time = self._get_candle_start_time(base_kline_time)
+        if base_kline_time == candle_start_time:
+            return self._create_candle(candle_start_time, base_kline)
+        if self.candle is not None and self.candle_start_time == candle_start_time \
+                and self.last_base_candle_time < base_kline_time:
+            kline = list(self.candle)
+            self._update_candle(kline, base_kline)
+            return kline
+        return None
+
+    def _add_candle(self, base_candle, completed_candles):
+        base_candle_time = base_candle[TIME_INDEX]
+        if self.last_base_candle_time is not None and base_candle_time <= self.last_base_candle_time:
+            # already aggregated
+            return
+        candle_start_time = self._get_candle_start_time(base_candle_time)
+        if candle_start_time != self.candle_start_time:
+            if self.candle is not None:
+                # the last base candles of the previous candle are missing on exchange: they will never be given
+                completed_candles.append(self.candle)
+            self.candle_start_time = candle_start_time
+            self.candle = self._create_candle(candle_start_time, base_candle) \
+                if self._is_tracked_from_start(base_candle_time, candle_start_time) else None
+        elif self.candle is not None:
+            self._update_candle(self.candle, base_candle)
+        self.last_base_candle_time = base_candle_time
+        if self.candle is not None and \
+                base_candle_time + self.base_time_frame_seconds >= candle_start_time + self.time_frame_seconds:
+            # last base candle of the candle
+            completed_candles.append(self.candle)
+            self.candle = None
+
+    def _is_tracked_from_start(self, base_candle_time, candle_start_time):
+        # when a previous base candle has been given, no base candle of this candle can be missing
+        return self.last_base_candle_time is not None or base_candle_time == candle_start_time
+
+    def _get_candle_start_time(self, base_candle_time):
+        return base_candle_time - base_candle_time % self.time_frame_seconds
+
+    @staticmethod
+    def _create_candle(candle_start_time, base_candle):
+        candle = [0] * PRICE_INDEXES_COUNT
+        candle[TIME_INDEX] = candle_start_time
+        candle[OPEN_INDEX] = base_candle[OPEN_INDEX]
+        candle[HIGH_INDEX] = base_candle[HIGH_INDEX]
+        candle[LOW_INDEX] = base_candle[LOW_INDEX]
+        candle[CLOSE_INDEX] = base_candle[CLOSE_INDEX]
+        candle[VOLUME_INDEX] = base_candle[VOLUME_INDEX]
+        return candle
+
+    @staticmethod
+    def _update_candle(candle, base_candle):
+        if base_candle[HIGH_INDEX] > candle[HIGH_INDEX]:
+            candle[HIGH_INDEX] = base_candle[HIGH_INDEX]
+        if base_candle[LOW_INDEX] < candle[LOW_INDEX]:
+            candle[LOW_INDEX] = base_candle[LOW_INDEX]
+        candle[CLOSE_INDEX] = base_candle[CLOSE_INDEX]
+        candle[VOLUME_INDEX] += base_candle[VOLUME_INDEX]
+
+
+def is_derivable_time_frame(base_time_frame, time_frame):
+    """
+    :return: True when time_frame candles are exact aggregations of base_time_frame candles
+    """
+    base_time_frame_minutes = enums.TimeFramesMinutes[base_time_frame]
+    time_frame_minutes = enums.TimeFramesMinutes[time_frame]
+    return time_frame_minutes > base_time_frame_minutes \
+        and time_frame_minutes % base_time_frame_minutes == 0 \
+        and ONE_DAY_MINUTES % time_frame_minutes == 0
+
+
+def get_derivable_time_frames(base_time_frame, time_frames):
+    return [
+        time_frame
+        for time_frame in time_frames
+        if is_derivable_time_frame(base_time_frame, time_frame)
+    ]
@@ -24,12 +24,9 @@ cdef class CandlesManager(util.Initializable):
     cdef public bint candles_initialized
     cdef public int max_candles_count
 
-    cdef public np.float64_t[::1] close_candles
-    cdef public np.float64_t[::1] open_candles
-    cdef public np.float64_t[::1] high_candles
-    cdef public np.float64_t[::1] low_candles
-    cdef public np.float64_t[::1] time_candles
-    cdef public np.float64_t[::1] volume_candles
+    cdef public np.ndarray candles
+    cdef public int candles_start_index
+    cdef set stored_candles_times
 
     cdef public int close_candles_index
     cdef public int open_candles_index
@@ -40,24 +37,31 @@ cdef class CandlesManager(util.Initializable):
 
     cdef public bint reached_max
 
-    cpdef np.ndarray get_symbol_close_candles(self, int limit=*)
-    cpdef np.ndarray get_symbol_open_candles(self, int limit=*)
-    cpdef np.ndarray get_symbol_high_candles(self, int limit=*)
-    cpdef np.ndarray get_symbol_low_candles(self, int limit=*)
-    cpdef np.ndarray get_symbol_time_candles(self, int limit=*)
-    cpdef np.ndarray get_symbol_volume_candles(self, int limit=*)
+    cpdef np.ndarray get_symbol_close_candles(self, int limit=*, bint copy=*)
+    cpdef np.ndarray get_symbol_open_candles(self, int limit=*, bint copy=*)
+    cpdef np.ndarray get_symbol_high_candles(self, int limit=*, bint copy=*)
+    cpdef np.ndarray get_symbol_low_candles(self, int limit=*, bint copy=*)
+    cpdef np.ndarray get_symbol_time_candles(self, int limit=*, bint copy=*)
+    cpdef np.ndarray get_symbol_volume_candles(self, int limit=*, bint copy=*)
 
-    cpdef dict get_symbol_prices(self, object limit=*)
+    cpdef np.ndarray get_symbol_ohlcv(self, int limit=*, bint copy=*)
+    cpdef dict get_symbol_prices(self, object limit=*, bint copy=*)
     cpdef list get_candles(self, object limit=*)
     cpdef void add_old_and_new_candles(self, list candles_data)
     cpdef void add_new_candle(self, list new_candle_data)
+    cpdef void add_candles(self, object candles_data)
     cpdef void replace_all_candles(self, list all_candles_data)
 
     # private
     cdef void _set_all_candles(self, object new_candles_data)
+    cdef void _append_candles(self, np.ndarray new_candles)
+    cdef void _set_candles_count(self, int candles_count)
     cdef void _change_current_candle(self)
     cdef bint _should_add_new_candle(self, new_open_time)
     cdef void _check_max_candles(self)
     cdef object _inc_candle_index(self)
     cdef void _reset_candles(self)
-    cdef np.ndarray _extract_limited_data(self, np.float64_t[::1] data, int limit=*, int max_limit=*)
+    cdef int _get_stored_candles_count(self)
+    cdef np.ndarray _get_window(self, int price_index)
+    cdef np.ndarray _get_limited_candles(self, int limit=*, bint copy=*, int price_index=*)
+    cdef np.ndarray _extract_limited_data(self, int price_index, int limit=*, bint copy=*)
@@ -15,14 +15,22 @@
 #  License along with this library.
 import numpy as np
 
-import octobot_commons.data_util as data_util
 import octobot_commons.enums as enums
 import octobot_commons.logging as logging
 
 import octobot_trading.util as util
 
+PRICE_INDEXES_COUNT = len(enums.PriceIndexes)
+
 
 class CandlesManager(util.Initializable):
+    """
+    Stores the latest max_candles_count candles into a single (price index x 2 * max_candles_count) buffer.
+    Candles are appended in O(1) amortized time: when the buffer is full, the candles window is moved one
+    column forward instead of shifting every data array, and is copied back at the beginning of the buffer
+    once its end is reached (every max_candles_count new candles).
+    Stored candles open times are also kept in a set to check for already stored candles in O(1).
+    """
     MAX_CANDLES_COUNT = 1000
 
     def __init__(self, max_candles_count=None):
@@ -41,12 +49,12 @@ class CandlesManager(util.Initializable):
         self.time_candles_index = 0
         self.volume_candles_index = 0
 
-        self.close_candles = None
-        self.open_candles = None
-        self.high_candles = None
-        self.low_candles = None
-        self.time_candles = None
-        self.volume_candles = None
+        # rows are enums.PriceIndexes values, columns are candles
+        self.candles = None
+        # index of the first candle of the max_candles_count candles window in self.candles
+        self.candles_start_index = 0
+        # open times of the stored candles
+        self.stored_candles_times = set()
 
         self.reached_max = False
         self._reset_candles()
@@ -65,62 +73,82 @@ class CandlesManager(util.Initializable):
         self.time_candles_index = 0
         self.volume_candles_index = 0
 
-        self.close_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.open_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.high_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.low_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.time_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.volume_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
+        self.candles = np.full((PRICE_INDEXES_COUNT, 2 * self.max_candles_count),
+                               fill_value=np.nan, dtype=np.float64)
+        self.candles_start_index = 0
+        self.stored_candles_times = set()
+
+    # candles window (max_candles_count values, not stored candles being nan) views, kept for compatibility
+    @property
+    def close_candles(self):
+        return self._get_window(enums.PriceIndexes.IND_PRICE_CLOSE.value)
+
+    @property
+    def open_candles(self):
+        return self._get_window(enums.PriceIndexes.IND_PRICE_OPEN.value)
+
+    @property
+    def high_candles(self):
+        return self._get_window(enums.PriceIndexes.IND_PRICE_HIGH.value)
+
+    @property
+    def low_candles(self):
+        return self._get_window(enums.PriceIndexes.IND_PRICE_LOW.value)
+
+    @property
+    def time_candles(self):
+        return self._get_window(enums.PriceIndexes.IND_PRICE_TIME.value)
+
+    @property
+    def volume_candles(self):
+        return self._get_window(enums.PriceIndexes.IND_PRICE_VOL.value)
 
     # getters
     def get_symbol_candles_count(self):
         return self.time_candles_index
 
-    def get_symbol_close_candles(self, limit=-1):
-        return self._extract_limited_data(self.close_candles, limit, max_limit=self.close_candles_index)
+    def get_symbol_close_candles(self, limit=-1, copy=True):
+        return self._extract_limited_data(enums.PriceIndexes.IND_PRICE_CLOSE.value, limit, copy)
+
+    def get_symbol_open_candles(self, limit=-1, copy=True):
+        return self._extract_limited_data(enums.PriceIndexes.IND_PRICE_OPEN.value, limit, copy)
 
-    def get_symbol_open_candles(self, limit=-1):
-        return self._extract_limited_data(self.open_candles, limit, max_limit=self.open_candles_index)
+    def get_symbol_high_candles(self, limit=-1, copy=True):
+        return self._extract_limited_data(enums.PriceIndexes.IND_PRICE_HIGH.value, limit, copy)
 
-    def get_symbol_high_candles(self, limit=-1):
-        return self._extract_limited_data(self.high_candles, limit, max_limit=self.high_candles_index)
+    def get_symbol_low_candles(self, limit=-1, copy=True):
+        return self._extract_limited_data(enums.PriceIndexes.IND_PRICE_LOW.value, limit, copy)
 
-    def get_symbol_low_candles(self, limit=-1):
-        return self._extract_limited_data(self.low_candles, limit, max_limit=self.low_candles_index)
+    def get_symbol_time_candles(self, limit=-1, copy=True):
+        return self._extract_limited_data(enums.PriceIndexes.IND_PRICE_TIME.value, limit, copy)
 
-    def get_symbol_time_candles(self, limit=-1):
-        return self._extract_limited_data(self.time_candles, limit, max_limit=self.time_candles_index)
+    def get_symbol_volume_candles(self, limit=-1, copy=True):
+        return self._extract_limited_data(enums.PriceIndexes.IND_PRICE_VOL.value, limit, copy)
 
-    def get_symbol_volume_candles(self, limit=-1):
-        return self._extract_limited_data(self.volume_candles, limit, max_limit=self.volume_candles_index)
+    def get_symbol_ohlcv(self, limit=-1, copy=True):
+        """
+        :param limit: max number of candles to return, -1 for all
+        :param copy: when True, returns a copy of the candles,
+        when False, returns a read-only view on the stored candles that is valid until the next update
+        :return: a 2D array of candles values: rows are enums.PriceIndexes values, columns are candles
+        """
+        return self._get_limited_candles(limit, copy)
 
-    def get_symbol_prices(self, limit=-1):
+    def get_symbol_prices(self, limit=-1, copy=True):
+        """
+        :param limit: max number of candles to return, -1 for all
+        :param copy: when True, every price index array is a view on a single copy of the candles,
+        when False, arrays are read-only views on the stored candles that are valid until the next update
+        :return: a dict of price index: candles values
+        """
+        candles = self._get_limited_candles(limit, copy)
         return {
-            enums.PriceIndexes.IND_PRICE_CLOSE.value: self.get_symbol_close_candles(limit),
-            enums.PriceIndexes.IND_PRICE_OPEN.value: self.get_symbol_open_candles(limit),
-            enums.PriceIndexes.IND_PRICE_HIGH.value: self.get_symbol_high_candles(limit),
-            enums.PriceIndexes.IND_PRICE_LOW.value: self.get_symbol_low_candles(limit),
-            enums.PriceIndexes.IND_PRICE_VOL.value: self.get_symbol_volume_candles(limit),
-            enums.PriceIndexes.IND_PRICE_TIME.value: self.get_symbol_time_candles(limit)
+            price_index.value: candles[price_index.value]
+            for price_index in enums.PriceIndexes
         }
 
     def get_candles(self, limit=-1):
-        candles_size = self.close_candles_index if limit == -1 else limit
-        candles = [[]] * candles_size
-        iter_range = range(self.close_candles_index) if limit == -1 \
-            else range(self.close_candles_index-limit, self.close_candles_index)
-        candles_index = 0
-        for index in iter_range:
-            candle = [0] * len(enums.PriceIndexes)
-            candle[enums.PriceIndexes.IND_PRICE_CLOSE.value] = self.close_candles[index]
-            candle[enums.PriceIndexes.IND_PRICE_OPEN.value] = self.open_candles[index]
-            candle[enums.PriceIndexes.IND_PRICE_HIGH.value] = self.high_candles[index]
-            candle[enums.PriceIndexes.IND_PRICE_LOW.value] = self.low_candles[index]
-            candle[enums.PriceIndexes.IND_PRICE_VOL.value] = self.volume_candles[index]
-            candle[enums.PriceIndexes.IND_PRICE_TIME.value] = self.time_candles[index]
-            candles[candles_index] = candle
-            candles_index += 1
-        return candles
+        return self._get_limited_candles(limit, False).T.tolist()
 
     def replace_all_candles(self, all_candles_data):
         self._reset_candles()
@@ -133,15 +161,29 @@ class CandlesManager(util.Initializable):
         :param candles_data: new candles data
         :return:
         """
-        # check old candles
-        for old_candle in candles_data[:-1]:
-            if old_candle[enums.PriceIndexes.IND_PRICE_TIME.value] not in self.time_candles:
-                self.add_new_candle(old_candle)
+        if len(candles_data) == 0:
+            self.logger.error(f"Fail to add last candle {candles_data} : no candle to add")
+            return
+        self.add_candles(candles_data)
 
+    def add_candles(self, candles_data):
+        """
+        Adds at once every given candle that is not already stored, in the given order
+        :param candles_data: list or 2D array of candles
+        :return:
+        """
         try:
-            self.add_new_candle(candles_data[-1])
-        except IndexError as e:
-            self.logger.error(f"Fail to add last candle {candles_data} : {e}")
+            new_candles = np.array(candles_data, dtype=np.float64, ndmin=2)[:, :PRICE_INDEXES_COUNT]
+        except (TypeError, ValueError) as e:
+            self.logger.error(f"Fail to add new candles {candles_data} : {e}")
+            return
+        added_candles_times = set()
+        is_new_candle = np.zeros(len(new_candles), dtype=bool)
+        for candle_index, candle_time in enumerate(new_candles[:, enums.PriceIndexes.IND_PRICE_TIME.value].tolist()):
+            if self._should_add_new_candle(candle_time) and candle_time not in added_candles_times:
+                added_candles_times.add(candle_time)
+                is_new_candle[candle_index] = True
+        self._append_candles(new_candles[is_new_candle])
 
     def add_new_candle(self, new_candle_data):
         """
@@ -151,12 +193,9 @@ class CandlesManager(util.Initializable):
         if self._should_add_new_candle(new_candle_data[enums.PriceIndexes.IND_PRICE_TIME.value]):
             try:
                 self._check_max_candles()
-                self.close_candles[self.close_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_CLOSE.value]
-                self.open_candles[self.open_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_OPEN.value]
-                self.high_candles[self.high_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_HIGH.value]
-                self.low_candles[self.low_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_LOW.value]
-                self.time_candles[self.time_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_TIME.value]
-                self.volume_candles[self.volume_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_VOL.value]
+                self.candles[:, self.candles_start_index + self.time_candles_index] = \
+                    new_candle_data[:PRICE_INDEXES_COUNT]
+                self.stored_candles_times.add(new_candle_data[enums.PriceIndexes.IND_PRICE_TIME.value])
                 self._inc_candle_index()
             except IndexError as e:
                 self.logger.error(f"Fail to add new candle {new_candle_data} : {e}")
@@ -164,21 +203,59 @@ class CandlesManager(util.Initializable):
     # private
     def _set_all_candles(self, new_candles_data):
         if isinstance(new_candles_data[-1], list):
-            for candle_data in new_candles_data:
-                self.add_new_candle(candle_data)
+            self.add_candles(new_candles_data)
         else:
             self.add_new_candle(new_candles_data)
 
+    def _append_candles(self, new_candles):
+        added_candles_count = min(len(new_candles), self.max_candles_count)
+        if added_candles_count == 0:
+            return
+        new_candles = new_candles[-added_candles_count:]
+        stored_candles_count = self._get_stored_candles_count()
+        kept_candles_count = min(stored_candles_count, self.max_candles_count - added_candles_count)
+        # drop the oldest candles
+        removed_candles_count = stored_candles_count - kept_candles_count
+        self.stored_candles_times.difference_update(
+            self.candles[enums.PriceIndexes.IND_PRICE_TIME.value,
+                         self.candles_start_index:self.candles_start_index + removed_candles_count].tolist()
+        )
+        self.candles_start_index += removed_candles_count
+        if self.candles_start_index + kept_candles_count + added_candles_count > self.candles.shape[1]:
+            # end of buffer: move the kept candles back to the beginning of the buffer
+            self.candles[:, :kept_candles_count] = \
+                self.candles[:, self.candles_start_index:self.candles_start_index + kept_candles_count]
+            self.candles_start_index = 0
+        first_new_candle_index = self.candles_start_index + kept_candles_count
+        self.candles[:, first_new_candle_index:first_new_candle_index + added_candles_count] = new_candles.T
+        self.stored_candles_times.update(new_candles[:, enums.PriceIndexes.IND_PRICE_TIME.value].tolist())
+        self._set_candles_count(kept_candles_count + added_candles_count)
+
+    def _set_candles_count(self, candles_count):
+        self.reached_max = candles_count >= self.max_candles_count
+        candles_index = self.max_candles_count - 1 if self.reached_max else candles_count
+        self.close_candles_index = candles_index
+        self.open_candles_index = candles_index
+        self.high_candles_index = candles_index
+        self.low_candles_index = candles_index
+        self.time_candles_index = candles_index
+        self.volume_candles_index = candles_index
+
     def _change_current_candle(self):
-        self.close_candles = data_util.shift_value_array(self.close_candles, -1, np.nan, np.float64)
-        self.open_candles = data_util.shift_value_array(self.open_candles, -1, np.nan, np.float64)
-        self.high_candles = data_util.shift_value_array(self.high_candles, -1, np.nan, np.float64)
-        self.low_candles = data_util.shift_value_array(self.low_candles, -1, np.nan, np.float64)
-        self.volume_candles = data_util.shift_value_array(self.volume_candles, -1, np.nan, np.float64)
-        self.time_candles = data_util.shift_value_array(self.time_candles, -1, np.nan, np.float64)
+        # drop the oldest candle by moving the window forward
+        self.stored_candles_times.discard(
+            self.candles[enums.PriceIndexes.IND_PRICE_TIME.value, self.candles_start_index]
+        )
+        self.candles_start_index += 1
+        if self.candles_start_index + self.max_candles_count > self.candles.shape[1]:
+            # end of buffer: move the remaining candles back to the beginning of the buffer
+            kept_candles_count = self.max_candles_count - 1
+            self.candles[:, :kept_candles_count] = \
+                self.candles[:, self.candles_start_index:self.candles_start_index + kept_candles_count]
+            self.candles_start_index = 0
 
     def _should_add_new_candle(self, new_open_time):
-        return new_open_time not in self.time_candles
+        return new_open_time not in self.stored_candles_times
 
     def _check_max_candles(self):
         if self.reached_max:
@@ -195,14 +272,23 @@ class CandlesManager(util.Initializable):
         else:
             self.reached_max = True
 
-    def _extract_limited_data(self, data, limit=-1, max_limit=-1):
-        max_handled_limit: int = self.max_candles_count if self.reached_max else max_limit
-        if limit == -1:
-            if max_limit == -1:
-                return np.array(data)
-            return np.array(data[:max_handled_limit])
+    def _get_stored_candles_count(self):
+        return self.max_candles_count if self.reached_max else self.time_candles_index
+
+    def _get_window(self, price_index):
+        return self.candles[price_index, self.candles_start_index:self.candles_start_index + self.max_candles_count]
+
+    def _get_limited_candles(self, limit=-1, copy=True, price_index=-1):
+        stored_candles_count = self._get_stored_candles_count()
+        first_candle_index = self.candles_start_index if limit == -1 \
+            else self.candles_start_index + max(0, stored_candles_count - limit)
+        last_candle_index = self.candles_start_index + stored_candles_count
+        candles = self.candles[:, first_candle_index:last_candle_index] if price_index == -1 \
+            else self.candles[price_index, first_candle_index:last_candle_index]
+        if copy:
+            return np.array(candles)
+        candles.flags.writeable = False
+        return candles
 
-        if max_limit == -1:
-            return np.array(data[-min(limit, len(data)):])
-        else:
-            return np.array(data[max(0, max_handled_limit - limit): max_handled_limit])
+    def _extract_limited_data(self, price_index, limit=-1, copy=True):
+        return self._get_limited_candles(limit, copy, price_index)
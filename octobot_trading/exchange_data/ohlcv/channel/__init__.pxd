@@ -20,6 +20,10 @@ from octobot_trading.exchange_data.ohlcv.channel.ohlcv cimport (
     OHLCVProducer,
     OHLCVChannel,
 )
+from octobot_trading.exchange_data.ohlcv.channel cimport ohlcv_refresh_scheduler
+from octobot_trading.exchange_data.ohlcv.channel.ohlcv_refresh_scheduler cimport (
+    OHLCVRefreshScheduler,
+)
 from octobot_trading.exchange_data.ohlcv.channel cimport ohlcv_updater
 from octobot_trading.exchange_data.ohlcv.channel.ohlcv_updater cimport (
     OHLCVUpdater,
@@ -35,4 +39,5 @@ __all__ = [
     "OHLCVProducer",
     "OHLCVChannel",
     "OHLCVUpdater",
+    "OHLCVRefreshScheduler",
 ]
@@ -19,6 +19,10 @@ from octobot_trading.exchange_data.ohlcv.channel.ohlcv import (
     OHLCVProducer,
     OHLCVChannel,
 )
+from octobot_trading.exchange_data.ohlcv.channel import ohlcv_refresh_scheduler
+from octobot_trading.exchange_data.ohlcv.channel.ohlcv_refresh_scheduler import (
+    OHLCVRefreshScheduler,
+)
 from octobot_trading.exchange_data.ohlcv.channel import ohlcv_updater
 from octobot_trading.exchange_data.ohlcv.channel.ohlcv_updater import (
     OHLCVUpdater,
@@ -35,4 +39,5 @@ __all__ = [
     "OHLCVProducer",
     "OHLCVChannel",
     "OHLCVUpdater",
+    "OHLCVRefreshScheduler",
 ]
@@ -26,17 +26,28 @@ class OHLCVProducer(exchanges_channel.ExchangeChannelProducer):
 
     async def perform(self, time_frame, symbol, candle, replace_all=False, partial=False):
         try:
-            if self.channel.get_filtered_consumers(symbol=constants.CHANNEL_WILDCARD) or \
+            symbol_data = self.channel.exchange_manager.get_symbol_data(symbol)
+            # derived time frames candles are built from this time frame ones
+            if time_frame is symbol_data.derivation_base_time_frame or \
+                    self.channel.get_filtered_consumers(symbol=constants.CHANNEL_WILDCARD) or \
                     self.channel.get_filtered_consumers(symbol=symbol, time_frame=time_frame.value):
-                await self.channel.exchange_manager.get_symbol_data(symbol) \
-                    .handle_candles_update(time_frame, candle, replace_all=replace_all, partial=partial)
+                derived_candles = await symbol_data.handle_candles_update(
+                    time_frame, candle, replace_all=replace_all, partial=partial
+                )
                 if candle and (partial or replace_all):
                     candle = candle[-1]
-                await self.send(cryptocurrency=self.channel.exchange_manager.exchange.
-                                get_pair_cryptocurrency(symbol),
+                cryptocurrency = self.channel.exchange_manager.exchange.get_pair_cryptocurrency(symbol)
+                await self.send(cryptocurrency=cryptocurrency,
                                 time_frame=time_frame.value,
                                 symbol=symbol,
                                 candle=candle)
+                for derived_time_frame, completed_candles in derived_candles.items():
+                    # a base time frame update can complete multiple candles: send each of them
+                    for completed_candle in completed_candles:
+                        await self.send(cryptocurrency=cryptocurrency,
+                                        time_frame=derived_time_frame.value,
+                                        symbol=symbol,
+                                        candle=completed_candle)
         except asyncio.CancelledError:
             self.logger.info("Update tasks cancelled.")
         except Exception as e:
@@ -0,0 +1,38 @@
+# cython: language_level=3
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+cdef class OHLCVRefreshScheduler:
+    cdef public double spread_window
+
+    cdef list _refreshes_heap
+    cdef dict _due_time_by_refresh
+    cdef dict _spread_offset_by_refresh
+    cdef long _sequence
+
+    cdef public long executed_refreshes_count
+    cdef public double last_refresh_lag
+    cdef public double max_refresh_lag
+
+    cpdef void set_refreshes(self, list refreshes)
+    cpdef void schedule(self, object time_frame, str pair, double due_time, bint spread=*)
+    cpdef object get_next_refresh_delay(self, double current_time)
+    cpdef object pop_next_refresh(self, double current_time)
+    cpdef int get_queue_depth(self, double current_time)
+    cpdef int get_scheduled_refreshes_count(self)
+    cpdef void clear(self)
+    cpdef dict get_metrics(self, double current_time)
+    cdef void _remove_rescheduled_refreshes(self)
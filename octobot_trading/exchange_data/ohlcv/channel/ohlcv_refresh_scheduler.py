@@ -0,0 +1,125 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import heapq
+
+
+class OHLCVRefreshScheduler:
+    """
+    Orders OHLCV refreshes of (time frame, pair) by due time.
+    A (time frame, pair) refresh is scheduled only once: scheduling an already scheduled refresh keeps the earliest
+    due time. Spread refreshes are delayed by an offset in [0, spread_window[ specific to each (time frame, pair)
+    so that refreshes due at the same candle close are not all executed at the same instant.
+    """
+
+    def __init__(self, spread_window):
+        self.spread_window = spread_window
+
+        # heap of (due time, sequence, time frame, pair), sequence keeps equal due times in scheduling order
+        self._refreshes_heap = []
+        self._due_time_by_refresh = {}
+        self._spread_offset_by_refresh = {}
+        self._sequence = 0
+
+        # metrics
+        self.executed_refreshes_count = 0
+        self.last_refresh_lag = 0
+        self.max_refresh_lag = 0
+
+    def set_refreshes(self, refreshes):
+        """
+        Spread the given (time frame, pair) refreshes in the spread window, in the given order
+        :param refreshes: the list of (time frame, pair) to refresh
+        """
+        self._spread_offset_by_refresh = {
+            refresh: self.spread_window * index / len(refreshes)
+            for index, refresh in enumerate(refreshes)
+        }
+
+    def schedule(self, time_frame, pair, due_time, spread=False):
+        """
+        Schedule the refresh of the given time frame and pair
+        :param time_frame: the time frame to refresh
+        :param pair: the pair to refresh
+        :param due_time: the refresh timestamp
+        :param spread: when True, the refresh is delayed by its spread offset
+        """
+        refresh = (time_frame, pair)
+        if spread:
+            due_time += self._spread_offset_by_refresh.get(refresh, 0)
+        scheduled_due_time = self._due_time_by_refresh.get(refresh)
+        if scheduled_due_time is not None and scheduled_due_time <= due_time:
+            # already scheduled
+            return
+        self._due_time_by_refresh[refresh] = due_time
+        heapq.heappush(self._refreshes_heap, (due_time, self._sequence, time_frame, pair))
+        self._sequence += 1
+
+    def get_next_refresh_delay(self, current_time):
+        """
+        :return: the number of seconds before the next refresh, None when no refresh is scheduled
+        """
+        self._remove_rescheduled_refreshes()
+        if self._refreshes_heap:
+            return self._refreshes_heap[0][0] - current_time
+        return None
+
+    def pop_next_refresh(self, current_time):
+        """
+        :return: the (time frame, pair) of the next refresh, None when no refresh is scheduled
+        """
+        self._remove_rescheduled_refreshes()
+        if not self._refreshes_heap:
+            return None
+        due_time, _, time_frame, pair = heapq.heappop(self._refreshes_heap)
+        self._due_time_by_refresh.pop((time_frame, pair))
+        self.executed_refreshes_count += 1
+        self.last_refresh_lag = max(0, current_time - due_time)
+        self.max_refresh_lag = max(self.max_refresh_lag, self.last_refresh_lag)
+        return time_frame, pair
+
+    def get_queue_depth(self, current_time):
+        """
+        :return: the number of refreshes that should already have been executed
+        """
+        queue_depth = 0
+        for due_time in self._due_time_by_refresh.values():
+            if due_time <= current_time:
+                queue_depth += 1
+        return queue_depth
+
+    def get_scheduled_refreshes_count(self):
+        return len(self._due_time_by_refresh)
+
+    def clear(self):
+        self._refreshes_heap = []
+        self._due_time_by_refresh = {}
+
+    def get_metrics(self, current_time) -> dict:
+        return {
+            "scheduled_refreshes_count": self.get_scheduled_refreshes_count(),
+            "queue_depth": self.get_queue_depth(current_time),
+            "executed_refreshes_count": self.executed_refreshes_count,
+            "last_refresh_lag": self.last_refresh_lag,
+            "max_refresh_lag": self.max_refresh_lag,
+        }
+
+    def _remove_rescheduled_refreshes(self):
+        # refreshes rescheduled earlier have an outdated entry in the heap
+        while self._refreshes_heap:
+            due_time, _, time_frame, pair = self._refreshes_heap[0]
+            if self._due_time_by_refresh.get((time_frame, pair)) == due_time:
+                return
+            heapq.heappop(self._refreshes_heap)
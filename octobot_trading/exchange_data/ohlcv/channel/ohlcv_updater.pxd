@@ -15,6 +15,7 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 cimport octobot_trading.exchange_data.ohlcv.channel.ohlcv as ohlcv_channel
+cimport octobot_trading.exchange_data.ohlcv.channel.ohlcv_refresh_scheduler as ohlcv_refresh_scheduler
 
 
 cdef class OHLCVUpdater(ohlcv_channel.OHLCVProducer):
@@ -22,9 +23,16 @@ cdef class OHLCVUpdater(ohlcv_channel.OHLCVProducer):
 
     cdef bint is_initialized
     cdef dict initialized_candles_by_tf_by_symbol
+    cdef public list derived_time_frames
+    cdef public ohlcv_refresh_scheduler.OHLCVRefreshScheduler refresh_scheduler
+    cdef dict _last_candle_timestamp_by_tf_by_symbol
+    cdef double _last_refresh_request_time
 
     cdef list _get_traded_pairs(self)
     cdef list _get_time_frames(self)
+    cdef void _set_derived_time_frames(self)
     cdef int _get_historical_candles_count(self)
     cdef double _ensure_correct_sleep_time(self, double sleep_time_candidate, double time_frame_sleep)
     cdef void _set_initialized(self, str pair, object time_frame, bint initialized)
+    cdef double _get_last_candle_timestamp(self, str pair, object time_frame)
+    cpdef dict get_refresh_metrics(self)
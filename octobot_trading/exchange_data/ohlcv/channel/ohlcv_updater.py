@@ -23,6 +23,7 @@ import octobot_commons.enums as common_enums
 import octobot_trading.errors as errors
 import octobot_trading.constants as constants
 import octobot_trading.exchange_data.ohlcv.channel.ohlcv as ohlcv_channel
+import octobot_trading.exchange_data.ohlcv.channel.ohlcv_refresh_scheduler as ohlcv_refresh_scheduler
 import octobot_trading.exchanges as exchanges
 
 
@@ -35,6 +36,8 @@ class OHLCVUpdater(ohlcv_channel.OHLCVProducer):
     OHLCV_REFRESH_TIME_THRESHOLD = 1.5  # to prevent spamming at candle closing
     OHLCV_MISSING_DATA_REFRESH_RETRY_MAX_DELAY = 30 * common_constants.MINUTE_TO_SECONDS
 
+    OHLCV_MAX_CONCURRENT_REQUESTS = 10
+
     OHLCV_INITIALIZATION_TIMEOUT = 60
     OHLCV_INITIALIZATION_RETRY_DELAY = 10
 
@@ -43,6 +46,12 @@ class OHLCVUpdater(ohlcv_channel.OHLCVProducer):
         self.tasks = []
         self.is_initialized = False
         self.initialized_candles_by_tf_by_symbol = {}
+        # time frames which candles are built from the shortest time frame candles instead of being refreshed
+        self.derived_time_frames = []
+        # schedules every (time frame, pair) refresh, executed by a single refresh loop
+        self.refresh_scheduler = ohlcv_refresh_scheduler.OHLCVRefreshScheduler(self.OHLCV_REFRESH_TIME_THRESHOLD)
+        self._last_candle_timestamp_by_tf_by_symbol = {}
+        self._last_refresh_request_time = 0
 
     async def start(self):
         """
@@ -54,10 +63,19 @@ class OHLCVUpdater(ohlcv_channel.OHLCVProducer):
             if self.channel.is_paused:
                 await self.pause()
             else:
-                self.tasks = [
-                    asyncio.create_task(self._candle_callback(time_frame, pair))
+                # refreshes of the same pair are next to each other
+                refreshes = [
+                    (time_frame, pair)
+                    for pair in self.channel.exchange_manager.exchange_config.traded_symbol_pairs
                     for time_frame in self.channel.exchange_manager.exchange_config.traded_time_frames
-                    for pair in self.channel.exchange_manager.exchange_config.traded_symbol_pairs]
+                    if time_frame not in self.derived_time_frames
+                ]
+                self.refresh_scheduler.clear()
+                self.refresh_scheduler.set_refreshes(refreshes)
+                current_time = time.time()
+                for time_frame, pair in refreshes:
+                    self.refresh_scheduler.schedule(time_frame, pair, current_time)
+                self.tasks = [asyncio.create_task(self._refresh_loop())]
 
     def _get_traded_pairs(self):
         return self.channel.exchange_manager.exchange_config.traded_symbol_pairs
@@ -68,8 +86,20 @@ class OHLCVUpdater(ohlcv_channel.OHLCVProducer):
     async def fetch_and_push(self):
         return await self._initialize(True)
 
+    def _set_derived_time_frames(self):
+        exchange_config = self.channel.exchange_manager.exchange_config
+        self.derived_time_frames = exchange_config.get_derived_time_frames(self._get_time_frames())
+        if self.derived_time_frames:
+            self.logger.debug(f"Building {[time_frame.value for time_frame in self.derived_time_frames]} candles "
+                              f"from {exchange_config.get_shortest_time_frame().value} candles")
+            for pair in self._get_traded_pairs():
+                self.channel.exchange_manager.get_symbol_data(pair).set_derived_time_frames(
+                    exchange_config.get_shortest_time_frame(), self.derived_time_frames
+                )
+
     async def _initialize(self, push_initialization_candles):
         try:
+            self._set_derived_time_frames()
             initial_candles_data = await asyncio.gather(*[
                 self._initialize_candles(time_frame, pair, True)
                 for time_frame in self._get_time_frames()
@@ -164,52 +194,104 @@ class OHLCVUpdater(ohlcv_channel.OHLCVProducer):
         if init_coroutines:
             await asyncio.gather(*init_coroutines)
 
-    async def _candle_callback(self, time_frame, pair):
+    async def _refresh_loop(self):
+        """
+        Executes scheduled refreshes by due time, spacing exchange requests by the exchange rate limit
+        """
+        semaphore = asyncio.Semaphore(self.OHLCV_MAX_CONCURRENT_REQUESTS)
+        refresh_tasks = set()
+        try:
+            while not self.should_stop and not self.channel.is_paused:
+                next_refresh_delay = self.refresh_scheduler.get_next_refresh_delay(time.time())
+                if next_refresh_delay is None or next_refresh_delay > 0:
+                    # refreshes can be scheduled by running refreshes: don't sleep longer than OHLCV_MIN_REFRESH_TIME
+                    await asyncio.sleep(self.OHLCV_MIN_REFRESH_TIME if next_refresh_delay is None
+                                        else min(next_refresh_delay, self.OHLCV_MIN_REFRESH_TIME))
+                    continue
+                await semaphore.acquire()
+                await self._wait_for_rate_limit()
+                time_frame, pair = self.refresh_scheduler.pop_next_refresh(time.time())
+                refresh_task = asyncio.create_task(self._refresh_candles(time_frame, pair))
+                refresh_tasks.add(refresh_task)
+                refresh_task.add_done_callback(refresh_tasks.discard)
+                refresh_task.add_done_callback(lambda _: semaphore.release())
+        finally:
+            for refresh_task in tuple(refresh_tasks):
+                refresh_task.cancel()
+
+    async def _wait_for_rate_limit(self):
+        waiting_time = self._last_refresh_request_time + self.channel.exchange_manager.exchange.get_rate_limit() \
+            - time.time()
+        if waiting_time > 0:
+            await asyncio.sleep(waiting_time)
+        self._last_refresh_request_time = time.time()
+
+    async def _refresh_candles(self, time_frame, pair):
+        """
+        Refresh candles of the given time frame and pair and schedule the next refresh
+        """
         time_frame_seconds: int = common_enums.TimeFramesMinutes[time_frame] * common_constants.MINUTE_TO_SECONDS
         time_frame_sleep: int = time_frame_seconds
-        last_candle_timestamp: float = 0
         missing_data_sleep_time = min(int(time_frame_seconds / 6), self.OHLCV_MISSING_DATA_REFRESH_RETRY_MAX_DELAY)
+        # wait for the next candle close by default
+        next_refresh_delay = time_frame_sleep
+        is_waiting_for_candle_close = False
+        try:
+            start_update_time = time.time()
+            await self._ensure_candles_initialization(pair)
+            # skip uninitialized candles
+            if self.initialized_candles_by_tf_by_symbol[pair][time_frame]:
+                candles: list = await self.channel.exchange_manager.exchange.get_symbol_prices(
+                    pair,
+                    time_frame,
+                    limit=self.OHLCV_LIMIT)
+                if candles:
+                    last_candle: list = candles[-1]
+                    self.channel.exchange_manager.exchange.uniformize_candles_if_necessary(candles)
+                else:
+                    last_candle: list = []
 
-        while not self.should_stop and not self.channel.is_paused:
-            try:
-                start_update_time = time.time()
-                await self._ensure_candles_initialization(pair)
-                # skip uninitialized candles
-                if self.initialized_candles_by_tf_by_symbol[pair][time_frame]:
-                    candles: list = await self.channel.exchange_manager.exchange.get_symbol_prices(
-                        pair,
-                        time_frame,
-                        limit=self.OHLCV_LIMIT)
-                    if candles:
-                        last_candle: list = candles[-1]
-                        self.channel.exchange_manager.exchange.uniformize_candles_if_necessary(candles)
-                    else:
-                        last_candle: list = []
-
-                    if last_candle and len(candles) > 1:
-                        last_candle_timestamp, sleep_time = await self._refresh_current_candle(
-                            time_frame, pair, candles, last_candle, last_candle_timestamp, time_frame_sleep
-                        )
-                        await asyncio.sleep(self._ensure_correct_sleep_time(sleep_time, time_frame_sleep))
-                    else:
-                        # not enough candles: retry soon
-                        self.logger.debug(f"Missing candles in request results for {pair} on {time_frame}, refreshing "
-                                          f"in {missing_data_sleep_time} seconds (available candles: {candles}).")
-                        await asyncio.sleep(missing_data_sleep_time)
+                if last_candle and len(candles) > 1:
+                    last_candle_timestamp, sleep_time = await self._refresh_current_candle(
+                        time_frame, pair, candles, last_candle,
+                        self._get_last_candle_timestamp(pair, time_frame), time_frame_sleep
+                    )
+                    self._last_candle_timestamp_by_tf_by_symbol[pair][time_frame] = last_candle_timestamp
+                    next_refresh_delay = self._ensure_correct_sleep_time(sleep_time, time_frame_sleep)
+                    is_waiting_for_candle_close = True
                 else:
-                    # candles on this time frame have not been initialized: sleep until the next candle update
-                    await asyncio.sleep(max(0.0, time_frame_sleep - (time.time() - start_update_time)))
-            except errors.FailedRequest as e:
-                self.logger.warning(str(e))
-                # avoid spamming on disconnected situation
-                await asyncio.sleep(constants.DEFAULT_FAILED_REQUEST_RETRY_TIME)
-            except errors.NotSupported:
-                self.logger.warning(
-                    f"{self.channel.exchange_manager.exchange_name} is not supporting updates")
-                await self.pause()
-            except Exception as e:
-                self.logger.exception(e, True, f"Failed to update ohlcv data for {pair} on {time_frame} : {e}")
-                await asyncio.sleep(self.OHLCV_ON_ERROR_TIME)
+                    # not enough candles: retry soon
+                    self.logger.debug(f"Missing candles in request results for {pair} on {time_frame}, refreshing "
+                                      f"in {missing_data_sleep_time} seconds (available candles: {candles}).")
+                    next_refresh_delay = missing_data_sleep_time
+            else:
+                # candles on this time frame have not been initialized: wait for the next candle update
+                next_refresh_delay = max(0.0, time_frame_sleep - (time.time() - start_update_time))
+        except errors.FailedRequest as e:
+            self.logger.warning(str(e))
+            # avoid spamming on disconnected situation
+            next_refresh_delay = constants.DEFAULT_FAILED_REQUEST_RETRY_TIME
+        except errors.NotSupported:
+            self.logger.warning(
+                f"{self.channel.exchange_manager.exchange_name} is not supporting updates")
+            await self.pause()
+            return
+        except Exception as e:
+            self.logger.exception(e, True, f"Failed to update ohlcv data for {pair} on {time_frame} : {e}")
+            next_refresh_delay = self.OHLCV_ON_ERROR_TIME
+        # spread candle close refreshes to avoid requesting every candle at the same time
+        self.refresh_scheduler.schedule(time_frame, pair, time.time() + next_refresh_delay,
+                                        spread=is_waiting_for_candle_close)
+
+    def _get_last_candle_timestamp(self, pair, time_frame):
+        try:
+            return self._last_candle_timestamp_by_tf_by_symbol[pair][time_frame]
+        except KeyError:
+            self._last_candle_timestamp_by_tf_by_symbol.setdefault(pair, {})[time_frame] = 0
+            return 0
+
+    def get_refresh_metrics(self) -> dict:
+        return self.refresh_scheduler.get_metrics(time.time())
 
     async def _refresh_current_candle(self, time_frame, pair, candles, last_candle,
                                       last_candle_timestamp, time_frame_sleep):
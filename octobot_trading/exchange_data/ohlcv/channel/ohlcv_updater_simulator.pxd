@@ -34,6 +34,14 @@ cdef class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
     cdef int future_candle_sec_length
 
     cdef dict last_candles_by_pair_by_time_frame
+    cdef dict preloaded_candles_by_pair_by_time_frame
+    cdef dict preloaded_candles_cursor_by_pair_by_time_frame
     cdef bint require_last_init_candles_pairs_push
     cdef list traded_pairs
     cdef list traded_time_frame
+
+    cdef list _get_preloaded_candles_from_timestamps(self, str pair, object time_frame,
+                                                     double inferior_timestamp, double superior_timestamp)
+    cdef bint _should_preload_candles(self)
+    cdef str _get_preloaded_candles_cache_file(self, str cache_folder, str pair, object time_frame,
+                                               double inferior_timestamp)
@@ -13,7 +13,13 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import os
+
+import numpy as np
+
 import octobot_backtesting.api as api
+import octobot_backtesting.errors as backtesting_errors
+import octobot_backtesting.importers as importers
 
 import octobot_commons.constants as constants
 import octobot_commons.enums as enums
@@ -24,6 +30,9 @@ import octobot_trading.util as util
 
 
 class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
+    # preloaded candles rows are: [database timestamp, *candle]
+    PRELOADED_CANDLES_TIMESTAMP_INDEX = 0
+
     def __init__(self, channel, importer):
         super().__init__(channel)
         self.exchange_data_importer = importer
@@ -38,6 +47,9 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
                                         constants.MINUTE_TO_SECONDS
 
         self.last_candles_by_pair_by_time_frame = {}
+        # when candles are preloaded, handle_timestamp reads candles from these arrays instead of the importer
+        self.preloaded_candles_by_pair_by_time_frame = {}
+        self.preloaded_candles_cursor_by_pair_by_time_frame = {}
         self.require_last_init_candles_pairs_push = False
         self.traded_pairs = self._get_traded_pairs()
         self.traded_time_frame = self._get_time_frames()
@@ -45,6 +57,8 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
     async def start(self):
         if not self.is_initialized:
             await self._initialize(False)
+        if self._should_preload_candles():
+            await self._preload_candles()
         await self.resume()
 
     async def handle_timestamp(self, timestamp, **kwargs):
@@ -56,16 +70,17 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
                     # (selection is <= and >=)
                     # Use timestamp + self.future_candle_sec_length to include the future candle on the future candles
                     # time frame that will be sorted in exchange simulator for later uses.
-                    ohlcv_data: list = await self.exchange_data_importer.get_ohlcv_from_timestamps(
-                        exchange_name=self.exchange_name,
-                        symbol=pair,
-                        time_frame=time_frame,
-                        inferior_timestamp=self.last_timestamp_pushed + 1,
-                        superior_timestamp=timestamp + (self.future_candle_sec_length
-                                                        if self.future_candle_time_frame is time_frame else 0)
-                    )
-                    if ohlcv_data:
-                        pushed_data = await self._handle_ohlcv_data(ohlcv_data, time_frame, pair, timestamp)
+                    # Derived time frames candles are pushed with the shortest time frame candles they are built from.
+                    candles: list = [] if time_frame in self.derived_time_frames \
+                        else await self._get_candles_from_timestamps(
+                            pair,
+                            time_frame,
+                            self.last_timestamp_pushed + 1,
+                            timestamp + (self.future_candle_sec_length
+                                         if self.future_candle_time_frame is time_frame else 0)
+                        )
+                    if candles:
+                        pushed_data = await self._handle_candles(candles, time_frame, pair, timestamp)
                     elif self.require_last_init_candles_pairs_push:
                         # triggered on first iteration to initialize large candles that might be pushed much later
                         # otherwise but are required to complete TA evaluation
@@ -89,13 +104,47 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
             self.last_timestamp_pushed = timestamp
             self.require_last_init_candles_pairs_push = False
 
-    async def _handle_ohlcv_data(self, ohlcv_data, time_frame, pair, timestamp):
+    async def _get_candles_from_timestamps(self, pair, time_frame, inferior_timestamp, superior_timestamp):
+        if self.preloaded_candles_by_pair_by_time_frame:
+            return self._get_preloaded_candles_from_timestamps(pair, time_frame, inferior_timestamp,
+                                                               superior_timestamp)
+        ohlcv_data: list = await self.exchange_data_importer.get_ohlcv_from_timestamps(
+            exchange_name=self.exchange_name,
+            symbol=pair,
+            time_frame=time_frame,
+            inferior_timestamp=inferior_timestamp,
+            superior_timestamp=superior_timestamp
+        )
+        return [ohlcv[-1] for ohlcv in ohlcv_data]
+
+    def _get_preloaded_candles_from_timestamps(self, pair, time_frame, inferior_timestamp, superior_timestamp):
+        try:
+            preloaded_candles = self.preloaded_candles_by_pair_by_time_frame[pair][time_frame.value]
+        except KeyError:
+            return []
+        timestamps = preloaded_candles[:, self.PRELOADED_CANDLES_TIMESTAMP_INDEX]
+        candles_count = len(timestamps)
+        # as timestamps are only increasing, previous candles can be ignored
+        first_index = self.preloaded_candles_cursor_by_pair_by_time_frame[pair][time_frame.value]
+        if first_index >= candles_count:
+            return []
+        if timestamps[first_index] < inferior_timestamp:
+            first_index = int(timestamps.searchsorted(inferior_timestamp, side="left"))
+            self.preloaded_candles_cursor_by_pair_by_time_frame[pair][time_frame.value] = first_index
+            if first_index >= candles_count:
+                return []
+        if timestamps[first_index] > superior_timestamp:
+            # most common case: no new candle in this time range
+            return []
+        last_index = int(timestamps.searchsorted(superior_timestamp, side="right"))
+        return preloaded_candles[first_index:last_index, self.PRELOADED_CANDLES_TIMESTAMP_INDEX + 1:].tolist()
+
+    async def _handle_candles(self, candles, time_frame, pair, timestamp):
         has_future_candle = False
         if self.future_candle_time_frame is time_frame:
-            if ohlcv_data[-1][-1][enums.PriceIndexes.IND_PRICE_TIME.value] == timestamp:
+            if candles[-1][enums.PriceIndexes.IND_PRICE_TIME.value] == timestamp:
                 # register future candle
-                self.channel.exchange.get_current_future_candles()[pair][time_frame.value] = \
-                    ohlcv_data[-1][-1]
+                self.channel.exchange.get_current_future_candles()[pair][time_frame.value] = candles[-1]
                 # do not push future candle
                 has_future_candle = True
             else:
@@ -105,17 +154,82 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
 
             # There should always be at least 2 candles in read data, otherwise this means that
             # the exchange was down for some time. Consider it unreachable
-            self.channel.exchange_manager.exchange.is_unreachable = len(ohlcv_data) < 2
-        if not has_future_candle or len(ohlcv_data) > 1:
+            self.channel.exchange_manager.exchange.is_unreachable = len(candles) < 2
+        if not has_future_candle or len(candles) > 1:
             # push current candle(s)
-            candles = ohlcv_data[:-1] if has_future_candle else ohlcv_data
             await self.push(time_frame,
                             pair,
-                            [ohlcv[-1] for ohlcv in candles],
+                            candles[:-1] if has_future_candle else candles,
                             partial=True)
             return True
         return False
 
+    def _should_preload_candles(self):
+        backtesting_exchange_config = self.channel.exchange_manager.exchange_config.backtesting_exchange_config
+        return backtesting_exchange_config is not None and backtesting_exchange_config.preload_candles
+
+    async def _preload_candles(self):
+        cache_folder = self.channel.exchange_manager.exchange_config.backtesting_exchange_config\
+            .preloaded_candles_cache_folder
+        # candles before last_timestamp_pushed + 1 will never be selected
+        inferior_timestamp = self.last_timestamp_pushed + 1
+        for pair in self.traded_pairs:
+            self.preloaded_candles_by_pair_by_time_frame[pair] = {}
+            self.preloaded_candles_cursor_by_pair_by_time_frame[pair] = {}
+            for time_frame in self.traded_time_frame:
+                if time_frame in self.derived_time_frames:
+                    # built from the shortest time frame candles
+                    continue
+                cache_file = None if cache_folder is None \
+                    else self._get_preloaded_candles_cache_file(cache_folder, pair, time_frame, inferior_timestamp)
+                if cache_file is not None and os.path.isfile(cache_file):
+                    preloaded_candles = np.load(cache_file, mmap_mode="r")
+                else:
+                    preloaded_candles = await self._load_candles(pair, time_frame, inferior_timestamp)
+                    if cache_file is not None:
+                        np.save(cache_file, preloaded_candles)
+                        preloaded_candles = np.load(cache_file, mmap_mode="r")
+                self.preloaded_candles_by_pair_by_time_frame[pair][time_frame.value] = preloaded_candles
+                self.preloaded_candles_cursor_by_pair_by_time_frame[pair][time_frame.value] = 0
+        self.logger.debug(f"Preloaded candles for {len(self.traded_pairs)} pairs on "
+                          f"{len(self.traded_time_frame)} time frames")
+
+    async def _load_candles(self, pair, time_frame, inferior_timestamp):
+        timestamps, operations = importers.get_operations_from_timestamps(
+            constants.DEFAULT_IGNORED_VALUE,
+            inferior_timestamp
+        )
+        ohlcv_data = await self.exchange_data_importer.get_ohlcv(
+            exchange_name=self.exchange_name,
+            symbol=pair,
+            time_frame=time_frame,
+            timestamps=timestamps,
+            operations=operations
+        )
+        preloaded_candles = np.array(
+            [[ohlcv[self.PRELOADED_CANDLES_TIMESTAMP_INDEX]] + ohlcv[-1][:len(enums.PriceIndexes)]
+             for ohlcv in ohlcv_data],
+            dtype=np.float64
+        ).reshape((len(ohlcv_data), len(enums.PriceIndexes) + 1))
+        # database rows are not necessarily sorted chronologically
+        # use a column-major array to keep timestamps contiguous
+        return np.asfortranarray(preloaded_candles[
+            np.argsort(preloaded_candles[:, self.PRELOADED_CANDLES_TIMESTAMP_INDEX], kind="stable")
+        ])
+
+    def _get_preloaded_candles_cache_file(self, cache_folder, pair, time_frame, inferior_timestamp):
+        try:
+            data_file_path = api.get_data_file_path(self.exchange_data_importer)
+            data_file_stat = os.stat(data_file_path)
+        except (backtesting_errors.BacktestingFileNotFound, OSError):
+            # the data file version can't be identified: don't use cache
+            return None
+        data_file = os.path.splitext(os.path.basename(data_file_path))[0]
+        # a regenerated data file with the same name has a different size or modification time
+        identifier = f"{data_file}_{data_file_stat.st_size}_{data_file_stat.st_mtime_ns}_" \
+                     f"{self.exchange_name}_{pair}_{time_frame.value}_{int(inferior_timestamp)}"
+        return os.path.join(cache_folder, f"{identifier.replace('/', '-').replace(':', '-')}.npy")
+
     async def pause(self):
         await util.pause_time_consumer(self)
 
@@ -15,6 +15,7 @@
 #  License along with this library.
 
 from octobot_trading.exchange_data.order_book cimport order_book_manager
+from octobot_trading.exchange_data.order_book cimport flat_order_book
 from octobot_trading.exchange_data.order_book cimport channel
 
 from octobot_trading.exchange_data.order_book.channel cimport (
@@ -27,6 +28,9 @@ from octobot_trading.exchange_data.order_book.channel cimport (
 from octobot_trading.exchange_data.order_book.order_book_manager cimport (
     OrderBookManager,
 )
+from octobot_trading.exchange_data.order_book.flat_order_book cimport (
+    FlatOrderBook,
+)
 from octobot_trading.exchange_data.order_book.channel.order_book_updater_simulator cimport (
     OrderBookUpdaterSimulator,
 )
@@ -38,5 +42,6 @@ __all__ = [
     "OrderBookTickerProducer",
     "OrderBookTickerChannel",
     "OrderBookManager",
+    "FlatOrderBook",
     "OrderBookUpdaterSimulator",
 ]
@@ -18,10 +18,10 @@ cimport octobot_trading.exchange_channel as exchanges_channel
 
 
 cdef class OrderBookProducer(exchanges_channel.ExchangeChannelProducer):
-    pass
+    cdef dict _get_data(self, str cryptocurrency, str symbol, list asks, list bids, object delta=*)
 
 cdef class OrderBookChannel(exchanges_channel.ExchangeChannel):
-    pass
+    cpdef object get_filtered_consumers(self, str cryptocurrency=*, str symbol=*, object delta=*)
 
 cdef class OrderBookTickerProducer(exchanges_channel.ExchangeChannelProducer):
     pass
@@ -21,40 +21,95 @@ import octobot_trading.exchange_channel as exchanges_channel
 
 
 class OrderBookProducer(exchanges_channel.ExchangeChannelProducer):
-    async def push(self, symbol, asks, bids, update_order_book=True):
-        await self.perform(symbol, asks, bids, update_order_book)
+    async def push(self, symbol, asks, bids, update_order_book=True, delta=False, full_book=None):
+        """
+        :param delta: when True, asks and bids only contain the changed [price, size] levels,
+        a 0 size level being removed
+        :param full_book: the up-to-date book providing get_levels(), used to send the full book to the
+        consumers that did not subscribe to deltas
+        """
+        await self.perform(symbol, asks, bids, update_order_book, delta, full_book)
 
-    async def perform(self, symbol, asks, bids, update_order_book):
+    async def perform(self, symbol, asks, bids, update_order_book, delta=False, full_book=None):
         try:
             if self.channel.get_filtered_consumers(symbol=constants.CHANNEL_WILDCARD) or \
                     self.channel.get_filtered_consumers(symbol=symbol):
                 if update_order_book:
-                    self.channel.exchange_manager.get_symbol_data(symbol).handle_order_book_update(asks, bids)
+                    if delta:
+                        self.channel.exchange_manager.get_symbol_data(symbol).handle_order_book_delta(asks, bids)
+                    else:
+                        self.channel.exchange_manager.get_symbol_data(symbol).handle_order_book_update(asks, bids)
                 await self.send(cryptocurrency=self.channel.exchange_manager.exchange.
                                 get_pair_cryptocurrency(symbol),
                                 symbol=symbol,
                                 asks=asks,
-                                bids=bids)
+                                bids=bids,
+                                delta=delta,
+                                full_book=full_book)
         except asyncio.CancelledError:
             self.logger.info("Update tasks cancelled.")
         except Exception as e:
             self.logger.exception(e, True, f"Exception when triggering update: {e}")
 
-    async def send(self, cryptocurrency, symbol, asks, bids):
-        for consumer in self.channel.get_filtered_consumers(symbol=symbol):
-            await consumer.queue.put({
-                "exchange": self.channel.exchange_manager.exchange_name,
-                "exchange_id": self.channel.exchange_manager.id,
-                "cryptocurrency": cryptocurrency,
-                "symbol": symbol,
-                "asks": asks,
-                "bids": bids
-            })
+    async def send(self, cryptocurrency, symbol, asks, bids, delta=False, full_book=None):
+        for consumer in self.channel.get_filtered_consumers(symbol=symbol, delta=True):
+            await consumer.queue.put(self._get_data(cryptocurrency, symbol, asks, bids, delta=delta))
+        full_book_consumers = self.channel.get_filtered_consumers(symbol=symbol, delta=False)
+        if full_book_consumers:
+            if delta:
+                if full_book is None:
+                    return
+                # full book levels are only computed when a consumer requires them
+                asks, bids = full_book.get_levels()
+            for consumer in full_book_consumers:
+                await consumer.queue.put(self._get_data(cryptocurrency, symbol, asks, bids))
+
+    def _get_data(self, cryptocurrency, symbol, asks, bids, delta=None):
+        data = {
+            "exchange": self.channel.exchange_manager.exchange_name,
+            "exchange_id": self.channel.exchange_manager.id,
+            "cryptocurrency": cryptocurrency,
+            "symbol": symbol,
+            "asks": asks,
+            "bids": bids
+        }
+        if delta is not None:
+            # only sent to delta consumers to keep full book consumers callbacks signature unchanged
+            data["delta"] = delta
+        return data
 
 
 class OrderBookChannel(exchanges_channel.ExchangeChannel):
     PRODUCER_CLASS = OrderBookProducer
     CONSUMER_CLASS = exchanges_channel.ExchangeChannelConsumer
+    DELTA_KEY = "delta"
+
+    def get_filtered_consumers(self,
+                               cryptocurrency=constants.CHANNEL_WILDCARD,
+                               symbol=constants.CHANNEL_WILDCARD,
+                               delta=constants.CHANNEL_WILDCARD):
+        return self.get_consumer_from_filters({
+            self.CRYPTOCURRENCY_KEY: cryptocurrency,
+            self.SYMBOL_KEY: symbol,
+            self.DELTA_KEY: delta
+        })
+
+    async def _add_new_consumer_and_run(self, consumer,
+                                        cryptocurrency=constants.CHANNEL_WILDCARD,
+                                        symbol=constants.CHANNEL_WILDCARD,
+                                        delta=False):
+        """
+        :param delta: when True, the consumer receives the changed levels of delta updates with a "delta"
+        argument instead of the full book
+        """
+        self.add_new_consumer(consumer,
+                              {
+                                  self.CRYPTOCURRENCY_KEY: cryptocurrency,
+                                  self.SYMBOL_KEY: symbol,
+                                  self.DELTA_KEY: delta
+                              })
+        await self._run_consumer(consumer,
+                                 symbol=symbol)
 
 
 class OrderBookTickerProducer(exchanges_channel.ExchangeChannelProducer):
@@ -0,0 +1,48 @@
+# cython: language_level=3
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+cdef class FlatOrderBook:
+    cdef object logger
+
+    cdef public bint order_book_initialized
+
+    cdef public list ask_prices
+    cdef public list ask_sizes
+    cdef public list bid_prices
+    cdef public list bid_sizes
+
+    cdef object _asks_array # np.ndarray
+    cdef object _bids_array # np.ndarray
+
+    cdef public double timestamp
+
+    cpdef void reset_order_book(self)
+    cpdef void handle_new_books(self, list asks, list bids, object timestamp=*)
+    cpdef void handle_book_deltas(self, list asks, list bids, object timestamp=*)
+    cpdef object get_ask(self)
+    cpdef object get_bid(self)
+    cpdef tuple get_levels(self)
+    cpdef tuple get_depth(self, int depth)
+    cpdef object get_vwap_for_quantity(self, object side, double quantity) # using object to propagate NotEnoughLiquidityError
+    cpdef object get_slippage_for_quantity(self, object side, double quantity) # using object to propagate NotEnoughLiquidityError
+
+    cdef object _get_asks_array(self)
+    cdef object _get_bids_array(self)
+
+cdef tuple _new_side(list levels)
+cdef void _apply_delta(list prices, list sizes, double price, double size)
+cdef object _to_levels_array(list prices, list sizes)
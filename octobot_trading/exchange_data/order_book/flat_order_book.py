@@ -0,0 +1,207 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import bisect
+
+import numpy as np
+
+import octobot_commons.logging as logging
+
+import octobot_trading.enums as enums
+import octobot_trading.errors as errors
+
+LEVEL_PRICE_INDEX = 0
+LEVEL_SIZE_INDEX = 1
+
+
+class FlatOrderBook:
+    """
+    Compact order book storing each side as price sorted price and size float lists.
+    Both sides are sorted by increasing price: the best ask is the first ask and the best bid is the last bid.
+    Levels are [price, size] pairs and a 0 size level delta removes its price level.
+    Depth and VWAP queries are vectorized on [price, size] arrays cached until the next book update.
+    """
+
+    def __init__(self):
+        self.logger = logging.get_logger(self.__class__.__name__)
+        self.order_book_initialized = False
+        self.ask_prices, self.ask_sizes = [], []
+        self.bid_prices, self.bid_sizes = [], []
+        # [price, size] arrays, best price first
+        self._asks_array = None
+        self._bids_array = None
+        self.timestamp = 0
+
+    def reset_order_book(self):
+        self.order_book_initialized = False
+        self.ask_prices, self.ask_sizes = [], []
+        self.bid_prices, self.bid_sizes = [], []
+        self._asks_array = self._bids_array = None
+        self.timestamp = 0
+
+    def handle_new_books(self, asks, bids, timestamp=None):
+        """
+        Replace the whole book by the given snapshot
+        :param asks: the [price, size] ask levels
+        :param bids: the [price, size] bid levels
+        :param timestamp: the snapshot timestamp
+        """
+        self.ask_prices, self.ask_sizes = _new_side(asks)
+        self.bid_prices, self.bid_sizes = _new_side(bids)
+        self._asks_array = self._bids_array = None
+        if timestamp:
+            self.timestamp = timestamp
+        self.order_book_initialized = True
+
+    def handle_book_deltas(self, asks, bids, timestamp=None):
+        """
+        Apply changed levels to the book: a 0 size level is removed, other levels are added or updated
+        :param asks: the changed [price, size] ask levels
+        :param bids: the changed [price, size] bid levels
+        :param timestamp: the deltas timestamp
+        """
+        if asks:
+            for level in asks:
+                _apply_delta(self.ask_prices, self.ask_sizes,
+                             float(level[LEVEL_PRICE_INDEX]), float(level[LEVEL_SIZE_INDEX]))
+            self._asks_array = None
+        if bids:
+            for level in bids:
+                _apply_delta(self.bid_prices, self.bid_sizes,
+                             float(level[LEVEL_PRICE_INDEX]), float(level[LEVEL_SIZE_INDEX]))
+            self._bids_array = None
+        if timestamp:
+            self.timestamp = timestamp
+
+    def get_ask(self):
+        """
+        :return: the best ask (price, size) or None when there is no ask
+        """
+        if self.ask_prices:
+            return self.ask_prices[0], self.ask_sizes[0]
+        return None
+
+    def get_bid(self):
+        """
+        :return: the best bid (price, size) or None when there is no bid
+        """
+        if self.bid_prices:
+            return self.bid_prices[-1], self.bid_sizes[-1]
+        return None
+
+    def get_levels(self):
+        """
+        :return: the asks and bids [price, size] levels lists, best price first
+        """
+        return (
+            [[price, size] for price, size in zip(self.ask_prices, self.ask_sizes)],
+            [[price, size] for price, size in zip(reversed(self.bid_prices), reversed(self.bid_sizes))]
+        )
+
+    def get_depth(self, depth):
+        """
+        :param depth: the maximum number of levels on each side
+        :return: the asks and bids [price, size] levels arrays, best price first
+        """
+        if depth < 0:
+            raise errors.InvalidArgumentError(f"Invalid order book depth: {depth}")
+        return self._get_asks_array()[:depth].copy(), self._get_bids_array()[:depth].copy()
+
+    def get_vwap_for_quantity(self, side, quantity):
+        """
+        :param side: the side of the order to fill: a buy order consumes asks, a sell order consumes bids
+        :param quantity: the quantity to fill
+        :return: the volume weighted average price of an order filling quantity from the best price
+        """
+        if not quantity > 0:
+            raise errors.InvalidArgumentError(f"Invalid quantity to {side.value}: {quantity}")
+        levels = self._get_asks_array() if side is enums.TradeOrderSide.BUY else self._get_bids_array()
+        cumulated_sizes = np.cumsum(levels[:, LEVEL_SIZE_INDEX])
+        if not len(cumulated_sizes) or cumulated_sizes[-1] < quantity:
+            raise errors.NotEnoughLiquidityError(
+                f"Not enough liquidity to {side.value} {quantity}: available: "
+                f"{cumulated_sizes[-1] if len(cumulated_sizes) else 0}"
+            )
+        last_level_index = int(cumulated_sizes.searchsorted(quantity))
+        filled_sizes = levels[:last_level_index + 1, LEVEL_SIZE_INDEX].copy()
+        # the last level is only partially filled
+        filled_sizes[-1] -= cumulated_sizes[last_level_index] - quantity
+        return float(np.dot(levels[:last_level_index + 1, LEVEL_PRICE_INDEX], filled_sizes) / quantity)
+
+    def get_slippage_for_quantity(self, side, quantity):
+        """
+        :param side: the side of the order to fill: a buy order consumes asks, a sell order consumes bids
+        :param quantity: the quantity to fill
+        :return: the relative price difference between the order average fill price and the best price
+        """
+        vwap = self.get_vwap_for_quantity(side, quantity)
+        if side is enums.TradeOrderSide.BUY:
+            return vwap / self.ask_prices[0] - 1
+        return 1 - vwap / self.bid_prices[-1]
+
+    def _get_asks_array(self):
+        if self._asks_array is None:
+            self._asks_array = _to_levels_array(self.ask_prices, self.ask_sizes)
+        return self._asks_array
+
+    def _get_bids_array(self):
+        if self._bids_array is None:
+            self._bids_array = _to_levels_array(self.bid_prices[::-1], self.bid_sizes[::-1])
+        return self._bids_array
+
+
+def _new_side(levels):
+    """
+    :param levels: a list of [price, size, ...] levels
+    :return: the price sorted prices and sizes lists of the non-empty levels, duplicate price levels are merged
+    """
+    size_by_price = {}
+    for level in levels:
+        size = float(level[LEVEL_SIZE_INDEX])
+        if size > 0:
+            price = float(level[LEVEL_PRICE_INDEX])
+            size_by_price[price] = size_by_price.get(price, 0) + size
+    prices = sorted(size_by_price)
+    return prices, [size_by_price[price] for price in prices]
+
+
+def _apply_delta(prices, sizes, price, size):
+    """
+    Apply a level delta to a book side
+    :param prices: the side sorted prices
+    :param sizes: the side sizes
+    :param price: the level price
+    :param size: the level size, a 0 size removes the level
+    """
+    index = bisect.bisect_left(prices, price)
+    if index < len(prices) and prices[index] == price:
+        if size > 0:
+            sizes[index] = size
+        else:
+            del prices[index]
+            del sizes[index]
+    elif size > 0:
+        prices.insert(index, price)
+        sizes.insert(index, size)
+
+
+def _to_levels_array(prices, sizes):
+    """
+    :return: a n x 2 float array of the given prices and sizes
+    """
+    levels_array = np.empty((len(prices), 2), dtype=np.float64)
+    levels_array[:, LEVEL_PRICE_INDEX] = prices
+    levels_array[:, LEVEL_SIZE_INDEX] = sizes
+    return levels_array
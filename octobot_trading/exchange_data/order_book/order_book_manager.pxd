@@ -37,6 +37,7 @@ cdef class OrderBookManager(util.Initializable):
                                         double bid_quantity, double bid_price)
     cpdef void handle_new_book(self, dict orders)
     cpdef void handle_new_books(self, list asks, list bids, object timestamp=*)
+    cpdef void handle_book_level_deltas(self, list asks, list bids)
     cpdef void handle_book_adds(self, list orders)
     cpdef void handle_book_deletes(self, list orders)
     cpdef void handle_book_updates(self, list orders)
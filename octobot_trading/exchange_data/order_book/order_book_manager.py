@@ -66,6 +66,20 @@ class OrderBookManager(util.Initializable):
             self.timestamp = timestamp
         self.order_book_initialized = True
 
+    def handle_book_level_deltas(self, asks, bids):
+        """
+        Apply [price, size] level deltas: a 0 size level is removed, other levels replace their price level
+        :param asks: the changed ask levels
+        :param bids: the changed bid levels
+        """
+        for price_size_list, side, book in ((asks, enums.TradeOrderSide.SELL.value, self.asks),
+                                            (bids, enums.TradeOrderSide.BUY.value, self.bids)):
+            for price_size in price_size_list:
+                if price_size[1]:
+                    book[price_size[0]] = [_convert_price_size_to_order(price_size, side)]
+                else:
+                    book.pop(price_size[0], None)
+
     def handle_book_adds(self, orders):
         for order in orders:
             try:
@@ -20,20 +20,31 @@ cimport octobot_trading.util as util
 cdef class PriceEventsManager(util.Initializable):
     cdef object logger
 
-    cdef list events
+    cdef dict events
+    cdef object _trigger_above_events # sortedcontainers.SortedList
+    cdef object _trigger_below_events # sortedcontainers.SortedList
+    cdef int _events_sequence
     cdef list _last_recent_prices
+    cdef object _pending_callbacks # collections.OrderedDict
+    cdef object _callbacks_dispatcher_task # asyncio.Task
 
     cpdef void reset(self)
     cpdef void handle_recent_trades(self, list recent_trades)
     cpdef void handle_price(self, object price, double timestamp)
-    cpdef object new_event(self, object price, double timestamp, bint trigger_above, bint allow_instant_fill=*) # return asyncio.Event
+    cpdef object new_event(self, object price, double timestamp, bint trigger_above, bint allow_instant_fill=*, object callback=*) # return asyncio.Event
     cpdef object remove_event(self, object event_to_remove) # object is an asyncio.Event
     cpdef void clear_recent_prices(self)
+    cpdef void dispatch_callback(self, object callback)
+    cpdef void remove_pending_callback(self, object callback)
 
     cdef bint _is_triggered_by_last_recent_prices(self, object price, double timestamp, bint trigger_above)
     cdef void _add_recent_price(self, object price, double timestamp)
+    cdef object _set_triggered_events(self, list triggered_price_events) # return to propagate errors
+    cdef void _dispatch_callbacks(self, list callbacks)
     cdef object _remove_and_set_event(self, object event_to_set) # return to propagate errors
     cdef object _remove_event(self, object event_to_remove) # object is an asyncio.Event
-    cdef list _check_events(self, object price, double timestamp)
+    cdef void _add_event(self, tuple price_event_tuple)
+    cdef list _check_events(self, object min_price, object max_price, double min_timestamp, double max_timestamp)
+    cdef bint _is_triggered_in_time_range(self, tuple price_event_tuple, double min_timestamp, double max_timestamp)
 
-cdef tuple _new_price_event(object price, double timestamp, bint trigger_above)
+cdef tuple _new_price_event(object price, double timestamp, bint trigger_above, object callback)
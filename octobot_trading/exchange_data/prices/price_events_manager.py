@@ -14,7 +14,9 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import asyncio
+import collections
 import decimal
+import sortedcontainers
 
 import octobot_commons.logging as logging
 from octobot_trading.enums import ExchangeConstantsOrderColumns as ECOC
@@ -30,13 +32,32 @@ class PriceEventsManager:
     The price event index from a price event tuple
     """
     PRICE_EVENT_INDEX = 2
+    """
+    The price event callback index from a price event tuple
+    """
+    CALLBACK_INDEX = 4
     PRICE_KEY = "price"
     TIME_KEY = "time"
 
+    """
+    The price event tuple index from a sorted price event entry
+    """
+    SORTED_ENTRY_PRICE_EVENT_INDEX = 2
+
     def __init__(self):
         self.logger = logging.get_logger(self.__class__.__name__)
-        self.events = []
+        # price event tuple by asyncio.Event
+        self.events = {}
+        # (-price, sequence, price event tuple) entries: crossed events are at the end of the list
+        self._trigger_above_events = sortedcontainers.SortedList()
+        # (price, sequence, price event tuple) entries: crossed events are at the end of the list
+        self._trigger_below_events = sortedcontainers.SortedList()
+        self._events_sequence = 0
         self._last_recent_prices = []
+        # callbacks of set events, awaited in order by the callbacks dispatcher task, OrderedDict is used as an
+        # ordered set to remove pending callbacks in constant time
+        self._pending_callbacks = collections.OrderedDict()
+        self._callbacks_dispatcher_task = None
 
     def reset(self):
         """
@@ -44,23 +65,31 @@ class PriceEventsManager:
         """
         self.clear_recent_prices()
         self.events.clear()
+        self._trigger_above_events.clear()
+        self._trigger_below_events.clear()
+        # only drop callbacks that are not started: cancelling the dispatcher task could interrupt a running
+        # callback (such as an order fill), the dispatcher task stops by itself once this callback is over
+        self._pending_callbacks.clear()
 
     def handle_recent_trades(self, recent_trades):
         """
         Handle new recent trades prices
+        Events are checked once using the min and max prices of the recent trades
         :param recent_trades: prices to check
         """
         # reset recent prices on new recent trades
         self.clear_recent_prices()
         for recent_trade in recent_trades:
-            price = decimal.Decimal(str(recent_trade[ECOC.PRICE.value]))
-            timestamp = recent_trade[ECOC.TIMESTAMP.value]
             try:
-                self._add_recent_price(price, timestamp)
-                for event_to_set in self._check_events(price, timestamp):
-                    self._remove_and_set_event(event_to_set)
+                self._add_recent_price(decimal.Decimal(str(recent_trade[ECOC.PRICE.value])),
+                                       recent_trade[ECOC.TIMESTAMP.value])
             except KeyError:
                 self.logger.error("Error when checking price events with recent trades data")
+        if not self._last_recent_prices:
+            return
+        prices = [recent_price[self.PRICE_KEY] for recent_price in self._last_recent_prices]
+        timestamps = [recent_price[self.TIME_KEY] for recent_price in self._last_recent_prices]
+        self._set_triggered_events(self._check_events(min(prices), max(prices), min(timestamps), max(timestamps)))
 
     def handle_price(self, price, timestamp):
         """
@@ -69,8 +98,7 @@ class PriceEventsManager:
         :param timestamp: the timestamp to check
         """
         self._add_recent_price(price, timestamp)
-        for event_to_set in self._check_events(price, timestamp):
-            self._remove_and_set_event(event_to_set)
+        self._set_triggered_events(self._check_events(price, price, timestamp, timestamp))
 
     def clear_recent_prices(self):
         self._last_recent_prices = []
@@ -81,7 +109,7 @@ class PriceEventsManager:
             self.TIME_KEY: timestamp
         })
 
-    def new_event(self, price, timestamp, trigger_above, allow_instant_fill=True):
+    def new_event(self, price, timestamp, trigger_above, allow_instant_fill=True, callback=None):
         """
         Create a new event at price and timestamp.
         This event can already be set should it be instantly triggered.
@@ -90,17 +118,32 @@ class PriceEventsManager:
         :param timestamp: the timestamp to wait for
         :param trigger_above: True if waiting for an upper price
         :param allow_instant_fill: True if recent prices should be checked to fill this event
+        :param callback: async callable awaited by the callbacks dispatcher once the price conditions are met,
+        it is not called when the event is instantly set
         :return: the price event
         """
-        price_event_tuple = _new_price_event(price, timestamp, trigger_above)
+        price_event_tuple = _new_price_event(price, timestamp, trigger_above, callback)
         if allow_instant_fill and self._is_triggered_by_last_recent_prices(price, timestamp, trigger_above):
             # don't add to self.events an event that is already set
             price_event_tuple[PriceEventsManager.PRICE_EVENT_INDEX].set()
         else:
             # this event will be set when conditions are met
-            self.events.append(price_event_tuple)
+            self._add_event(price_event_tuple)
         return price_event_tuple[PriceEventsManager.PRICE_EVENT_INDEX]
 
+    def _add_event(self, price_event_tuple):
+        """
+        Add the price event to events and to the sorted events of its trigger side
+        :param price_event_tuple: the price event tuple to add
+        """
+        price, _, event, trigger_above, _ = price_event_tuple
+        self.events[event] = price_event_tuple
+        self._events_sequence += 1
+        if trigger_above:
+            self._trigger_above_events.add((-price, self._events_sequence, price_event_tuple))
+        else:
+            self._trigger_below_events.add((price, self._events_sequence, price_event_tuple))
+
     def _is_triggered_by_last_recent_prices(self, price, timestamp, trigger_above):
         """
         Check if the give price and time would be instantly triggered by last recent trades
@@ -125,6 +168,55 @@ class PriceEventsManager:
         """
         return self._remove_event(event_to_remove)
 
+    def dispatch_callback(self, callback):
+        """
+        Await the callback with the callbacks dispatcher, after the already pending callbacks
+        Does nothing if this callback is already pending
+        :param callback: the async callable to await
+        """
+        self._dispatch_callbacks([callback])
+
+    def remove_pending_callback(self, callback):
+        """
+        Remove the given callback from the callbacks waiting to be awaited by the callbacks dispatcher
+        :param callback: the callback to remove
+        """
+        self._pending_callbacks.pop(callback, None)
+
+    def _set_triggered_events(self, triggered_price_events):
+        """
+        Set and remove the triggered events and dispatch their callbacks
+        :param triggered_price_events: the triggered price event tuples, in events creation order
+        """
+        callbacks = []
+        for price_event_tuple in triggered_price_events:
+            self._remove_and_set_event(price_event_tuple[self.PRICE_EVENT_INDEX])
+            if price_event_tuple[self.CALLBACK_INDEX] is not None:
+                callbacks.append(price_event_tuple[self.CALLBACK_INDEX])
+        if callbacks:
+            self._dispatch_callbacks(callbacks)
+
+    def _dispatch_callbacks(self, callbacks):
+        """
+        Add callbacks to the pending callbacks and start the callbacks dispatcher if it is not running
+        :param callbacks: the callbacks to call
+        """
+        for callback in callbacks:
+            self._pending_callbacks[callback] = None
+        if self._callbacks_dispatcher_task is None or self._callbacks_dispatcher_task.done():
+            self._callbacks_dispatcher_task = asyncio.create_task(self._call_pending_callbacks())
+
+    async def _call_pending_callbacks(self):
+        """
+        Await pending callbacks one after the other, including the ones added while awaiting
+        """
+        while self._pending_callbacks:
+            callback, _ = self._pending_callbacks.popitem(last=False)
+            try:
+                await callback()
+            except Exception as err:
+                self.logger.exception(err, True, f"Error when calling price event callback: {err}")
+
     def _remove_and_set_event(self, event_to_set):
         """
         Set the event and remove it from event list
@@ -136,37 +228,65 @@ class PriceEventsManager:
 
     def _remove_event(self, event_to_remove):
         """
-        Remove the event from events list
+        Remove the event from events and from its sorted events
         :param event_to_remove: the event to remove
         """
-        for price_event_data in self.events:
-            if event_to_remove in price_event_data:
-                return self.events.remove(price_event_data)
-
-    def _check_events(self, price, timestamp):
-        """
-        Check for each price, timestamp pair event if it should be triggered
-        :param price: the price used to check
-        :param timestamp: the timestamp used to check
-        :return: the event list that match
-        """
-        return [
-            event
-            for event_price, event_timestamp, event, trigger_above in self.events
-            if event_timestamp <= timestamp and
-            (
-                (trigger_above and event_price <= price) or
-                (not trigger_above and event_price >= price)
-            )
+        price_event_tuple = self.events.pop(event_to_remove, None)
+        if price_event_tuple is None:
+            return
+        price, _, _, trigger_above, _ = price_event_tuple
+        sorted_events = self._trigger_above_events if trigger_above else self._trigger_below_events
+        key = -price if trigger_above else price
+        for index in range(sorted_events.bisect_left((key,)), len(sorted_events)):
+            if sorted_events[index][self.SORTED_ENTRY_PRICE_EVENT_INDEX] is price_event_tuple:
+                del sorted_events[index]
+                return
+
+    def _check_events(self, min_price, max_price, min_timestamp, max_timestamp):
+        """
+        Check which events are triggered by prices between min_price and max_price
+        at timestamps between min_timestamp and max_timestamp
+        :param min_price: the lowest price used to check
+        :param max_price: the highest price used to check
+        :param min_timestamp: the earliest timestamp used to check
+        :param max_timestamp: the latest timestamp used to check
+        :return: the price event tuples list that match, in events creation order
+        """
+        triggered_events = [
+            (sequence, price_event_tuple)
+            for sorted_events, key in ((self._trigger_above_events, -max_price),
+                                       (self._trigger_below_events, min_price))
+            # only look at crossed events
+            for _, sequence, price_event_tuple in sorted_events.islice(sorted_events.bisect_left((key,)))
+            if self._is_triggered_in_time_range(price_event_tuple, min_timestamp, max_timestamp)
         ]
+        triggered_events.sort()
+        return [price_event_tuple for _, price_event_tuple in triggered_events]
+
+    def _is_triggered_in_time_range(self, price_event_tuple, min_timestamp, max_timestamp):
+        """
+        Check if an event which price has been crossed is triggered
+        :param price_event_tuple: the crossed price event tuple
+        :param min_timestamp: the earliest timestamp of the crossing prices
+        :param max_timestamp: the latest timestamp of the crossing prices
+        :return: True if triggered
+        """
+        event_price, event_timestamp, _, trigger_above, _ = price_event_tuple
+        if event_timestamp <= min_timestamp:
+            return True
+        if event_timestamp > max_timestamp:
+            return False
+        # only happens with recent trades: check each of them
+        return self._is_triggered_by_last_recent_prices(event_price, event_timestamp, trigger_above)
 
 
-def _new_price_event(price, timestamp, trigger_above):
+def _new_price_event(price, timestamp, trigger_above, callback):
     """
     Create a new price event item
     :param price: the price condition
     :param timestamp: the timestamp condition
     :param trigger_above: True if waiting for an upper price
-    :return: a tuple to be added into events list
+    :param callback: the callback to call when the event is set, can be None
+    :return: a tuple to be added into events
     """
-    return price, timestamp, asyncio.Event(), trigger_above
+    return price, timestamp, asyncio.Event(), trigger_above, callback
@@ -20,6 +20,8 @@ cdef class TickerUpdater(ticker_channel.TickerProducer):
     cdef list _added_pairs
     cdef bint is_fetching_future_data
     cdef int refresh_time
+    cdef public bint is_fetching_all_tickers
+    cdef public double last_cycle_duration
 
     cdef dict _cleanup_ticker_dict(self, dict ticker)
     cdef list _get_pairs_to_update(self)
@@ -15,6 +15,7 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import decimal
+import time
 
 import asyncio
 
@@ -30,12 +31,17 @@ class TickerUpdater(ticker_channel.TickerProducer):
     TICKER_REFRESH_TIME = 64
     TICKER_FUTURE_REFRESH_TIME = 14
     TICKER_REFRESH_DELAY_THRESHOLD = 10
+    MAX_CONCURRENT_TICKER_REQUESTS = 5
 
     def __init__(self, channel):
         super().__init__(channel)
         self._added_pairs = []
         self.is_fetching_future_data = False
         self.refresh_time = self.TICKER_REFRESH_TIME
+        # when True, tickers are fetched using get_all_currencies_price_ticker
+        self.is_fetching_all_tickers = True
+        # duration of the last tickers update cycle (in seconds)
+        self.last_cycle_duration = 0
 
     async def start(self):
         if self._should_use_future():
@@ -45,16 +51,14 @@ class TickerUpdater(ticker_channel.TickerProducer):
             await self.pause()
         else:
             # initialize ticker
-            await asyncio.gather(*[self._fetch_ticker(pair)
-                                   for pair in self._get_pairs_to_update()])
+            await self._fetch_tickers(self._get_pairs_to_update())
             await asyncio.sleep(self.refresh_time)
             await self.start_update_loop()
 
     async def start_update_loop(self):
         while not self.should_stop and not self.channel.is_paused:
             try:
-                for pair in self._get_pairs_to_update():
-                    await self._fetch_ticker(pair)
+                await self._fetch_tickers(self._get_pairs_to_update())
 
                 await asyncio.sleep(self.refresh_time)
             except errors.NotSupported:
@@ -63,21 +67,72 @@ class TickerUpdater(ticker_channel.TickerProducer):
             except Exception as e:
                 self.logger.exception(e, True, f"Fail to update ticker : {e}")
 
+    async def _fetch_tickers(self, pairs):
+        """
+        Fetch and push tickers of the given pairs: using get_all_currencies_price_ticker when supported,
+        otherwise using at most MAX_CONCURRENT_TICKER_REQUESTS concurrent get_price_ticker requests
+        :param pairs: the pairs to fetch tickers of
+        """
+        start_time = time.time()
+        if not (self.is_fetching_all_tickers and len(pairs) > 1 and await self._fetch_all_tickers(pairs)):
+            await self._fetch_tickers_by_pair(pairs)
+        self.last_cycle_duration = time.time() - start_time
+        if self.last_cycle_duration > self.refresh_time:
+            self.logger.warning(f"Fetching {len(pairs)} tickers took {round(self.last_cycle_duration, 3)} seconds, "
+                                f"which is more than the {self.refresh_time} seconds refresh time")
+        else:
+            self.logger.debug(f"Fetched {len(pairs)} tickers in {round(self.last_cycle_duration, 3)} seconds")
+
+    async def _fetch_all_tickers(self, pairs) -> bool:
+        """
+        :return: False when the exchange is not supporting tickers fetch for multiple pairs
+        """
+        exchange = self.channel.exchange_manager.exchange
+        max_pairs = exchange.MAX_TICKERS_PER_REQUEST or len(pairs)
+        for index in range(0, len(pairs), max_pairs):
+            pairs_chunk = pairs[index:index + max_pairs]
+            try:
+                tickers: dict = await exchange.get_all_currencies_price_ticker(symbols=pairs_chunk)
+                for pair in pairs_chunk:
+                    await self._push_ticker(pair, tickers.get(pair))
+            except (errors.NotSupported, NotImplementedError):
+                self.logger.debug(f"{self.channel.exchange_manager.exchange_name} is not supporting tickers fetch "
+                                  f"for multiple pairs, fetching tickers by pair instead")
+                self.is_fetching_all_tickers = False
+                self._update_refresh_time()
+                return False
+            except errors.FailedRequest as e:
+                self.logger.warning(str(e))
+                # avoid spamming on disconnected situation
+                await asyncio.sleep(constants.DEFAULT_FAILED_REQUEST_RETRY_TIME)
+        return True
+
+    async def _fetch_tickers_by_pair(self, pairs):
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_TICKER_REQUESTS)
+
+        async def _fetch_pair_ticker(pair):
+            async with semaphore:
+                await self._fetch_ticker(pair)
+
+        await asyncio.gather(*(_fetch_pair_ticker(pair) for pair in pairs))
+
     async def _fetch_ticker(self, pair):
         try:
-            ticker: dict = await self.channel.exchange_manager.exchange.get_price_ticker(pair)
-            if self._is_valid(ticker):
-                await self.push(pair, ticker)
-                await self.parse_mini_ticker(pair, ticker)
-                if self.channel.exchange_manager.is_future:
-                    await self.parse_future_data(pair, ticker)
-            else:
-                self.logger.debug(f"Ignored incomplete ticker: {ticker}")
+            await self._push_ticker(pair, await self.channel.exchange_manager.exchange.get_price_ticker(pair))
         except errors.FailedRequest as e:
             self.logger.warning(str(e))
             # avoid spamming on disconnected situation
             await asyncio.sleep(constants.DEFAULT_FAILED_REQUEST_RETRY_TIME)
 
+    async def _push_ticker(self, pair, ticker):
+        if self._is_valid(ticker):
+            await self.push(pair, ticker)
+            await self.parse_mini_ticker(pair, ticker)
+            if self.channel.exchange_manager.is_future:
+                await self.parse_future_data(pair, ticker)
+        else:
+            self.logger.debug(f"Ignored incomplete ticker: {ticker}")
+
     @staticmethod
     def _is_valid(ticker):
         try:
@@ -189,6 +244,10 @@ class TickerUpdater(ticker_channel.TickerProducer):
         if self.is_fetching_future_data:
             # do not change ticker update rate on futures
             return
+        if self.is_fetching_all_tickers:
+            # tickers are fetched all at once, the number of requests does not depend on pairs count
+            self.refresh_time = self.TICKER_REFRESH_TIME
+            return
         pairs_to_update_count = len(self._get_pairs_to_update())
         delay_multiplier = pairs_to_update_count // self.TICKER_REFRESH_DELAY_THRESHOLD + 1
         # there can be many ticker requests when a large number of currency is in a
@@ -49,6 +49,8 @@ cdef class AbstractExchange(util.Initializable):
 
     # exchange settings
     cpdef bint authenticated(self)
+    cpdef bint supports_all_symbols_orders_fetch(self, bint is_open)
+    cpdef void on_reload_config(self)
     cpdef int get_max_handled_pair_with_time_frame(self)
 
     # parsers
@@ -53,6 +53,15 @@ class AbstractExchange(util.Initializable):
     SUPPORTED_BUNDLED_ORDERS = {}
     ACCOUNTS = {}
 
+    # when True, open and closed orders of every symbol are fetched in a single request (without symbol)
+    # when None, this support is derived from the connector capabilities, see supports_all_symbols_orders_fetch
+    # can be overridden locally to match exchange support
+    SUPPORTS_ALL_SYMBOLS_ORDERS_FETCH = None
+
+    # maximum number of symbols in a single get_all_currencies_price_ticker request, None when unlimited
+    # can be overridden locally to match exchange support
+    MAX_TICKERS_PER_REQUEST = None
+
     def __init__(self, config, exchange_manager):
         super().__init__()
         self.config = config
@@ -281,6 +290,16 @@ class AbstractExchange(util.Initializable):
         """
         raise NotImplementedError("cancel_order is not implemented")
 
+    async def cancel_orders(self, order_ids: list, symbol: str = None, **kwargs: dict) -> list:
+        """
+        Cancel a list of orders of the same symbol on the exchange using a single request
+        Raises NotSupported when the exchange does not support batch cancels
+        :param order_ids: the orders ids
+        :param symbol: the orders symbol
+        :return: the ids of the orders confirmed as cancelled
+        """
+        raise NotImplementedError("cancel_orders is not implemented")
+
     async def create_order(self, order_type: enums.TraderOrderType, symbol: str, quantity: decimal.Decimal,
                            price: decimal.Decimal = None, stop_price: decimal.Decimal = None,
                            side: enums.TradeOrderSide = None, current_price: decimal.Decimal = None,
@@ -361,6 +380,22 @@ class AbstractExchange(util.Initializable):
         """
         raise NotImplementedError("get_fees is not implemented")
 
+    def supports_all_symbols_orders_fetch(self, is_open):
+        """
+        :param is_open: True for open orders, False for closed orders
+        :return: True if orders of every symbol can be fetched in a single request (without symbol)
+        """
+        if self.SUPPORTS_ALL_SYMBOLS_ORDERS_FETCH is not None:
+            return self.SUPPORTS_ALL_SYMBOLS_ORDERS_FETCH
+        if self.connector is None:
+            return False
+        return self.connector.supports_all_symbols_orders_fetch(is_open)
+
+    def on_reload_config(self):
+        """
+        Called after the configuration is reloaded: clears configuration dependant cached values
+        """
+
     def get_pair_from_exchange(self, pair) -> str:
         """
         :param pair: the pair
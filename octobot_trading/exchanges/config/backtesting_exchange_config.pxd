@@ -18,3 +18,6 @@
 cdef class BacktestingExchangeConfig:
     cdef public object future_contract_type
     cdef public object funding_rate
+
+    cdef public bint preload_candles
+    cdef public object preloaded_candles_cache_folder
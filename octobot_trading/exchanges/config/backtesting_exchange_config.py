@@ -21,3 +21,9 @@ class BacktestingExchangeConfig:
         # future trading config data
         self.future_contract_type = trading_constants.DEFAULT_SYMBOL_CONTRACT_TYPE
         self.funding_rate = trading_constants.DEFAULT_SYMBOL_FUNDING_RATE
+
+        # candles data config
+        # when True, each symbol and time frame candles are loaded at once before starting backtesting
+        self.preload_candles = False
+        # when set, preloaded candles are stored into this folder and read from it as memory-mapped files
+        self.preloaded_candles_cache_folder = None
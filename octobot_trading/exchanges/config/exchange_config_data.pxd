@@ -30,6 +30,7 @@ cdef class ExchangeConfig(util.Initializable):
     cdef public list available_required_time_frames
     cdef public list traded_time_frames
     cdef public list real_time_time_frames
+    cdef public bint derive_higher_time_frames
     cdef public int required_historical_candles_count
 
     cdef public object exchange_manager
@@ -40,12 +41,10 @@ cdef class ExchangeConfig(util.Initializable):
     cpdef void set_config_traded_pairs(self)
     cpdef void set_historical_settings(self)
     cpdef object get_shortest_time_frame(self)
+    cpdef list get_derived_time_frames(self, list time_frames=*)
     cpdef void init_backtesting_exchange_config(self)
     cpdef list get_relevant_time_frames(self)
 
-    @staticmethod
-    cdef str _is_tradable_with_cryptocurrency(str symbol, str cryptocurrency)
-
     cdef void _set_config_time_frame(self)
     cdef void _set_config_traded_pairs(self)
     cdef set _set_config_traded_pair(self, str cryptocurrency, set traded_symbol_pairs_set, set existing_pairs)
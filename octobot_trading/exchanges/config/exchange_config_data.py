@@ -24,6 +24,7 @@ import octobot_commons.enums as commons_enums
 import octobot_commons.tree as commons_tree
 
 import octobot_trading.exchange_channel as exchange_channel
+import octobot_trading.exchange_data.ohlcv.candles_aggregator as candles_aggregator
 import octobot_trading.exchanges.config.backtesting_exchange_config as backtesting_exchange_config
 import octobot_trading.constants as trading_constants
 import octobot_trading.util as util
@@ -60,6 +61,11 @@ class ExchangeConfig(util.Initializable):
         # list of time frames to be used for real-time purposes (short time frames)
         self.real_time_time_frames = []
 
+        # when True, traded time frames candles that are aggregations of the shortest time frame candles are
+        # built from the shortest time frame candles instead of being fetched
+        # (enabled using ExchangeBuilder.is_deriving_higher_time_frames)
+        self.derive_higher_time_frames = False
+
         # number of required historical candles
         self.required_historical_candles_count = constants.DEFAULT_IGNORED_VALUE
 
@@ -84,6 +90,18 @@ class ExchangeConfig(util.Initializable):
     def get_shortest_time_frame(self):
         return self.traded_time_frames[-1]
 
+    def get_derived_time_frames(self, time_frames=None):
+        """
+        :param time_frames: time frames to select derived time frames from, defaults to traded time frames
+        :return: the time frames which candles are built from the shortest time frame candles
+        """
+        if not self.derive_higher_time_frames or not self.traded_time_frames:
+            return []
+        return candles_aggregator.get_derivable_time_frames(
+            self.get_shortest_time_frame(),
+            self.traded_time_frames if time_frames is None else time_frames
+        )
+
     def initialize_exchange_event_tree(self):
         tree_provider = commons_tree.EventProvider.instance()
         for topic in trading_constants.DEFAULT_FUTURES_INITIALIZATION_EVENT_TOPICS \
@@ -254,10 +272,6 @@ class ExchangeConfig(util.Initializable):
         self.traded_time_frames = list(set().union(self.available_required_time_frames, self.real_time_time_frames))
         self.traded_time_frames = time_frame_manager.sort_time_frames(self.traded_time_frames, reverse=True)
 
-    @staticmethod
-    def _is_tradable_with_cryptocurrency(symbol, cryptocurrency):
-        return symbol if octobot_commons.symbols.parse_symbol(symbol).quote == cryptocurrency else None
-
     def _add_tradable_symbols_from_config(self, cryptocurrency, filtered_symbols):
         return [
             symbol
@@ -269,6 +283,4 @@ class ExchangeConfig(util.Initializable):
         return self.exchange_manager.symbol_exists(symbol) and symbol not in filtered_symbols
 
     def _create_wildcard_symbol_list(self, cryptocurrency):
-        return [s for s in [ExchangeConfig._is_tradable_with_cryptocurrency(symbol, cryptocurrency)
-                            for symbol in self.exchange_manager.client_symbols]
-                if s is not None]
+        return self.exchange_manager.get_symbols_by_quote(cryptocurrency)
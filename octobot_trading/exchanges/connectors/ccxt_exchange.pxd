@@ -28,6 +28,7 @@ cdef class CCXTExchange(abstract_exchange.AbstractExchange):
     cdef dict headers
 
     cdef object additional_ccxt_config
+    cdef set _symbol_required_orders_fetches
 
     # private
     cdef void _create_client(self)
@@ -48,3 +49,5 @@ cdef class CCXTExchange(abstract_exchange.AbstractExchange):
     cdef object _get_unauthenticated_exchange(self)
     cdef object _get_client_config(self, object api_key=*, object secret=*, object password=*)
     cdef bint _should_authenticate(self)
+
+cdef list _get_cancelled_order_ids(list order_ids, object cancel_response)
@@ -52,6 +52,8 @@ class CCXTExchange(abstract_exchange.AbstractExchange):
         self.additional_ccxt_config = additional_ccxt_config
         self.headers = {}
         self.options = {}
+        # ccxt orders fetch methods that turned out to require a symbol
+        self._symbol_required_orders_fetches = set()
         # add default options
         self.add_options(self.get_ccxt_client_login_options())
 
@@ -69,6 +71,8 @@ class CCXTExchange(abstract_exchange.AbstractExchange):
             if self.exchange_manager.is_loading_markets:
                 with self.error_describer():
                     await self.client.load_markets()
+                # previous markets order rules are outdated
+                personal_data.clear_symbol_order_rules_cache()
 
             # initialize symbols and timeframes
             self.symbols = self.get_client_symbols()
@@ -333,7 +337,7 @@ class CCXTExchange(abstract_exchange.AbstractExchange):
     async def get_open_orders(self, symbol: str = None, since: int = None,
                               limit: int = None, **kwargs: dict) -> list:
         if self.client.has['fetchOpenOrders']:
-            with self.error_describer():
+            with self.error_describer(), self._symbol_required_orders_fetch_describer("fetchOpenOrders", symbol):
                 return await self.client.fetch_open_orders(symbol=symbol, since=since, limit=limit, params=kwargs)
         else:
             raise octobot_trading.errors.NotSupported("This exchange doesn't support fetchOpenOrders")
@@ -341,11 +345,35 @@ class CCXTExchange(abstract_exchange.AbstractExchange):
     async def get_closed_orders(self, symbol: str = None, since: int = None,
                                 limit: int = None, **kwargs: dict) -> list:
         if self.client.has['fetchClosedOrders']:
-            with self.error_describer():
+            with self.error_describer(), self._symbol_required_orders_fetch_describer("fetchClosedOrders", symbol):
                 return await self.client.fetch_closed_orders(symbol=symbol, since=since, limit=limit, params=kwargs)
         else:
             raise octobot_trading.errors.NotSupported("This exchange doesn't support fetchClosedOrders")
 
+    def supports_all_symbols_orders_fetch(self, is_open):
+        """
+        :param is_open: True for open orders, False for closed orders
+        :return: True when the ccxt client can fetch open or closed orders without symbol
+        """
+        fetch_method = "fetchOpenOrders" if is_open else "fetchClosedOrders"
+        if not self.client.has.get(fetch_method) or fetch_method in self._symbol_required_orders_fetches:
+            return False
+        # ccxt refuses symbol-less open orders requests when this option is enabled (rate limit cost warning)
+        return not (is_open and self.client.options.get("warnOnFetchOpenOrdersWithoutSymbol", False))
+
+    @contextlib.contextmanager
+    def _symbol_required_orders_fetch_describer(self, fetch_method, symbol):
+        """
+        Registers fetch_method as requiring a symbol when a symbol-less orders request is rejected by ccxt
+        """
+        try:
+            yield
+        except ccxt.ArgumentsRequired as err:
+            if symbol is not None:
+                raise
+            self._symbol_required_orders_fetches.add(fetch_method)
+            raise octobot_trading.errors.NotSupported(f"{fetch_method} requires a symbol: {err}") from err
+
     async def get_my_recent_trades(self, symbol: str = None, since: int = None,
                                    limit: int = None, **kwargs: dict) -> list:
         if self.client.has['fetchMyTrades'] or self.client.has['fetchTrades']:
@@ -377,6 +405,24 @@ class CCXTExchange(abstract_exchange.AbstractExchange):
             self.logger.exception(e, True, f"Order {order_id} failed to cancel | {e} ({e.__class__.__name__})")
         return cancel_resp is not None
 
+    async def cancel_orders(self, order_ids: list, symbol: str = None, **kwargs: dict) -> list:
+        if not self.client.has['cancelOrders']:
+            raise octobot_trading.errors.NotSupported("This exchange doesn't support cancelOrders")
+        try:
+            with self.error_describer():
+                cancel_response = await self.client.cancel_orders(order_ids, symbol=symbol, params=kwargs)
+            cancelled_order_ids = _get_cancelled_order_ids(order_ids, cancel_response)
+            if len(cancelled_order_ids) < len(order_ids):
+                self.logger.warning(f"Cancel of orders "
+                                    f"{[order_id for order_id in order_ids if order_id not in cancelled_order_ids]} "
+                                    f"is not confirmed by {self.name}")
+            return cancelled_order_ids
+        except (ccxt.NotSupported, octobot_trading.errors.NotSupported) as e:
+            raise octobot_trading.errors.NotSupported from e
+        except Exception as e:
+            self.logger.exception(e, True, f"Orders {order_ids} failed to cancel | {e} ({e.__class__.__name__})")
+        return []
+
     async def get_positions(self, **kwargs: dict) -> list:
         return await self.client.fetch_positions(params=kwargs)
 
@@ -635,3 +681,16 @@ class CCXTExchange(abstract_exchange.AbstractExchange):
                     f"Last json response: {self.client.last_json_response}"
                 )
             raise
+
+
+def _get_cancelled_order_ids(order_ids, cancel_response):
+    """
+    :return: the ids from order_ids that are confirmed as cancelled in the given ccxt cancel_orders response
+    """
+    if not isinstance(cancel_response, list):
+        return []
+    confirmed_ids = set()
+    for order in cancel_response:
+        if isinstance(order, dict) and order.get(ecoc.STATUS.value) in (None, enums.OrderStatus.CANCELED.value):
+            confirmed_ids.add(str(order.get(ecoc.ID.value)))
+    return [order_id for order_id in order_ids if str(order_id) in confirmed_ids]
@@ -38,8 +38,7 @@ import octobot_trading.constants as trading_constants
 import octobot_trading.enums as trading_enums
 import octobot_trading.exchanges.abstract_websocket_exchange as abstract_websocket
 import octobot_trading.exchanges.connectors.abstract_websocket_connector as abstract_websocket_connector
-from octobot_trading.enums import ExchangeConstantsOrderBookInfoColumns as ECOBIC, \
-    ExchangeConstantsTickersColumns as Ectc
+from octobot_trading.enums import ExchangeConstantsTickersColumns as Ectc
 from octobot_trading.enums import WebsocketFeeds as Feeds
 
 
@@ -574,21 +573,16 @@ class CryptofeedWebsocketConnector(abstract_websocket.AbstractWebsocketExchange)
     def _is_pair_independent_feed(self, feed):
         return feed in self.PAIR_INDEPENDENT_CHANNELS
 
-    def _convert_book_prices_to_orders(self, book_prices, book_side):
+    def _convert_book_prices_to_levels(self, book_prices):
         """
-        Convert a book_prices format : {PRICE_1: SIZE_1, PRICE_2: SIZE_2...}
-        to OctoBot's order book format
-        :param book_prices: an order book dictionary (order_book.SortedDict)
-        :param book_side: a TradeOrderSide value
-        :return: the list of order book data converted
+        Convert a book_prices format : [(PRICE_1, SIZE_1), (PRICE_2, SIZE_2)...]
+        to OctoBot's [price, size] order book levels format
+        :param book_prices: an order book side price and size pairs
+        :return: the list of order book levels converted
         """
         return [
-            {
-                ECOBIC.PRICE.value: float(order_price),
-                ECOBIC.SIZE.value: float(order_size),
-                ECOBIC.SIDE.value: book_side,
-            }
-            for order_price, order_size in book_prices.to_dict().items()
+            [float(order_price), float(order_size)]
+            for order_price, order_size in book_prices
         ]
 
     def _set_async_callbacks(self):
@@ -677,20 +671,24 @@ class CryptofeedWebsocketConnector(abstract_websocket.AbstractWebsocketExchange)
         """
         symbol = self.get_pair_from_exchange(order_book.symbol)
         book_instance = self.get_book_instance(symbol)
-
-        book_instance.handle_book_adds(
-            self._convert_book_prices_to_orders(
-                book_prices=order_book.book.asks,
-                book_side=trading_enums.TradeOrderSide.SELL.value) +
-            self._convert_book_prices_to_orders(
-                book_prices=order_book.book.bids,
-                book_side=trading_enums.TradeOrderSide.BUY.value))
+        is_delta = order_book.delta is not None
+        if is_delta:
+            # only forward changed levels, full book consumers get the levels of book_instance
+            asks = self._convert_book_prices_to_levels(order_book.delta[cryptofeed_constants.ASK])
+            bids = self._convert_book_prices_to_levels(order_book.delta[cryptofeed_constants.BID])
+            book_instance.handle_book_deltas(asks, bids, timestamp=order_book.timestamp)
+        else:
+            asks = self._convert_book_prices_to_levels(order_book.book.asks.to_list())
+            bids = self._convert_book_prices_to_levels(order_book.book.bids.to_list())
+            book_instance.handle_new_books(asks, bids, timestamp=order_book.timestamp)
 
         await self.push_to_channel(trading_constants.ORDER_BOOK_CHANNEL,
                                    symbol,
-                                   book_instance.asks,
-                                   book_instance.bids,
-                                   update_order_book=False)
+                                   asks,
+                                   bids,
+                                   update_order_book=False,
+                                   delta=is_delta,
+                                   full_book=book_instance)
 
     async def candle(self, candle_data: cryptofeed_types.Candle, receipt_timestamp: float):
         """
@@ -26,13 +26,23 @@ cdef class ExchangeSimulator(abstract_exchange.AbstractExchange):
 
     cdef public bint is_authenticated
 
+    cdef dict _fees_by_symbol
+    cdef dict _base_and_quote_by_symbol
+    cdef dict _market_status
+
     cpdef str get_pair_cryptocurrency(self, str pair)
     cpdef list get_available_time_frames(self)
     cpdef list get_backtesting_data_files(self)
     cpdef list get_time_frames(self, object importer)
 
+    cdef dict _get_symbol_market_status(self, str symbol)
+    cdef dict _get_symbol_fees(self, str symbol)
+    cdef dict _create_fees(self)
+
     cdef void _read_fees_from_config(self, dict result_fees)
 
+cdef dict _copy_market_status(dict market_status)
+
 # Should be cythonized with cython 3.0
 # cpdef set handles_real_data_for_updater(str channel_type, list available_data_types)
 
@@ -29,6 +29,7 @@ import octobot_trading.enums as enums
 import octobot_trading.exchanges.abstract_exchange as abstract_exchange
 import octobot_trading.exchange_data as exchange_data
 import octobot_trading.exchanges.util as util
+import octobot_trading.personal_data as personal_data
 
 
 class ExchangeSimulator(abstract_exchange.AbstractExchange):
@@ -43,6 +44,12 @@ class ExchangeSimulator(abstract_exchange.AbstractExchange):
 
         self.is_authenticated = False
 
+        # per symbol cached values, see on_reload_config
+        self._fees_by_symbol = {}
+        self._base_and_quote_by_symbol = {}
+        # market status of every symbol
+        self._market_status = self._create_market_status()
+
     async def initialize_impl(self):
         self.exchange_importers = self.backtesting.get_importers(importers.ExchangeDataImporter)
         # load symbols and time frames
@@ -114,7 +121,28 @@ class ExchangeSimulator(abstract_exchange.AbstractExchange):
     def get_backtesting_data_files(self):
         return [backtesting_api.get_data_file_path(importer) for importer in self.exchange_importers]
 
+    def on_reload_config(self):
+        """
+        Called after the simulator configuration changed: clears cached symbols fees and order rules
+        """
+        self._fees_by_symbol = {}
+        self._base_and_quote_by_symbol = {}
+        personal_data.clear_symbol_order_rules_cache()
+
     def get_market_status(self, symbol, price_example=0, with_fixer=True):
+        """
+        :return: a copy of the market status of the given symbol
+        """
+        return _copy_market_status(self._get_symbol_market_status(symbol))
+
+    def _get_symbol_market_status(self, symbol):
+        """
+        :return: the market status of the given symbol, should not be modified
+        """
+        return self._market_status
+
+    @staticmethod
+    def _create_market_status():
         return {
             # number of decimal digits "after the dot"
             enums.ExchangeConstantsMarketStatusColumns.PRECISION.value: {
@@ -142,6 +170,22 @@ class ExchangeSimulator(abstract_exchange.AbstractExchange):
         return timestamp / 1000
 
     def get_fees(self, symbol):
+        """
+        :return: a copy of the cached fees of the given symbol
+        """
+        return dict(self._get_symbol_fees(symbol))
+
+    def _get_symbol_fees(self, symbol):
+        """
+        :return: the cached fees of the given symbol, should not be modified
+        """
+        try:
+            return self._fees_by_symbol[symbol]
+        except KeyError:
+            fees = self._fees_by_symbol[symbol] = self._create_fees()
+            return fees
+
+    def _create_fees(self):
         result_fees = {
             enums.ExchangeConstantsMarketPropertyColumns.TAKER.value: constants.CONFIG_DEFAULT_SIMULATOR_FEES,
             enums.ExchangeConstantsMarketPropertyColumns.MAKER.value: constants.CONFIG_DEFAULT_SIMULATOR_FEES,
@@ -183,12 +227,11 @@ class ExchangeSimulator(abstract_exchange.AbstractExchange):
     def get_trade_fee(self, symbol, order_type, quantity, price, taker_or_maker):
         if not taker_or_maker:
             taker_or_maker = enums.ExchangeConstantsMarketPropertyColumns.TAKER.value
-        symbol_fees = self.get_fees(symbol)
-        rate = symbol_fees[taker_or_maker]
-        currency, market = symbol_util.parse_symbol(symbol).base_and_quote()
+        rate = self._get_symbol_fees(symbol)[taker_or_maker]
+        currency, market = self.get_split_pair_from_exchange(symbol)
         fee_currency = currency
 
-        precision = self.get_market_status(symbol)[enums.ExchangeConstantsMarketStatusColumns.PRECISION.value] \
+        precision = self._get_symbol_market_status(symbol)[enums.ExchangeConstantsMarketStatusColumns.PRECISION.value] \
             [enums.ExchangeConstantsMarketStatusColumns.PRECISION_PRICE.value]
         cost = float(number_util.round_into_str_with_max_digits(float(quantity) * rate, precision))
 
@@ -209,7 +252,11 @@ class ExchangeSimulator(abstract_exchange.AbstractExchange):
                                                    reverse=True)
 
     def get_split_pair_from_exchange(self, pair) -> (str, str):
-        return symbol_util.parse_symbol(pair).base_and_quote()
+        try:
+            return self._base_and_quote_by_symbol[pair]
+        except KeyError:
+            base_and_quote = self._base_and_quote_by_symbol[pair] = symbol_util.parse_symbol(pair).base_and_quote()
+            return base_and_quote
 
     def get_pair_cryptocurrency(self, pair) -> str:
         return self.get_split_pair_from_exchange(pair)[0]
@@ -226,3 +273,16 @@ class ExchangeSimulator(abstract_exchange.AbstractExchange):
         :return: the maximum number of simultaneous pairs * time_frame that this exchange can handle.
         """
         return constants.INFINITE_MAX_HANDLED_PAIRS_WITH_TIMEFRAME
+
+
+def _copy_market_status(market_status):
+    """
+    :return: a copy of the market status and of its precision and limits dicts
+    """
+    return {
+        key: {
+            sub_key: dict(sub_value) if isinstance(sub_value, dict) else sub_value
+            for sub_key, sub_value in value.items()
+        } if isinstance(value, dict) else value
+        for key, value in market_status.items()
+    }
@@ -36,6 +36,8 @@ cdef class ExchangeBuilder:
     cpdef ExchangeBuilder is_loading_markets(self, bint is_loading_markets)
     cpdef ExchangeBuilder is_real(self)
     cpdef ExchangeBuilder is_using_exchange_type(self, str exchange_type)
+    cpdef ExchangeBuilder is_preloading_candles(self, bint preload_candles=*, object cache_folder=*)
+    cpdef ExchangeBuilder is_deriving_higher_time_frames(self, bint derive_higher_time_frames=*)
     cpdef ExchangeBuilder enable_storage(self, bint enabled)
     cpdef ExchangeBuilder is_margin(self, bint use_margin=*)
     cpdef ExchangeBuilder is_exchange_only(self)
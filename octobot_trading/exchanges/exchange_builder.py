@@ -187,6 +187,17 @@ class ExchangeBuilder:
                 future_contract_type
         return self
 
+    def is_preloading_candles(self, preload_candles=True, cache_folder=None):
+        if self.exchange_manager.is_backtesting:
+            self.exchange_manager.exchange_config.backtesting_exchange_config.preload_candles = preload_candles
+            self.exchange_manager.exchange_config.backtesting_exchange_config.preloaded_candles_cache_folder = \
+                cache_folder
+        return self
+
+    def is_deriving_higher_time_frames(self, derive_higher_time_frames=True):
+        self.exchange_manager.exchange_config.derive_higher_time_frames = derive_higher_time_frames
+        return self
+
     def enable_storage(self, enabled):
         self.exchange_manager.enable_storage = enabled
         return self
@@ -34,8 +34,12 @@ cdef class ExchangeManager(util.Initializable):
     cdef public object backtesting
     cdef public object trader
 
-    cdef public list client_time_frames
-    cdef public list client_symbols
+    cdef list _client_time_frames
+    cdef list _client_symbols
+    cdef set _client_symbols_set
+    cdef set _client_time_frames_set
+    cdef dict _symbols_by_base
+    cdef dict _symbols_by_quote
     cdef public list trading_modes
 
     cdef public bint rest_only
@@ -70,6 +74,7 @@ cdef class ExchangeManager(util.Initializable):
 
     # private
     cdef object _load_config_symbols_and_time_frames(self)
+    cdef void _index_client_symbols_by_currency(self)
 
     # public
     cpdef bint enabled(self)
@@ -83,6 +88,8 @@ cdef class ExchangeManager(util.Initializable):
     cpdef bint check_config(self, str exchange_name)
     cpdef bint symbol_exists(self, str symbol)
     cpdef bint time_frame_exists(self, object time_frame)
+    cpdef list get_symbols_by_base(self, str base)
+    cpdef list get_symbols_by_quote(self, str quote)
     cpdef str get_exchange_name(self)
     cpdef int get_currently_handled_pair_with_time_frame(self)
     cpdef bint get_is_overloaded(self)
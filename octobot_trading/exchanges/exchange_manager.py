@@ -18,6 +18,7 @@ import uuid
 import octobot_commons.configuration as configuration
 import octobot_commons.constants as common_constants
 import octobot_commons.logging as logging
+import octobot_commons.symbols as symbol_util
 import octobot_commons.timestamp_util as timestamp_util
 
 import octobot_trading.exchange_channel as exchange_channel
@@ -74,8 +75,14 @@ class ExchangeManager(util.Initializable):
 
         self.exchange_web_socket = None
 
-        self.client_symbols = []
-        self.client_time_frames = []
+        self._client_symbols = []
+        self._client_time_frames = []
+        # client_symbols and client_time_frames lookup sets, rebuilt when these lists are set
+        self._client_symbols_set = set()
+        self._client_time_frames_set = set()
+        # {currency: [client_symbols of this base or quote]}, created on first call
+        self._symbols_by_base = None
+        self._symbols_by_quote = None
 
         self.storage_manager = storage.StorageManager(self)
         self.exchange_config = exchanges.ExchangeConfig(self)
@@ -84,6 +91,27 @@ class ExchangeManager(util.Initializable):
 
         self.debug_info = {}
 
+    @property
+    def client_symbols(self):
+        return self._client_symbols
+
+    @client_symbols.setter
+    def client_symbols(self, client_symbols):
+        # lookups are indexed when setting client_symbols: replace this list instead of updating it in place
+        self._client_symbols = client_symbols
+        self._client_symbols_set = set(client_symbols or ())
+        self._symbols_by_base = self._symbols_by_quote = None
+
+    @property
+    def client_time_frames(self):
+        return self._client_time_frames
+
+    @client_time_frames.setter
+    def client_time_frames(self, client_time_frames):
+        # lookups are indexed when setting client_time_frames: replace this list instead of updating it in place
+        self._client_time_frames = client_time_frames
+        self._client_time_frames_set = set(client_time_frames or ())
+
     async def initialize_impl(self):
         await exchanges.create_exchanges(self)
         if self.is_storage_enabled():
@@ -224,12 +252,38 @@ class ExchangeManager(util.Initializable):
             self.logger.error(f"Failed to load available symbols from REST exchange, impossible to check if "
                               f"{symbol} exists on {self.exchange.name}")
             return False
-        return symbol in self.client_symbols
+        return symbol in self._client_symbols_set
 
     def time_frame_exists(self, time_frame):
         if not self.client_time_frames:
             return False
-        return time_frame in self.client_time_frames
+        return time_frame in self._client_time_frames_set
+
+    def get_symbols_by_base(self, base):
+        """
+        :param base: the base currency
+        :return: the client_symbols of this base currency, in client_symbols order
+        """
+        if self._symbols_by_base is None:
+            self._index_client_symbols_by_currency()
+        return list(self._symbols_by_base.get(base, ()))
+
+    def get_symbols_by_quote(self, quote):
+        """
+        :param quote: the quote currency
+        :return: the client_symbols of this quote currency, in client_symbols order
+        """
+        if self._symbols_by_quote is None:
+            self._index_client_symbols_by_currency()
+        return list(self._symbols_by_quote.get(quote, ()))
+
+    def _index_client_symbols_by_currency(self):
+        self._symbols_by_base = {}
+        self._symbols_by_quote = {}
+        for symbol in self.client_symbols:
+            parsed_symbol = symbol_util.parse_symbol(symbol)
+            self._symbols_by_base.setdefault(parsed_symbol.base, []).append(symbol)
+            self._symbols_by_quote.setdefault(parsed_symbol.quote, []).append(symbol)
 
     # Exceptions
     def _raise_exchange_load_error(self):
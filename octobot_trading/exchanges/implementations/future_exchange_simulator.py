@@ -83,6 +83,9 @@ class FutureExchangeSimulator(exchanges_types.FutureExchange):
     def get_fees(self, symbol):
         return self.connector.get_fees(symbol)
 
+    def on_reload_config(self):
+        self.connector.on_reload_config()
+
     def get_trade_fee(self, symbol, order_type, quantity, price, taker_or_maker):
         return self.connector.get_trade_fee(symbol, order_type, quantity, price, taker_or_maker)
 
@@ -98,6 +98,9 @@ class MarginCCXTExchange(exchanges_types.MarginExchange):
     async def cancel_order(self, order_id: str, symbol: str = None, **kwargs: dict) -> bool:
         return await self.connector.cancel_order(symbol=symbol, order_id=order_id, **kwargs)
 
+    async def cancel_orders(self, order_ids: list, symbol: str = None, **kwargs: dict) -> list:
+        return await self.connector.cancel_orders(order_ids, symbol=symbol, **kwargs)
+
     def get_trade_fee(self, symbol, order_type, quantity, price, taker_or_maker):
         return self.connector.get_trade_fee(symbol, order_type, quantity, price, taker_or_maker)
 
@@ -30,6 +30,8 @@ cdef class Trader(util.Initializable):
     cdef public bint simulate
     cdef public bint is_enabled
 
+    cdef set _cancelled_on_exchange_order_ids
+
     cdef public object logger
 
     cdef public exchange_manager.ExchangeManager exchange_manager
@@ -14,6 +14,8 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 
+import asyncio
+import contextlib
 import decimal
 
 import octobot_commons.logging as logging
@@ -33,6 +35,8 @@ import octobot_trading.signals as signals
 class Trader(util.Initializable):
     NO_HISTORY_MESSAGE = "Starting a fresh new trading session using the current portfolio as a profitability " \
                          "reference."
+    # maximum number of parallel order creation or cancel requests
+    MAX_CONCURRENT_ORDERS_REQUESTS = 5
 
     def __init__(self, config, exchange_manager):
         super().__init__()
@@ -54,6 +58,8 @@ class Trader(util.Initializable):
 
         if not hasattr(self, 'simulate'):
             self.simulate = False
+        # ids of the orders already cancelled on exchange by ongoing cancel_orders calls
+        self._cancelled_on_exchange_order_ids = set()
         self.is_enabled = self.__class__.enabled(self.config)
 
     async def initialize_impl(self):
@@ -99,17 +105,8 @@ class Trader(util.Initializable):
             order.is_from_this_octobot = False
             self.logger.debug(f"Order loaded : {order.to_string()} ")
         else:
-            try:
-                params = params or {}
-                self.logger.info(f"Creating order: {created_order}")
-                created_order = await self._create_new_order(order, params)
-                if created_order is None:
-                    self.logger.warning(f"Order not created order on {self.exchange_manager.exchange_name} "
-                                        f"(failed attempt to create: {order}). This is likely due to "
-                                        f"the order being refused by the exchange.")
-                    return None
-            except Exception as e:
-                self.logger.exception(e, True, f"Unexpected error when creating order: {e}")
+            created_order = await self._create_new_order_or_log_error(order, params)
+            if created_order is None:
                 return None
 
         if pre_init_callback is not None:
@@ -119,6 +116,53 @@ class Trader(util.Initializable):
         await created_order.initialize()
         return created_order
 
+    async def create_orders(self, orders: list, params: dict = None) -> list:
+        """
+        Create new orders from OrderFactory created orders, update portfolio, registers orders in order manager and
+        notifies order channel.
+        On real exchanges, creation requests are sent in parallel. Orders are then initialized one by one, in the
+        given order, from the current task to remain compatible with an already acquired portfolio lock.
+        :param orders: Orders to create
+        :param params: Additional parameters to give to each order upon creation (used in real trading only)
+        :return: The created orders instances, None for each order that failed to be created
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_ORDERS_REQUESTS)
+
+        async def _create_new_order(order):
+            async with semaphore:
+                return await self._create_new_order_or_log_error(order, params)
+
+        if self.simulate:
+            # simulated orders creation is not waiting for any exchange request: no need for parallel creations
+            created_orders = [await self._create_new_order_or_log_error(order, params) for order in orders]
+        else:
+            created_orders = await asyncio.gather(*(_create_new_order(order) for order in orders))
+        created_orders = list(created_orders)
+        for index, created_order in enumerate(created_orders):
+            if created_order is not None:
+                try:
+                    # force initialize to always create open state
+                    await created_order.initialize()
+                except Exception as e:
+                    # keep initializing the other orders: they might already be created on exchange
+                    self.logger.exception(e, True, f"Unexpected error when initializing order: {e}")
+                    created_orders[index] = None
+        return created_orders
+
+    async def _create_new_order_or_log_error(self, order: object, params: dict) -> object:
+        try:
+            params = params or {}
+            self.logger.info(f"Creating order: {order}")
+            created_order = await self._create_new_order(order, params)
+            if created_order is None:
+                self.logger.warning(f"Order not created order on {self.exchange_manager.exchange_name} "
+                                    f"(failed attempt to create: {order}). This is likely due to "
+                                    f"the order being refused by the exchange.")
+            return created_order
+        except Exception as e:
+            self.logger.exception(e, True, f"Unexpected error when creating order: {e}")
+            return None
+
     async def create_artificial_order(self, order_type, symbol, current_price, quantity, price):
         """
         Creates an OctoBot managed order (managed orders example: stop loss that is not published on the exchange and
@@ -281,10 +325,15 @@ class Trader(util.Initializable):
         if order and order.is_open():
             self.logger.info(f"Cancelling order: {order}")
             # always cancel this order first to avoid infinite loop followed by deadlock
-            return await self._handle_order_cancellation(order, ignored_order)
+            # orders of an ongoing cancel_orders call might get cancelled from their order group: don't cancel
+            # them on exchange when it has already been done
+            return await self._handle_order_cancellation(
+                order, ignored_order, cancelled_on_exchange=order.order_id in self._cancelled_on_exchange_order_ids
+            )
         return False
 
-    async def _handle_order_cancellation(self, order: object, ignored_order: object) -> bool:
+    async def _handle_order_cancellation(self, order: object, ignored_order: object,
+                                         cancelled_on_exchange: bool = False) -> bool:
         success = True
         async with order.lock:
             if order.is_waiting_for_chained_trigger:
@@ -293,10 +342,9 @@ class Trader(util.Initializable):
                 return success
             # if real order: cancel on exchange
             if not self.simulate and not order.is_self_managed():
-                success = await self.exchange_manager.exchange.cancel_order(order.order_id, order.symbol)
-                if not success:
-                    # retry to cancel order
-                    success = await self.exchange_manager.exchange.cancel_order(order.order_id, order.symbol)
+                # order is already cancelled on exchange when cancelled from cancel_orders
+                if not cancelled_on_exchange:
+                    success = await self._cancel_order_on_exchange(order)
                 if not success:
                     self.logger.warning(f"Failed to cancel order {order}")
                     return False
@@ -312,6 +360,93 @@ class Trader(util.Initializable):
                               ignored_order=ignored_order)
         return True
 
+    async def _cancel_order_on_exchange(self, order: object) -> bool:
+        success = await self.exchange_manager.exchange.cancel_order(order.order_id, order.symbol)
+        if not success:
+            # retry to cancel order
+            success = await self.exchange_manager.exchange.cancel_order(order.order_id, order.symbol)
+        return success
+
+    async def cancel_orders(self, orders: list, emit_trading_signals=False) -> (bool, list):
+        """
+        Cancels the given orders, updates the portfolio and publish in order channel.
+        On real exchanges, orders of a same symbol are cancelled using a single request when supported by the
+        exchange, otherwise cancel requests are sent in parallel.
+        :param orders: Orders to cancel
+        :param emit_trading_signals: when true, trading signals will be emitted (one signal bundle per symbol)
+        :return: (True, orders): True if all orders got cancelled, False if an error occurred and the list of
+        cancelled orders
+        """
+        orders = [order for order in orders if order.is_open()]
+        all_cancelled = True
+        cancelled_orders = []
+        async with contextlib.AsyncExitStack() as signal_publishers:
+            for symbol in set(order.symbol for order in orders):
+                await signal_publishers.enter_async_context(
+                    signals.remote_signal_publisher(self.exchange_manager, symbol, emit_trading_signals)
+                )
+            cancelled_order_ids, failed_orders = (set(), []) if self.simulate \
+                else await self._cancel_orders_on_exchange(orders)
+            self._cancelled_on_exchange_order_ids.update(cancelled_order_ids)
+            try:
+                for order in orders:
+                    if order in failed_orders:
+                        all_cancelled = False
+                        continue
+                    if not order.is_open():
+                        # already cancelled alongside a previously cancelled order (from an order group)
+                        continue
+                    self.logger.info(f"Cancelling order: {order}")
+                    if await self._handle_order_cancellation(
+                        order, None, cancelled_on_exchange=order.order_id in cancelled_order_ids
+                    ):
+                        cancelled_orders.append(order)
+                        if emit_trading_signals:
+                            signals.SignalPublisher.instance().get_signal_bundle_builder(order.symbol) \
+                                .add_cancelled_order(order, self.exchange_manager)
+                    else:
+                        all_cancelled = False
+            finally:
+                self._cancelled_on_exchange_order_ids.difference_update(cancelled_order_ids)
+        return all_cancelled, cancelled_orders
+
+    async def _cancel_orders_on_exchange(self, orders: list) -> tuple:
+        """
+        Cancels the given orders on exchange. Orders are not updated on OctoBot's side.
+        Orders which cancel is not confirmed by a batch cancel request are cancelled one by one.
+        :return: the ids of the orders cancelled on exchange and the list of orders that failed to be cancelled
+        """
+        orders_by_symbol = {}
+        for order in orders:
+            if not order.is_self_managed() and not order.is_waiting_for_chained_trigger:
+                orders_by_symbol.setdefault(order.symbol, []).append(order)
+        cancelled_order_ids = set()
+        remaining_orders = []
+        for symbol, symbol_orders in orders_by_symbol.items():
+            try:
+                cancelled_order_ids.update(await self.exchange_manager.exchange.cancel_orders(
+                    [order.order_id for order in symbol_orders], symbol
+                ))
+            except (errors.NotSupported, NotImplementedError):
+                pass
+            remaining_orders += [order for order in symbol_orders if order.order_id not in cancelled_order_ids]
+        if not remaining_orders:
+            return cancelled_order_ids, []
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_ORDERS_REQUESTS)
+
+        async def _cancel_order(order):
+            async with semaphore:
+                if await self._cancel_order_on_exchange(order):
+                    cancelled_order_ids.add(order.order_id)
+                    return True
+            self.logger.warning(f"Failed to cancel order {order}")
+            return False
+
+        cancelled = await asyncio.gather(*(_cancel_order(order) for order in remaining_orders))
+        return cancelled_order_ids, [
+            order for order, is_cancelled in zip(remaining_orders, cancelled) if not is_cancelled
+        ]
+
     async def cancel_order_with_id(self, order_id, emit_trading_signals=False):
         """
         Gets order matching order_id from the OrderManager and calls self.cancel_order() on it
@@ -337,19 +472,17 @@ class Trader(util.Initializable):
         :return: (True, orders): True if all orders got cancelled, False if an error occurred and the list of
         cancelled orders
         """
-        all_cancelled = True
-        cancelled_orders = []
-        for order in self.exchange_manager.exchange_personal_data.orders_manager.get_open_orders():
-            if order.symbol == symbol and \
-                    (side is None or order.side is side) and \
-                    not order.is_cancelled() and \
-                    (cancel_loaded_orders or order.is_from_this_octobot):
-                async with signals.remote_signal_publisher(self.exchange_manager, order.symbol, emit_trading_signals):
-                    cancelled = await signals.cancel_order(self.exchange_manager, emit_trading_signals, order)
-                if cancelled:
-                    cancelled_orders.append(order)
-                all_cancelled = cancelled and all_cancelled
-        return all_cancelled, cancelled_orders
+        return await self.cancel_orders(
+            [
+                order
+                for order in self.exchange_manager.exchange_personal_data.orders_manager.get_open_orders()
+                if order.symbol == symbol and
+                (side is None or order.side is side) and
+                not order.is_cancelled() and
+                (cancel_loaded_orders or order.is_from_this_octobot)
+            ],
+            emit_trading_signals=emit_trading_signals
+        )
 
     async def cancel_all_open_orders_with_currency(self, currency, emit_trading_signals=False) -> bool:
         """
@@ -359,13 +492,17 @@ class Trader(util.Initializable):
         :param emit_trading_signals: when true, trading signals will be emitted
         :return: True if all orders got cancelled, False if an error occurred
         """
-        all_cancelled = True
         symbols = util.get_pairs(self.config, currency, enabled_only=True)
         if symbols:
-            for symbol in symbols:
-                all_cancelled = (await self.cancel_open_orders(symbol, emit_trading_signals=emit_trading_signals))[0] \
-                                and all_cancelled
-        return all_cancelled
+            return (await self.cancel_orders(
+                [
+                    order
+                    for order in self.exchange_manager.exchange_personal_data.orders_manager.get_open_orders()
+                    if order.symbol in symbols and not order.is_cancelled()
+                ],
+                emit_trading_signals=emit_trading_signals
+            ))[0]
+        return True
 
     async def cancel_all_open_orders(self, emit_trading_signals=False) -> bool:
         """
@@ -373,43 +510,45 @@ class Trader(util.Initializable):
         :param emit_trading_signals: when true, trading signals will be emitted
         :return: True if all orders got cancelled, False if an error occurred
         """
-        all_cancelled = True
-        for order in self.exchange_manager.exchange_personal_data.orders_manager.get_open_orders():
-            if not order.is_cancelled():
-                async with signals.remote_signal_publisher(self.exchange_manager, order.symbol, emit_trading_signals):
-                    all_cancelled = await signals.cancel_order(self.exchange_manager, emit_trading_signals, order) \
-                                    and all_cancelled
-        return all_cancelled
-
-    async def _sell_everything(self, symbol, inverted, timeout=None):
-        created_orders = []
+        return (await self.cancel_orders(
+            [
+                order
+                for order in self.exchange_manager.exchange_personal_data.orders_manager.get_open_orders()
+                if not order.is_cancelled()
+            ],
+            emit_trading_signals=emit_trading_signals
+        ))[0]
+
+    async def _get_sell_everything_orders(self, symbol, inverted, timeout=None):
+        """
+        :return: the orders to create to sell everything of the given symbol
+        """
+        orders = []
         order_type = octobot_trading.enums.TraderOrderType.BUY_MARKET \
             if inverted else octobot_trading.enums.TraderOrderType.SELL_MARKET
-        async with self.exchange_manager.exchange_personal_data.portfolio_manager.portfolio.lock:
-            current_symbol_holding, current_market_quantity, _, price, symbol_market = \
-                await order_util.get_pre_order_data(self.exchange_manager, symbol, timeout=timeout)
-            if inverted:
-                if price > 0:
-                    quantity = current_market_quantity / price
-                else:
-                    quantity = 0
+        current_symbol_holding, current_market_quantity, _, price, symbol_market = \
+            await order_util.get_pre_order_data(self.exchange_manager, symbol, timeout=timeout)
+        if inverted:
+            if price > 0:
+                quantity = current_market_quantity / price
             else:
-                quantity = current_symbol_holding
-            for order_quantity, order_price in decimal_order_adapter.decimal_check_and_adapt_order_details_if_necessary(quantity, price,
-                                                                                                        symbol_market):
-                current_order = order_factory.create_order_instance(trader=self,
-                                                                    order_type=order_type,
-                                                                    symbol=symbol,
-                                                                    current_price=order_price,
-                                                                    quantity=order_quantity,
-                                                                    price=order_price)
-                created_orders.append(
-                    await self.create_order(current_order))
-        return created_orders
+                quantity = 0
+        else:
+            quantity = current_symbol_holding
+        for order_quantity, order_price in decimal_order_adapter.decimal_check_and_adapt_order_details_if_necessary(quantity, price,
+                                                                                                    symbol_market):
+            orders.append(order_factory.create_order_instance(trader=self,
+                                                              order_type=order_type,
+                                                              symbol=symbol,
+                                                              current_price=order_price,
+                                                              quantity=order_quantity,
+                                                              price=order_price))
+        return orders
 
     async def sell_all(self, currencies_to_sell=None, timeout=None):
         """
         Sell every currency in portfolio for reference market using market orders.
+        Orders are all built before being created as a single batch.
         :param currencies_to_sell: List of currencies to sell, default values consider every currency in portfolio
         :param timeout: Timeout to get market price
         :return: The created orders
@@ -424,11 +563,12 @@ class Trader(util.Initializable):
                           for currency in currencies_to_sell
                           if currency in currency_list]
 
-        for currency in currencies:
-            symbol, inverted = util.get_market_pair(self.config, currency, enabled_only=True)
-            if symbol:
-                orders += await self._sell_everything(symbol, inverted, timeout=timeout)
-        return orders
+        async with self.exchange_manager.exchange_personal_data.portfolio_manager.portfolio.lock:
+            for currency in currencies:
+                symbol, inverted = util.get_market_pair(self.config, currency, enabled_only=True)
+                if symbol:
+                    orders += await self._get_sell_everything_orders(symbol, inverted, timeout=timeout)
+            return await self.create_orders(orders)
 
     def parse_order_id(self, order_id):
         return order_id
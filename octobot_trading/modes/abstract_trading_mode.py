@@ -294,6 +294,8 @@ class AbstractTradingMode(abstract_tentacle.AbstractTentacle):
         if not self.trading_config:
             self.set_default_config()
         await self.load_and_save_user_inputs(bot_id)
+        # clear exchange cached values that can depend on the reloaded configuration
+        self.exchange_manager.exchange.on_reload_config()
         for element in self.consumers + self.producers:
             if isinstance(element, (abstract_mode_consumer.AbstractTradingModeConsumer,
                                     abstract_mode_producer.AbstractTradingModeProducer)):
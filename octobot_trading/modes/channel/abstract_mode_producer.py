@@ -298,7 +298,7 @@ class AbstractTradingModeProducer(modes_channel.ModeChannelProducer):
             # update db after each run only in live mode
             for database in self.all_databases().values():
                 if database:
-                    await database.flush()
+                    await self.exchange_manager.storage_manager.databases_flusher.request_flush(database)
 
     async def set_final_eval(self, matrix_id: str, cryptocurrency: str, symbol: str, time_frame) -> None:
         """
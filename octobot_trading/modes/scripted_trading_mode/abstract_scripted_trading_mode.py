@@ -289,11 +289,13 @@ class AbstractScriptedTradingModeProducer(modes_channel.AbstractTradingModeProdu
                 if context.has_cache(context.symbol, context.time_frame):
                     await context.get_cache().flush()
                 for symbol in self.exchange_manager.exchange_config.traded_symbol_pairs:
-                    await databases.RunDatabasesProvider.instance().get_symbol_db(
-                        self.exchange_manager.bot_id,
-                        self.exchange_manager.exchange_name,
-                        symbol
-                    ).flush()
+                    await self.exchange_manager.storage_manager.databases_flusher.request_flush(
+                        databases.RunDatabasesProvider.instance().get_symbol_db(
+                            self.exchange_manager.bot_id,
+                            self.exchange_manager.exchange_name,
+                            symbol
+                        )
+                    )
             run_data_writer.set_initialized_flags(initialized)
             databases.RunDatabasesProvider.instance().get_symbol_db(self.exchange_manager.bot_id,
                                                                   self.exchange_name, symbol)\
@@ -20,6 +20,7 @@ from octobot_trading.personal_data.state cimport (
 )
 from octobot_trading.personal_data cimport orders
 from octobot_trading.personal_data.orders cimport (
+    SymbolOrderRules,
     Order,
     OrderState,
     OrdersManager,
@@ -112,6 +113,7 @@ from octobot_trading.personal_data.exchange_personal_data cimport (
 
 __all__ = [
     "State",
+    "SymbolOrderRules",
     "Order",
     "OrderState",
     "OrdersUpdater",
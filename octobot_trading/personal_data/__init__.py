@@ -22,6 +22,9 @@ from octobot_trading.personal_data.state import (
 )
 from octobot_trading.personal_data import orders
 from octobot_trading.personal_data.orders import (
+    SymbolOrderRules,
+    get_symbol_order_rules,
+    clear_symbol_order_rules_cache,
     Order,
     parse_order_type,
     is_valid,
@@ -110,6 +113,7 @@ from octobot_trading.personal_data.portfolios import (
     SubPortfolio,
     PortfolioManager,
     PortfolioValueHolder,
+    PriceConversionGraph,
     FuturePortfolio,
     MarginPortfolio,
     SpotPortfolio,
@@ -211,6 +215,9 @@ TraderPositionTypeClasses = {
 
 __all__ = [
     "State",
+    "SymbolOrderRules",
+    "get_symbol_order_rules",
+    "clear_symbol_order_rules_cache",
     "Order",
     "parse_order_type",
     "is_valid",
@@ -298,6 +305,7 @@ __all__ = [
     "SubPortfolio",
     "PortfolioManager",
     "PortfolioValueHolder",
+    "PriceConversionGraph",
     "FuturePortfolio",
     "MarginPortfolio",
     "SpotPortfolio",
@@ -75,6 +75,12 @@ from octobot_trading.personal_data.orders.channel cimport (
     OrdersUpdaterSimulator,
 )
 
+from octobot_trading.personal_data.orders cimport symbol_order_rules
+from octobot_trading.personal_data.orders.symbol_order_rules cimport (
+    SymbolOrderRules,
+    get_symbol_order_rules,
+    clear_symbol_order_rules_cache,
+)
 from octobot_trading.personal_data.orders.order_util cimport (
     is_valid,
     get_min_max_amounts,
@@ -108,6 +114,9 @@ from octobot_trading.personal_data.orders.order_factory cimport (
 )
 
 __all__ = [
+    "SymbolOrderRules",
+    "get_symbol_order_rules",
+    "clear_symbol_order_rules_cache",
     "Order",
     "is_valid",
     "get_min_max_amounts",
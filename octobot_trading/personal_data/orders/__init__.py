@@ -68,6 +68,12 @@ from octobot_trading.personal_data.orders import orders_manager
 from octobot_trading.personal_data.orders.orders_manager import (
     OrdersManager,
 )
+from octobot_trading.personal_data.orders import symbol_order_rules
+from octobot_trading.personal_data.orders.symbol_order_rules import (
+    SymbolOrderRules,
+    get_symbol_order_rules,
+    clear_symbol_order_rules_cache,
+)
 from octobot_trading.personal_data.orders import order_util
 from octobot_trading.personal_data.orders.order_util import (
     is_valid,
@@ -122,6 +128,9 @@ from octobot_trading.personal_data.orders.order_factory import (
 )
 
 __all__ = [
+    "SymbolOrderRules",
+    "get_symbol_order_rules",
+    "clear_symbol_order_rules_cache",
     "Order",
     "parse_order_type",
     "is_valid",
@@ -24,3 +24,5 @@ cdef class OrdersUpdater(orders_channel.OrdersProducer):
     cdef async_job.AsyncJob closed_orders_job
     cdef async_job.AsyncJob order_update_job
     cdef bint _is_initialized_event_set
+    cdef dict _last_open_orders_by_symbol
+    cdef dict _last_closed_orders_by_symbol
@@ -15,6 +15,7 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import asyncio
+import time
 
 import octobot_commons.async_job as async_job
 import octobot_commons.tree as commons_tree
@@ -38,11 +39,15 @@ class OrdersUpdater(orders_channel.OrdersProducer):
     CLOSE_ORDER_REFRESH_TIME = 81
     TIME_BETWEEN_ORDERS_REFRESH = 2
     DEPENDENCIES_TIMEOUT = 30
+    MAX_CONCURRENT_SYMBOL_ORDERS_REQUESTS = 5
 
     def __init__(self, channel):
         super().__init__(channel)
 
         self._is_initialized_event_set = False
+        # last fetched orders by symbol, used to skip pushing unchanged orders
+        self._last_open_orders_by_symbol = {}
+        self._last_closed_orders_by_symbol = {}
         # create async jobs
         self.open_orders_job = async_job.AsyncJob(self._open_orders_fetch_and_push,
                                                   execution_interval_delay=self.OPEN_ORDER_REFRESH_TIME,
@@ -113,12 +118,15 @@ class OrdersUpdater(orders_channel.OrdersProducer):
         :param is_from_bot: True if the order was created by OctoBot
         :param limit: the exchange request orders count limit
         """
-        for symbol in self.channel.exchange_manager.exchange_config.traded_symbol_pairs:
-            open_orders: list = await self.channel.exchange_manager.exchange.get_open_orders(symbol=symbol, limit=limit)
-            if open_orders:
-                await self.push(list(map(self.channel.exchange_manager.exchange.clean_order, open_orders)),
-                                is_from_bot=is_from_bot)
+        open_orders_by_symbol = await self._fetch_orders_by_symbol(
+            self.channel.exchange_manager.exchange.get_open_orders, limit, is_open=True
+        )
+        for symbol, open_orders in open_orders_by_symbol.items():
+            have_orders_changed = self._update_last_orders(self._last_open_orders_by_symbol, symbol, open_orders)
+            if open_orders and (have_orders_changed or self._has_unknown_orders(open_orders)):
+                await self.push(open_orders, is_from_bot=is_from_bot)
             else:
+                # no open order or unchanged open orders: only check for missing open orders
                 await self.handle_post_open_order_update(symbol, open_orders, False)
             if not self._is_initialized_event_set:
                 self._set_initialized_event(symbol)
@@ -139,13 +147,84 @@ class OrdersUpdater(orders_channel.OrdersProducer):
         Update closed orders from exchange
         :param limit: the exchange request orders count limit
         """
-        for symbol in self.channel.exchange_manager.exchange_config.traded_symbol_pairs:
-            close_orders: list = await self.channel.exchange_manager.exchange.get_closed_orders(
-                symbol=symbol, limit=limit)
+        close_orders_by_symbol = await self._fetch_orders_by_symbol(
+            self.channel.exchange_manager.exchange.get_closed_orders, limit, is_open=False
+        )
+        for symbol, close_orders in close_orders_by_symbol.items():
+            if self._update_last_orders(self._last_closed_orders_by_symbol, symbol, close_orders) and close_orders:
+                await self.push(close_orders, are_closed=True)
+
+    async def _fetch_orders_by_symbol(self, fetch_orders, limit, is_open) -> dict:
+        """
+        Fetch orders of every traded symbol: in a single request when the exchange supports it,
+        otherwise using concurrent requests spaced by the exchange rate limit
+        :param fetch_orders: the exchange orders request method
+        :param limit: the exchange request orders count limit of each symbol
+        :param is_open: True when fetching open orders
+        :return: the cleaned orders by traded symbol, in traded symbols order
+        """
+        exchange = self.channel.exchange_manager.exchange
+        traded_symbols = self.channel.exchange_manager.exchange_config.traded_symbol_pairs
+        if exchange.supports_all_symbols_orders_fetch(is_open):
+            try:
+                # open orders can't be limited: every open order is required to check missing open orders.
+                # A symbol-less closed orders request limit applies to every symbol orders: it is scaled
+                # to fetch up to limit orders of each traded symbol, as when fetching by symbol
+                all_orders = await fetch_orders(
+                    limit=None if is_open or limit is None else limit * len(traded_symbols)
+                )
+            except errors.NotSupported:
+                if exchange.supports_all_symbols_orders_fetch(is_open):
+                    raise
+                self.logger.debug(f"{self.channel.exchange_manager.exchange_name} requires a symbol to fetch "
+                                  f"{'open' if is_open else 'closed'} orders: fetching orders by symbol")
+            else:
+                orders_by_symbol = {symbol: [] for symbol in traded_symbols}
+                for order in all_orders:
+                    order = exchange.clean_order(order)
+                    symbol = self.channel.exchange_manager.get_exchange_symbol(exchange.parse_order_symbol(order))
+                    if symbol in orders_by_symbol:
+                        orders_by_symbol[symbol].append(order)
+                return orders_by_symbol
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SYMBOL_ORDERS_REQUESTS)
+        rate_limit_lock = asyncio.Lock()
+        last_request_time = 0
+
+        async def _fetch_symbol_orders(symbol):
+            nonlocal last_request_time
+            async with semaphore:
+                async with rate_limit_lock:
+                    # space requests by the exchange rate limit
+                    waiting_time = last_request_time + exchange.get_rate_limit() - time.time()
+                    if waiting_time > 0:
+                        await asyncio.sleep(waiting_time)
+                    last_request_time = time.time()
+                return list(map(exchange.clean_order, await fetch_orders(symbol=symbol, limit=limit)))
+
+        return dict(zip(
+            traded_symbols,
+            await asyncio.gather(*(_fetch_symbol_orders(symbol) for symbol in traded_symbols))
+        ))
+
+    @staticmethod
+    def _update_last_orders(last_orders_by_symbol, symbol, orders) -> bool:
+        """
+        :return: True if orders are different from the last orders of this symbol, which are replaced by orders
+        """
+        if last_orders_by_symbol.get(symbol) == orders:
+            return False
+        last_orders_by_symbol[symbol] = orders
+        return True
 
-            if close_orders:
-                await self.push(list(map(self.channel.exchange_manager.exchange.clean_order, close_orders)),
-                                are_closed=True)
+    def _has_unknown_orders(self, orders) -> bool:
+        """
+        :return: True if an order is not in the orders manager
+        """
+        orders_manager = self.channel.exchange_manager.exchange_personal_data.orders_manager
+        return any(
+            not orders_manager.has_order(self.channel.exchange_manager.exchange.parse_order_id(order))
+            for order in orders
+        )
 
     async def update_order_from_exchange(self, order,
                                          should_notify=False,
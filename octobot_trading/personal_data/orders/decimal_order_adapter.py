@@ -19,20 +19,16 @@ import decimal
 import octobot_trading.constants as constants
 import octobot_trading.exchanges as exchanges
 import octobot_trading.personal_data as personal_data
+import octobot_trading.personal_data.orders.symbol_order_rules as symbol_order_rules
 from octobot_trading.enums import ExchangeConstantsMarketStatusColumns as Ecmsc
 
 
 def decimal_adapt_price(symbol_market, price, truncate=True):
-    maximal_price_digits = symbol_market[Ecmsc.PRECISION.value].get(
-                                                Ecmsc.PRECISION_PRICE.value,
-                                                constants.CURRENCY_DEFAULT_MAX_PRICE_DIGITS)
-    return decimal_trunc_with_n_decimal_digits(price, maximal_price_digits, truncate)
+    return symbol_order_rules.get_symbol_order_rules(symbol_market).adapt_price(price, truncate)
 
 
 def decimal_adapt_quantity(symbol_market, quantity, truncate=True):
-    maximal_volume_digits = symbol_market[Ecmsc.PRECISION.value].get(
-                                                 Ecmsc.PRECISION_AMOUNT.value, 0)
-    return decimal_trunc_with_n_decimal_digits(quantity, maximal_volume_digits, truncate)
+    return symbol_order_rules.get_symbol_order_rules(symbol_market).adapt_quantity(quantity, truncate)
 
 
 def decimal_trunc_with_n_decimal_digits(value, digits, truncate=True):  # TODO migrate to commons
@@ -130,40 +126,30 @@ def decimal_check_and_adapt_order_details_if_necessary(quantity, price, symbol_m
     if quantity.is_nan() or price.is_nan() or price == constants.ZERO:
         return []
 
-    symbol_market_limits = symbol_market[Ecmsc.LIMITS.value]
-
-    limit_amount = symbol_market_limits[Ecmsc.LIMITS_AMOUNT.value]
-    limit_cost = symbol_market_limits[Ecmsc.LIMITS_COST.value]
-    limit_price = symbol_market_limits[Ecmsc.LIMITS_PRICE.value]
+    rules = symbol_order_rules.get_symbol_order_rules(symbol_market)
 
     # case 1: try with data directly from exchange
-    if personal_data.is_valid(limit_amount, Ecmsc.LIMITS_AMOUNT_MIN.value):
-        min_quantity = decimal.Decimal(str(limit_amount.get(Ecmsc.LIMITS_AMOUNT_MIN.value, math.nan)))
-        max_quantity = None
+    if rules.min_quantity is not None:
         # not all symbol data have a max quantity
-        if personal_data.is_valid(limit_amount, Ecmsc.LIMITS_AMOUNT_MAX.value):
-            max_quantity = decimal.Decimal(str(limit_amount.get(Ecmsc.LIMITS_AMOUNT_MAX.value, math.nan)))
+        max_quantity = rules.max_quantity
 
         # adapt digits if necessary
-        valid_quantity = decimal_adapt_quantity(symbol_market, quantity, truncate)
-        valid_price = decimal_adapt_price(symbol_market, price, truncate)
+        valid_quantity = rules.adapt_quantity(quantity, truncate)
+        valid_price = rules.adapt_price(price, truncate)
 
         total_order_price = valid_quantity * valid_price
 
-        if valid_quantity < min_quantity:
+        if valid_quantity < rules.min_quantity:
             # invalid order
             return []
 
         # case 1.1: use only quantity and cost
-        if personal_data.is_valid(limit_cost, Ecmsc.LIMITS_COST_MIN.value):
-            min_cost = decimal.Decimal(str(limit_cost.get(Ecmsc.LIMITS_COST_MIN.value, math.nan)))
-            max_cost = None
+        if rules.min_cost is not None:
             # not all symbol data have a max cost
-            if personal_data.is_valid(limit_cost, Ecmsc.LIMITS_COST_MAX.value):
-                max_cost = decimal.Decimal(str(limit_cost.get(Ecmsc.LIMITS_COST_MAX.value, math.nan)))
+            max_cost = rules.max_cost
 
             # check total_order_price not < min_cost
-            if not personal_data.check_cost(float(total_order_price), min_cost):
+            if not personal_data.check_cost(float(total_order_price), rules.min_cost):
                 return []
 
             # check total_order_price not > max_cost and valid_quantity not > max_quantity
@@ -178,14 +164,11 @@ def decimal_check_and_adapt_order_details_if_necessary(quantity, price, symbol_m
                 return [(valid_quantity, valid_price)]
 
         # case 1.2: use only quantity and price
-        elif personal_data.is_valid(limit_price, Ecmsc.LIMITS_PRICE_MIN.value):
-            min_price = decimal.Decimal(str(limit_price.get(Ecmsc.LIMITS_PRICE_MIN.value, math.nan)))
-            max_price = None
+        elif rules.min_price is not None:
             # not all symbol data have a max price
-            if personal_data.is_valid(limit_price, Ecmsc.LIMITS_PRICE_MAX.value):
-                max_price = decimal.Decimal(str(limit_price.get(Ecmsc.LIMITS_PRICE_MAX.value, math.nan)))
+            max_price = rules.max_price
 
-            if (max_price is not None and (max_price <= valid_price)) or valid_price <= min_price:
+            if (max_price is not None and (max_price <= valid_price)) or valid_price <= rules.min_price:
                 # invalid order
                 return []
 
@@ -27,7 +27,7 @@ cdef class Order(util.Initializable):
     cdef public object exchange_manager
 
     cdef public object side # TradeOrderSide
-    cdef public object status # OrderStatus
+    cdef object _status # OrderStatus
     cdef public object order_type # TraderOrderType
     cdef public object lock # Lock
 
@@ -47,7 +47,7 @@ cdef class Order(util.Initializable):
     cdef public str taker_or_maker
     cdef public str order_id
     cdef public str logger_name
-    cdef public str tag
+    cdef str _tag
 
     cdef readonly str shared_signal_order_id
 
@@ -138,6 +138,7 @@ cdef class Order(util.Initializable):
     cpdef void add_to_order_group(self, object order_group)
     cpdef object ensure_order_id(self)
     cdef void _update_total_cost(self)
+    cdef void _update_orders_manager_indexes(self)
 
 cdef object _get_sell_and_buy_types(object order_type)
 cdef object _infer_order_type_from_maker_or_taker(dict raw_order, object side)
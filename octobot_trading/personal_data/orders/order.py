@@ -49,7 +49,8 @@ class Order(util.Initializable):
         self.logger_name = None
         self.order_id = trader.parse_order_id(None)
         self.shared_signal_order_id = str(uuid.uuid4())
-        self.status = enums.OrderStatus.OPEN
+        # status and tag are indexed by the orders manager: see status and tag properties
+        self._status = enums.OrderStatus.OPEN
         self.symbol = None
         self.currency = None
         self.market = None
@@ -57,7 +58,7 @@ class Order(util.Initializable):
         self.taker_or_maker = None
         self.timestamp = 0
         self.side = side
-        self.tag = None
+        self._tag = None
 
         # original order attributes
         self.creation_time = self.exchange_manager.exchange.get_exchange_current_time()
@@ -113,6 +114,26 @@ class Order(util.Initializable):
         # kwargs given to trader.create_order() when this order should be created later on
         self.trader_creation_kwargs = {}
 
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, status):
+        if self._status is not status:
+            self._status = status
+            self._update_orders_manager_indexes()
+
+    @property
+    def tag(self):
+        return self._tag
+
+    @tag.setter
+    def tag(self, tag):
+        if self._tag != tag:
+            self._tag = tag
+            self._update_orders_manager_indexes()
+
     @classmethod
     def get_name(cls):
         return cls.__name__
@@ -137,6 +158,7 @@ class Order(util.Initializable):
         if symbol and self.symbol != symbol:
             self.currency, self.market = self.exchange_manager.get_exchange_quote_and_base(symbol)
             self.symbol = symbol
+            self._update_orders_manager_indexes()
 
         if quantity_currency is None:
             if self.quantity_currency is None and self.symbol is not None:
@@ -304,6 +326,15 @@ class Order(util.Initializable):
         if not self.is_open():
             logging.get_logger(self.get_logger_name()).warning(f"Adding order to group however order is not open.")
         self.order_group = order_group
+        self._update_orders_manager_indexes()
+
+    def _update_orders_manager_indexes(self):
+        # keep orders manager status, symbol, tag and group indexes up to date
+        if self.exchange_manager is None or self.exchange_manager.exchange_personal_data is None:
+            return
+        orders_manager = self.exchange_manager.exchange_personal_data.orders_manager
+        if orders_manager is not None:
+            orders_manager.update_order_indexes(self)
 
     def get_total_fees(self, currency):
         return order_util.get_fees_for_currency(self.fee, currency)
@@ -26,7 +26,7 @@ import octobot_trading.constants as constants
 import octobot_trading.enums as enums
 import octobot_trading.errors as errors
 import octobot_trading.exchanges.util.exchange_market_status_fixer as exchange_market_status_fixer
-from octobot_trading.enums import ExchangeConstantsMarketStatusColumns as Ecmsc
+import octobot_trading.personal_data.orders.symbol_order_rules as symbol_order_rules
 
 
 LOGGER_NAME = "order_util"
@@ -49,34 +49,7 @@ def get_min_max_amounts(symbol_market, default_value=None):
     :param default_value:
     :return:
     """
-    min_quantity = max_quantity = min_cost = max_cost = min_price = max_price = default_value
-    if Ecmsc.LIMITS.value in symbol_market:
-        symbol_market_limits = symbol_market[Ecmsc.LIMITS.value]
-
-        if Ecmsc.LIMITS_AMOUNT.value in symbol_market_limits:
-            limit_amount = symbol_market_limits[Ecmsc.LIMITS_AMOUNT.value]
-            if is_valid(limit_amount, Ecmsc.LIMITS_AMOUNT_MIN.value) \
-                    or is_valid(limit_amount, Ecmsc.LIMITS_AMOUNT_MAX.value):
-                min_quantity = limit_amount.get(Ecmsc.LIMITS_AMOUNT_MIN.value, default_value)
-                max_quantity = limit_amount.get(Ecmsc.LIMITS_AMOUNT_MAX.value, default_value)
-
-        # case 2: use cost and price
-        if Ecmsc.LIMITS_COST.value in symbol_market_limits:
-            limit_cost = symbol_market_limits[Ecmsc.LIMITS_COST.value]
-            if is_valid(limit_cost, Ecmsc.LIMITS_COST_MIN.value) \
-                    or is_valid(limit_cost, Ecmsc.LIMITS_COST_MAX.value):
-                min_cost = limit_cost.get(Ecmsc.LIMITS_COST_MIN.value, default_value)
-                max_cost = limit_cost.get(Ecmsc.LIMITS_COST_MAX.value, default_value)
-
-        # case 2: use quantity and price
-        if Ecmsc.LIMITS_PRICE.value in symbol_market_limits:
-            limit_price = symbol_market_limits[Ecmsc.LIMITS_PRICE.value]
-            if is_valid(limit_price, Ecmsc.LIMITS_PRICE_MIN.value) \
-                    or is_valid(limit_price, Ecmsc.LIMITS_PRICE_MAX.value):
-                min_price = limit_price.get(Ecmsc.LIMITS_PRICE_MIN.value, default_value)
-                max_price = limit_price.get(Ecmsc.LIMITS_PRICE_MAX.value, default_value)
-
-    return min_quantity, max_quantity, min_cost, max_cost, min_price, max_price
+    return symbol_order_rules.get_symbol_order_rules(symbol_market).get_min_max_amounts(default_value)
 
 
 def check_cost(total_order_price, min_cost):
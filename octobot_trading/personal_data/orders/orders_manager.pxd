@@ -27,6 +27,11 @@ cdef class OrdersManager(util.Initializable):
     cdef exchanges.Trader trader
 
     cdef public object orders
+    cdef tuple _indexes
+    cdef dict _indexed_values
+    cdef dict _positions
+    cdef long long _next_position
+    cdef set _unsorted_buckets
     cdef public dict order_groups
     cdef public list pending_creation_orders
     cdef public bint are_exchange_orders_initialized
@@ -37,10 +42,17 @@ cdef class OrdersManager(util.Initializable):
     cdef list _select_orders(self, object state=*, str symbol=*, int since=*, int limit=*, str tag=*)
     cdef object _get_pending_order(self, object created_order, bint should_pop)
     cdef void _add_order(self, str order_id, object order)
+    cdef void _remove_order(self, str order_id)
+    cdef void _add_to_indexes(self, str order_id, object order)
+    cdef void _remove_from_indexes(self, str order_id)
+    cdef void _add_to_index_bucket(self, int index, object value, str order_id, object order)
+    cdef void _remove_from_index_bucket(self, int index, object value, str order_id)
+    cdef dict _get_index_bucket(self, int index, object value)
 
     cpdef order_class.Order get_order(self, str order_id)
     cpdef void register_pending_creation_order(self, object pending_order)
     cpdef bint has_order(self, str order_id)
+    cpdef void update_order_indexes(self, order_class.Order order)
     cpdef void remove_order_instance(self, order_class.Order order)
     cpdef void replace_order(self, str previous_id, order_class.Order order)
     cpdef list get_all_orders(self, str symbol=*, int since=*, int limit=*, str tag=*)
@@ -49,3 +61,5 @@ cdef class OrdersManager(util.Initializable):
     cpdef list get_order_from_group(self, str group_name)
     cpdef object get_or_create_group(self, object group_type, str group_name)
     cpdef void clear(self)
+
+cdef tuple _get_indexed_values(object order)
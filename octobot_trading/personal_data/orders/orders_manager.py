@@ -26,6 +26,12 @@ import octobot_trading.personal_data.orders.order as order_class
 import octobot_trading.personal_data.orders.order_factory as order_factory
 import octobot_trading.personal_data.orders.order_util as order_util
 
+# positions of the indexed values in OrdersManager indexes
+STATUS_INDEX = 0
+SYMBOL_INDEX = 1
+TAG_INDEX = 2
+GROUP_INDEX = 3
+
 
 class OrdersManager(util.Initializable):
     MAX_ORDERS_COUNT = 0
@@ -36,6 +42,16 @@ class OrdersManager(util.Initializable):
         self.trader = trader
         self.orders_initialized = False  # TODO
         self.orders = collections.OrderedDict()
+        # status, symbol, tag and group indexes: ({indexed value: {order_id: order}}, ...)
+        # an index bucket lists its orders in self.orders order
+        self._indexes = ({}, {}, {}, {})
+        # (status, symbol, tag, group name) values each order is indexed with by order_id
+        self._indexed_values = {}
+        # position of each order_id in self.orders, used to keep index buckets in self.orders order
+        self._positions = {}
+        self._next_position = 0
+        # (index, value) of the buckets in which an updated order has been appended out of self.orders order
+        self._unsorted_buckets = set()
         self.order_groups = {}
         # orders that are expected from exchange but have not yet been fetched: will be removed when fetched
         self.pending_creation_orders = []
@@ -60,7 +76,7 @@ class OrdersManager(util.Initializable):
     def get_order_from_group(self, group_name):
         return [
             order
-            for order in self.orders.values()
+            for order in self._get_index_bucket(GROUP_INDEX, group_name).values()
             if order.order_group is not None and order.order_group.name == group_name
         ]
 
@@ -156,14 +172,38 @@ class OrdersManager(util.Initializable):
     def _add_order(self, order_id, order):
         if order_id is None:
             self.logger.warning(f"Adding order with None order_id to order manager: {order}")
+        if order_id in self.orders:
+            self._remove_from_indexes(order_id)
+        else:
+            self._positions[order_id] = self._next_position
+            self._next_position += 1
         self.orders[order_id] = order
+        self._add_to_indexes(order_id, order)
 
     def has_order(self, order_id) -> bool:
-        return order_id in set(self.orders.keys())
+        return order_id in self.orders
+
+    def update_order_indexes(self, order):
+        """
+        Called by orders when their status, symbol, tag or group changes
+        :param order: the updated order
+        """
+        order_id = order.order_id
+        if self.orders.get(order_id) is not order:
+            # not (or not yet) in this orders manager
+            return
+        previous_values = self._indexed_values[order_id]
+        indexed_values = _get_indexed_values(order)
+        if previous_values != indexed_values:
+            self._indexed_values[order_id] = indexed_values
+            for index, (previous_value, value) in enumerate(zip(previous_values, indexed_values)):
+                if previous_value != value:
+                    self._remove_from_index_bucket(index, previous_value, order_id)
+                    self._add_to_index_bucket(index, value, order_id, order)
 
     def remove_order_instance(self, order):
         if self.has_order(order.order_id):
-            self.orders.pop(order.order_id, None)
+            self._remove_order(order.order_id)
             order.clear()
         else:
             self.logger.warning(f"Attempt to remove an order that is not in orders_manager: "
@@ -173,7 +213,7 @@ class OrdersManager(util.Initializable):
 
     def replace_order(self, previous_id, order):
         if self.has_order(previous_id):
-            self.orders.pop(previous_id, None)
+            self._remove_order(previous_id)
         self._add_order(order.order_id, order)
         self._check_orders_size()
 
@@ -181,6 +221,11 @@ class OrdersManager(util.Initializable):
     def _reset_orders(self):
         self.orders_initialized = False
         self.orders = collections.OrderedDict()
+        self._indexes = ({}, {}, {}, {})
+        self._indexed_values = {}
+        self._positions = {}
+        self._next_position = 0
+        self._unsorted_buckets = set()
         for group in self.order_groups.values():
             group.clear()
         self.order_groups = {}
@@ -190,9 +235,16 @@ class OrdersManager(util.Initializable):
             self._remove_oldest_orders(int(self.MAX_ORDERS_COUNT / 2))
 
     def _select_orders(self, state=None, symbol=None, since=-1, limit=-1, tag=None):
+        # only go through the smallest index bucket matching the given filters
+        selected_orders = self.orders
+        for index, value in ((STATUS_INDEX, state), (SYMBOL_INDEX, symbol), (TAG_INDEX, tag)):
+            if value is not None:
+                bucket = self._get_index_bucket(index, value)
+                if len(bucket) < len(selected_orders):
+                    selected_orders = bucket
         orders = [
             order
-            for order in self.orders.values()
+            for order in selected_orders.values()
             if (
                     (state is None or order.status == state) and
                     (symbol is None or (symbol and order.symbol == symbol)) and
@@ -204,7 +256,59 @@ class OrdersManager(util.Initializable):
 
     def _remove_oldest_orders(self, nb_to_remove):
         for _ in range(nb_to_remove):
-            self.orders.popitem(last=False)
+            self._remove_order(next(iter(self.orders)))
+
+    def _remove_order(self, order_id):
+        self.orders.pop(order_id, None)
+        self._remove_from_indexes(order_id)
+        self._positions.pop(order_id, None)
+
+    def _add_to_indexes(self, order_id, order):
+        indexed_values = _get_indexed_values(order)
+        self._indexed_values[order_id] = indexed_values
+        for index, value in enumerate(indexed_values):
+            self._add_to_index_bucket(index, value, order_id, order)
+
+    def _remove_from_indexes(self, order_id):
+        indexed_values = self._indexed_values.pop(order_id, None)
+        if indexed_values is None:
+            return
+        for index, value in enumerate(indexed_values):
+            self._remove_from_index_bucket(index, value, order_id)
+
+    def _add_to_index_bucket(self, index, value, order_id, order):
+        if value is None:
+            return
+        try:
+            bucket = self._indexes[index][value]
+            if self._positions[next(reversed(bucket))] > self._positions[order_id]:
+                # order is appended after newer orders: sort bucket on next read
+                self._unsorted_buckets.add((index, value))
+        except KeyError:
+            bucket = self._indexes[index][value] = {}
+        bucket[order_id] = order
+
+    def _remove_from_index_bucket(self, index, value, order_id):
+        if value is None:
+            return
+        bucket = self._indexes[index][value]
+        bucket.pop(order_id, None)
+        if not bucket:
+            self._indexes[index].pop(value)
+            self._unsorted_buckets.discard((index, value))
+
+    def _get_index_bucket(self, index, value):
+        try:
+            bucket = self._indexes[index][value]
+        except KeyError:
+            return {}
+        if (index, value) in self._unsorted_buckets:
+            self._unsorted_buckets.discard((index, value))
+            bucket = self._indexes[index][value] = {
+                order_id: bucket[order_id]
+                for order_id in sorted(bucket, key=self._positions.__getitem__)
+            }
+        return bucket
 
     def clear(self):
         for order in self.orders.values():
@@ -212,6 +316,15 @@ class OrdersManager(util.Initializable):
         self._reset_orders()
 
 
+def _get_indexed_values(order):
+    return (
+        order.status,
+        order.symbol,
+        order.tag,
+        None if order.order_group is None else order.order_group.name,
+    )
+
+
 async def _update_order_from_raw(order, raw_order):
     """
     Calling order update from raw method
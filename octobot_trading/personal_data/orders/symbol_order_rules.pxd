@@ -0,0 +1,47 @@
+# cython: language_level=3
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+cdef class SymbolOrderRules:
+    cdef public object price_precision
+    cdef public object amount_precision
+    cdef public object min_quantity
+    cdef public object max_quantity
+    cdef public object min_cost
+    cdef public object max_cost
+    cdef public object min_price
+    cdef public object max_price
+
+    cdef object _price_quantize_exponent
+    cdef object _amount_quantize_exponent
+    cdef bint _is_price_adaptable
+    cdef bint _is_amount_adaptable
+    cdef tuple _min_max_amounts
+    cdef bint _has_missing_min_max_amounts
+
+    cpdef object adapt_price(self, object price, bint truncate=*)
+    cpdef object adapt_quantity(self, object quantity, bint truncate=*)
+    cpdef tuple get_min_max_amounts(self, object default_value=*)
+
+cpdef SymbolOrderRules get_symbol_order_rules(dict symbol_market)
+cpdef void clear_symbol_order_rules_cache()
+
+cdef tuple _get_market_status_values(dict symbol_market)
+cdef bint _is_valid(object value)
+cdef tuple _get_valid_limits(object min_value, object max_value)
+cdef object _get_decimal_limit(object value)
+cdef tuple _get_quantize_exponent(object digits)
+cdef object _adapt_value(object value, object quantize_exponent, bint is_adaptable, bint truncate)
@@ -0,0 +1,178 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+import decimal
+
+import octobot_trading.constants as constants
+import octobot_trading.exchanges.util.exchange_market_status_fixer as exchange_market_status_fixer
+from octobot_trading.enums import ExchangeConstantsMarketStatusColumns as Ecmsc
+
+
+# identifies market status values that are not set
+_MISSING = object()
+_EMPTY_DICT = {}
+# market status keys, read at each get_symbol_order_rules call
+_PRECISION = Ecmsc.PRECISION.value
+_PRECISION_PRICE = Ecmsc.PRECISION_PRICE.value
+_PRECISION_AMOUNT = Ecmsc.PRECISION_AMOUNT.value
+_LIMITS = Ecmsc.LIMITS.value
+_LIMITS_AMOUNT = Ecmsc.LIMITS_AMOUNT.value
+_LIMITS_AMOUNT_MIN = Ecmsc.LIMITS_AMOUNT_MIN.value
+_LIMITS_AMOUNT_MAX = Ecmsc.LIMITS_AMOUNT_MAX.value
+_LIMITS_COST = Ecmsc.LIMITS_COST.value
+_LIMITS_COST_MIN = Ecmsc.LIMITS_COST_MIN.value
+_LIMITS_COST_MAX = Ecmsc.LIMITS_COST_MAX.value
+_LIMITS_PRICE = Ecmsc.LIMITS_PRICE.value
+_LIMITS_PRICE_MIN = Ecmsc.LIMITS_PRICE_MIN.value
+_LIMITS_PRICE_MAX = Ecmsc.LIMITS_PRICE_MAX.value
+
+# symbol order rules by market status values, see get_symbol_order_rules
+_SYMBOL_ORDER_RULES_CACHE = {}
+
+
+class SymbolOrderRules:
+    """
+    Parsed precision and limits of a symbol market status, ready to be used to adapt orders.
+    Use get_symbol_order_rules to benefit from cached rules.
+    """
+
+    def __init__(self, price_precision, amount_precision,
+                 min_quantity, max_quantity, min_cost, max_cost, min_price, max_price):
+        self.price_precision = constants.CURRENCY_DEFAULT_MAX_PRICE_DIGITS \
+            if price_precision is _MISSING else price_precision
+        self.amount_precision = 0 if amount_precision is _MISSING else amount_precision
+        self._price_quantize_exponent, self._is_price_adaptable = _get_quantize_exponent(self.price_precision)
+        self._amount_quantize_exponent, self._is_amount_adaptable = _get_quantize_exponent(self.amount_precision)
+
+        # raw market status values, as returned by get_min_max_amounts
+        self._min_max_amounts = _get_valid_limits(min_quantity, max_quantity) + \
+            _get_valid_limits(min_cost, max_cost) + \
+            _get_valid_limits(min_price, max_price)
+        self._has_missing_min_max_amounts = False
+        for value in self._min_max_amounts:
+            if value is _MISSING:
+                self._has_missing_min_max_amounts = True
+                break
+
+        # decimal limits, None when not valid
+        self.min_quantity = _get_decimal_limit(min_quantity)
+        self.max_quantity = _get_decimal_limit(max_quantity)
+        self.min_cost = _get_decimal_limit(min_cost)
+        self.max_cost = _get_decimal_limit(max_cost)
+        self.min_price = _get_decimal_limit(min_price)
+        self.max_price = _get_decimal_limit(max_price)
+
+    @classmethod
+    def from_market_status(cls, symbol_market):
+        return cls(*_get_market_status_values(symbol_market))
+
+    def adapt_price(self, price, truncate=True):
+        return _adapt_value(price, self._price_quantize_exponent, self._is_price_adaptable, truncate)
+
+    def adapt_quantity(self, quantity, truncate=True):
+        return _adapt_value(quantity, self._amount_quantize_exponent, self._is_amount_adaptable, truncate)
+
+    def get_min_max_amounts(self, default_value=None):
+        """
+        :return: the min and max quantity, cost and price, default_value when unavailable
+        """
+        if self._has_missing_min_max_amounts:
+            return tuple([default_value if value is _MISSING else value for value in self._min_max_amounts])
+        return self._min_max_amounts
+
+
+def get_symbol_order_rules(symbol_market):
+    """
+    :return: the SymbolOrderRules of the given market status. Rules are cached by market status values:
+    reloaded or fixed market status automatically get their own rules
+    """
+    values = _get_market_status_values(symbol_market)
+    try:
+        return _SYMBOL_ORDER_RULES_CACHE[values]
+    except KeyError:
+        if len(_SYMBOL_ORDER_RULES_CACHE) >= constants.SYMBOL_ORDER_RULES_CACHE_MAX_SIZE:
+            _SYMBOL_ORDER_RULES_CACHE.clear()
+        rules = _SYMBOL_ORDER_RULES_CACHE[values] = SymbolOrderRules(*values)
+        return rules
+    except TypeError:
+        # unhashable market status values: can't be cached
+        return SymbolOrderRules(*values)
+
+
+def clear_symbol_order_rules_cache():
+    """
+    Called when markets are reloaded: rules of the previous market statuses are not used anymore
+    """
+    _SYMBOL_ORDER_RULES_CACHE.clear()
+
+
+def _get_market_status_values(symbol_market):
+    precision = symbol_market.get(_PRECISION) or _EMPTY_DICT
+    limits = symbol_market.get(_LIMITS) or _EMPTY_DICT
+    limit_amount = limits.get(_LIMITS_AMOUNT) or _EMPTY_DICT
+    limit_cost = limits.get(_LIMITS_COST) or _EMPTY_DICT
+    limit_price = limits.get(_LIMITS_PRICE) or _EMPTY_DICT
+    return (
+        precision.get(_PRECISION_PRICE, _MISSING),
+        precision.get(_PRECISION_AMOUNT, _MISSING),
+        limit_amount.get(_LIMITS_AMOUNT_MIN, _MISSING),
+        limit_amount.get(_LIMITS_AMOUNT_MAX, _MISSING),
+        limit_cost.get(_LIMITS_COST_MIN, _MISSING),
+        limit_cost.get(_LIMITS_COST_MAX, _MISSING),
+        limit_price.get(_LIMITS_PRICE_MIN, _MISSING),
+        limit_price.get(_LIMITS_PRICE_MAX, _MISSING),
+    )
+
+
+def _is_valid(value):
+    return value is not _MISSING and exchange_market_status_fixer.is_ms_valid(value)
+
+
+def _get_valid_limits(min_value, max_value):
+    if _is_valid(min_value) or _is_valid(max_value):
+        return min_value, max_value
+    return _MISSING, _MISSING
+
+
+def _get_decimal_limit(value):
+    return decimal.Decimal(str(value)) if _is_valid(value) else None
+
+
+def _get_quantize_exponent(digits):
+    """
+    :return: the exponent to quantize values with and False when digits can't be used to adapt values
+    """
+    try:
+        if digits > constants.ZERO:
+            return decimal.Decimal(f".{'0' * int(digits)}"), True
+        return None, True
+    except (TypeError, ValueError, decimal.InvalidOperation):
+        return None, False
+
+
+def _adapt_value(value, quantize_exponent, is_adaptable, truncate):
+    if not is_adaptable:
+        return value
+    try:
+        if quantize_exponent is None:
+            adapted_value = value // constants.ONE
+        else:
+            adapted_value = value.quantize(quantize_exponent,
+                                           rounding=decimal.ROUND_DOWN if truncate else decimal.ROUND_UP)
+        # decimal.Decimal can add unnecessary complexity in numbers, only use the adapted value when necessary
+        return value if adapted_value == value else adapted_value
+    except (TypeError, ValueError, decimal.InvalidOperation):
+        return value
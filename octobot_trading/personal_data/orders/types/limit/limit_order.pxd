@@ -18,7 +18,6 @@ cimport octobot_trading.personal_data.orders.order as order_class
 
 cdef class LimitOrder(order_class.Order):
     cdef object limit_price_hit_event # object is asyncio.Event
-    cdef object wait_for_hit_event_task # object is asyncio.Task
 
     cdef bint trigger_above
     cdef public bint allow_instant_fill
@@ -26,6 +25,5 @@ cdef class LimitOrder(order_class.Order):
     cpdef str _filled_maker_or_taker(self)
     # return object to allow exception raising
     cdef object _create_hit_event(self, object price_time)
-    cdef object _create_hit_task(self)
     cdef object _reset_events(self, object price_time)
-    cdef object _clear_event_and_tasks(self)
+    cdef object _clear_event(self)
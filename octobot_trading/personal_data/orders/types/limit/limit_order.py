@@ -13,8 +13,6 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
-import asyncio
-
 import octobot_trading.enums as enums
 import octobot_trading.constants as constants
 import octobot_trading.personal_data.orders.order as order_class
@@ -24,21 +22,16 @@ class LimitOrder(order_class.Order):
     def __init__(self, trader, side=enums.TradeOrderSide.BUY):
         super().__init__(trader, side)
         self.limit_price_hit_event = None
-        self.wait_for_hit_event_task = None
         self.trigger_above = self.side is enums.TradeOrderSide.SELL
         self.allow_instant_fill = True
 
     async def update_order_status(self, force_refresh=False):
         if self.limit_price_hit_event is None:
             self._create_hit_event(self.creation_time)
-
-        if self.wait_for_hit_event_task is None and self.limit_price_hit_event is not None:
             if self.limit_price_hit_event.is_set():
                 # order should be filled instantly
                 await self.on_fill(force_fill=True)
-            else:
-                # order will be filled when conditions are met
-                self._create_hit_task()
+            # otherwise order will be filled by the price events manager when conditions are met
 
     def _on_origin_price_change(self, previous_price, price_time):
         if previous_price is not constants.ZERO:
@@ -48,32 +41,24 @@ class LimitOrder(order_class.Order):
     def _create_hit_event(self, price_time):
         self.limit_price_hit_event = self.exchange_manager.exchange_symbols_data.\
             get_exchange_symbol_data(self.symbol).price_events_manager.\
-            new_event(self.origin_price, price_time, self.trigger_above, self.allow_instant_fill)
-
-    def _create_hit_task(self):
-        self.wait_for_hit_event_task = asyncio.create_task(self.wait_for_price_hit())
+            new_event(self.origin_price, price_time, self.trigger_above, self.allow_instant_fill, self.on_fill)
 
     def _reset_events(self, price_time):
         """
-        Reset events and tasks
+        Reset events
         """
-        self._clear_event_and_tasks()
+        self._clear_event()
         self._create_hit_event(price_time)
-        self._create_hit_task()
+        if self.limit_price_hit_event.is_set():
+            # price is already reached: fill order as soon as possible
+            self.exchange_manager.exchange_symbols_data.get_exchange_symbol_data(self.symbol).\
+                price_events_manager.dispatch_callback(self.on_fill)
 
-    def _clear_event_and_tasks(self):
-        if self.wait_for_hit_event_task is not None:
-            if not self.limit_price_hit_event.is_set():
-                self.wait_for_hit_event_task.cancel()
-            self.wait_for_hit_event_task = None
+    def _clear_event(self):
         if self.limit_price_hit_event is not None:
             self.exchange_manager.exchange_symbols_data. \
                 get_exchange_symbol_data(self.symbol).price_events_manager.remove_event(self.limit_price_hit_event)
 
-    async def wait_for_price_hit(self):
-        await asyncio.wait_for(self.limit_price_hit_event.wait(), timeout=None)
-        await self.on_fill()
-
     def _filled_maker_or_taker(self):
         return enums.ExchangeConstantsMarketPropertyColumns.MAKER.value
 
@@ -85,5 +70,10 @@ class LimitOrder(order_class.Order):
         order_class.Order.on_fill_actions(self)
 
     def clear(self):
-        self._clear_event_and_tasks()
+        if self.limit_price_hit_event is not None:
+            # a cleared order should not be filled by an already dispatched on_fill
+            self.exchange_manager.exchange_symbols_data. \
+                get_exchange_symbol_data(self.symbol).price_events_manager.remove_pending_callback(self.on_fill)
+        self._clear_event()
+        self.limit_price_hit_event = None
         order_class.Order.clear(self)
@@ -19,8 +19,6 @@ cimport octobot_trading.personal_data.orders.order as order_class
 cdef class TrailingStopOrder(order_class.Order):
     cdef object trailing_stop_price_hit_event # object is asyncio.Event
     cdef object trailing_price_hit_event # object is asyncio.Event
-    cdef object wait_for_stop_price_hit_event_task # object is asyncio.Event
-    cdef object wait_for_price_hit_event_task # object is asyncio.Event
     cdef public object trailing_percent
     cdef public bint allow_instant_fill
 
@@ -29,5 +27,4 @@ cdef class TrailingStopOrder(order_class.Order):
                                  double new_price_time)
     cdef object _calculate_stop_price(self, object new_price)
     cdef void _remove_events(self, object price_events_manager)
-    cdef void _clear_event_and_tasks(self)
-    cdef void _cancel_hit_tasks(self)
+    cdef void _clear_events(self)
@@ -13,7 +13,6 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
-import asyncio
 import decimal
 
 import octobot_commons.logging as logging
@@ -32,8 +31,6 @@ class TrailingStopOrder(order_class.Order):
         self.order_type = enums.TraderOrderType.TRAILING_STOP
         self.trailing_stop_price_hit_event = None
         self.trailing_price_hit_event = None
-        self.wait_for_stop_price_hit_event_task = None
-        self.wait_for_price_hit_event_task = None
         self.trailing_percent = trailing_percent
         self.allow_instant_fill = True
 
@@ -44,7 +41,7 @@ class TrailingStopOrder(order_class.Order):
 
     async def set_trailing_percent(self, trailing_percent):
         """
-        Set trailing percent and reset event and tasks
+        Set trailing percent and reset events
         :param trailing_percent: the new trailing percent
         """
         self.trailing_percent = trailing_percent
@@ -52,30 +49,31 @@ class TrailingStopOrder(order_class.Order):
 
     async def _reset_events(self, new_price, new_price_time):
         """
-        Reset events and tasks
+        Reset events
         :param new_price: the new trailing price
         """
-        self._clear_event_and_tasks()
+        self._clear_events()
         price_events_manager = self.exchange_manager.exchange_symbols_data. \
             get_exchange_symbol_data(self.symbol).price_events_manager
         self._create_hit_events(price_events_manager, new_price, new_price_time)
-        await self._handle_events_and_hit_tasks()
+        await self._handle_instantly_set_events()
 
     def _create_hit_events(self, price_events_manager, new_price, new_price_time):
         """
-        Create prices hit events
+        Create prices hit events, their callbacks are called by the price events manager when they are hit
         :param price_events_manager: the price events manager to use
         :param new_price: the new trailing price
         """
         if self.trailing_stop_price_hit_event is None:
             self.trailing_stop_price_hit_event = price_events_manager.new_event(
                 self._calculate_stop_price(new_price), new_price_time,
-                self.side is enums.TradeOrderSide.BUY, self.allow_instant_fill)
+                self.side is enums.TradeOrderSide.BUY, self.allow_instant_fill, self.on_fill)
         if self.trailing_price_hit_event is None:
             # don't allow instant fill since this event should only be triggered by next recent trades and prices
             self.trailing_price_hit_event = price_events_manager.new_event(new_price, new_price_time,
                                                                            self.side is enums.TradeOrderSide.SELL,
-                                                                           allow_instant_fill=False)
+                                                                           allow_instant_fill=False,
+                                                                           callback=self._on_price_hit)
 
     def _calculate_stop_price(self, new_price):
         """
@@ -89,23 +87,16 @@ class TrailingStopOrder(order_class.Order):
         trailing_price_factor *= constants.ONE if self.side is enums.TradeOrderSide.BUY else -constants.ONE
         return new_price * (constants.ONE + trailing_price_factor)
 
-    async def _handle_events_and_hit_tasks(self):
+    async def _handle_instantly_set_events(self):
         """
-        Create event hit waiting tasks
+        Call the callbacks of events that have been set at creation: the price events manager only calls
+        callbacks of events that are set after their creation
         """
-        if self.wait_for_price_hit_event_task is None and self.trailing_price_hit_event is not None:
-            if self.trailing_price_hit_event.is_set():
-                await self._on_price_hit()
-            else:
-                self.wait_for_price_hit_event_task = asyncio.create_task(
-                    _wait_for_price_hit(self.trailing_price_hit_event, self._on_price_hit))
+        if self.trailing_price_hit_event is not None and self.trailing_price_hit_event.is_set():
+            await self._on_price_hit()
 
-        if self.wait_for_stop_price_hit_event_task is None and self.trailing_stop_price_hit_event is not None:
-            if self.trailing_stop_price_hit_event.is_set():
-                await self.on_fill()
-            else:
-                self.wait_for_stop_price_hit_event_task = asyncio.create_task(
-                    _wait_for_price_hit(self.trailing_stop_price_hit_event, self.on_fill))
+        if self.trailing_stop_price_hit_event is not None and self.trailing_stop_price_hit_event.is_set():
+            await self.on_fill()
 
     def _remove_events(self, price_events_manager):
         """
@@ -119,20 +110,6 @@ class TrailingStopOrder(order_class.Order):
             price_events_manager.remove_event(self.trailing_price_hit_event)
             self.trailing_price_hit_event = None
 
-    def _cancel_hit_tasks(self):
-        """
-        Cancel and destroy event hit waiting tasks
-        """
-        if self.wait_for_price_hit_event_task is not None:
-            if not self.trailing_price_hit_event.is_set():
-                self.wait_for_price_hit_event_task.cancel()
-            self.wait_for_price_hit_event_task = None
-
-        if self.wait_for_stop_price_hit_event_task is not None:
-            if not self.trailing_stop_price_hit_event.is_set():
-                self.wait_for_stop_price_hit_event_task.cancel()
-            self.wait_for_stop_price_hit_event_task = None
-
     async def _on_price_hit(self):
         """
         Is called when the trailing price is hit
@@ -155,27 +132,21 @@ class TrailingStopOrder(order_class.Order):
                                                   self.symbol, self.origin_stop_price,
                                                   self.origin_quantity, self.origin_stop_price)
 
-    def _clear_event_and_tasks(self):
+    def _clear_events(self):
         """
-        Clear prices hit events and their related tasks
+        Clear prices hit events
         """
-        self._cancel_hit_tasks()
         self._remove_events(self.exchange_manager.exchange_symbols_data.
                             get_exchange_symbol_data(self.symbol).price_events_manager)
 
     def clear(self):
         """
-        Clear prices hit events and their related tasks and call super clear
+        Clear prices hit events, pending callbacks and call super clear
         """
-        self._clear_event_and_tasks()
+        self._clear_events()
+        price_events_manager = self.exchange_manager.exchange_symbols_data. \
+            get_exchange_symbol_data(self.symbol).price_events_manager
+        price_events_manager.remove_pending_callback(self.on_fill)
+        price_events_manager.remove_pending_callback(self._on_price_hit)
         order_class.Order.clear(self)
 
-
-async def _wait_for_price_hit(event_to_wait, callback):
-    """
-    Awaitable wait for event and call the specified callback
-    :param event_to_wait: the event to wait
-    :param callback: the callback to call
-    """
-    await asyncio.wait_for(event_to_wait.wait(), timeout=None)
-    await callback()
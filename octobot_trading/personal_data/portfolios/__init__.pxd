@@ -44,6 +44,10 @@ from octobot_trading.personal_data.portfolios cimport portfolio_manager
 from octobot_trading.personal_data.portfolios.portfolio_manager cimport (
     PortfolioManager,
 )
+from octobot_trading.personal_data.portfolios cimport price_conversion_graph
+from octobot_trading.personal_data.portfolios.price_conversion_graph cimport (
+    PriceConversionGraph,
+)
 from octobot_trading.personal_data.portfolios cimport types
 from octobot_trading.personal_data.portfolios.types cimport (
     FuturePortfolio,
@@ -81,6 +85,7 @@ __all__ = [
     "BalanceProfitabilityChannel",
     "SubPortfolio",
     "PortfolioManager",
+    "PriceConversionGraph",
     "FuturePortfolio",
     "MarginPortfolio",
     "SpotPortfolio",
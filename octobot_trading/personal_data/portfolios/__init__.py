@@ -39,6 +39,7 @@ from octobot_trading.personal_data.portfolios import portfolio_profitability
 from octobot_trading.personal_data.portfolios import sub_portfolio
 from octobot_trading.personal_data.portfolios import portfolio_manager
 from octobot_trading.personal_data.portfolios import portfolio_value_holder
+from octobot_trading.personal_data.portfolios import price_conversion_graph
 from octobot_trading.personal_data.portfolios import types
 from octobot_trading.personal_data.portfolios import portfolio_util
 from octobot_trading.personal_data.portfolios import history
@@ -59,6 +60,9 @@ from octobot_trading.personal_data.portfolios.portfolio_manager import (
 from octobot_trading.personal_data.portfolios.portfolio_value_holder import (
     PortfolioValueHolder,
 )
+from octobot_trading.personal_data.portfolios.price_conversion_graph import (
+    PriceConversionGraph,
+)
 from octobot_trading.personal_data.portfolios.types import (
     FuturePortfolio,
     MarginPortfolio,
@@ -98,6 +102,7 @@ __all__ = [
     "SubPortfolio",
     "PortfolioManager",
     "PortfolioValueHolder",
+    "PriceConversionGraph",
     "FuturePortfolio",
     "MarginPortfolio",
     "SpotPortfolio",
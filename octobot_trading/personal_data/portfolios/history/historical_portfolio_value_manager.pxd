@@ -34,16 +34,25 @@ cdef class HistoricalPortfolioValueManager(util.Initializable):
 
     cdef public int max_history_size
     cdef public object historical_portfolio_value
+    cdef set _updated_historical_timestamps
+    cdef int _stored_historical_values_count
+    cdef bint _requires_historical_values_compaction
+    cdef dict _historical_timestamps_by_time_frame_seconds
 
     cpdef object get_historical_values(self, str currency, object time_frame, object from_timestamp=*, object to_timestamp=*)
+    cpdef tuple get_historical_values_array(self, str currency, object time_frame, object from_timestamp=*, object to_timestamp=*)
     cpdef object get_historical_value(self, object timestamp)
 
     cdef void _add_historical_portfolio_value(self, double timestamp, dict value_by_currency)
+    cdef bint _should_compact_historical_values(self, double compaction_ratio)
     cdef void _load_metadata(self, list metadata)
-    cdef bint _is_historical_timestamp_relevant(self, double timestamp, object time_frame_seconds, object from_timestamp, object to_timestamp)
+    cdef list _get_relevant_historical_values(self, object time_frame, object from_timestamp, object to_timestamp)
+    cdef object _get_time_frame_timestamps(self, object time_frame_seconds)
     cdef set _get_relevant_timestamps(self, double timestamp, object currencies, list time_frames, bint force_update, bint include_past_data)
     cdef bint _should_update_timestamp(self, object currencies, object time_frame_allowed_window_start, bint force_update)
     cdef object _get_value_in_currency(self, object historical_value, str currency)
+    cdef tuple _get_conversion_currency_and_rate(self, object historical_value, str target_currency, dict conversion_rate_by_currency)
+    cdef object _get_conversion_rate(self, str currency, str target_currency)
     cdef object _convert_historical_value(self, object historical_value, str target_currency)
     cdef object _get_metadata(self)
     cdef object _update_portfolios(self)
@@ -15,6 +15,7 @@
 #  License along with this library.
 import sortedcontainers
 import copy
+import numpy as np
 
 import octobot_commons.logging as logging
 import octobot_commons.constants as commons_constants
@@ -47,6 +48,9 @@ class HistoricalPortfolioValueManager(util.Initializable):
     # time passed to avoid using past data: use future data at worse). use high value to still take value if users
     # start it in the 1st part of the day for example
     MAX_HISTORY_SIZE = 250000
+    # stored values are only appended on save, rewrite them all when the stored values count would reach
+    # HISTORY_COMPACTION_RATIO times the historical values count
+    HISTORY_COMPACTION_RATIO = 2
 
     def __init__(self, portfolio_manager, data_source=None, version=None):
         super().__init__()
@@ -66,6 +70,14 @@ class HistoricalPortfolioValueManager(util.Initializable):
 
         self.max_history_size = self.__class__.MAX_HISTORY_SIZE
         self.historical_portfolio_value = sortedcontainers.SortedDict()
+        # timestamps of the historical values added or updated since the last save
+        self._updated_historical_timestamps = set()
+        # count of stored values, including outdated values of updated or removed timestamps
+        self._stored_historical_values_count = 0
+        # rewrite stored values on the first save to ensure consistency with the table content
+        self._requires_historical_values_compaction = True
+        # sorted timestamps of historical values relevant for a time frame, by time frame seconds
+        self._historical_timestamps_by_time_frame_seconds = {}
 
     async def initialize_impl(self):
         """
@@ -122,15 +134,8 @@ class HistoricalPortfolioValueManager(util.Initializable):
         :param from_timestamp: selected time window start time
         :param to_timestamp: selected time window end time
         """
-        to_timestamp = to_timestamp or self.portfolio_manager.exchange_manager.exchange.get_exchange_current_time()
-        time_frame_seconds = commons_enums.TimeFramesMinutes[time_frame] * commons_constants.MINUTE_TO_SECONDS
-        relevant_historical_values = [
-            value
-            for timestamp, value in self.historical_portfolio_value.items()
-            if self._is_historical_timestamp_relevant(timestamp, time_frame_seconds, from_timestamp, to_timestamp)
-        ]
         historical_values = {}
-        for historical_value in relevant_historical_values:
+        for historical_value in self._get_relevant_historical_values(time_frame, from_timestamp, to_timestamp):
             try:
                 historical_values[historical_value.get_timestamp()] = \
                     self._get_value_in_currency(historical_value, currency)
@@ -139,18 +144,58 @@ class HistoricalPortfolioValueManager(util.Initializable):
                 self.logger.debug(f"Missing price data when computing historical portfolio value: {e}")
         return historical_values
 
+    def get_historical_values_array(self, currency, time_frame, from_timestamp=0, to_timestamp=None):
+        """
+        Returns the timestamps and their associated portfolio historical value as numpy arrays, to be used
+        on large histories. Does not include the current portfolio value
+        :param currency: the currency to compute value in
+        :param time_frame: intervals between values
+        :param from_timestamp: selected time window start time
+        :param to_timestamp: selected time window end time
+        :return: the timestamps and values float arrays
+        """
+        timestamps = []
+        values = []
+        conversion_rates = []
+        conversion_rate_by_currency = {}
+        for historical_value in self._get_relevant_historical_values(time_frame, from_timestamp, to_timestamp):
+            if currency in historical_value:
+                values.append(historical_value.get(currency))
+                conversion_rates.append(1)
+            else:
+                try:
+                    value_currency, conversion_rate = self._get_conversion_currency_and_rate(
+                        historical_value, currency, conversion_rate_by_currency
+                    )
+                except errors.MissingPriceDataError as e:
+                    # do not add missing historical values
+                    self.logger.debug(f"Missing price data when computing historical portfolio value: {e}")
+                    continue
+                values.append(historical_value.get(value_currency))
+                conversion_rates.append(conversion_rate)
+            timestamps.append(historical_value.get_timestamp())
+        return (
+            np.array(timestamps, dtype=np.float64),
+            np.array(values, dtype=np.float64) * np.array(conversion_rates, dtype=np.float64)
+        )
+
     def get_historical_value(self, timestamp):
         return self.historical_portfolio_value[timestamp]
 
     async def reset_history(self):
         self.historical_portfolio_value = sortedcontainers.SortedDict()
+        self._historical_timestamps_by_time_frame_seconds = {}
+        self._updated_historical_timestamps.clear()
+        self._requires_historical_values_compaction = True
         await self.save_historical_portfolio_value()
 
     async def _upsert_value(self, timestamps, value_by_currency, save_changes):
         changed = False
         for timestamp in timestamps:
             try:
-                changed |= self.get_historical_value(timestamp).update(value_by_currency)
+                if self.get_historical_value(timestamp).update(value_by_currency):
+                    self._updated_historical_timestamps.add(timestamp)
+                    changed = True
             except KeyError:
                 self._add_historical_portfolio_value(timestamp, value_by_currency)
                 changed = True
@@ -160,10 +205,18 @@ class HistoricalPortfolioValueManager(util.Initializable):
 
     def _add_historical_portfolio_value(self, timestamp, value_by_currency):
         if len(self.historical_portfolio_value) >= self.max_history_size:
-            # remove the oldest element
-            self.historical_portfolio_value.popitem(0)
+            # remove the oldest element, its stored value will be removed on the next compaction
+            removed_timestamp, _ = self.historical_portfolio_value.popitem(0)
+            self._updated_historical_timestamps.discard(removed_timestamp)
+            for time_frame_seconds, timestamps in self._historical_timestamps_by_time_frame_seconds.items():
+                if self._is_timestamp_relevant(removed_timestamp, time_frame_seconds):
+                    timestamps.remove(removed_timestamp)
         self.historical_portfolio_value[timestamp] = \
             historical_asset_value.HistoricalAssetValue(timestamp, value_by_currency)
+        self._updated_historical_timestamps.add(timestamp)
+        for time_frame_seconds, timestamps in self._historical_timestamps_by_time_frame_seconds.items():
+            if self._is_timestamp_relevant(timestamp, time_frame_seconds):
+                timestamps.add(timestamp)
 
     def _update_portfolios(self):
         if self.portfolio_manager.portfolio is None or self.portfolio_manager.portfolio.portfolio is None:
@@ -186,9 +239,32 @@ class HistoricalPortfolioValueManager(util.Initializable):
         if update_data:
             self.last_update_time = self.portfolio_manager.exchange_manager.exchange.get_exchange_current_time()
             self._update_portfolios()
+        compact = self._should_compact_historical_values(self.HISTORY_COMPACTION_RATIO)
+        if compact:
+            saved_historical_values = [
+                historical_asset.to_dict()
+                for historical_asset in self.historical_portfolio_value.values()
+            ]
+            self._stored_historical_values_count = len(saved_historical_values)
+        else:
+            # only append added or updated values: loading will use the last stored value of each timestamp
+            saved_historical_values = [
+                self.historical_portfolio_value[timestamp].to_dict()
+                for timestamp in sorted(self._updated_historical_timestamps)
+            ]
+            self._stored_historical_values_count += len(saved_historical_values)
+        self._updated_historical_timestamps.clear()
+        self._requires_historical_values_compaction = False
         await self.portfolio_manager.exchange_manager.storage_manager.portfolio_storage.save_historical_portfolio_value(
             self._get_metadata(),
-            [historical_asset.to_dict() for historical_asset in self.historical_portfolio_value.values()]
+            saved_historical_values,
+            replace_all=compact
+        )
+
+    def _should_compact_historical_values(self, compaction_ratio):
+        return self._requires_historical_values_compaction or (
+            self._stored_historical_values_count + len(self._updated_historical_timestamps)
+            > compaction_ratio * len(self.historical_portfolio_value)
         )
 
     async def _reload_historical_portfolio_value(self):
@@ -197,6 +273,7 @@ class HistoricalPortfolioValueManager(util.Initializable):
         self._load_metadata(await db.all(commons_enums.RunDatabases.METADATA.value))
 
     def _load_historical_values(self, dict_values):
+        # values are stored in save order: the last value of a timestamp is the up-to-date one
         self.historical_portfolio_value = sortedcontainers.SortedDict({
             element[historical_asset_value.HistoricalAssetValue.TIMESTAMP_KEY]:
                 historical_asset_value_factory.create_historical_asset_value_from_dict_like_object(
@@ -204,6 +281,11 @@ class HistoricalPortfolioValueManager(util.Initializable):
                 )
             for element in dict_values
         })
+        while len(self.historical_portfolio_value) > self.max_history_size:
+            self.historical_portfolio_value.popitem(0)
+        self._historical_timestamps_by_time_frame_seconds = {}
+        self._updated_historical_timestamps.clear()
+        self._stored_historical_values_count = len(dict_values)
 
     def _load_metadata(self, metadata_list):
         if metadata_list:
@@ -214,9 +296,28 @@ class HistoricalPortfolioValueManager(util.Initializable):
                 self.starting_time = metadata.get(self.STARTING_TIME, self.starting_time)
                 self.starting_portfolio = metadata.get(self.STARTING_PORTFOLIO, None)
 
-    def _is_historical_timestamp_relevant(self, timestamp, time_frame_seconds, from_timestamp, to_timestamp):
-        return self._is_timestamp_relevant(timestamp, time_frame_seconds) and \
-               from_timestamp <= timestamp <= to_timestamp
+    def _get_relevant_historical_values(self, time_frame, from_timestamp, to_timestamp):
+        to_timestamp = to_timestamp or self.portfolio_manager.exchange_manager.exchange.get_exchange_current_time()
+        time_frame_seconds = commons_enums.TimeFramesMinutes[time_frame] * commons_constants.MINUTE_TO_SECONDS
+        return [
+            self.historical_portfolio_value[timestamp]
+            for timestamp in self._get_time_frame_timestamps(time_frame_seconds).irange(from_timestamp, to_timestamp)
+        ]
+
+    def _get_time_frame_timestamps(self, time_frame_seconds):
+        """
+        :return: the sorted timestamps relevant for time_frame_seconds, maintained on each new historical value
+        """
+        try:
+            return self._historical_timestamps_by_time_frame_seconds[time_frame_seconds]
+        except KeyError:
+            timestamps = sortedcontainers.SortedList([
+                timestamp
+                for timestamp in self.historical_portfolio_value
+                if self._is_timestamp_relevant(timestamp, time_frame_seconds)
+            ])
+            self._historical_timestamps_by_time_frame_seconds[time_frame_seconds] = timestamps
+            return timestamps
 
     @staticmethod
     def _is_timestamp_relevant(timestamp, time_frame_seconds):
@@ -263,6 +364,32 @@ class HistoricalPortfolioValueManager(util.Initializable):
         except KeyError:
             return self._convert_historical_value(historical_value, currency)
 
+    def _get_conversion_currency_and_rate(self, historical_value, target_currency, conversion_rate_by_currency):
+        """
+        :param conversion_rate_by_currency: cache of the conversion rates from currencies to target_currency,
+        None when a currency can't be converted
+        :return: the historical value currency to use and its conversion rate to target_currency
+        """
+        for currency in historical_value.get_currencies():
+            try:
+                conversion_rate = conversion_rate_by_currency[currency]
+            except KeyError:
+                conversion_rate = conversion_rate_by_currency[currency] = \
+                    self._get_conversion_rate(currency, target_currency)
+            if conversion_rate is not None:
+                return currency, conversion_rate
+        raise errors.MissingPriceDataError(f"no price data to evaluate {historical_value} on {target_currency}")
+
+    def _get_conversion_rate(self, currency, target_currency):
+        # same as _convert_historical_value: use last prices of the first pair containing both currencies
+        for pair in self.portfolio_manager.portfolio_value_holder.last_prices_by_trading_pair:
+            base_and_quote = symbol_util.parse_symbol(pair).base_and_quote()
+            if currency in base_and_quote and target_currency in base_and_quote:
+                return float(self.portfolio_manager.portfolio_value_holder.convert_currency_value_using_last_prices(
+                    constants.ONE, currency, target_currency
+                ))
+        return None
+
     def _convert_historical_value(self, historical_value, target_currency):
         # TODO try to get a more accurate historical value into target_currency currency using price history
         # last chance: try to get any usable value from portfolio value holder (not accurate since used the intermediary
@@ -287,4 +414,7 @@ class HistoricalPortfolioValueManager(util.Initializable):
         }
 
     async def stop(self):
+        # rewrite the table when it contains outdated values of updated or removed timestamps to leave
+        # exactly one stored value per timestamp
+        self._requires_historical_values_compaction = self._should_compact_historical_values(1)
         await self.save_historical_portfolio_value(update_data=False)
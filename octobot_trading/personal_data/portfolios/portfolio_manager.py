@@ -183,7 +183,8 @@ class PortfolioManager(util.Initializable):
         """
         return self.portfolio_profitability. \
             update_profitability(force_recompute_origin_portfolio=self.portfolio_value_holder.
-                                 update_origin_crypto_currencies_values(symbol, mark_price))
+                                 update_origin_crypto_currencies_values(symbol, mark_price),
+                                 updated_symbol=symbol)
 
     async def _refresh_real_trader_portfolio(self) -> bool:
         """
@@ -35,13 +35,17 @@ cdef class PortfolioProfitability:
     cdef public object initial_portfolio_current_profitability
 
     cdef set traded_currencies_without_market_specific
+    cdef dict _market_profitability_ratios
+    cdef object _market_profitability_ratios_sum
     cdef public set valuated_currencies
 
-    cpdef object update_profitability(self, bint force_recompute_origin_portfolio=*)
+    cpdef object update_profitability(self, bint force_recompute_origin_portfolio=*, str updated_symbol=*)
 
     cdef object _calculate_average_market_profitability(self)
+    cdef object _update_average_market_profitability(self, list updated_currencies)
+    cdef object _get_average_market_profitability_from_ratios(self)
     cdef void _reset_before_profitability_calculation(self)
-    cdef object _update_profitability_calculation(self)
-    cdef object _update_portfolio_delta(self)
+    cdef object _update_profitability_calculation(self, list updated_currencies=*)
+    cdef object _update_portfolio_delta(self, list updated_currencies=*)
     cdef dict _only_symbol_currency_filter(self, dict currency_dict)
     # cdef void _init_traded_currencies_without_market_specific(self) can't be cythonized for now
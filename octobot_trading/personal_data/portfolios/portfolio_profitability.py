@@ -43,6 +43,11 @@ class PortfolioProfitability:
         # is market only => not used to compute market average profitability
         self.traded_currencies_without_market_specific = set()
 
+        # current / origin value ratio of each traded currency and their sum, used to compute
+        # market_profitability_percent without iterating over every currency on each price update
+        self._market_profitability_ratios = {}
+        self._market_profitability_ratios_sum = constants.ZERO
+
         # set of currencies that should be valuated because either present in config or as a reference market
         self.valuated_currencies = util.get_all_currencies(self.portfolio_manager.config, enabled_only=False)
         self.valuated_currencies.add(self.portfolio_manager.reference_market)
@@ -55,16 +60,23 @@ class PortfolioProfitability:
         self.portfolio_manager.portfolio_value_holder.get_current_crypto_currencies_values()
         return self._calculate_average_market_profitability()
 
-    def update_profitability(self, force_recompute_origin_portfolio=False):
+    def update_profitability(self, force_recompute_origin_portfolio=False, updated_symbol=None):
         """
         Get profitability calls get_currencies_prices to update required data
         Then calls get_portfolio_current_value to set the current value of portfolio_current_value attribute
+        :param force_recompute_origin_portfolio: when True, force origin portfolio computation
+        :param updated_symbol: the symbol which price changed, when set, only currencies valued using this
+        symbol are reevaluated unless a full recalculation is required
         :return: True if changed else False
         """
         self._reset_before_profitability_calculation()
         try:
-            self.portfolio_manager.handle_profitability_recalculation(force_recompute_origin_portfolio)
-            self._update_profitability_calculation()
+            updated_currencies = None
+            if updated_symbol is not None and not force_recompute_origin_portfolio:
+                updated_currencies = self.value_manager.update_current_values_from_symbol(updated_symbol)
+            if updated_currencies is None:
+                self.portfolio_manager.handle_profitability_recalculation(force_recompute_origin_portfolio)
+            self._update_profitability_calculation(updated_currencies)
             return self.profitability_diff != constants.ZERO
         except KeyError as missing_data_exception:
             self.logger.warning(f"Missing ticker data to calculate profitability")
@@ -82,11 +94,12 @@ class PortfolioProfitability:
         self.market_profitability_percent = constants.ZERO
         self.initial_portfolio_current_profitability = constants.ZERO
 
-    def _update_profitability_calculation(self):
+    def _update_profitability_calculation(self, updated_currencies=None):
         """
         Calculates the new portfolio profitability
+        :param updated_currencies: currencies which value changed since the last calculation, None if unknown
         """
-        initial_portfolio_current_value = self.value_manager.get_origin_portfolio_current_value()
+        initial_portfolio_current_value = self.value_manager.origin_portfolio_current_value
         self.profitability = self.value_manager.portfolio_current_value - self.value_manager.portfolio_origin_value
 
         if self.value_manager.portfolio_origin_value > constants.ZERO:
@@ -97,28 +110,58 @@ class PortfolioProfitability:
                                                            constants.ONE_HUNDRED
         else:
             self.profitability_percent = constants.ZERO
-        self._update_portfolio_delta()
+        self._update_portfolio_delta(updated_currencies)
 
-    def _update_portfolio_delta(self):
+    def _update_portfolio_delta(self, updated_currencies=None):
         """
         Calculates difference between the current and the last portfolio
+        :param updated_currencies: currencies which value changed since the last calculation, None if unknown
         """
         self.profitability_diff = self.profitability_percent - self.profitability_diff
-        self.market_profitability_percent = self.get_average_market_profitability()
+        if updated_currencies is None:
+            self.market_profitability_percent = self.get_average_market_profitability()
+        else:
+            self.market_profitability_percent = self._update_average_market_profitability(updated_currencies)
 
     def _calculate_average_market_profitability(self):
         """
         Calculate the average of all the watched cryptocurrencies between bot's start time and now
         :return: the calculation result
         """
-        origin_values = [value / self.value_manager.origin_crypto_currencies_values[currency]
-                         for currency, value
-                         in self._only_symbol_currency_filter(self.value_manager.
-                                                              current_crypto_currencies_values).items()
-                         if self.value_manager.origin_crypto_currencies_values[currency] > constants.ZERO]
+        self._market_profitability_ratios = {
+            currency: value / self.value_manager.origin_crypto_currencies_values[currency]
+            for currency, value
+            in self._only_symbol_currency_filter(self.value_manager.current_crypto_currencies_values).items()
+            if self.value_manager.origin_crypto_currencies_values[currency] > constants.ZERO
+        }
+        self._market_profitability_ratios_sum = sum(self._market_profitability_ratios.values())
+        return self._get_average_market_profitability_from_ratios()
 
-        return sum(origin_values) / len(origin_values) * constants.ONE_HUNDRED - constants.ONE_HUNDRED \
-            if origin_values else constants.ZERO
+    def _update_average_market_profitability(self, updated_currencies):
+        """
+        Update the average of all the watched cryptocurrencies between bot's start time and now
+        using only the given currencies updated values
+        :param updated_currencies: currencies which value changed since the last calculation
+        :return: the calculation result
+        """
+        if not self.traded_currencies_without_market_specific:
+            self._init_traded_currencies_without_market_specific()
+        for currency in updated_currencies:
+            if currency in self.traded_currencies_without_market_specific:
+                origin_value = self.value_manager.origin_crypto_currencies_values[currency]
+                if origin_value > constants.ZERO:
+                    ratio = self.value_manager.current_crypto_currencies_values[currency] / origin_value
+                    self._market_profitability_ratios_sum += \
+                        ratio - self._market_profitability_ratios.get(currency, constants.ZERO)
+                    self._market_profitability_ratios[currency] = ratio
+        return self._get_average_market_profitability_from_ratios()
+
+    def _get_average_market_profitability_from_ratios(self):
+        """
+        :return: the average market profitability from the current ratios
+        """
+        return self._market_profitability_ratios_sum / len(self._market_profitability_ratios) * \
+            constants.ONE_HUNDRED - constants.ONE_HUNDRED if self._market_profitability_ratios else constants.ZERO
 
     def _only_symbol_currency_filter(self, currency_dict):
         """
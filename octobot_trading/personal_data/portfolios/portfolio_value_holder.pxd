@@ -21,6 +21,7 @@ In simulation it will also define rules to be filled / canceled
 It is also use to store creation & fill values of the order """
 cimport octobot_trading.personal_data.portfolios.portfolio as portfolio
 cimport octobot_trading.personal_data.portfolios.portfolio_manager as portfolio_manager
+cimport octobot_trading.personal_data.portfolios.price_conversion_graph as price_conversion_graph_class
 
 cdef class PortfolioValueHolder:
     cdef object logger
@@ -28,8 +29,10 @@ cdef class PortfolioValueHolder:
 
     cdef public object portfolio_origin_value
     cdef public object portfolio_current_value
+    cdef public object origin_portfolio_current_value
 
     cdef public dict last_prices_by_trading_pair
+    cdef public price_conversion_graph_class.PriceConversionGraph price_conversion_graph
     cdef public dict origin_crypto_currencies_values
     cdef public dict current_crypto_currencies_values
     cdef public set initializing_symbol_prices
@@ -39,6 +42,14 @@ cdef class PortfolioValueHolder:
 
     cdef set missing_currency_data_in_exchange
 
+    cdef dict _valuated_portfolio
+    cdef dict _valuated_holdings
+    cdef set _valuated_missing_currencies
+    cdef int _valuated_symbols_count
+    cdef dict _valuated_currencies_by_symbol
+    cdef dict _current_value_by_currency
+    cdef dict _origin_current_value_by_currency
+
     cdef portfolio_manager.PortfolioManager portfolio_manager
 
     cpdef bint update_origin_crypto_currencies_values(self, str symbol, object mark_price)
@@ -46,20 +57,26 @@ cdef class PortfolioValueHolder:
     cpdef dict get_current_holdings_values(self)
     cpdef object get_origin_portfolio_current_value(self, bint refresh_values=*)
     cpdef object handle_profitability_recalculation(self, bint force_recompute_origin_portfolio)
+    cpdef list update_current_values_from_symbol(self, str symbol)
     cpdef object convert_currency_value_using_last_prices(self, object quantity, str current_currency, str target_currency)
     # cpdef object get_currency_holding_ratio(self, str currency)
 
     cdef object _init_portfolio_values_if_necessary(self, bint force_recompute_origin_portfolio)
+    cdef void _init_incremental_valuation(self)
+    cdef list _get_conversion_symbols(self, str current_currency, str target_currency)
+    cdef price_conversion_graph_class.PriceConversionGraph _get_price_conversion_graph(self)
     cdef object _init_origin_portfolio_and_currencies_value(self)
     cdef object _update_portfolio_current_value(self, dict portfolio, dict currencies_values=*, bint fill_currencies_values=*)
     cdef void _fill_currencies_values(self, dict currencies_values)
     cdef dict _update_portfolio_and_currencies_current_value(self)
     cdef object _check_currency_initialization(self, str currency, object currency_value)
     cdef void _recompute_origin_portfolio_initial_value(self)
-    cdef void _try_to_ask_ticker_missing_symbol_data(self, str currency, str symbol, str reversed_symbol)
+    cdef void _try_to_ask_ticker_missing_symbol_data(self, str currency, list symbols_to_add)
+    cdef list _get_reference_market_exchange_symbols(self, str currency)
+    cdef str _get_exchange_symbol(self, str currency, str other_currency)
     cdef void _ask_ticker_data_for_currency(self, list symbols_to_add)
     cdef void _inform_no_matching_symbol(self, str currency)
-    cdef object _has_price_data(self, str symbol) # return object to propagate exceptions
+    cdef object _convert_using_last_price(self, object quantity, str current_currency, str target_currency)
     cdef object _evaluate_config_crypto_currencies_and_portfolio_values(self,
                                                                 dict portfolio,
                                                                 bint ignore_missing_currency_data=*)
@@ -74,6 +91,7 @@ cdef class PortfolioValueHolder:
                                                     set missing_tickers,
                                                     bint ignore_missing_currency_data)
     cdef object _evaluate_portfolio_value(self, dict portfolio, dict currencies_values=*)
+    cdef dict _get_portfolio_values(self, dict portfolio, dict currencies_values=*)
     cdef bint _should_currency_be_considered(self, str currency, dict portfolio, bint ignore_missing_currency_data)
     # cdef object _evaluate_value(self, str currency, object quantity, bint raise_error=*)
     # cdef object _try_get_value_of_currency(self, str currency, object quantity, bint raise_error)
@@ -22,6 +22,7 @@ import octobot_commons.symbols as symbol_util
 
 import octobot_trading.constants as constants
 import octobot_trading.errors as errors
+import octobot_trading.personal_data.portfolios.price_conversion_graph as price_conversion_graph_class
 
 
 class PortfolioValueHolder:
@@ -42,6 +43,8 @@ class PortfolioValueHolder:
 
         # values in decimal.Decimal
         self.last_prices_by_trading_pair = {}
+        self.price_conversion_graph = \
+            price_conversion_graph_class.PriceConversionGraph(self.last_prices_by_trading_pair)
         self.origin_portfolio = None
 
         # values in decimal.Decimal
@@ -51,6 +54,21 @@ class PortfolioValueHolder:
         # set of currencies for which the current exchange is not providing any suitable price data
         self.missing_currency_data_in_exchange = set()
 
+        # origin portfolio value using current currencies values
+        self.origin_portfolio_current_value = constants.ZERO
+
+        # incremental valuation state, set by each full valuation and used by update_current_values_from_symbol
+        # portfolio dict, currencies totals and last prices symbols count the current values have been computed with
+        self._valuated_portfolio = None
+        self._valuated_holdings = {}
+        self._valuated_missing_currencies = set()
+        self._valuated_symbols_count = 0
+        # currencies evaluated by a full valuation by symbol used to convert them into reference market
+        self._valuated_currencies_by_symbol = {}
+        # value of each currency in portfolio_current_value and origin_portfolio_current_value
+        self._current_value_by_currency = {}
+        self._origin_current_value_by_currency = {}
+
     def update_origin_crypto_currencies_values(self, symbol, mark_price):
         """
         Update origin cryptocurrencies value
@@ -62,12 +80,12 @@ class PortfolioValueHolder:
         # update origin values if this price has relevant data regarding the origin portfolio (using both quote and base)
         origin_currencies_should_be_updated = (
                 (
-                        currency not in set(self.origin_crypto_currencies_values.keys()) and
+                        currency not in self.origin_crypto_currencies_values and
                         market == self.portfolio_manager.reference_market
                 )
                 or
                 (
-                        market not in set(self.origin_crypto_currencies_values.keys()) and
+                        market not in self.origin_crypto_currencies_values and
                         currency == self.portfolio_manager.reference_market
                 )
         )
@@ -81,6 +99,13 @@ class PortfolioValueHolder:
         self.last_prices_by_trading_pair[symbol] = mark_price
         return origin_currencies_should_be_updated
 
+    def _get_price_conversion_graph(self):
+        if self.price_conversion_graph.last_prices_by_trading_pair is not self.last_prices_by_trading_pair:
+            # last prices dict has been replaced: build a new graph from it
+            self.price_conversion_graph = \
+                price_conversion_graph_class.PriceConversionGraph(self.last_prices_by_trading_pair)
+        return self.price_conversion_graph
+
     def get_current_crypto_currencies_values(self):
         """
         Return the current crypto-currencies values
@@ -115,8 +140,61 @@ class PortfolioValueHolder:
         Initialize values required by portfolio profitability to perform its profitability calculation
         :param force_recompute_origin_portfolio: when True, force origin portfolio computation
         """
+        self._valuated_portfolio = None
         self._update_portfolio_and_currencies_current_value()
         self._init_portfolio_values_if_necessary(force_recompute_origin_portfolio)
+        self._init_incremental_valuation()
+
+    def update_current_values_from_symbol(self, symbol):
+        """
+        Incremental alternative to handle_profitability_recalculation after a symbol price update: only reevaluate
+        the currencies valued using this symbol and the currencies which holdings changed since the last valuation
+        :param symbol: the symbol which price has been updated
+        :return: the currencies which current value has been updated, None when a full valuation is required
+        """
+        portfolio = self.portfolio_manager.portfolio.portfolio
+        if self._valuated_portfolio is not portfolio \
+           or len(portfolio) != len(self._valuated_holdings) \
+           or len(self.last_prices_by_trading_pair) != self._valuated_symbols_count \
+           or self.missing_currency_data_in_exchange != self._valuated_missing_currencies \
+           or self.portfolio_origin_value == constants.ZERO:
+            return None
+        updated_holdings = []
+        for currency, asset in portfolio.items():
+            try:
+                previous_total = self._valuated_holdings[currency]
+            except KeyError:
+                return None
+            if asset.total != previous_total:
+                if (asset.total > constants.ZERO) is not (previous_total > constants.ZERO):
+                    # currency might now be or not be evaluated: full valuation required
+                    return None
+                updated_holdings.append(currency)
+
+        updated_currencies = []
+        for currency in self._valuated_currencies_by_symbol.get(symbol, ()):
+            try:
+                self.current_crypto_currencies_values[currency] = self._evaluate_value(currency, constants.ONE)
+                updated_currencies.append(currency)
+            except errors.MissingPriceDataError:
+                pass
+        if self.missing_currency_data_in_exchange != self._valuated_missing_currencies:
+            return None
+
+        for currency in updated_holdings:
+            self._valuated_holdings[currency] = portfolio[currency].total
+        for currency in set(updated_currencies + updated_holdings):
+            if currency in self._current_value_by_currency:
+                value = self._get_currency_value(portfolio, currency, self.current_crypto_currencies_values)
+                self.portfolio_current_value += value - self._current_value_by_currency[currency]
+                self._current_value_by_currency[currency] = value
+        for currency in updated_currencies:
+            if currency in self._origin_current_value_by_currency:
+                value = self._get_currency_value(self.origin_portfolio.portfolio, currency,
+                                                 self.current_crypto_currencies_values)
+                self.origin_portfolio_current_value += value - self._origin_current_value_by_currency[currency]
+                self._origin_current_value_by_currency[currency] = value
+        return updated_currencies
 
     def get_origin_portfolio_current_value(self, refresh_values=False):
         """
@@ -141,6 +219,48 @@ class PortfolioValueHolder:
         if force_recompute_origin_portfolio:
             self._recompute_origin_portfolio_initial_value()
 
+    def _init_incremental_valuation(self):
+        """
+        Store the current valuation state to be able to update it from update_current_values_from_symbol
+        """
+        portfolio = self.portfolio_manager.portfolio.portfolio
+        self._origin_current_value_by_currency = self._get_portfolio_values(self.origin_portfolio.portfolio,
+                                                                             self.current_crypto_currencies_values)
+        self.origin_portfolio_current_value = sum(self._origin_current_value_by_currency.values())
+        self._valuated_holdings = {currency: asset.total for currency, asset in portfolio.items()}
+        self._valuated_missing_currencies = set(self.missing_currency_data_in_exchange)
+        self._valuated_symbols_count = len(self.last_prices_by_trading_pair)
+        valuated_currencies = [
+            currency
+            for currency in portfolio
+            if self._should_currency_be_considered(currency, portfolio, False)
+        ]
+        if self.portfolio_manager.exchange_manager.exchange_config.all_config_symbol_pairs:
+            valuated_currencies += symbol_util.parse_symbol(
+                self.portfolio_manager.exchange_manager.exchange_config.all_config_symbol_pairs[0]
+            ).base_and_quote()
+        self._valuated_currencies_by_symbol = {}
+        for currency in set(valuated_currencies):
+            for symbol in self._get_conversion_symbols(currency, self.portfolio_manager.reference_market):
+                self._valuated_currencies_by_symbol.setdefault(symbol, []).append(currency)
+        self._valuated_portfolio = portfolio
+
+    def _get_conversion_symbols(self, current_currency, target_currency):
+        """
+        :return: the last prices symbols which prices are used to convert current_currency into target_currency
+        """
+        conversion_graph = self._get_price_conversion_graph()
+        conversion_path = conversion_graph.get_conversion_path(current_currency, target_currency)
+        if conversion_path is None:
+            return []
+        return [
+            symbol
+            for from_currency, to_currency in zip(conversion_path, conversion_path[1:])
+            for symbol in (conversion_graph.get_symbol(from_currency, to_currency),
+                           conversion_graph.get_symbol(to_currency, from_currency))
+            if symbol is not None
+        ]
+
     def _init_origin_portfolio_and_currencies_value(self):
         """
         Initialize origin portfolio and the origin portfolio currencies values
@@ -183,8 +303,11 @@ class PortfolioValueHolder:
         """
         Update the portfolio current value with the current portfolio instance
         """
-        self.portfolio_current_value = self._update_portfolio_current_value(
-            self.portfolio_manager.portfolio.portfolio)
+        portfolio = self.portfolio_manager.portfolio.portfolio
+        self.current_crypto_currencies_values.update(
+            self._evaluate_config_crypto_currencies_and_portfolio_values(portfolio))
+        self._current_value_by_currency = self._get_portfolio_values(portfolio, self.current_crypto_currencies_values)
+        self.portfolio_current_value = sum(self._current_value_by_currency.values())
 
     def _evaluate_value(self, currency, quantity, raise_error=True):
         """
@@ -230,62 +353,94 @@ class PortfolioValueHolder:
             return self.convert_currency_value_using_last_prices(quantity, currency,
                                                                  self.portfolio_manager.reference_market)
         except errors.MissingPriceDataError as missing_data_exception:
-            symbol = symbol_util.merge_currencies(currency, self.portfolio_manager.reference_market)
-            reversed_symbol = symbol_util.merge_currencies(self.portfolio_manager.reference_market, currency)
-            if not any(self.portfolio_manager.exchange_manager.symbol_exists(s) for s in (symbol, reversed_symbol)) \
-               and currency not in self.missing_currency_data_in_exchange:
+            exchange_symbols = self._get_reference_market_exchange_symbols(currency)
+            if not exchange_symbols and currency not in self.missing_currency_data_in_exchange:
                 self._inform_no_matching_symbol(currency)
                 self.missing_currency_data_in_exchange.add(currency)
             if not self.portfolio_manager.exchange_manager.is_backtesting:
-                self._try_to_ask_ticker_missing_symbol_data(currency, symbol, reversed_symbol)
+                self._try_to_ask_ticker_missing_symbol_data(currency, exchange_symbols)
                 if raise_error:
                     raise missing_data_exception
         return constants.ZERO
 
     def convert_currency_value_using_last_prices(self, quantity, current_currency, target_currency):
-        try:
-            symbol = symbol_util.merge_currencies(current_currency, target_currency)
-            if self._has_price_data(symbol):
-                return quantity * self._get_last_price_data(symbol)
-        except KeyError:
-            pass
-        try:
-            reversed_symbol = symbol_util.merge_currencies(target_currency, current_currency)
-            return quantity / self._get_last_price_data(reversed_symbol)
-        except decimal.DivisionByZero:
-            pass
-        except KeyError:
-            pass
+        """
+        Convert quantity using last prices, through intermediary currencies when there is no symbol between
+        current_currency and target_currency, e.g. XYZ -> BTC -> USDT
+        :param quantity: the current_currency quantity to convert
+        :param current_currency: the currency to convert
+        :param target_currency: the currency to convert into
+        :return: the converted quantity
+        """
+        conversion_path = self._get_price_conversion_graph().get_conversion_path(current_currency, target_currency)
+        if conversion_path is None:
+            raise errors.MissingPriceDataError(
+                f"no price data to evaluate {current_currency} price in {target_currency}"
+            )
+        for from_currency, to_currency in zip(conversion_path, conversion_path[1:]):
+            quantity = self._convert_using_last_price(quantity, from_currency, to_currency)
+        return quantity
+
+    def _convert_using_last_price(self, quantity, current_currency, target_currency):
+        """
+        Convert quantity using the last price of the symbol between current_currency and target_currency
+        (a settlement asset or other symbol extra data might be different)
+        """
+        conversion_graph = self._get_price_conversion_graph()
+        symbol = conversion_graph.get_symbol(current_currency, target_currency)
+        if symbol is not None and self.last_prices_by_trading_pair[symbol] is not constants.ZERO:
+            return quantity * self.last_prices_by_trading_pair[symbol]
+        reversed_symbol = conversion_graph.get_symbol(target_currency, current_currency)
+        if reversed_symbol is not None:
+            try:
+                return quantity / self.last_prices_by_trading_pair[reversed_symbol]
+            except decimal.DivisionByZero:
+                pass
         raise errors.MissingPriceDataError(f"no price data to evaluate {current_currency} price in {target_currency}")
 
-    def _has_price_data(self, symbol):
-        return self._get_last_price_data(symbol) is not constants.ZERO
-
-    def _get_last_price_data(self, symbol):
-        try:
-            return self.last_prices_by_trading_pair[symbol]
-        except KeyError:
-            # a settlement asset or other symbol extra data might be different, try to ignore it
-            to_find_symbol = symbol_util.parse_symbol(symbol)
-            for symbol_key in self.last_prices_by_trading_pair:
-                if symbol_util.parse_symbol(symbol_key).is_same_base_and_quote(to_find_symbol):
-                    return self.last_prices_by_trading_pair[symbol_key]
-        raise KeyError(symbol)
-
-    def _try_to_ask_ticker_missing_symbol_data(self, currency, symbol, reversed_symbol):
+    def _get_exchange_symbol(self, currency, other_currency):
+        """
+        :return: the exchange symbol between currency and other_currency, in this order first, None if there is none
+        """
+        symbol = symbol_util.merge_currencies(currency, other_currency)
+        if self.portfolio_manager.exchange_manager.symbol_exists(symbol):
+            return symbol
+        reversed_symbol = symbol_util.merge_currencies(other_currency, currency)
+        if self.portfolio_manager.exchange_manager.symbol_exists(reversed_symbol):
+            return reversed_symbol
+        return None
+
+    def _get_reference_market_exchange_symbols(self, currency):
+        """
+        :return: the exchange symbols to value currency in reference market with, directly or through an
+        intermediary currency, an empty list if there is none
+        """
+        reference_market = self.portfolio_manager.reference_market
+        exchange_symbol = self._get_exchange_symbol(currency, reference_market)
+        if exchange_symbol is not None:
+            return [exchange_symbol]
+        exchange_manager = self.portfolio_manager.exchange_manager
+        conversion_graph = self._get_price_conversion_graph()
+        exchange_symbols = []
+        for symbol in exchange_manager.get_symbols_by_base(currency) + exchange_manager.get_symbols_by_quote(currency):
+            base, quote = symbol_util.parse_symbol(symbol).base_and_quote()
+            intermediary_currency = quote if base == currency else base
+            if conversion_graph.get_conversion_path(intermediary_currency, reference_market) is not None:
+                # intermediary currency is already valued: only its symbol with currency is required
+                return [symbol]
+            if not exchange_symbols:
+                intermediary_symbol = self._get_exchange_symbol(intermediary_currency, reference_market)
+                if intermediary_symbol is not None:
+                    exchange_symbols = [symbol, intermediary_symbol]
+        return exchange_symbols
+
+    def _try_to_ask_ticker_missing_symbol_data(self, currency, symbols_to_add):
         """
         Try to ask the ticker producer to watch additional symbols
         to collect missing data required for profitability calculation
         :param currency: the concerned currency
-        :param symbol: the symbol to add
-        :param reversed_symbol: the reversed symbol to add
+        :param symbols_to_add: the exchange symbols to add
         """
-        symbols_to_add = []
-        if self.portfolio_manager.exchange_manager.symbol_exists(symbol):
-            symbols_to_add = [symbol]
-        elif self.portfolio_manager.exchange_manager.symbol_exists(reversed_symbol):
-            symbols_to_add = [reversed_symbol]
-
         new_symbols_to_add = [s for s in symbols_to_add if s not in self.initializing_symbol_prices_pairs]
         if new_symbols_to_add:
             self.logger.debug(f"Fetching price for {new_symbols_to_add} to compute all the "
@@ -386,11 +541,19 @@ class PortfolioValueHolder:
         :param currencies_values: currencies to evaluate
         :return: the calculated quantity value in reference (attribute) currency
         """
-        return sum([
-            self._get_currency_value(portfolio, currency, currencies_values)
+        return sum(self._get_portfolio_values(portfolio, currencies_values).values())
+
+    def _get_portfolio_values(self, portfolio, currencies_values=None):
+        """
+        :param portfolio: the portfolio to explore
+        :param currencies_values: currencies to evaluate
+        :return: the value of each portfolio currency in reference (attribute) currency
+        """
+        return {
+            currency: self._get_currency_value(portfolio, currency, currencies_values)
             for currency in portfolio
             if currency not in self.missing_currency_data_in_exchange
-        ])
+        }
 
     def _get_currency_value(self, portfolio, currency, currencies_values=None, raise_error=False):
         """
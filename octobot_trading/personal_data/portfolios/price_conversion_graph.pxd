@@ -0,0 +1,35 @@
+# cython: language_level=3
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+
+cdef class PriceConversionGraph:
+    cdef public dict last_prices_by_trading_pair
+    cdef public int pairs_count
+    cdef str _last_symbol
+
+    cdef set _symbols
+
+    cdef dict _symbol_by_base_and_quote
+    cdef dict _linked_currencies
+    cdef dict _conversion_paths
+
+    cpdef str get_symbol(self, str base, str quote)
+    cpdef tuple get_conversion_path(self, str from_currency, str to_currency)
+
+    cdef void _update_graph(self)
+    cdef void _add_symbol(self, str symbol)
+    cdef tuple _find_shortest_path(self, str from_currency, str to_currency)
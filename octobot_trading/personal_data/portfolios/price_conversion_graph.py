@@ -0,0 +1,117 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import collections
+
+import octobot_commons.symbols as symbol_util
+
+
+class PriceConversionGraph:
+    """
+    PriceConversionGraph links currencies through the symbols of a last prices by symbol dict
+    to find the shortest conversion path between two currencies, e.g. XYZ -> BTC -> USDT.
+    Conversion paths are cached until symbols are added to or removed from the last prices dict.
+    """
+
+    def __init__(self, last_prices_by_trading_pair):
+        # the graph is updated when the size or the last symbol of this dict changes
+        self.last_prices_by_trading_pair = last_prices_by_trading_pair
+        self.pairs_count = 0
+        self._last_symbol = None
+
+        # symbols the graph is built from
+        self._symbols = set()
+
+        # symbol to use for each (base, quote), the exact symbol is preferred over settlement specific ones
+        self._symbol_by_base_and_quote = {}
+        # currencies sharing a symbol with each currency
+        self._linked_currencies = {}
+        # (from_currency, to_currency): currencies to convert through including both, None if there is no path
+        self._conversion_paths = {}
+
+    def get_symbol(self, base, quote):
+        """
+        :param base: the symbol base
+        :param quote: the symbol quote
+        :return: the last prices symbol of this base and quote, None if there is none
+        """
+        self._update_graph()
+        return self._symbol_by_base_and_quote.get((base, quote))
+
+    def get_conversion_path(self, from_currency, to_currency):
+        """
+        :param from_currency: the currency to convert
+        :param to_currency: the currency to convert into
+        :return: the tuple of currencies to convert through, including from_currency and to_currency,
+        None if there is none
+        """
+        self._update_graph()
+        key = (from_currency, to_currency)
+        try:
+            return self._conversion_paths[key]
+        except KeyError:
+            path = self._conversion_paths[key] = self._find_shortest_path(from_currency, to_currency)
+            return path
+
+    def _update_graph(self):
+        # a symbol replacing a removed one is the last symbol of the dict
+        last_symbol = next(reversed(self.last_prices_by_trading_pair), None)
+        if len(self.last_prices_by_trading_pair) == self.pairs_count and last_symbol == self._last_symbol:
+            return
+        for symbol in self._symbols:
+            if symbol not in self.last_prices_by_trading_pair:
+                # removed symbol: rebuild the graph
+                self._symbols.clear()
+                self._symbol_by_base_and_quote.clear()
+                self._linked_currencies.clear()
+                break
+        for symbol in self.last_prices_by_trading_pair:
+            if symbol not in self._symbols:
+                self._add_symbol(symbol)
+        self.pairs_count = len(self.last_prices_by_trading_pair)
+        self._last_symbol = last_symbol
+        # new symbols might create shorter paths and removed symbols invalidate paths
+        self._conversion_paths.clear()
+
+    def _add_symbol(self, symbol):
+        self._symbols.add(symbol)
+        base, quote = symbol_util.parse_symbol(symbol).base_and_quote()
+        if symbol == symbol_util.merge_currencies(base, quote):
+            self._symbol_by_base_and_quote[(base, quote)] = symbol
+        else:
+            self._symbol_by_base_and_quote.setdefault((base, quote), symbol)
+        self._linked_currencies.setdefault(base, {})[quote] = None
+        self._linked_currencies.setdefault(quote, {})[base] = None
+
+    def _find_shortest_path(self, from_currency, to_currency):
+        # breadth first search: the first path found uses the smallest number of conversions
+        if from_currency == to_currency or from_currency not in self._linked_currencies \
+           or to_currency not in self._linked_currencies:
+            return None
+        previous_currencies = {from_currency: None}
+        currencies_to_explore = collections.deque((from_currency, ))
+        while currencies_to_explore:
+            currency = currencies_to_explore.popleft()
+            for linked_currency in self._linked_currencies[currency]:
+                if linked_currency in previous_currencies:
+                    continue
+                previous_currencies[linked_currency] = currency
+                if linked_currency == to_currency:
+                    path = [linked_currency]
+                    while previous_currencies[path[-1]] is not None:
+                        path.append(previous_currencies[path[-1]])
+                    return tuple(reversed(path))
+                currencies_to_explore.append(linked_currency)
+        return None
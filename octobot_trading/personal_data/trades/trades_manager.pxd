@@ -25,13 +25,25 @@ cdef class TradesManager(util.Initializable):
 
     cdef public bint trades_initialized
 
+    cdef dict _trades_by_origin_order_id
+    cdef dict _trades_by_symbol
+    cdef list _sorted_executed_times
+    cdef list _trades_sorted_by_executed_time
+    cdef dict _total_paid_fees
+    cdef dict _paid_fees_trades_count
+
     cdef void _check_trades_size(self)
     cdef void _reset_trades(self)
     cdef void _remove_oldest_trades(self, int nb_to_remove)
+    cdef void _add_to_indexes(self, object trade)
+    cdef bint _remove_from_indexes(self, str trade_id, object trade)
 
     cpdef object get_trade(self, str trade_id)
     cpdef object upsert_trade(self, str trade_id, dict raw_trade)
     cpdef object upsert_trade_instance(self, object trade)
     cpdef bint has_closing_trade_with_order_id(self, str order_id)
+    cpdef list get_trades_by_origin_order_id(self, str order_id)
+    cpdef list get_symbol_trades(self, str symbol)
+    cpdef list get_trades_by_executed_time(self, object from_time=*, object to_time=*, str symbol=*)
     cpdef dict get_total_paid_fees(self)
     cpdef void clear(self)
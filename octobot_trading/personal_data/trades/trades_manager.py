@@ -13,6 +13,7 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import bisect
 import collections
 
 import octobot_commons.logging as logging
@@ -23,8 +24,17 @@ import octobot_trading.enums as enums
 import octobot_trading.personal_data as personal_data
 import octobot_trading.util as util
 
+FEE_COST_KEY = enums.FeePropertyColumns.COST.value
+FEE_CURRENCY_KEY = enums.FeePropertyColumns.CURRENCY.value
+
 
 class TradesManager(util.Initializable):
+    """
+    Stores trades by trade id in insertion order.
+    Trades added through upsert_trade and upsert_trade_instance are also indexed by origin order id, by symbol and
+    by executed time, and their fees are added to the paid fees totals. Indexes are updated when the oldest trades
+    are removed.
+    """
     # memory usage for 100000 trades: approx 180 Mo
     MAX_TRADES_COUNT = 100000
 
@@ -35,6 +45,17 @@ class TradesManager(util.Initializable):
         self.trades_initialized = False
         self.trades = collections.OrderedDict()
 
+        # origin order id: {trade id: trade}
+        self._trades_by_origin_order_id = {}
+        # symbol: {trade id: trade} in insertion order
+        self._trades_by_symbol = {}
+        # trades and their executed times sorted by executed time
+        self._sorted_executed_times = []
+        self._trades_sorted_by_executed_time = []
+        # fee currency: total paid fees and related trades count
+        self._total_paid_fees = {}
+        self._paid_fees_trades_count = {}
+
     async def initialize_impl(self):
         self._reset_trades()
         self.trades_initialized = True
@@ -51,6 +72,7 @@ class TradesManager(util.Initializable):
                     self.logger.debug(f"Replacement of an existing trade: {self.trades[trade_id].to_dict()} "
                                       f"by {created_trade.to_dict()} on id: {trade_id}")
                 self.trades[trade_id] = created_trade
+                self._add_to_indexes(created_trade)
                 self._check_trades_size()
                 return True
         return False
@@ -58,27 +80,41 @@ class TradesManager(util.Initializable):
     def upsert_trade_instance(self, trade):
         if trade.trade_id not in self.trades:
             self.trades[trade.trade_id] = trade
+            self._add_to_indexes(trade)
             self._check_trades_size()
 
     def has_closing_trade_with_order_id(self, order_id) -> bool:
-        for trade in self.trades.values():
-            if trade.origin_order_id == order_id and trade.is_closing_order:
+        for trade in self._trades_by_origin_order_id.get(order_id, {}).values():
+            if trade.is_closing_order:
                 return True
         return False
 
+    def get_trades_by_origin_order_id(self, order_id) -> list:
+        return list(self._trades_by_origin_order_id.get(order_id, {}).values())
+
+    def get_symbol_trades(self, symbol) -> list:
+        """
+        :return: the trades of the given symbol in insertion order
+        """
+        return list(self._trades_by_symbol.get(symbol, {}).values())
+
+    def get_trades_by_executed_time(self, from_time=None, to_time=None, symbol=None) -> list:
+        """
+        :param from_time: when set, only return trades executed at or after this time
+        :param to_time: when set, only return trades executed at or before this time
+        :param symbol: when set, only return trades of this symbol
+        :return: the selected trades sorted by executed time
+        """
+        first_index = 0 if from_time is None else bisect.bisect_left(self._sorted_executed_times, from_time)
+        last_index = len(self._sorted_executed_times) if to_time is None \
+            else bisect.bisect_right(self._sorted_executed_times, to_time)
+        trades = self._trades_sorted_by_executed_time[first_index:last_index]
+        if symbol is None:
+            return trades
+        return [trade for trade in trades if trade.symbol == symbol]
+
     def get_total_paid_fees(self):
-        total_fees = {}
-        for trade in self.trades.values():
-            if trade.fee is not None:
-                fee_cost = trade.fee[enums.FeePropertyColumns.COST.value]
-                fee_currency = trade.fee[enums.FeePropertyColumns.CURRENCY.value]
-                if fee_currency in total_fees:
-                    total_fees[fee_currency] += fee_cost
-                else:
-                    total_fees[fee_currency] = fee_cost
-            elif trade.status is not enums.OrderStatus.CANCELED:
-                self.logger.warning(f"Trade without any registered fee: {trade.to_dict()}")
-        return total_fees
+        return dict(self._total_paid_fees)
 
     def get_trade(self, trade_id):
         return self.trades[trade_id]
@@ -91,10 +127,73 @@ class TradesManager(util.Initializable):
     def _reset_trades(self):
         self.trades_initialized = False
         self.trades = collections.OrderedDict()
+        self._trades_by_origin_order_id = {}
+        self._trades_by_symbol = {}
+        self._sorted_executed_times = []
+        self._trades_sorted_by_executed_time = []
+        self._total_paid_fees = {}
+        self._paid_fees_trades_count = {}
 
     def _remove_oldest_trades(self, nb_to_remove):
+        removed_trade_ids = set()
         for _ in range(nb_to_remove):
-            self.trades.popitem(last=False)
+            trade_id, trade = self.trades.popitem(last=False)
+            if self._remove_from_indexes(trade_id, trade):
+                removed_trade_ids.add(trade_id)
+        if removed_trade_ids:
+            # rebuild the executed time index at once instead of removing trades one by one
+            kept_trades = [
+                trade
+                for trade in self._trades_sorted_by_executed_time
+                if trade.trade_id not in removed_trade_ids
+            ]
+            self._trades_sorted_by_executed_time = kept_trades
+            self._sorted_executed_times = [trade.executed_time for trade in kept_trades]
+
+    def _add_to_indexes(self, trade):
+        self._trades_by_origin_order_id.setdefault(trade.origin_order_id, {})[trade.trade_id] = trade
+        self._trades_by_symbol.setdefault(trade.symbol, {})[trade.trade_id] = trade
+        # trades are usually added in executed time order: inserted at the end
+        index = bisect.bisect_right(self._sorted_executed_times, trade.executed_time)
+        self._sorted_executed_times.insert(index, trade.executed_time)
+        self._trades_sorted_by_executed_time.insert(index, trade)
+        if trade.fee is not None:
+            fee_cost = trade.fee[FEE_COST_KEY]
+            fee_currency = trade.fee[FEE_CURRENCY_KEY]
+            if fee_currency in self._total_paid_fees:
+                self._total_paid_fees[fee_currency] += fee_cost
+                self._paid_fees_trades_count[fee_currency] += 1
+            else:
+                self._total_paid_fees[fee_currency] = fee_cost
+                self._paid_fees_trades_count[fee_currency] = 1
+        elif trade.status is not enums.OrderStatus.CANCELED:
+            self.logger.warning(f"Trade without any registered fee: {trade.to_dict()}")
+
+    def _remove_from_indexes(self, trade_id, trade) -> bool:
+        """
+        :return: True when the trade was indexed
+        """
+        try:
+            origin_order_trades = self._trades_by_origin_order_id[trade.origin_order_id]
+            origin_order_trades.pop(trade_id)
+        except KeyError:
+            # trade has not been added through upsert_trade or upsert_trade_instance
+            return False
+        if not origin_order_trades:
+            self._trades_by_origin_order_id.pop(trade.origin_order_id)
+        symbol_trades = self._trades_by_symbol[trade.symbol]
+        symbol_trades.pop(trade_id)
+        if not symbol_trades:
+            self._trades_by_symbol.pop(trade.symbol)
+        if trade.fee is not None:
+            fee_currency = trade.fee[FEE_CURRENCY_KEY]
+            self._paid_fees_trades_count[fee_currency] -= 1
+            if self._paid_fees_trades_count[fee_currency] == 0:
+                self._paid_fees_trades_count.pop(fee_currency)
+                self._total_paid_fees.pop(fee_currency)
+            else:
+                self._total_paid_fees[fee_currency] -= trade.fee[FEE_COST_KEY]
+        return True
 
     def _set_initialized_event(self, symbol):
         # set init in updater as it's the only place we know if we fetched trades or not regardless of trades existence
@@ -22,9 +22,24 @@ import octobot_trading.constants as trading_constants
 
 class TradingSignalBundleBuilder(signals.SignalBundleBuilder):
     def __init__(self, identifier: str, strategy: str):
+        # index in self.signals of each registered order signal by shared_signal_order_id
+        self._signal_index_by_shared_signal_order_id = {}
+        # signals list referenced by the index, the index is rebuilt when self.signals is replaced
+        self._indexed_signals = None
         super().__init__(identifier)
         self.strategy = strategy
 
+    def register_signal(self, topic: str, content: dict, **kwargs):
+        """
+        Store a signal to be packed on build call and index it by shared_signal_order_id
+        """
+        self._ensure_up_to_date_index()
+        super().register_signal(topic, content, **kwargs)
+        shared_signal_order_id = content.get(trading_enums.TradingSignalOrdersAttrs.SHARED_SIGNAL_ORDER_ID.value)
+        if shared_signal_order_id is not None:
+            # keep the first registered signal as the reference signal of this order
+            self._signal_index_by_shared_signal_order_id.setdefault(shared_signal_order_id, len(self.signals) - 1)
+
     def build(self) -> signals.SignalBundle:
         """
         Link bundled an grouped orders and create a signal_bundle.SignalBundle from registered signals
@@ -169,7 +184,7 @@ class TradingSignalBundleBuilder(signals.SignalBundleBuilder):
                 if order_description[trading_enums.TradingSignalCommonsAttrs.ACTION.value] == \
                    trading_enums.TradingSignalOrdersActions.CREATE.value:
                     # avoid creating order that are to be cancelled
-                    self.signals.pop(index)
+                    self._remove_signal(index)
                 else:
                     # now cancel order (no need to perform previous actions as it will get cancelled anyway
                     order_description[trading_enums.TradingSignalCommonsAttrs.ACTION.value] = \
@@ -207,11 +222,35 @@ class TradingSignalBundleBuilder(signals.SignalBundleBuilder):
                 filtered_signals.append(signal)
         self.signals = filtered_signals
 
-    def _get_order_description_from_local_orders(self, shared_signal_order_id):
-        for index, signal in enumerate(self.signals):
-            if signal.content[trading_enums.TradingSignalOrdersAttrs.SHARED_SIGNAL_ORDER_ID.value] == \
-                    shared_signal_order_id:
-                return index, signal.content
-        raise trading_errors.OrderDescriptionNotFoundError(
-            f"order not found (shared_signal_order_id: {shared_signal_order_id})"
+    def _remove_signal(self, index):
+        removed_signal = self.signals.pop(index)
+        self._signal_index_by_shared_signal_order_id.pop(
+            removed_signal.content.get(trading_enums.TradingSignalOrdersAttrs.SHARED_SIGNAL_ORDER_ID.value), None
         )
+        # following signals moved by one position
+        self._reindex_signals(index)
+
+    def _ensure_up_to_date_index(self):
+        if self._indexed_signals is not self.signals:
+            self._reindex_signals()
+
+    def _reindex_signals(self, from_index=0):
+        if from_index == 0:
+            self._signal_index_by_shared_signal_order_id = {}
+            self._indexed_signals = self.signals
+        shared_signal_order_id_key = trading_enums.TradingSignalOrdersAttrs.SHARED_SIGNAL_ORDER_ID.value
+        for index in range(from_index, len(self.signals)):
+            shared_signal_order_id = self.signals[index].content.get(shared_signal_order_id_key)
+            if shared_signal_order_id is not None:
+                if self._signal_index_by_shared_signal_order_id.get(shared_signal_order_id, index) >= index:
+                    self._signal_index_by_shared_signal_order_id[shared_signal_order_id] = index
+
+    def _get_order_description_from_local_orders(self, shared_signal_order_id):
+        self._ensure_up_to_date_index()
+        try:
+            index = self._signal_index_by_shared_signal_order_id[shared_signal_order_id]
+            return index, self.signals[index].content
+        except KeyError:
+            raise trading_errors.OrderDescriptionNotFoundError(
+                f"order not found (shared_signal_order_id: {shared_signal_order_id})"
+            )
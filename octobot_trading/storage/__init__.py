@@ -45,10 +45,16 @@ from octobot_trading.storage.transactions_storage import (
 )
 
 
+from octobot_trading.storage import databases_flusher
+from octobot_trading.storage.databases_flusher import (
+    DatabasesFlusher,
+)
+
+
 from octobot_trading.storage import storage_manager
 from octobot_trading.storage.storage_manager import (
     StorageManager,
 )
 
 
-__all__ = ["AbstractStorage", "TradesStorage", "PortfolioStorage", "CandlesStorage", "TransactionsStorage", "StorageManager"]
+__all__ = ["AbstractStorage", "TradesStorage", "PortfolioStorage", "CandlesStorage", "TransactionsStorage", "DatabasesFlusher", "StorageManager"]
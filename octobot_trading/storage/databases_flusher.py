@@ -0,0 +1,127 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library
+import asyncio
+import time
+
+import octobot_commons.logging as commons_logging
+
+import octobot_trading.constants as constants
+
+
+class DatabasesFlusher:
+    """
+    Coalesces flush requests of databases and flushes them in background every flush_interval seconds or as soon as
+    max_pending_databases databases are waiting to be flushed.
+    Flush requests are directly executed when the flusher is not running.
+    """
+
+    def __init__(self, flush_interval: float = constants.DATABASES_FLUSH_INTERVAL,
+                 max_pending_databases: int = constants.DATABASES_FLUSH_MAX_PENDING_DATABASES):
+        self.logger = commons_logging.get_logger(self.__class__.__name__)
+        self.flush_interval = flush_interval
+        self.max_pending_databases = max_pending_databases
+
+        # stats
+        self.flush_count = 0
+        self.flushed_databases_count = 0
+        self.last_flush_duration = 0
+        self.total_flush_duration = 0
+
+        # databases waiting to be flushed, dict is used as an ordered set
+        self._pending_databases = {}
+        # created from start to be bound to the running loop
+        self._flush_event = None
+        self._flush_task = None
+
+    def is_running(self):
+        return self._flush_task is not None and not self._flush_task.done()
+
+    async def start(self):
+        if not self.is_running():
+            self._flush_event = asyncio.Event()
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        if self._flush_task is not None:
+            flush_task, self._flush_task = self._flush_task, None
+            flush_task.cancel()
+            try:
+                await flush_task
+            except asyncio.CancelledError:
+                pass
+        # flush on shutdown
+        await self.flush()
+
+    async def request_flush(self, database):
+        """
+        Schedule the given database flush
+        :param database: the database to flush
+        """
+        if database is None:
+            return
+        if not self.is_running():
+            await self._flush_databases((database, ))
+            return
+        self._pending_databases[database] = None
+        if len(self._pending_databases) >= self.max_pending_databases:
+            self._flush_event.set()
+
+    async def flush(self):
+        """
+        Flush every pending database
+        """
+        if self._pending_databases:
+            databases = tuple(self._pending_databases)
+            self._pending_databases.clear()
+            try:
+                await self._flush_databases(databases)
+            except asyncio.CancelledError:
+                # interrupted flush: keep databases to flush them later
+                for database in databases:
+                    self._pending_databases[database] = None
+                raise
+
+    async def _flush_loop(self):
+        # also check _flush_task as wait_for can swallow the stop cancellation when the event is set at the same time
+        while self._flush_task is not None:
+            try:
+                await asyncio.wait_for(self._flush_event.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_event.clear()
+            await self.flush()
+
+    async def _flush_databases(self, databases):
+        t0 = time.time()
+        for database in databases:
+            try:
+                await database.flush()
+            except Exception as e:
+                self.logger.exception(e, True, f"Error when flushing database: {e}")
+        self.last_flush_duration = time.time() - t0
+        self.total_flush_duration += self.last_flush_duration
+        self.flush_count += 1
+        self.flushed_databases_count += len(databases)
+        self.logger.debug(f"Flushed {len(databases)} databases in {round(self.last_flush_duration * 1000, 2)}ms")
+
+    def get_stats(self) -> dict:
+        return {
+            "flush_count": self.flush_count,
+            "flushed_databases_count": self.flushed_databases_count,
+            "pending_databases_count": len(self._pending_databases),
+            "last_flush_duration": self.last_flush_duration,
+            "total_flush_duration": self.total_flush_duration,
+        }
@@ -24,17 +24,28 @@ class PortfolioStorage(abstract_storage.AbstractStorage):
     IS_LIVE_CONSUMER = False
     IS_HISTORICAL = False
 
-    async def save_historical_portfolio_value(self, metadata, historical_portfolio_value):
+    async def save_historical_portfolio_value(self, metadata, historical_portfolio_value, replace_all=True):
+        """
+        :param replace_all: when True, replace the whole table by historical_portfolio_value,
+        append historical_portfolio_value to the table otherwise
+        """
         if not self.enabled:
             return
         portfolio_db = self.get_db()
-        # replace the whole table to ensure consistency
         await portfolio_db.upsert(commons_enums.RunDatabases.METADATA.value, metadata, None, uuid=1)
-        await portfolio_db.replace_all(
-            commons_enums.RunDatabases.HISTORICAL_PORTFOLIO_VALUE.value,
-            historical_portfolio_value,
-            cache=False
-        )
+        if replace_all:
+            # replace the whole table to ensure consistency
+            await portfolio_db.replace_all(
+                commons_enums.RunDatabases.HISTORICAL_PORTFOLIO_VALUE.value,
+                historical_portfolio_value,
+                cache=False
+            )
+        elif historical_portfolio_value:
+            await portfolio_db.log_many(
+                commons_enums.RunDatabases.HISTORICAL_PORTFOLIO_VALUE.value,
+                historical_portfolio_value,
+                cache=False
+            )
         if not self.exchange_manager.is_backtesting:
             # in live move, flush database as soon as an update is provided
             await portfolio_db.flush()
@@ -24,6 +24,7 @@ import octobot_trading.storage.trades_storage as trades_storage
 import octobot_trading.storage.transactions_storage as transactions_storage
 import octobot_trading.storage.candles_storage as candles_storage
 import octobot_trading.storage.portfolio_storage as portfolio_storage
+import octobot_trading.storage.databases_flusher as databases_flusher
 
 
 class StorageManager(util.Initializable):
@@ -36,6 +37,7 @@ class StorageManager(util.Initializable):
         self.transactions_storage = None
         self.portfolio_storage = None
         self.candles_storage = None
+        self.databases_flusher = databases_flusher.DatabasesFlusher()
 
     async def initialize_impl(self):
         await commons_databases.RunDatabasesProvider.instance().get_run_databases_identifier(
@@ -48,8 +50,13 @@ class StorageManager(util.Initializable):
                 await storage.start()
             except Exception as e:
                 self.logger.exception(e, True, f"Error when initializing {storage}: {e}")
+        if not self.exchange_manager.is_backtesting:
+            # in live mode, databases are flushed in background
+            await self.databases_flusher.start()
 
     async def stop(self):
+        # flush pending databases before stopping storages
+        await self.databases_flusher.stop()
         for storage in self._storages():
             await storage.stop()
         self.exchange_manager = None
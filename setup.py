@@ -56,6 +56,7 @@ packages_list = [
     "octobot_trading.exchange_data.contracts.margin_contract",
     "octobot_trading.exchange_data.contracts.future_contract",
     "octobot_trading.exchange_data.order_book.order_book_manager",
+    "octobot_trading.exchange_data.order_book.flat_order_book",
     "octobot_trading.exchange_data.order_book.channel.order_book",
     "octobot_trading.exchange_data.order_book.channel.order_book_updater_simulator",
     "octobot_trading.exchange_data.order_book.channel.order_book_updater",
@@ -78,6 +79,8 @@ packages_list = [
     "octobot_trading.exchange_data.prices.channel.prices_updater",
     "octobot_trading.exchange_data.ohlcv.candles_manager",
     "octobot_trading.exchange_data.ohlcv.candles_adapter",
+    "octobot_trading.exchange_data.ohlcv.candles_aggregator",
+    "octobot_trading.exchange_data.ohlcv.channel.ohlcv_refresh_scheduler",
     "octobot_trading.exchange_data.ohlcv.channel.ohlcv_updater",
     "octobot_trading.exchange_data.ohlcv.channel.ohlcv_updater_simulator",
     "octobot_trading.exchange_data.ohlcv.channel.ohlcv",
@@ -95,6 +98,7 @@ packages_list = [
     "octobot_trading.personal_data.orders.order_state",
     "octobot_trading.personal_data.orders.order_group",
     "octobot_trading.personal_data.orders.order_util",
+    "octobot_trading.personal_data.orders.symbol_order_rules",
     "octobot_trading.personal_data.orders.order_factory",
     "octobot_trading.personal_data.orders.groups.balanced_take_profit_and_stop_order_group",
     "octobot_trading.personal_data.orders.groups.one_cancels_the_other_order_group",
@@ -120,6 +124,7 @@ packages_list = [
     "octobot_trading.personal_data.orders.channel.orders",
     "octobot_trading.personal_data.orders.channel.orders_updater",
     "octobot_trading.personal_data.portfolios.portfolio_value_holder",
+    "octobot_trading.personal_data.portfolios.price_conversion_graph",
     "octobot_trading.personal_data.portfolios.portfolio_manager",
     "octobot_trading.personal_data.portfolios.sub_portfolio",
     "octobot_trading.personal_data.portfolios.portfolio",
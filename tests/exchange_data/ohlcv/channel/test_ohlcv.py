@@ -0,0 +1,57 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import mock
+import pytest
+
+import octobot_commons.enums as commons_enums
+
+import octobot_trading.exchange_data.ohlcv.channel.ohlcv as ohlcv
+from tests import event_loop
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+SYMBOL = "BTC/USDT"
+
+
+async def test_perform_sends_every_completed_derived_candle():
+    base_candles = [[0, 1, 2, 0.5, 1.5, 10], [60, 1.5, 2, 1, 1, 10]]
+    hour_candles = [[0, 1, 2, 0.5, 1.5, 10], [3600, 1.5, 2, 1, 1, 10]]
+    symbol_data = mock.Mock(
+        derivation_base_time_frame=commons_enums.TimeFrames.ONE_MINUTE,
+        handle_candles_update=mock.AsyncMock(return_value={commons_enums.TimeFrames.ONE_HOUR: hour_candles})
+    )
+    channel = mock.Mock(
+        exchange_manager=mock.Mock(
+            get_symbol_data=mock.Mock(return_value=symbol_data),
+            exchange=mock.Mock(get_pair_cryptocurrency=mock.Mock(return_value="Bitcoin"))
+        )
+    )
+    producer = ohlcv.OHLCVProducer(channel)
+    with mock.patch.object(producer, "send", mock.AsyncMock()) as send_mock:
+        await producer.perform(commons_enums.TimeFrames.ONE_MINUTE, SYMBOL, base_candles, partial=True)
+        symbol_data.handle_candles_update.assert_awaited_once_with(
+            commons_enums.TimeFrames.ONE_MINUTE, base_candles, replace_all=False, partial=True
+        )
+        assert send_mock.mock_calls == [
+            mock.call(cryptocurrency="Bitcoin", time_frame=commons_enums.TimeFrames.ONE_MINUTE.value,
+                      symbol=SYMBOL, candle=base_candles[-1]),
+            # both completed hour candles are sent
+            mock.call(cryptocurrency="Bitcoin", time_frame=commons_enums.TimeFrames.ONE_HOUR.value,
+                      symbol=SYMBOL, candle=hour_candles[0]),
+            mock.call(cryptocurrency="Bitcoin", time_frame=commons_enums.TimeFrames.ONE_HOUR.value,
+                      symbol=SYMBOL, candle=hour_candles[1]),
+        ]
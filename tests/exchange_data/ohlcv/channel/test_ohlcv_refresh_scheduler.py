@@ -0,0 +1,77 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import octobot_commons.enums as commons_enums
+
+import octobot_trading.exchange_data.ohlcv.channel.ohlcv_refresh_scheduler as ohlcv_refresh_scheduler
+
+ONE_MINUTE = commons_enums.TimeFrames.ONE_MINUTE
+ONE_HOUR = commons_enums.TimeFrames.ONE_HOUR
+
+
+def test_schedule_and_pop_next_refresh():
+    scheduler = ohlcv_refresh_scheduler.OHLCVRefreshScheduler(1.5)
+    assert scheduler.get_next_refresh_delay(0) is None
+    assert scheduler.pop_next_refresh(0) is None
+
+    scheduler.schedule(ONE_HOUR, "BTC/USDT", 20)
+    scheduler.schedule(ONE_MINUTE, "BTC/USDT", 10)
+    scheduler.schedule(ONE_MINUTE, "ETH/USDT", 10)
+    assert scheduler.get_scheduled_refreshes_count() == 3
+    assert scheduler.get_next_refresh_delay(5) == 5
+    assert scheduler.get_queue_depth(10) == 2
+
+    # already scheduled: keep the earliest due time
+    scheduler.schedule(ONE_MINUTE, "BTC/USDT", 15)
+    scheduler.schedule(ONE_HOUR, "BTC/USDT", 5)
+    assert scheduler.get_scheduled_refreshes_count() == 3
+
+    assert scheduler.pop_next_refresh(7) == (ONE_HOUR, "BTC/USDT")
+    assert scheduler.last_refresh_lag == 2
+    # same due time: scheduling order
+    assert scheduler.pop_next_refresh(10) == (ONE_MINUTE, "BTC/USDT")
+    assert scheduler.pop_next_refresh(14) == (ONE_MINUTE, "ETH/USDT")
+    # outdated ONE_HOUR refresh at 20 is skipped
+    assert scheduler.get_next_refresh_delay(14) is None
+    assert scheduler.pop_next_refresh(14) is None
+    assert scheduler.get_metrics(14) == {
+        "scheduled_refreshes_count": 0,
+        "queue_depth": 0,
+        "executed_refreshes_count": 3,
+        "last_refresh_lag": 4,
+        "max_refresh_lag": 4,
+    }
+
+
+def test_spread_refreshes():
+    scheduler = ohlcv_refresh_scheduler.OHLCVRefreshScheduler(1.5)
+    refreshes = [(ONE_MINUTE, "BTC/USDT"), (ONE_HOUR, "BTC/USDT"), (ONE_MINUTE, "ETH/USDT")]
+    scheduler.set_refreshes(refreshes)
+    for time_frame, pair in reversed(refreshes):
+        scheduler.schedule(time_frame, pair, 60, spread=True)
+    assert scheduler.get_next_refresh_delay(60) == 0
+    assert scheduler.pop_next_refresh(60) == refreshes[0]
+    assert scheduler.get_next_refresh_delay(60) == 0.5
+    assert scheduler.pop_next_refresh(60.5) == refreshes[1]
+    assert scheduler.get_next_refresh_delay(60) == 1
+    assert scheduler.pop_next_refresh(61) == refreshes[2]
+
+    # unknown refreshes are not delayed
+    scheduler.schedule(ONE_HOUR, "ADA/USDT", 60, spread=True)
+    assert scheduler.get_next_refresh_delay(60) == 0
+
+    scheduler.clear()
+    assert scheduler.get_scheduled_refreshes_count() == 0
+    assert scheduler.get_next_refresh_delay(60) is None
@@ -0,0 +1,154 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import time
+
+import mock
+import pytest
+
+import octobot_commons.enums as commons_enums
+
+import octobot_trading.exchange_data.ohlcv.channel.ohlcv_updater as ohlcv_updater
+from tests import event_loop
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+SYMBOLS = ["BTC/USDT", "ETH/USDT"]
+TIME_FRAMES = [commons_enums.TimeFrames.ONE_MINUTE, commons_enums.TimeFrames.ONE_HOUR]
+RATE_LIMIT = 0.02
+
+
+@pytest.fixture
+def updater():
+    async def _get_symbol_prices(pair, time_frame, limit=None):
+        return _candles(time_frame)
+
+    exchange = mock.Mock(
+        get_symbol_prices=mock.AsyncMock(side_effect=_get_symbol_prices),
+        uniformize_candles_if_necessary=mock.Mock(),
+        get_rate_limit=mock.Mock(return_value=RATE_LIMIT),
+    )
+    exchange_manager = mock.Mock(exchange_name="binance", exchange=exchange)
+    exchange_manager.exchange_config.traded_symbol_pairs = SYMBOLS
+    exchange_manager.exchange_config.traded_time_frames = TIME_FRAMES
+    updater = ohlcv_updater.OHLCVUpdater(mock.Mock(exchange_manager=exchange_manager, is_paused=False))
+    updater.is_initialized = True
+    for pair in SYMBOLS:
+        for time_frame in TIME_FRAMES:
+            updater._set_initialized(pair, time_frame, True)
+    with mock.patch.object(updater, "push", mock.AsyncMock()):
+        yield updater
+
+
+def _candles(time_frame):
+    time_frame_seconds = commons_enums.TimeFramesMinutes[time_frame] * 60
+    current_candle_time = time.time() // time_frame_seconds * time_frame_seconds
+    return [
+        [current_candle_time - time_frame_seconds * index, 1, 2, 0.5, 1.5, 10]
+        for index in reversed(range(3))
+    ]
+
+
+async def test_refresh_candles(updater):
+    time_frame = commons_enums.TimeFrames.ONE_MINUTE
+    candles_close_time = time.time() // 60 * 60 + 60
+    await updater._refresh_candles(time_frame, SYMBOLS[0])
+    updater.push.assert_awaited_once()
+    assert updater.push.await_args.args[:2] == (time_frame, SYMBOLS[0])
+    # next refresh at the next candle close, spread by OHLCV_REFRESH_TIME_THRESHOLD at most
+    next_refresh_delay = updater.refresh_scheduler.get_next_refresh_delay(candles_close_time)
+    assert 0 <= next_refresh_delay < updater.OHLCV_REFRESH_TIME_THRESHOLD + 1
+
+    # same candle: not pushed again
+    updater.push.reset_mock()
+    updater.refresh_scheduler.clear()
+    await updater._refresh_candles(time_frame, SYMBOLS[0])
+    updater.push.assert_not_awaited()
+    assert updater.refresh_scheduler.get_scheduled_refreshes_count() == 1
+
+
+async def test_refresh_loop(updater):
+    dispatch_times = []
+    wait_for_rate_limit = updater._wait_for_rate_limit
+
+    async def _wait_for_rate_limit():
+        await wait_for_rate_limit()
+        dispatch_times.append(time.time())
+
+    updater._wait_for_rate_limit = _wait_for_rate_limit
+    await updater.start()
+    try:
+        await _wait_for_executed_refreshes(updater, len(SYMBOLS) * len(TIME_FRAMES))
+        # refreshes of the same pair are next to each other
+        assert [(call.args[0], call.args[1]) for call in updater.channel.exchange_manager.exchange
+                .get_symbol_prices.await_args_list] == [
+            (pair, time_frame)
+            for pair in SYMBOLS
+            for time_frame in TIME_FRAMES
+        ]
+        # requests are spaced by the exchange rate limit
+        assert len(dispatch_times) == len(SYMBOLS) * len(TIME_FRAMES)
+        assert all(
+            next_dispatch_time - dispatch_time >= RATE_LIMIT * 0.9
+            for dispatch_time, next_dispatch_time in zip(dispatch_times, dispatch_times[1:])
+        )
+        # every refresh is scheduled for the next candles close
+        metrics = updater.get_refresh_metrics()
+        assert metrics["scheduled_refreshes_count"] == len(SYMBOLS) * len(TIME_FRAMES)
+        assert metrics["queue_depth"] == 0
+    finally:
+        updater.should_stop = True
+        for task in updater.tasks:
+            task.cancel()
+
+
+async def test_start_with_derived_time_frames(updater):
+    exchange_manager = updater.channel.exchange_manager
+    exchange_manager.exchange_config.get_derived_time_frames = mock.Mock(
+        return_value=[commons_enums.TimeFrames.ONE_HOUR]
+    )
+    exchange_manager.exchange_config.get_shortest_time_frame = mock.Mock(
+        return_value=commons_enums.TimeFrames.ONE_MINUTE
+    )
+    with mock.patch.object(updater, "_get_traded_pairs", mock.Mock(return_value=SYMBOLS)):
+        updater._set_derived_time_frames()
+    assert updater.derived_time_frames == [commons_enums.TimeFrames.ONE_HOUR]
+    exchange_manager.get_symbol_data.return_value.set_derived_time_frames.assert_called_with(
+        commons_enums.TimeFrames.ONE_MINUTE, [commons_enums.TimeFrames.ONE_HOUR]
+    )
+    await updater.start()
+    try:
+        # derived time frames candles are never requested
+        assert updater.refresh_scheduler.get_scheduled_refreshes_count() == len(SYMBOLS)
+        await _wait_for_executed_refreshes(updater, len(SYMBOLS))
+        assert [(call.args[0], call.args[1]) for call in exchange_manager.exchange
+                .get_symbol_prices.await_args_list] == [
+            (pair, commons_enums.TimeFrames.ONE_MINUTE)
+            for pair in SYMBOLS
+        ]
+    finally:
+        updater.should_stop = True
+        for task in updater.tasks:
+            task.cancel()
+
+
+async def _wait_for_executed_refreshes(updater, refreshes_count, timeout=10):
+    # refreshes are executed in background tasks: wait for their candles requests
+    for _ in range(int(timeout / RATE_LIMIT)):
+        if updater.channel.exchange_manager.exchange.get_symbol_prices.await_count >= refreshes_count:
+            return
+        await asyncio.sleep(RATE_LIMIT)
@@ -0,0 +1,170 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import mock
+import pytest
+
+import octobot_commons.enums as commons_enums
+
+import octobot_trading.exchange_data.ohlcv.channel.ohlcv_updater_simulator as ohlcv_updater_simulator
+import octobot_trading.exchanges.config.backtesting_exchange_config as backtesting_exchange_config
+from tests import event_loop
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+EXCHANGE_NAME = "binance"
+SYMBOL = "BTC/USDT"
+TIME_FRAMES = [commons_enums.TimeFrames.ONE_HOUR, commons_enums.TimeFrames.ONE_MINUTE]
+
+
+async def test_handle_timestamp_with_preloaded_candles(tmp_path):
+    importer = _importer(_ohlcv_rows(), _data_file(tmp_path))
+    cache_folder = tmp_path / "cache"
+    cache_folder.mkdir()
+    updater = _updater(importer, preload_candles=False)
+    preloaded_updater = _updater(importer, preload_candles=True)
+    cached_preloaded_updater = _updater(importer, preload_candles=True, cache_folder=str(cache_folder))
+
+    await preloaded_updater._preload_candles()
+    importer.get_ohlcv.assert_called()
+    # candles are read from the preloaded cache file
+    await cached_preloaded_updater._preload_candles()
+    importer.get_ohlcv.reset_mock()
+    await _updater(importer, preload_candles=True, cache_folder=str(cache_folder))._preload_candles()
+    importer.get_ohlcv.assert_not_called()
+
+    for timestamp in range(0, 60 * 200, 60):
+        await updater.handle_timestamp(timestamp)
+        await preloaded_updater.handle_timestamp(timestamp)
+        await cached_preloaded_updater.handle_timestamp(timestamp)
+        assert updater.channel.exchange.get_current_future_candles() == \
+            preloaded_updater.channel.exchange.get_current_future_candles() == \
+            cached_preloaded_updater.channel.exchange.get_current_future_candles()
+    assert updater.push.call_count > 100
+    assert updater.push.mock_calls == preloaded_updater.push.mock_calls == cached_preloaded_updater.push.mock_calls
+    # preloaded candles are not read from importer each time
+    assert importer.get_ohlcv_from_timestamps.call_count == 2 * 200
+
+
+async def test_preloaded_candles_cache_data_file_version(tmp_path):
+    data_file = _data_file(tmp_path)
+    importer = _importer(_ohlcv_rows(), data_file)
+    await _updater(importer, preload_candles=True, cache_folder=str(tmp_path))._preload_candles()
+    importer.get_ohlcv.reset_mock()
+    await _updater(importer, preload_candles=True, cache_folder=str(tmp_path))._preload_candles()
+    importer.get_ohlcv.assert_not_called()
+
+    # regenerated data file with the same name: cache is not used
+    with open(data_file, "a") as regenerated_data_file:
+        regenerated_data_file.write("new candles")
+    await _updater(importer, preload_candles=True, cache_folder=str(tmp_path))._preload_candles()
+    importer.get_ohlcv.assert_called()
+
+    # unknown data file: no cache
+    importer.adapt_file_path_if_necessary.return_value = str(tmp_path / "missing.data")
+    updater = _updater(importer, preload_candles=True, cache_folder=str(tmp_path))
+    assert updater._get_preloaded_candles_cache_file(
+        str(tmp_path), SYMBOL, commons_enums.TimeFrames.ONE_MINUTE, 0
+    ) is None
+
+
+async def test_handle_timestamp_with_derived_time_frames(tmp_path):
+    importer = _importer(_ohlcv_rows(), _data_file(tmp_path))
+    updater = _updater(importer, preload_candles=True)
+    updater.channel.exchange_manager.exchange_config.get_derived_time_frames = mock.Mock(
+        return_value=[commons_enums.TimeFrames.ONE_HOUR]
+    )
+    updater._set_derived_time_frames()
+    assert updater.derived_time_frames == [commons_enums.TimeFrames.ONE_HOUR]
+    await updater._preload_candles()
+    assert list(updater.preloaded_candles_by_pair_by_time_frame[SYMBOL]) == \
+        [commons_enums.TimeFrames.ONE_MINUTE.value]
+    for timestamp in range(0, 60 * 200, 60):
+        await updater.handle_timestamp(timestamp)
+    # derived time frame candles are neither read nor pushed: they are built from the shortest time frame candles
+    assert updater.push.call_count > 100
+    assert all(call.args[0] is commons_enums.TimeFrames.ONE_MINUTE for call in updater.push.mock_calls)
+    assert all(call.kwargs["time_frame"] is commons_enums.TimeFrames.ONE_MINUTE
+               for call in importer.get_ohlcv.mock_calls)
+
+
+def _updater(importer, preload_candles, cache_folder=None):
+    config = backtesting_exchange_config.BacktestingExchangeConfig()
+    config.preload_candles = preload_candles
+    config.preloaded_candles_cache_folder = cache_folder
+    current_future_candles = {SYMBOL: {}}
+    channel = mock.Mock(
+        exchange_manager=mock.Mock(
+            exchange_name=EXCHANGE_NAME,
+            exchange_config=mock.Mock(
+                backtesting_exchange_config=config,
+                get_shortest_time_frame=mock.Mock(return_value=commons_enums.TimeFrames.ONE_MINUTE)
+            )
+        ),
+        exchange=mock.Mock(
+            get_time_frames=mock.Mock(return_value=TIME_FRAMES),
+            get_current_future_candles=mock.Mock(return_value=current_future_candles)
+        )
+    )
+    with mock.patch.object(ohlcv_updater_simulator.api, "get_backtesting_current_time", mock.Mock(return_value=0)):
+        updater = ohlcv_updater_simulator.OHLCVUpdaterSimulator(channel, importer)
+    updater.push = mock.AsyncMock()
+    return updater
+
+
+def _data_file(folder):
+    data_file = folder / "ExchangeHistoryDataCollector_1.data"
+    data_file.write_text("candles")
+    return str(data_file)
+
+
+def _importer(rows, data_file):
+    async def _get_ohlcv_from_timestamps(exchange_name=None, symbol=None, time_frame=None,
+                                         inferior_timestamp=-1, superior_timestamp=-1):
+        return [
+            row
+            for row in sorted(rows, key=lambda r: r[0])
+            if row[4] == time_frame.value and inferior_timestamp <= row[0] <= superior_timestamp
+        ]
+
+    async def _get_ohlcv(exchange_name=None, symbol=None, time_frame=None, limit=-1, timestamps=None,
+                         operations=None):
+        # database rows are selected by descending timestamp
+        return [
+            row
+            for row in sorted(rows, key=lambda r: r[0], reverse=True)
+            if row[4] == time_frame.value and row[0] >= float(timestamps[0])
+        ]
+
+    return mock.Mock(
+        symbols=[SYMBOL],
+        file_path=data_file,
+        adapt_file_path_if_necessary=mock.Mock(return_value=data_file),
+        get_ohlcv_from_timestamps=mock.AsyncMock(side_effect=_get_ohlcv_from_timestamps),
+        get_ohlcv=mock.AsyncMock(side_effect=_get_ohlcv),
+    )
+
+
+def _ohlcv_rows():
+    rows = []
+    for time_frame, seconds in ((commons_enums.TimeFrames.ONE_MINUTE, 60), (commons_enums.TimeFrames.ONE_HOUR, 3600)):
+        for candle_time in range(0, 60 * 250, seconds):
+            if candle_time == 60 * 50:
+                # missing candle
+                continue
+            rows.append([candle_time, EXCHANGE_NAME, "BTC", SYMBOL, time_frame.value,
+                         [candle_time, 1.5, 3.0, 1.0, 2.25, 100.0]])
+    return rows
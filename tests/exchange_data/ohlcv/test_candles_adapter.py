@@ -21,7 +21,7 @@ from octobot_commons.enums import PriceIndexes, TimeFrames
 from octobot_trading.api.symbol_data import get_symbol_candles_manager
 from octobot_trading.exchange_data.ohlcv.candles_adapter import get_symbol_close_candles, get_symbol_open_candles, \
     get_symbol_low_candles, get_symbol_high_candles, get_symbol_time_candles, get_symbol_volume_candles, \
-    get_candle_as_list
+    get_symbol_ohlcv, get_candle_as_list
 from octobot_trading.exchange_data.ohlcv.candles_manager import CandlesManager
 from octobot_trading.exchange_data.kline.kline_manager import KlineManager
 from octobot_trading.exchange_data.exchange_symbol_data import ExchangeSymbolData
@@ -120,6 +120,35 @@ async def test_get_symbol_volume_candles(symbol_data, time_frame):
                                    dtype=float))
 
 
+async def test_get_symbol_ohlcv(symbol_data, time_frame):
+    # default selector
+    ohlcv = get_symbol_ohlcv(symbol_data, time_frame, 10, False)
+    assert ohlcv.shape == (len(PriceIndexes), 10)
+    for price_index in PriceIndexes:
+        assert np.array_equal(ohlcv[price_index.value],
+                              np.array(_get_candles_extract(price_index.value), dtype=float))
+    assert np.array_equal(get_symbol_ohlcv(symbol_data, time_frame, 3, False)[PriceIndexes.IND_PRICE_CLOSE.value],
+                          np.array(_get_candles_extract(PriceIndexes.IND_PRICE_CLOSE.value)[-3:], dtype=float))
+    # returned candles are a copy
+    ohlcv[PriceIndexes.IND_PRICE_CLOSE.value][0] = 0
+    assert get_symbol_close_candles(symbol_data, time_frame, 10, False)[0] != 0
+
+    # selector with in construction candle
+    ohlcv = get_symbol_ohlcv(symbol_data, time_frame, 10, True)
+    assert ohlcv.shape == (len(PriceIndexes), 10)
+    for price_index in PriceIndexes:
+        assert np.array_equal(ohlcv[price_index.value],
+                              np.array(_get_candles_extract_with_extra_candle(price_index.value), dtype=float))
+    # stored candles are not updated
+    assert np.array_equal(get_symbol_ohlcv(symbol_data, time_frame, 10, False)[PriceIndexes.IND_PRICE_CLOSE.value],
+                          np.array(_get_candles_extract(PriceIndexes.IND_PRICE_CLOSE.value), dtype=float))
+
+    # no in construction candle
+    symbol_data.symbol_klines.pop(TimeFrames(time_frame))
+    assert np.array_equal(get_symbol_ohlcv(symbol_data, time_frame, 10, True),
+                          get_symbol_ohlcv(symbol_data, time_frame, 10, False))
+
+
 async def test_get_candle_as_list(symbol_data, time_frame):
     row_candles = _get_candles()
     candles = get_symbol_candles_manager(symbol_data, time_frame).get_symbol_prices()
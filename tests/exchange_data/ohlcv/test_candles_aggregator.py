@@ -0,0 +1,216 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import random
+
+import numpy as np
+import pytest
+
+import octobot_commons.enums as enums
+
+import octobot_trading.exchange_data.ohlcv.candles_aggregator as candles_aggregator
+from octobot_trading.exchange_data.exchange_symbol_data import ExchangeSymbolData
+
+# Import required fixtures
+from tests import event_loop
+from tests.exchanges import backtesting_config, fake_backtesting, backtesting_exchange_manager
+
+BASE_TIME_FRAME = enums.TimeFrames.ONE_MINUTE
+DERIVED_TIME_FRAMES = [
+    enums.TimeFrames.FIVE_MINUTES,
+    enums.TimeFrames.FIFTEEN_MINUTES,
+    enums.TimeFrames.ONE_HOUR,
+    enums.TimeFrames.FOUR_HOURS,
+    enums.TimeFrames.ONE_DAY,
+]
+# 2022-01-01 00:00:00 UTC
+START_TIME = 1640995200
+
+
+def test_is_derivable_time_frame():
+    assert candles_aggregator.is_derivable_time_frame(enums.TimeFrames.ONE_MINUTE, enums.TimeFrames.ONE_HOUR)
+    assert candles_aggregator.is_derivable_time_frame(enums.TimeFrames.FIVE_MINUTES, enums.TimeFrames.ONE_DAY)
+    assert not candles_aggregator.is_derivable_time_frame(enums.TimeFrames.ONE_HOUR, enums.TimeFrames.ONE_HOUR)
+    assert not candles_aggregator.is_derivable_time_frame(enums.TimeFrames.ONE_HOUR, enums.TimeFrames.ONE_MINUTE)
+    assert not candles_aggregator.is_derivable_time_frame(enums.TimeFrames.FIVE_MINUTES,
+                                                          enums.TimeFrames.THREE_MINUTES)
+    # not aligned on days
+    assert not candles_aggregator.is_derivable_time_frame(enums.TimeFrames.ONE_MINUTE, enums.TimeFrames.THREE_DAYS)
+    assert not candles_aggregator.is_derivable_time_frame(enums.TimeFrames.ONE_MINUTE, enums.TimeFrames.ONE_WEEK)
+    assert not candles_aggregator.is_derivable_time_frame(enums.TimeFrames.ONE_MINUTE, enums.TimeFrames.ONE_MONTH)
+    assert candles_aggregator.get_derivable_time_frames(
+        enums.TimeFrames.FIFTEEN_MINUTES,
+        [enums.TimeFrames.ONE_WEEK, enums.TimeFrames.FOUR_HOURS, enums.TimeFrames.FIFTEEN_MINUTES,
+         enums.TimeFrames.FIVE_MINUTES]
+    ) == [enums.TimeFrames.FOUR_HOURS]
+
+
+def test_add_candles_is_consistent_with_exchange_candles():
+    # starts in the middle of a 4h candle
+    base_candles = _generate_candles(START_TIME + 90 * 60, 3 * 24 * 60)
+    for time_frame in DERIVED_TIME_FRAMES:
+        aggregator = candles_aggregator.CandlesAggregator(BASE_TIME_FRAME, time_frame)
+        completed_candles = []
+        index = 0
+        while index < len(base_candles):
+            # candles are given by batches of random sizes
+            batch_size = random.randint(1, 10)
+            completed_candles += aggregator.add_candles(base_candles[index:index + batch_size])
+            index += batch_size
+        # first candles can't be built when their first base candles are missing and the last ones are not
+        # completed yet
+        _assert_equal_candles(completed_candles, _get_exchange_candles(base_candles, time_frame, complete_only=True))
+
+
+def test_add_candles_ignores_already_aggregated_candles():
+    base_candles = _generate_candles(START_TIME, 30)
+    aggregator = candles_aggregator.CandlesAggregator(BASE_TIME_FRAME, enums.TimeFrames.FIVE_MINUTES)
+    completed_candles = aggregator.add_candles(base_candles[:12])
+    assert len(completed_candles) == 2
+    # updates can include previous candles
+    completed_candles += aggregator.add_candles(base_candles[8:])
+    _assert_equal_candles(completed_candles, _get_exchange_candles(base_candles, enums.TimeFrames.FIVE_MINUTES))
+
+
+def test_add_candles_with_missing_candles():
+    base_candles = _generate_candles(START_TIME, 25)
+    aggregator = candles_aggregator.CandlesAggregator(BASE_TIME_FRAME, enums.TimeFrames.FIVE_MINUTES)
+    # missing candles on exchange (no trade): 1st candle of the 4th candle, middle candle of the 3rd candle
+    # and last candle of the 2nd candle
+    del base_candles[15]
+    del base_candles[12]
+    del base_candles[9]
+    completed_candles = aggregator.add_candles(base_candles[:9])
+    assert len(completed_candles) == 1
+    # 2nd candle is completed when the next one starts: its last base candle will never be given
+    completed_candles += aggregator.add_candles(base_candles[9:10])
+    assert len(completed_candles) == 2
+    # candles are built without their missing base candles, as exchanges do
+    completed_candles += aggregator.add_candles(base_candles[10:])
+    _assert_equal_candles(completed_candles, _get_exchange_candles(base_candles, enums.TimeFrames.FIVE_MINUTES))
+    assert len(completed_candles) == 5
+
+
+def test_initialize():
+    base_candles = _generate_candles(START_TIME, 15)
+    exchange_candles = _get_exchange_candles(base_candles, enums.TimeFrames.FIVE_MINUTES)
+    aggregator = candles_aggregator.CandlesAggregator(BASE_TIME_FRAME, enums.TimeFrames.FIVE_MINUTES)
+    aggregator.initialize(base_candles[:12])
+    assert aggregator.last_base_candle_time == base_candles[11][enums.PriceIndexes.IND_PRICE_TIME.value]
+    _assert_equal_candles(aggregator.add_candles(base_candles[12:]), [exchange_candles[-1]])
+
+    # history starts in the middle of the last candle
+    aggregator.initialize(base_candles[11:12])
+    assert aggregator.candle is None
+    assert aggregator.add_candles(base_candles[12:]) == []
+    aggregator.initialize([])
+    assert aggregator.last_base_candle_time is None
+
+
+def test_get_kline():
+    base_candles = _generate_candles(START_TIME, 11)
+    aggregator = candles_aggregator.CandlesAggregator(BASE_TIME_FRAME, enums.TimeFrames.FIVE_MINUTES)
+    # first candle base candles are missing
+    assert aggregator.get_kline(base_candles[2]) is None
+    aggregator.add_candles(base_candles[:7])
+    _assert_equal_candles([aggregator.get_kline(base_candles[7])],
+                          [_get_exchange_candles(base_candles[:8], enums.TimeFrames.FIVE_MINUTES)[-1]])
+    # kline does not change the aggregated candle
+    _assert_equal_candles(aggregator.add_candles(base_candles[7:10]),
+                          [_get_exchange_candles(base_candles[:10], enums.TimeFrames.FIVE_MINUTES)[-1]])
+    # kline of a new candle
+    _assert_equal_candles([aggregator.get_kline(base_candles[10])], [base_candles[10]])
+
+
+@pytest.mark.asyncio
+async def test_handle_candles_update_with_derived_time_frames(backtesting_exchange_manager):
+    symbol_data = ExchangeSymbolData(backtesting_exchange_manager, "BTC/USDT")
+    base_candles = _generate_candles(START_TIME, 5 * 60)
+    hour_candles = _get_exchange_candles(base_candles, enums.TimeFrames.ONE_HOUR)
+    symbol_data.set_derived_time_frames(BASE_TIME_FRAME, [enums.TimeFrames.ONE_HOUR])
+    assert symbol_data.derivation_base_time_frame is BASE_TIME_FRAME
+    # history initialization
+    assert await symbol_data.handle_candles_update(BASE_TIME_FRAME, base_candles[:90], replace_all=True) == {}
+    assert await symbol_data.handle_candles_update(enums.TimeFrames.ONE_HOUR, hour_candles[:1],
+                                                   replace_all=True) == {}
+
+    for index in range(90, 5 * 60):
+        derived_candles = await symbol_data.handle_candles_update(BASE_TIME_FRAME, base_candles[index - 4:index + 1],
+                                                                  partial=True)
+        if (index + 1) % 60 == 0:
+            _assert_equal_candles(derived_candles[enums.TimeFrames.ONE_HOUR], [hour_candles[index // 60]])
+        else:
+            assert derived_candles == {}
+        if index % 60 == 30:
+            derived_klines = await symbol_data.handle_kline_update(BASE_TIME_FRAME, base_candles[index + 1])
+            hour_kline = _get_exchange_candles(base_candles[index - 30:index + 2], enums.TimeFrames.ONE_HOUR)[0]
+            _assert_equal_candles([derived_klines[enums.TimeFrames.ONE_HOUR]], [hour_kline])
+            _assert_equal_candles([symbol_data.symbol_klines[enums.TimeFrames.ONE_HOUR].kline], [hour_kline])
+    _assert_equal_candles(symbol_data.symbol_candles[enums.TimeFrames.ONE_HOUR].get_candles(), hour_candles)
+    # non derived time frames are not aggregated
+    assert await symbol_data.handle_candles_update(enums.TimeFrames.FIVE_MINUTES, base_candles[:1],
+                                                   replace_all=True) == {}
+    assert await symbol_data.handle_candles_update(enums.TimeFrames.FIVE_MINUTES, base_candles[5:10],
+                                                   partial=True) == {}
+    symbol_data.set_derived_time_frames(BASE_TIME_FRAME, [])
+    assert symbol_data.derivation_base_time_frame is None
+    assert await symbol_data.handle_candles_update(BASE_TIME_FRAME, base_candles[-10:], partial=True) == {}
+
+
+def _generate_candles(start_time, count):
+    candles = []
+    close_price = 100
+    for candle_time in range(start_time, start_time + count * 60, 60):
+        open_price = close_price
+        close_price = open_price * random.uniform(0.98, 1.02)
+        candles.append([
+            candle_time,
+            open_price,
+            max(open_price, close_price) * random.uniform(1, 1.01),
+            min(open_price, close_price) * random.uniform(0.99, 1),
+            close_price,
+            random.uniform(0, 1000),
+        ])
+    return candles
+
+
+def _get_exchange_candles(base_candles, time_frame, complete_only=False):
+    # candles built like exchanges do: grouped by time frame open time
+    time_frame_seconds = enums.TimeFramesMinutes[time_frame] * 60
+    candles_array = np.array(base_candles)
+    open_times = candles_array[:, 0] - candles_array[:, 0] % time_frame_seconds
+    if complete_only:
+        is_complete = (open_times >= candles_array[0, 0]) \
+            & (open_times + time_frame_seconds <= candles_array[-1, 0] + 60)
+        candles_array = candles_array[is_complete]
+        open_times = open_times[is_complete]
+    return [
+        [
+            open_time,
+            group[0, 1],
+            group[:, 2].max(),
+            group[:, 3].min(),
+            group[-1, 4],
+            group[:, 5].sum(),
+        ]
+        for open_time in np.unique(open_times)
+        for group in (candles_array[open_times == open_time], )
+    ]
+
+
+def _assert_equal_candles(candles, expected_candles):
+    assert len(candles) == len(expected_candles)
+    for candle, expected_candle in zip(candles, expected_candles):
+        assert candle == pytest.approx(expected_candle)
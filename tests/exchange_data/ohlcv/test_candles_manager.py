@@ -14,6 +14,7 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import numpy as np
+import pytest
 
 from octobot_commons.enums import PriceIndexes
 from octobot_trading.exchange_data.ohlcv.candles_manager import CandlesManager
@@ -155,6 +156,83 @@ def test_reach_max_candles_count_with_custom_candles_count():
                other_candles[-1][PriceIndexes.IND_PRICE_CLOSE.value])
 
 
+def test_add_new_candle_after_max_candles_count_buffer_wrap():
+    candles_manager = CandlesManager()
+    # fill the candles buffer more than twice to move candles back to its beginning
+    all_candles = _gen_candles(candles_manager.MAX_CANDLES_COUNT * 3 + 7)
+    for candle in all_candles:
+        candles_manager.add_new_candle(candle)
+    assert candles_manager.reached_max is True
+    assert candles_manager.close_candles_index == candles_manager.MAX_CANDLES_COUNT - 1
+    assert candles_manager.candles.shape[1] == 2 * candles_manager.MAX_CANDLES_COUNT
+    expected_candles = all_candles[-candles_manager.MAX_CANDLES_COUNT:]
+    assert candles_manager.get_candles() == expected_candles
+    assert candles_manager.get_candles(3) == expected_candles[-3:]
+    assert list(candles_manager.close_candles) == \
+        [candle[PriceIndexes.IND_PRICE_CLOSE.value] for candle in expected_candles]
+    assert list(candles_manager.get_symbol_time_candles(2)) == \
+        [candle[PriceIndexes.IND_PRICE_TIME.value] for candle in expected_candles[-2:]]
+
+    # already stored candle is not added again
+    candles_manager.add_new_candle(expected_candles[10])
+    assert candles_manager.get_candles() == expected_candles
+
+
+def test_add_candles():
+    candles_manager = CandlesManager()
+    all_candles = _gen_candles(candles_manager.MAX_CANDLES_COUNT * 2)
+
+    # duplicated candles are added once
+    candles_manager.add_candles(all_candles[:5] + all_candles[3:10])
+    assert candles_manager.close_candles_index == 10
+    assert candles_manager.get_candles() == all_candles[:10]
+
+    # already stored candles are ignored, using a numpy array
+    candles_manager.add_candles(np.array(all_candles[5:15]))
+    assert candles_manager.close_candles_index == 15
+    assert candles_manager.get_candles() == all_candles[:15]
+
+    # oldest candles are removed
+    candles_manager.add_candles(all_candles[15:candles_manager.MAX_CANDLES_COUNT + 20])
+    assert candles_manager.reached_max is True
+    assert candles_manager.close_candles_index == candles_manager.MAX_CANDLES_COUNT - 1
+    assert candles_manager.get_candles() == all_candles[20:candles_manager.MAX_CANDLES_COUNT + 20]
+    # removed candles are not considered as stored anymore
+    candles_manager.add_new_candle(all_candles[0])
+    assert candles_manager.get_candles(2) == [all_candles[candles_manager.MAX_CANDLES_COUNT + 19], all_candles[0]]
+
+    # more candles than max_candles_count
+    candles_manager = CandlesManager()
+    candles_manager.add_candles(all_candles)
+    assert candles_manager.get_candles() == all_candles[-candles_manager.MAX_CANDLES_COUNT:]
+    candles_manager.add_new_candle(_get_candle(candles_manager.MAX_CANDLES_COUNT * 3))
+    assert candles_manager.get_candles(1) == [_get_candle(candles_manager.MAX_CANDLES_COUNT * 3)]
+    assert candles_manager.get_candles(2)[0] == all_candles[-1]
+
+
+def test_get_symbol_candles_copy():
+    candles_manager = CandlesManager()
+    candles_manager.add_old_and_new_candles(_gen_candles(5))
+
+    copied_candles = candles_manager.get_symbol_close_candles(3)
+    assert copied_candles.flags.writeable is True
+    copied_candles[-1] = 0
+    assert candles_manager.get_symbol_close_candles()[-1] == _get_candle(5)[PriceIndexes.IND_PRICE_CLOSE.value]
+
+    candles_view = candles_manager.get_symbol_close_candles(3, copy=False)
+    assert list(candles_view) == [30000, 40000, 50000]
+    assert candles_view.flags.writeable is False
+    with pytest.raises(ValueError):
+        candles_view[-1] = 0
+
+    symbol_prices = candles_manager.get_symbol_prices(2, copy=False)
+    assert all(values.flags.writeable is False for values in symbol_prices.values())
+    assert list(symbol_prices[PriceIndexes.IND_PRICE_VOL.value]) == [400000, 500000]
+    symbol_prices = candles_manager.get_symbol_prices(2)
+    # all price indexes are sharing the same copy
+    assert symbol_prices[PriceIndexes.IND_PRICE_VOL.value].base is symbol_prices[PriceIndexes.IND_PRICE_TIME.value].base
+
+
 def _test_data(candles_data, expected_len, expected_last_val):
     assert len(candles_data) == expected_len
     if expected_len > 0:
@@ -0,0 +1,141 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+import pytest
+
+import octobot_trading.errors as errors
+from octobot_trading.exchange_data.order_book.flat_order_book import FlatOrderBook
+from octobot_trading.enums import TradeOrderSide
+
+
+@pytest.fixture
+def flat_order_book():
+    order_book = FlatOrderBook()
+    order_book.handle_new_books(
+        asks=[[103, 3], [101, 1], [102, 2], [104, 0]],
+        bids=[[98, 2], [99, 1], [97, 3]],
+        timestamp=1
+    )
+    return order_book
+
+
+def test_init():
+    order_book = FlatOrderBook()
+    assert not order_book.order_book_initialized
+    assert order_book.get_ask() is None
+    assert order_book.get_bid() is None
+
+
+def test_handle_new_books(flat_order_book):
+    assert flat_order_book.order_book_initialized
+    assert flat_order_book.timestamp == 1
+    # 0 size levels are ignored
+    assert flat_order_book.ask_prices == [101, 102, 103]
+    assert flat_order_book.ask_sizes == [1, 2, 3]
+    assert flat_order_book.bid_prices == [97, 98, 99]
+    assert flat_order_book.bid_sizes == [3, 2, 1]
+    assert flat_order_book.get_ask() == (101, 1)
+    assert flat_order_book.get_bid() == (99, 1)
+    # duplicate price levels are merged
+    flat_order_book.handle_new_books(asks=[[101, 1], [102, 2], [101, 0.5], [101, 0]], bids=[[99, 1], [99, 1]])
+    assert flat_order_book.ask_prices == [101, 102]
+    assert flat_order_book.ask_sizes == [1.5, 2]
+    assert flat_order_book.bid_prices == [99]
+    assert flat_order_book.bid_sizes == [2]
+    flat_order_book.reset_order_book()
+    assert not flat_order_book.order_book_initialized
+    assert flat_order_book.timestamp == 0
+    assert flat_order_book.get_ask() is None
+
+
+def test_handle_book_deltas(flat_order_book):
+    flat_order_book.handle_book_deltas(
+        # remove 101, update 103, add 100 and 105, last 102 update wins
+        asks=[[101, 0], [102, 5], [103, 4], [100, 1], [105, 1], [102, 6], [110, 0]],
+        bids=[[99, 0], [98, 0], [99.5, 2]],
+        timestamp=2
+    )
+    assert flat_order_book.timestamp == 2
+    assert flat_order_book.ask_prices == [100, 102, 103, 105]
+    assert flat_order_book.ask_sizes == [1, 6, 4, 1]
+    assert flat_order_book.bid_prices == [97, 99.5]
+    assert flat_order_book.bid_sizes == [3, 2]
+    assert flat_order_book.get_ask() == (100, 1)
+    assert flat_order_book.get_bid() == (99.5, 2)
+    flat_order_book.handle_book_deltas(asks=[], bids=[[97, 0], [99.5, 0]])
+    assert flat_order_book.get_bid() is None
+    assert flat_order_book.get_ask() == (100, 1)
+
+
+def test_handle_book_deltas_random():
+    order_book = FlatOrderBook()
+    order_book.handle_new_books(asks=[], bids=[])
+    expected_asks = {}
+    random_state = np.random.RandomState(42)
+    for _ in range(200):
+        deltas = [
+            [float(price), float(size) if random_state.rand() > 0.3 else 0]
+            for price, size in zip(random_state.randint(1, 50, size=10), random_state.randint(1, 10, size=10))
+        ]
+        order_book.handle_book_deltas(asks=deltas, bids=[])
+        for price, size in deltas:
+            if size:
+                expected_asks[price] = size
+            else:
+                expected_asks.pop(price, None)
+        assert order_book.ask_prices == sorted(expected_asks)
+        assert order_book.ask_sizes == [expected_asks[price] for price in sorted(expected_asks)]
+
+
+def test_get_depth(flat_order_book):
+    asks, bids = flat_order_book.get_depth(2)
+    assert asks.tolist() == [[101, 1], [102, 2]]
+    assert bids.tolist() == [[99, 1], [98, 2]]
+    asks, bids = flat_order_book.get_depth(10)
+    assert len(asks) == 3
+    assert bids.tolist() == [[99, 1], [98, 2], [97, 3]]
+    asks, bids = flat_order_book.get_depth(0)
+    assert len(asks) == len(bids) == 0
+    with pytest.raises(errors.InvalidArgumentError):
+        flat_order_book.get_depth(-1)
+
+
+def test_get_vwap_for_quantity(flat_order_book):
+    assert flat_order_book.get_vwap_for_quantity(TradeOrderSide.BUY, 0.5) == 101
+    assert flat_order_book.get_vwap_for_quantity(TradeOrderSide.BUY, 1) == 101
+    assert flat_order_book.get_vwap_for_quantity(TradeOrderSide.BUY, 2) == (101 + 102) / 2
+    assert flat_order_book.get_vwap_for_quantity(TradeOrderSide.BUY, 6) == (101 + 102 * 2 + 103 * 3) / 6
+    assert flat_order_book.get_vwap_for_quantity(TradeOrderSide.SELL, 2) == (99 + 98) / 2
+    with pytest.raises(errors.NotEnoughLiquidityError):
+        flat_order_book.get_vwap_for_quantity(TradeOrderSide.BUY, 7)
+    with pytest.raises(errors.NotEnoughLiquidityError):
+        FlatOrderBook().get_vwap_for_quantity(TradeOrderSide.SELL, 1)
+    for invalid_quantity in (0, -1, float("nan")):
+        with pytest.raises(errors.InvalidArgumentError):
+            flat_order_book.get_vwap_for_quantity(TradeOrderSide.BUY, invalid_quantity)
+
+
+def test_get_slippage_for_quantity(flat_order_book):
+    assert flat_order_book.get_slippage_for_quantity(TradeOrderSide.BUY, 1) == 0
+    assert flat_order_book.get_slippage_for_quantity(TradeOrderSide.BUY, 2) == pytest.approx(0.5 / 101)
+    assert flat_order_book.get_slippage_for_quantity(TradeOrderSide.SELL, 2) == pytest.approx(0.5 / 99)
+
+
+def test_get_levels(flat_order_book):
+    asks, bids = flat_order_book.get_levels()
+    assert asks == [[101, 1], [102, 2], [103, 3]]
+    assert bids == [[99, 1], [98, 2], [97, 3]]
+    assert FlatOrderBook().get_levels() == ([], [])
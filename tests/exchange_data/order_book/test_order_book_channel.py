@@ -0,0 +1,59 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import pytest
+from mock import AsyncMock
+
+import octobot_trading.constants as constants
+import octobot_trading.exchange_channel as exchange_channel
+from octobot_trading.exchange_data.order_book.flat_order_book import FlatOrderBook
+
+from tests.exchanges import backtesting_exchange_manager, backtesting_config, fake_backtesting, \
+    DEFAULT_BACKTESTING_SYMBOL
+from tests import event_loop
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+async def test_delta_consumers_opt_in(backtesting_exchange_manager):
+    channel = exchange_channel.get_chan(constants.ORDER_BOOK_CHANNEL, backtesting_exchange_manager.id)
+    full_book_callback = AsyncMock()
+    delta_callback = AsyncMock()
+    full_book_consumer = await channel.new_consumer(full_book_callback)
+    delta_consumer = await channel.new_consumer(delta_callback, delta=True)
+    assert channel.get_filtered_consumers(delta=False) == [full_book_consumer]
+    assert channel.get_filtered_consumers(delta=True) == [delta_consumer]
+    assert len(channel.get_filtered_consumers()) == 2
+
+    book = FlatOrderBook()
+    book.handle_new_books([[101, 1], [102, 2]], [[99, 1]])
+    producer = channel.get_internal_producer()
+    await producer.send("BTC", DEFAULT_BACKTESTING_SYMBOL, [[101, 1], [102, 2]], [[99, 1]], full_book=book)
+    full_book_data = full_book_consumer.queue.get_nowait()
+    assert "delta" not in full_book_data
+    assert full_book_data["asks"] == [[101, 1], [102, 2]]
+    assert delta_consumer.queue.get_nowait()["delta"] is False
+
+    book.handle_book_deltas([[101, 0]], [[98, 3]])
+    await producer.send("BTC", DEFAULT_BACKTESTING_SYMBOL, [[101, 0]], [[98, 3]], delta=True, full_book=book)
+    full_book_data = full_book_consumer.queue.get_nowait()
+    assert "delta" not in full_book_data
+    assert full_book_data["asks"] == [[102, 2]]
+    assert full_book_data["bids"] == [[99, 1], [98, 3]]
+    delta_data = delta_consumer.queue.get_nowait()
+    assert delta_data["delta"] is True
+    assert delta_data["asks"] == [[101, 0]]
+    assert delta_data["bids"] == [[98, 3]]
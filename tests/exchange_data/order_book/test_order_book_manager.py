@@ -108,6 +108,17 @@ async def test_handle_new_book(order_book_manager):
     assert order_book_manager.get_bid()
 
 
+async def test_handle_book_level_deltas(order_book_manager):
+    order_book_manager.handle_new_books([[11, 1], [12, 2]], [[9, 1], [8, 2]])
+    order_book_manager.handle_book_level_deltas([[11, 0], [12, 3], [13, 1]], [[7, 1], [10, 0]])
+    assert list(order_book_manager.asks) == [12, 13]
+    assert order_book_manager.get_asks(12)[0][ECOBIC.SIZE.value] == 3
+    assert order_book_manager.get_asks(13)[0][ECOBIC.SIDE.value] == TradeOrderSide.SELL.value
+    assert list(order_book_manager.bids) == [7, 8, 9]
+    assert order_book_manager.get_bid()[0] == 9
+    assert order_book_manager.get_bids(7)[0][ECOBIC.SIDE.value] == TradeOrderSide.BUY.value
+
+
 async def test_handle_book_adds(order_book_manager):
     order_book_manager.handle_book_adds([
         get_test_order(TradeOrderSide.BUY.value, "1"),
@@ -22,6 +22,7 @@ from mock import patch, Mock
 import octobot_trading.constants as trading_constants
 
 from tests.exchange_data import price_events_manager
+from octobot_commons.asyncio_tools import wait_asyncio_next_cycle
 from tests import event_loop
 from tests.test_utils.random_numbers import decimal_random_recent_trade, decimal_random_price, random_timestamp
 
@@ -31,10 +32,15 @@ pytestmark = pytest.mark.asyncio
 
 async def test_reset(price_events_manager):
     if not os.getenv('CYTHON_IGNORE'):
-        price_events_manager.events.append(None)
+        price_events_manager.new_event(decimal_random_price(), random_timestamp(), True)
+        price_events_manager.new_event(decimal_random_price(), random_timestamp(), False)
         assert price_events_manager.events
+        assert price_events_manager._trigger_above_events
+        assert price_events_manager._trigger_below_events
         price_events_manager.reset()
         assert not price_events_manager.events
+        assert not price_events_manager._trigger_above_events
+        assert not price_events_manager._trigger_below_events
 
 
 async def test_new_event(price_events_manager):
@@ -171,3 +177,125 @@ async def test_remove_event(price_events_manager):
         price_events_manager.remove_event(event_2)
         assert event_2 not in price_events_manager.events
         assert len(price_events_manager.events) == 0
+        assert not price_events_manager._trigger_above_events
+        assert not price_events_manager._trigger_below_events
+
+
+async def test_handle_recent_trades_sorted_events(price_events_manager):
+    above_events = [price_events_manager.new_event(decimal.Decimal(str(price)), 10, True)
+                    for price in (30, 10, 20, 40)]
+    below_events = [price_events_manager.new_event(decimal.Decimal(str(price)), 10, False)
+                    for price in (5, 1, 3)]
+    late_above_event = price_events_manager.new_event(decimal.Decimal("1"), 20, True)
+    set_events = []
+    for event in above_events + below_events + [late_above_event]:
+        event.set = Mock(side_effect=lambda e=event: set_events.append(e))
+    price_events_manager.handle_recent_trades([
+        decimal_random_recent_trade(price=decimal.Decimal("25"), timestamp=15),
+        decimal_random_recent_trade(price=decimal.Decimal("3"), timestamp=15),
+        decimal_random_recent_trade(price=decimal.Decimal("2"), timestamp=25),
+    ])
+    # above events triggered by 25 and below events triggered by 3 and 2
+    # late_above_event is triggered by the price of 2 at 25
+    assert set_events == [above_events[1], above_events[2], below_events[0], below_events[2], late_above_event]
+    if not os.getenv('CYTHON_IGNORE'):
+        for event in set_events:
+            assert event not in price_events_manager.events
+        assert len(price_events_manager.events) == 3
+    price_events_manager.handle_price(decimal.Decimal("50"), 30)
+    price_events_manager.handle_price(decimal.Decimal("0.5"), 30)
+    assert set_events[5:] == [above_events[0], above_events[3], below_events[1]]
+    if not os.getenv('CYTHON_IGNORE'):
+        assert not price_events_manager.events
+
+
+async def test_new_event_with_callback(price_events_manager):
+    called_prices = []
+
+    def _get_callback(price):
+        async def _callback():
+            called_prices.append(price)
+            if price == 20:
+                # callbacks of events set from a callback are also called
+                price_events_manager.handle_price(decimal.Decimal("5"), 10)
+        return _callback
+
+    above_event = price_events_manager.new_event(decimal.Decimal("20"), 10, True, callback=_get_callback(20))
+    price_events_manager.new_event(decimal.Decimal("30"), 10, True, callback=_get_callback(30))
+    price_events_manager.new_event(decimal.Decimal("10"), 10, False, callback=_get_callback(10))
+    removed_event = price_events_manager.new_event(decimal.Decimal("15"), 10, True, callback=_get_callback(15))
+    price_events_manager.remove_event(removed_event)
+    price_events_manager.handle_price(decimal.Decimal("25"), 10)
+    assert above_event.is_set()
+    # callbacks are called by the callbacks dispatcher
+    assert called_prices == []
+    await wait_asyncio_next_cycle()
+    assert called_prices == [20, 10]
+    price_events_manager.handle_price(decimal.Decimal("35"), 10)
+    await wait_asyncio_next_cycle()
+    assert called_prices == [20, 10, 30]
+
+    # instantly set event: callback is not called
+    instant_event = price_events_manager.new_event(decimal.Decimal("30"), 10, True, callback=_get_callback(31))
+    assert instant_event.is_set()
+    await wait_asyncio_next_cycle()
+    assert called_prices == [20, 10, 30]
+
+
+async def test_dispatch_and_remove_pending_callbacks(price_events_manager):
+    called_prices = []
+
+    def _get_callback(price):
+        async def _callback():
+            called_prices.append(price)
+        return _callback
+
+    callback_1 = _get_callback(1)
+    callback_2 = _get_callback(2)
+    price_events_manager.new_event(decimal.Decimal("10"), 10, True, callback=callback_1)
+    price_events_manager.handle_price(decimal.Decimal("15"), 10)
+    price_events_manager.dispatch_callback(callback_2)
+    price_events_manager.dispatch_callback(callback_1)
+    price_events_manager.remove_pending_callback(callback_1)
+    await wait_asyncio_next_cycle()
+    assert called_prices == [2]
+
+    # reset clears pending callbacks
+    price_events_manager.dispatch_callback(callback_1)
+    price_events_manager.reset()
+    await wait_asyncio_next_cycle()
+    assert called_prices == [2]
+    if not os.getenv('CYTHON_IGNORE'):
+        assert not price_events_manager._pending_callbacks
+        assert price_events_manager._callbacks_dispatcher_task.done()
+    price_events_manager.dispatch_callback(callback_1)
+    # already pending callback: called once
+    price_events_manager.dispatch_callback(callback_1)
+    await wait_asyncio_next_cycle()
+    assert called_prices == [2, 1]
+
+
+async def test_reset_does_not_interrupt_running_callback(price_events_manager):
+    called_prices = []
+    release_event = Event()
+
+    async def _running_callback():
+        await release_event.wait()
+        called_prices.append(1)
+
+    async def _pending_callback():
+        called_prices.append(2)
+
+    async def _new_callback():
+        called_prices.append(3)
+
+    price_events_manager.dispatch_callback(_running_callback)
+    price_events_manager.dispatch_callback(_pending_callback)
+    await wait_asyncio_next_cycle()
+    # _running_callback is running: reset only drops _pending_callback
+    price_events_manager.reset()
+    price_events_manager.dispatch_callback(_new_callback)
+    release_event.set()
+    await wait_asyncio_next_cycle()
+    await wait_asyncio_next_cycle()
+    assert called_prices == [1, 3]
@@ -0,0 +1,110 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import mock
+import pytest
+
+import octobot_trading.errors as errors
+import octobot_trading.exchange_data.ticker.channel.ticker_updater as ticker_updater
+from octobot_trading.enums import ExchangeConstantsTickersColumns as Ectc
+
+from tests import event_loop
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+SYMBOLS = ["BTC/USDT", "ETH/USDT", "ADA/USDT"]
+
+
+@pytest.fixture
+def updater():
+    exchange = mock.Mock(
+        MAX_TICKERS_PER_REQUEST=None,
+        get_all_currencies_price_ticker=mock.AsyncMock(),
+        get_price_ticker=mock.AsyncMock(side_effect=_ticker),
+    )
+    exchange_manager = mock.Mock(
+        exchange_name="binance",
+        exchange=exchange,
+        is_future=False,
+    )
+    exchange_manager.exchange_config.traded_symbol_pairs = SYMBOLS
+    updater = ticker_updater.TickerUpdater(mock.Mock(exchange_manager=exchange_manager))
+    with mock.patch.object(updater, "push", mock.AsyncMock()), \
+            mock.patch.object(updater, "parse_mini_ticker", mock.AsyncMock()):
+        yield updater
+
+
+def _ticker(symbol):
+    return {Ectc.SYMBOL.value: symbol, Ectc.CLOSE.value: 1, Ectc.BASE_VOLUME.value: 2, Ectc.TIMESTAMP.value: 3}
+
+
+async def test_fetch_tickers_using_all_tickers_fetch(updater):
+    exchange = updater.channel.exchange_manager.exchange
+    # ADA/USDT ticker is missing
+    exchange.get_all_currencies_price_ticker.return_value = {
+        symbol: _ticker(symbol)
+        for symbol in SYMBOLS[:2] + ["XRP/USDT"]
+    }
+    await updater._fetch_tickers(SYMBOLS)
+    exchange.get_all_currencies_price_ticker.assert_awaited_once_with(symbols=SYMBOLS)
+    exchange.get_price_ticker.assert_not_called()
+    assert updater.push.await_args_list == [mock.call(symbol, _ticker(symbol)) for symbol in SYMBOLS[:2]]
+    assert updater.is_fetching_all_tickers is True
+    assert updater.last_cycle_duration >= 0
+
+    # split in chunks
+    exchange.get_all_currencies_price_ticker.reset_mock()
+    exchange.MAX_TICKERS_PER_REQUEST = 2
+    await updater._fetch_tickers(SYMBOLS)
+    assert exchange.get_all_currencies_price_ticker.await_args_list == [
+        mock.call(symbols=SYMBOLS[:2]), mock.call(symbols=SYMBOLS[2:])
+    ]
+
+
+async def test_fetch_tickers_by_pair(updater):
+    exchange = updater.channel.exchange_manager.exchange
+    # single pair: fetched by pair
+    await updater._fetch_tickers(SYMBOLS[:1])
+    exchange.get_all_currencies_price_ticker.assert_not_called()
+    exchange.get_price_ticker.assert_awaited_once_with(SYMBOLS[0])
+    updater.push.assert_awaited_once_with(SYMBOLS[0], _ticker(SYMBOLS[0]))
+
+    # not supported all tickers fetch: fallback to tickers fetch by pair
+    exchange.get_price_ticker.reset_mock()
+    updater.push.reset_mock()
+    exchange.get_all_currencies_price_ticker.side_effect = errors.NotSupported
+    await updater._fetch_tickers(SYMBOLS)
+    exchange.get_all_currencies_price_ticker.assert_awaited_once()
+    assert sorted(call.args[0] for call in exchange.get_price_ticker.await_args_list) == sorted(SYMBOLS)
+    assert sorted(call.args[0] for call in updater.push.await_args_list) == sorted(SYMBOLS)
+    assert updater.is_fetching_all_tickers is False
+
+    # do not try all tickers fetch again
+    exchange.get_all_currencies_price_ticker.reset_mock()
+    await updater._fetch_tickers(SYMBOLS)
+    exchange.get_all_currencies_price_ticker.assert_not_called()
+
+
+async def test_fetch_tickers_failed_request(updater):
+    exchange = updater.channel.exchange_manager.exchange
+    exchange.get_all_currencies_price_ticker.side_effect = errors.FailedRequest
+    with mock.patch.object(ticker_updater.asyncio, "sleep", mock.AsyncMock()) as sleep_mock:
+        await updater._fetch_tickers(SYMBOLS)
+        sleep_mock.assert_awaited_once()
+    updater.push.assert_not_called()
+    exchange.get_price_ticker.assert_not_called()
+    # still fetching all tickers at once
+    assert updater.is_fetching_all_tickers is True
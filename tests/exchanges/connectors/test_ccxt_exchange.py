@@ -16,10 +16,12 @@
 #  License along with this library.
 import decimal
 
+import ccxt.async_support as ccxt
 import mock
 
 import octobot_trading.exchanges.connectors as exchange_connectors
 import octobot_trading.enums as enums
+import octobot_trading.errors as errors
 import octobot_trading.exchange_data.contracts as contracts
 import pytest
 
@@ -116,6 +118,61 @@ async def test_set_symbol_partial_take_profit_stop_loss(exchange_manager):
                                                                      enums.TakeProfitStopLossMode.PARTIAL)
 
 
+async def test_supports_all_symbols_orders_fetch(exchange_manager):
+    ccxt_exchange = exchange_connectors.CCXTExchange(exchange_manager.config, exchange_manager)
+    with mock.patch.object(ccxt_exchange, "client", mock.Mock(
+        has={"fetchOpenOrders": True, "fetchClosedOrders": True},
+        options={},
+        fetch_closed_orders=mock.AsyncMock(side_effect=ccxt.ArgumentsRequired("symbol required")),
+    )) as client_mock:
+        assert ccxt_exchange.supports_all_symbols_orders_fetch(True) is True
+        assert ccxt_exchange.supports_all_symbols_orders_fetch(False) is True
+        client_mock.options["warnOnFetchOpenOrdersWithoutSymbol"] = True
+        assert ccxt_exchange.supports_all_symbols_orders_fetch(True) is False
+        assert ccxt_exchange.supports_all_symbols_orders_fetch(False) is True
+
+        # symbol-less requests that are rejected by ccxt are not supported
+        with pytest.raises(errors.NotSupported):
+            await ccxt_exchange.get_closed_orders(limit=10)
+        assert ccxt_exchange.supports_all_symbols_orders_fetch(False) is False
+        with pytest.raises(ccxt.ArgumentsRequired):
+            await ccxt_exchange.get_closed_orders(symbol="BTC/USDT", limit=10)
+
+        client_mock.has["fetchOpenOrders"] = False
+        client_mock.options["warnOnFetchOpenOrdersWithoutSymbol"] = False
+        assert ccxt_exchange.supports_all_symbols_orders_fetch(True) is False
+
+
+async def test_cancel_orders(exchange_manager):
+    ccxt_exchange = exchange_connectors.CCXTExchange(exchange_manager.config, exchange_manager)
+    with mock.patch.object(ccxt_exchange, "client", mock.Mock(
+        has={"cancelOrders": True},
+        cancel_orders=mock.AsyncMock(return_value=[
+            {enums.ExchangeConstantsOrderColumns.ID.value: "1",
+             enums.ExchangeConstantsOrderColumns.STATUS.value: enums.OrderStatus.CANCELED.value},
+            {enums.ExchangeConstantsOrderColumns.ID.value: "2",
+             enums.ExchangeConstantsOrderColumns.STATUS.value: enums.OrderStatus.CLOSED.value},
+            {enums.ExchangeConstantsOrderColumns.ID.value: "3",
+             enums.ExchangeConstantsOrderColumns.STATUS.value: None},
+            {enums.ExchangeConstantsOrderColumns.ID.value: "5",
+             enums.ExchangeConstantsOrderColumns.STATUS.value: enums.OrderStatus.CANCELED.value},
+        ]),
+    )) as client_mock:
+        # only orders confirmed as cancelled are returned
+        assert await ccxt_exchange.cancel_orders(["1", "2", "3", "4"], "BTC/USDT") == ["1", "3"]
+        client_mock.cancel_orders.assert_called_once_with(["1", "2", "3", "4"], symbol="BTC/USDT", params={})
+
+        client_mock.cancel_orders.return_value = {"success": True}
+        assert await ccxt_exchange.cancel_orders(["1", "2"], "BTC/USDT") == []
+
+        client_mock.cancel_orders.side_effect = ccxt.OrderNotFound
+        assert await ccxt_exchange.cancel_orders(["1", "2"], "BTC/USDT") == []
+
+        client_mock.has["cancelOrders"] = False
+        with pytest.raises(errors.NotSupported):
+            await ccxt_exchange.cancel_orders(["1", "2"], "BTC/USDT")
+
+
 async def test_get_ccxt_order_type(exchange_manager):
     ccxt_exchange = exchange_connectors.CCXTExchange(exchange_manager.config, exchange_manager)
     with pytest.raises(RuntimeError):
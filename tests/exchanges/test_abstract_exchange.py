@@ -70,3 +70,21 @@ def test_get_order_additional_params(abstract_exchange):
 def test_get_bundled_order_parameters(abstract_exchange):
     with pytest.raises(NotImplementedError):
         abstract_exchange.get_bundled_order_parameters()
+
+
+def test_supports_all_symbols_orders_fetch(abstract_exchange):
+    # no connector
+    assert abstract_exchange.supports_all_symbols_orders_fetch(True) is False
+    connector = mock.Mock(supports_all_symbols_orders_fetch=mock.Mock(return_value=True))
+    abstract_exchange.connector = connector
+    # derived from the connector
+    assert abstract_exchange.supports_all_symbols_orders_fetch(False) is True
+    connector.supports_all_symbols_orders_fetch.assert_called_once_with(False)
+
+    class _SymbolRequiredExchange(exchanges.AbstractExchange):
+        SUPPORTS_ALL_SYMBOLS_ORDERS_FETCH = False
+
+    exchange = _SymbolRequiredExchange(abstract_exchange.config, abstract_exchange.exchange_manager)
+    exchange.connector = connector
+    # locally overridden
+    assert exchange.supports_all_symbols_orders_fetch(True) is False
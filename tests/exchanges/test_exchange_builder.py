@@ -55,3 +55,12 @@ async def test_build_collector_exchange(exchange_manager):
     assert new_exchange_manager.exchange_name == exchange_manager.exchange_name
     assert new_exchange_manager.tentacles_setup_config is exchange_manager.tentacles_setup_config
     await new_exchange_manager.stop()
+
+
+async def test_is_deriving_higher_time_frames():
+    builder = exchanges.ExchangeBuilder({}, "binance")
+    assert builder.exchange_manager.exchange_config.derive_higher_time_frames is False
+    assert builder.is_deriving_higher_time_frames() is builder
+    assert builder.exchange_manager.exchange_config.derive_higher_time_frames is True
+    builder.is_deriving_higher_time_frames(False)
+    assert builder.exchange_manager.exchange_config.derive_higher_time_frames is False
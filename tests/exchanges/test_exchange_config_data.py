@@ -13,12 +13,15 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import mock
 import pytest
 
 from tests import event_loop
+from octobot_commons.enums import TimeFrames
 from octobot_commons.tests.test_config import load_test_config
 from octobot_commons.constants import CONFIG_CRYPTO_CURRENCIES
 from octobot_trading.exchanges.exchange_manager import ExchangeManager
+from octobot_trading.exchanges.config.exchange_config_data import ExchangeConfig
 from octobot_trading.api.exchange import cancel_ccxt_throttle_task
 
 pytestmark = pytest.mark.asyncio
@@ -206,3 +209,15 @@ class TestExchangeConfig:
 
         cancel_ccxt_throttle_task()
         await exchange_manager.stop()
+
+    async def test_get_derived_time_frames(self):
+        exchange_config = ExchangeConfig(mock.Mock(config={}))
+        exchange_config.traded_time_frames = [TimeFrames.ONE_WEEK, TimeFrames.FOUR_HOURS, TimeFrames.ONE_HOUR,
+                                              TimeFrames.FIVE_MINUTES]
+        assert exchange_config.get_derived_time_frames() == []
+        exchange_config.derive_higher_time_frames = True
+        assert exchange_config.get_derived_time_frames() == [TimeFrames.FOUR_HOURS, TimeFrames.ONE_HOUR]
+        assert exchange_config.get_derived_time_frames([TimeFrames.ONE_DAY, TimeFrames.THREE_MINUTES]) == \
+            [TimeFrames.ONE_DAY]
+        exchange_config.traded_time_frames = []
+        assert exchange_config.get_derived_time_frames() == []
@@ -114,3 +114,26 @@ class TestExchangeManager:
         assert exchange_manager.is_ready
         cancel_ccxt_throttle_task()
         await exchange_manager.stop()
+
+    async def test_symbol_and_time_frame_lookups(self):
+        exchange_manager = ExchangeManager(load_test_config(), TestExchangeManager.EXCHANGE_NAME)
+        exchange_manager.client_symbols = ["BTC/USDT", "ETH/BTC", "ETH/USDT", "BTC/USDT:USDT"]
+        exchange_manager.client_time_frames = ["1m", "1h"]
+        assert exchange_manager.symbol_exists("ETH/BTC")
+        assert not exchange_manager.symbol_exists("BTC/ETH")
+        assert exchange_manager.time_frame_exists("1h")
+        assert not exchange_manager.time_frame_exists("4h")
+        assert exchange_manager.get_symbols_by_quote("USDT") == ["BTC/USDT", "ETH/USDT", "BTC/USDT:USDT"]
+        assert exchange_manager.get_symbols_by_base("ETH") == ["ETH/BTC", "ETH/USDT"]
+        assert exchange_manager.get_symbols_by_quote("EUR") == []
+
+        # lookups are rebuilt when client symbols and time frames are set
+        exchange_manager.client_symbols = exchange_manager.client_symbols + ["SOL/USDT"]
+        exchange_manager.client_time_frames = exchange_manager.client_time_frames + ["4h"]
+        assert exchange_manager.symbol_exists("SOL/USDT")
+        assert exchange_manager.time_frame_exists("4h")
+        assert exchange_manager.get_symbols_by_quote("USDT") == ["BTC/USDT", "ETH/USDT", "BTC/USDT:USDT", "SOL/USDT"]
+        exchange_manager.client_symbols = ["XRP/BTC"]
+        assert not exchange_manager.symbol_exists("BTC/USDT")
+        assert exchange_manager.get_symbols_by_base("XRP") == ["XRP/BTC"]
+        assert exchange_manager.get_symbols_by_base("ETH") == []
@@ -18,7 +18,8 @@ import decimal
 import pytest
 import octobot_trading.constants as constants
 import octobot_commons.constants as commons_constants
-from octobot_trading.enums import FeePropertyColumns, ExchangeConstantsMarketPropertyColumns, TraderOrderType
+from octobot_trading.enums import FeePropertyColumns, ExchangeConstantsMarketPropertyColumns, TraderOrderType, \
+    ExchangeConstantsMarketStatusColumns
 from octobot_trading.api.exchange import cancel_ccxt_throttle_task
 
 # Import required fixtures
@@ -90,6 +91,45 @@ async def test_get_trade_fee(backtesting_trader):
                 ExchangeConstantsMarketPropertyColumns.TAKER.value)
 
 
+async def test_on_reload_config(backtesting_trader):
+    _, exchange_manager, trader_inst = backtesting_trader
+    exchange_manager.config[commons_constants.CONFIG_SIMULATOR][commons_constants.CONFIG_SIMULATOR_FEES] = {
+        commons_constants.CONFIG_SIMULATOR_FEES_MAKER: 0.05,
+        commons_constants.CONFIG_SIMULATOR_FEES_TAKER: 0.1
+    }
+    fees = exchange_manager.exchange.get_fees(DEFAULT_BACKTESTING_SYMBOL)
+    market_status = exchange_manager.exchange.get_market_status(DEFAULT_BACKTESTING_SYMBOL)
+    assert fees[ExchangeConstantsMarketPropertyColumns.TAKER.value] == 0.001
+    # cached values are copied: editing them does not change the cache
+    fees[ExchangeConstantsMarketPropertyColumns.TAKER.value] = 1
+    market_status[ExchangeConstantsMarketStatusColumns.LIMITS.value][
+        ExchangeConstantsMarketStatusColumns.LIMITS_COST.value][
+        ExchangeConstantsMarketStatusColumns.LIMITS_COST_MIN.value] = 1
+    fees = exchange_manager.exchange.get_fees(DEFAULT_BACKTESTING_SYMBOL)
+    assert fees[ExchangeConstantsMarketPropertyColumns.TAKER.value] == 0.001
+    assert exchange_manager.exchange.get_market_status(DEFAULT_BACKTESTING_SYMBOL)[
+        ExchangeConstantsMarketStatusColumns.LIMITS.value][
+        ExchangeConstantsMarketStatusColumns.LIMITS_COST.value][
+        ExchangeConstantsMarketStatusColumns.LIMITS_COST_MIN.value] == 0.001
+    market_status = exchange_manager.exchange.get_market_status(DEFAULT_BACKTESTING_SYMBOL)
+
+    exchange_manager.config[commons_constants.CONFIG_SIMULATOR][commons_constants.CONFIG_SIMULATOR_FEES] = {
+        commons_constants.CONFIG_SIMULATOR_FEES_MAKER: 0.2,
+        commons_constants.CONFIG_SIMULATOR_FEES_TAKER: 0.2
+    }
+    # not reloaded yet
+    assert exchange_manager.exchange.get_fees(DEFAULT_BACKTESTING_SYMBOL) == fees
+    exchange_manager.exchange.on_reload_config()
+    assert exchange_manager.exchange.get_fees(DEFAULT_BACKTESTING_SYMBOL)[
+               ExchangeConstantsMarketPropertyColumns.TAKER.value] == 0.002
+    assert exchange_manager.exchange.get_market_status(DEFAULT_BACKTESTING_SYMBOL) == market_status
+    sell_market_fee = exchange_manager.exchange.get_trade_fee(
+        DEFAULT_BACKTESTING_SYMBOL, TraderOrderType.SELL_MARKET, 10, 100,
+        ExchangeConstantsMarketPropertyColumns.TAKER.value)
+    _assert_fee(sell_market_fee, DEFAULT_BACKTESTING_MARKET, decimal.Decimal(2), 0.002,
+                ExchangeConstantsMarketPropertyColumns.TAKER.value)
+
+
 async def test_stop(backtesting_trader):
     _, exchange_manager, trader_inst = backtesting_trader
     await exchange_manager.exchange.stop()
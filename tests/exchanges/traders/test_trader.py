@@ -23,7 +23,7 @@ import time
 from mock import AsyncMock, patch, Mock
 from octobot_commons import asyncio_tools
 
-from octobot_trading.errors import TooManyOpenPositionError, InvalidLeverageValue, OrderEditError
+from octobot_trading.errors import TooManyOpenPositionError, InvalidLeverageValue, OrderEditError, NotSupported
 from octobot_trading.personal_data import LinearPosition
 import octobot_commons.constants as commons_constants
 from octobot_commons.asyncio_tools import wait_asyncio_next_cycle
@@ -388,6 +388,134 @@ class TestTrader:
 
         await self.stop(exchange_manager)
 
+    async def test_create_orders(self):
+        config, exchange_manager, trader_inst = await self.init_default()
+        orders_manager = exchange_manager.exchange_personal_data.orders_manager
+
+        orders = _create_limit_orders(trader_inst)
+        assert await trader_inst.create_orders(orders) == orders
+        assert orders_manager.get_open_orders() == orders
+
+        # failed orders are returned as None
+        orders = _create_limit_orders(trader_inst)
+        with patch.object(trader_inst, "_create_new_order", AsyncMock(side_effect=[orders[0], None, orders[2]])) \
+                as _create_new_order_mock:
+            assert await trader_inst.create_orders(orders, params={"a": 1}) == [orders[0], None, orders[2]]
+            assert _create_new_order_mock.call_count == 3
+            _create_new_order_mock.assert_any_call(orders[1], {"a": 1})
+        assert orders[0] in orders_manager.get_open_orders()
+        assert orders[1] not in orders_manager.get_open_orders()
+        assert orders[2] in orders_manager.get_open_orders()
+
+        # orders failing to initialize are returned as None, other orders are still initialized
+        orders = _create_limit_orders(trader_inst)
+        with patch.object(BuyLimitOrder, "initialize", AsyncMock(side_effect=[None, ValueError, None])) \
+                as initialize_mock:
+            assert await trader_inst.create_orders(orders) == [orders[0], None, orders[2]]
+            assert initialize_mock.call_count == 3
+
+        await self.stop(exchange_manager)
+
+    async def test_cancel_orders(self):
+        config, exchange_manager, trader_inst = await self.init_default()
+        orders_manager = exchange_manager.exchange_personal_data.orders_manager
+
+        # simulated trader
+        orders = _create_limit_orders(trader_inst)
+        for order in orders:
+            await trader_inst.create_order(order)
+        assert await trader_inst.cancel_orders(orders) == (True, orders)
+        assert all(order not in orders_manager.get_open_orders() for order in orders)
+        # already cancelled orders are ignored
+        assert await trader_inst.cancel_orders(orders) == (True, [])
+
+        # real trader: one batch request per symbol
+        orders = _create_limit_orders(trader_inst)
+        for order in orders:
+            await trader_inst.create_order(order)
+        trader_inst.simulate = False
+        with patch.object(exchange_manager.exchange, "cancel_orders",
+                          AsyncMock(side_effect=lambda order_ids, symbol: order_ids), create=True) \
+                as cancel_orders_mock, \
+                patch.object(exchange_manager.exchange, "cancel_order", AsyncMock(return_value=True), create=True) \
+                as cancel_order_mock:
+            assert await trader_inst.cancel_orders(orders) == (True, orders)
+            assert cancel_orders_mock.call_count == 2
+            cancel_orders_mock.assert_any_call([orders[0].order_id, orders[1].order_id], self.DEFAULT_SYMBOL)
+            cancel_orders_mock.assert_any_call([orders[2].order_id], "NANO/USDT")
+            cancel_order_mock.assert_not_called()
+        assert all(order not in orders_manager.get_open_orders() for order in orders)
+        trader_inst.simulate = True
+
+        # real trader: orders which cancel is not confirmed by the batch request are cancelled one by one
+        orders = _create_limit_orders(trader_inst)
+        for order in orders:
+            await trader_inst.create_order(order)
+        trader_inst.simulate = False
+        with patch.object(exchange_manager.exchange, "cancel_orders",
+                          AsyncMock(side_effect=lambda order_ids, symbol: order_ids[:1]), create=True) \
+                as cancel_orders_mock, \
+                patch.object(exchange_manager.exchange, "cancel_order", AsyncMock(return_value=True), create=True) \
+                as cancel_order_mock:
+            assert await trader_inst.cancel_orders(orders) == (True, orders)
+            assert cancel_orders_mock.call_count == 2
+            cancel_order_mock.assert_called_once_with(orders[1].order_id, self.DEFAULT_SYMBOL)
+        assert all(order.is_cancelled() for order in orders)
+        assert all(order not in orders_manager.get_open_orders() for order in orders)
+        trader_inst.simulate = True
+
+        # real trader: single order cancel always requests the exchange, whatever the order status
+        orders = _create_limit_orders(trader_inst)
+        await trader_inst.create_order(orders[0])
+        trader_inst.simulate = False
+        orders[0].status = OrderStatus.CLOSED
+        with patch.object(exchange_manager.exchange, "cancel_order", AsyncMock(return_value=False), create=True) \
+                as cancel_order_mock:
+            assert await trader_inst.cancel_order(orders[0]) is False
+            assert cancel_order_mock.call_count == 2
+        assert orders[0].is_open()
+        trader_inst.simulate = True
+
+        # real trader: orders cancelled from their order group are not cancelled again on exchange
+        orders = _create_limit_orders(trader_inst)
+        oco_group = orders_manager.create_group(order_groups.OneCancelsTheOtherOrderGroup)
+        for order in orders[:2]:
+            order.add_to_order_group(oco_group)
+        for order in orders:
+            await trader_inst.create_order(order)
+        trader_inst.simulate = False
+        with patch.object(exchange_manager.exchange, "cancel_orders",
+                          AsyncMock(side_effect=lambda order_ids, symbol: order_ids), create=True) \
+                as cancel_orders_mock, \
+                patch.object(exchange_manager.exchange, "cancel_order", AsyncMock(return_value=True), create=True) \
+                as cancel_order_mock:
+            # orders[1] is cancelled with orders[0] from their group
+            assert await trader_inst.cancel_orders(orders) == (True, [orders[0], orders[2]])
+            assert cancel_orders_mock.call_count == 2
+            cancel_order_mock.assert_not_called()
+        assert all(order.is_cancelled() for order in orders)
+        trader_inst.simulate = True
+
+        # real trader: batch cancel is not supported, fallback to one request per order
+        orders = _create_limit_orders(trader_inst)
+        for order in orders:
+            await trader_inst.create_order(order)
+        trader_inst.simulate = False
+        with patch.object(exchange_manager.exchange, "cancel_orders",
+                          AsyncMock(side_effect=NotSupported), create=True) as cancel_orders_mock, \
+                patch.object(exchange_manager.exchange, "cancel_order",
+                             AsyncMock(side_effect=[True, False, False, True]), create=True) as cancel_order_mock:
+            assert await trader_inst.cancel_orders(orders) == (False, [orders[0], orders[2]])
+            assert cancel_orders_mock.call_count == 2
+            # failed cancel is retried once
+            assert cancel_order_mock.call_count == 4
+        assert orders[0] not in orders_manager.get_open_orders()
+        assert orders[1] in orders_manager.get_open_orders()
+        assert orders[2] not in orders_manager.get_open_orders()
+        trader_inst.simulate = True
+
+        await self.stop(exchange_manager)
+
     async def test_close_filled_order(self):
         config, exchange_manager, trader_inst = await self.init_default()
         orders_manager = exchange_manager.exchange_personal_data.orders_manager
@@ -1088,3 +1216,16 @@ def make_coroutine(response):
         return response
 
     return coroutine
+
+
+def _create_limit_orders(trader_inst):
+    orders = []
+    for symbol, price in ((TestTrader.DEFAULT_SYMBOL, "70"), (TestTrader.DEFAULT_SYMBOL, "60"), ("NANO/USDT", "1")):
+        limit_buy = BuyLimitOrder(trader_inst)
+        limit_buy.update(order_type=TraderOrderType.BUY_LIMIT,
+                         symbol=symbol,
+                         current_price=decimal.Decimal(price),
+                         quantity=decimal.Decimal("1"),
+                         price=decimal.Decimal(price))
+        orders.append(limit_buy)
+    return orders
@@ -158,7 +158,7 @@ async def test_get_holdings_ratio():
     # force not backtesting mode
     exchange_manager.is_backtesting = False
     # force add symbol in exchange symbols
-    exchange_manager.client_symbols.append("ETH/BTC")
+    exchange_manager.client_symbols = exchange_manager.client_symbols + ["ETH/BTC"]
     with pytest.raises(errors.MissingPriceDataError):
         ratio = consumer.get_holdings_ratio("ETH")
     # let channel register proceed
@@ -66,6 +66,21 @@ async def test_remote_signal_publisher(trading_mode):
             assert builder.strategy == trading_mode.get_name()
 
 
+async def test_reload_config(trading_mode):
+    with mock.patch.object(modes.abstract_trading_mode.tentacles_manager_api, "get_tentacle_config",
+                           mock.Mock(return_value={"key": "value"})) as get_tentacle_config_mock, \
+            mock.patch.object(trading_mode, "load_and_save_user_inputs", mock.AsyncMock()) \
+            as load_and_save_user_inputs_mock, \
+            mock.patch.object(trading_mode.exchange_manager.exchange, "on_reload_config", mock.Mock()) \
+            as on_reload_config_mock:
+        await trading_mode.reload_config(trading_mode.exchange_manager.bot_id)
+        get_tentacle_config_mock.assert_called_once()
+        load_and_save_user_inputs_mock.assert_called_once_with(trading_mode.exchange_manager.bot_id)
+        # exchange configuration dependant caches are cleared
+        on_reload_config_mock.assert_called_once_with()
+        assert trading_mode.trading_config == {"key": "value"}
+
+
 async def test_create_order(trading_mode, buy_limit_order):
     octobot_trading.api.force_set_mark_price(trading_mode.exchange_manager, "BTC/USDT", 1000)
     buy_limit_order.origin_quantity = decimal.Decimal("0.1")
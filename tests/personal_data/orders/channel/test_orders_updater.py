@@ -0,0 +1,153 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import mock
+import pytest
+
+import octobot_trading.errors as errors
+import octobot_trading.personal_data.orders.channel.orders_updater as orders_updater
+from octobot_trading.enums import ExchangeConstantsOrderColumns as ecoc
+
+from tests import event_loop
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+SYMBOLS = ["BTC/USDT", "ETH/USDT", "ADA/USDT"]
+
+
+@pytest.fixture
+def updater():
+    exchange = mock.Mock(
+        supports_all_symbols_orders_fetch=mock.Mock(return_value=False),
+        get_open_orders=mock.AsyncMock(),
+        get_closed_orders=mock.AsyncMock(),
+        clean_order=lambda order: order,
+        parse_order_symbol=lambda order: order[ecoc.SYMBOL.value],
+        parse_order_id=lambda order: order[ecoc.ID.value],
+        get_rate_limit=mock.Mock(return_value=0),
+    )
+    exchange_manager = mock.Mock(
+        exchange_name="binance",
+        exchange=exchange,
+        get_exchange_symbol=lambda symbol: symbol,
+    )
+    exchange_manager.exchange_config.traded_symbol_pairs = SYMBOLS
+    exchange_manager.exchange_personal_data.orders_manager.has_order = mock.Mock(return_value=True)
+    updater = orders_updater.OrdersUpdater(mock.Mock(exchange_manager=exchange_manager))
+    with mock.patch.object(updater, "push", mock.AsyncMock()), \
+            mock.patch.object(updater, "handle_post_open_order_update", mock.AsyncMock()), \
+            mock.patch.object(updater, "_set_initialized_event", mock.Mock()):
+        yield updater
+
+
+def _order(order_id, symbol, filled=0):
+    return {ecoc.ID.value: order_id, ecoc.SYMBOL.value: symbol, ecoc.FILLED.value: filled}
+
+
+async def test_open_orders_fetch_and_push_by_symbol(updater):
+    exchange = updater.channel.exchange_manager.exchange
+    orders_by_symbol = {
+        "BTC/USDT": [_order("1", "BTC/USDT"), _order("2", "BTC/USDT")],
+        "ETH/USDT": [],
+        "ADA/USDT": [_order("3", "ADA/USDT")],
+    }
+    exchange.get_open_orders.side_effect = lambda symbol, limit: list(orders_by_symbol[symbol])
+    await updater._open_orders_fetch_and_push(limit=10)
+    assert exchange.get_open_orders.call_args_list == [mock.call(symbol=symbol, limit=10) for symbol in SYMBOLS]
+    assert updater.push.call_args_list == [
+        mock.call(orders_by_symbol["BTC/USDT"], is_from_bot=True),
+        mock.call(orders_by_symbol["ADA/USDT"], is_from_bot=True),
+    ]
+    updater.handle_post_open_order_update.assert_called_once_with("ETH/USDT", [], False)
+    assert updater._set_initialized_event.call_count == len(SYMBOLS)
+    updater.push.reset_mock()
+    updater.handle_post_open_order_update.reset_mock()
+
+    # unchanged orders are not pushed
+    orders_by_symbol["ADA/USDT"] = [_order("3", "ADA/USDT", filled=1)]
+    await updater._open_orders_fetch_and_push(limit=10)
+    updater.push.assert_called_once_with(orders_by_symbol["ADA/USDT"], is_from_bot=True)
+    assert updater.handle_post_open_order_update.call_args_list == [
+        mock.call("BTC/USDT", orders_by_symbol["BTC/USDT"], False),
+        mock.call("ETH/USDT", [], False),
+    ]
+    updater.push.reset_mock()
+
+    # unchanged orders that are unknown by the orders manager are pushed
+    updater.channel.exchange_manager.exchange_personal_data.orders_manager.has_order.return_value = False
+    await updater._open_orders_fetch_and_push(limit=10)
+    assert updater.push.call_count == 2
+    # initialized events are only set on first fetch
+    assert updater._set_initialized_event.call_count == len(SYMBOLS)
+
+
+async def test_open_orders_fetch_and_push_all_symbols(updater):
+    exchange = updater.channel.exchange_manager.exchange
+    exchange.supports_all_symbols_orders_fetch.return_value = True
+    btc_order = _order("1", "BTC/USDT")
+    ada_order = _order("3", "ADA/USDT")
+    exchange.get_open_orders.return_value = [btc_order, _order("4", "XRP/USDT"), ada_order]
+    await updater._open_orders_fetch_and_push(limit=10)
+    # open orders are not limited
+    exchange.get_open_orders.assert_called_once_with(limit=None)
+    assert updater.push.call_args_list == [
+        mock.call([btc_order], is_from_bot=True),
+        mock.call([ada_order], is_from_bot=True),
+    ]
+    updater.handle_post_open_order_update.assert_called_once_with("ETH/USDT", [], False)
+
+
+async def test_closed_orders_fetch_and_push(updater):
+    exchange = updater.channel.exchange_manager.exchange
+    exchange.supports_all_symbols_orders_fetch.return_value = True
+    btc_order = _order("1", "BTC/USDT")
+    exchange.get_closed_orders.return_value = [btc_order]
+    await updater._closed_orders_fetch_and_push(limit=10)
+    # limit is applied to every symbol orders
+    exchange.get_closed_orders.assert_called_once_with(limit=10 * len(SYMBOLS))
+    updater.push.assert_called_once_with([btc_order], are_closed=True)
+    updater.push.reset_mock()
+    await updater._closed_orders_fetch_and_push(limit=10)
+    updater.push.assert_not_called()
+
+
+async def test_closed_orders_fetch_and_push_symbol_required(updater):
+    exchange = updater.channel.exchange_manager.exchange
+    btc_order = _order("1", "BTC/USDT")
+    # the exchange turns out to require a symbol
+    exchange.supports_all_symbols_orders_fetch.side_effect = [True, False, False]
+
+    async def _get_closed_orders(symbol=None, limit=None):
+        if symbol is None:
+            raise errors.NotSupported("symbol required")
+        return [btc_order] if symbol == "BTC/USDT" else []
+
+    exchange.get_closed_orders.side_effect = _get_closed_orders
+    await updater._closed_orders_fetch_and_push(limit=10)
+    assert exchange.get_closed_orders.call_args_list == [mock.call(limit=10 * len(SYMBOLS))] + [
+        mock.call(symbol=symbol, limit=10) for symbol in SYMBOLS
+    ]
+    updater.push.assert_called_once_with([btc_order], are_closed=True)
+    exchange.get_closed_orders.reset_mock()
+    # next fetches are made by symbol
+    await updater._closed_orders_fetch_and_push(limit=10)
+    assert exchange.get_closed_orders.call_args_list == [mock.call(symbol=symbol, limit=10) for symbol in SYMBOLS]
+
+    # not supported at all
+    exchange.supports_all_symbols_orders_fetch.side_effect = None
+    exchange.supports_all_symbols_orders_fetch.return_value = True
+    with pytest.raises(errors.NotSupported):
+        await updater._closed_orders_fetch_and_push(limit=10)
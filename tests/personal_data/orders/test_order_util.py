@@ -421,10 +421,10 @@ async def test_ensure_orders_relevancy_with_positions(future_trader_simulator_wi
     group_mock = mock.Mock(on_cancel=mock.AsyncMock())
     to_cancel_order_mock = mock.Mock(trader=trader_mock, order_group=group_mock, status=enums.OrderStatus.OPEN,
                                      is_open=mock.Mock(return_value=True), reduce_only=True,
-                                     symbol=DEFAULT_FUTURE_SYMBOL)
+                                     symbol=DEFAULT_FUTURE_SYMBOL, order_id="id", tag=None)
     # with positions
     exchange_manager_inst.exchange_personal_data.positions_manager.positions = {"BTC/USDT": position}
-    exchange_manager_inst.exchange_personal_data.orders_manager.orders = {"id": to_cancel_order_mock}
+    await exchange_manager_inst.exchange_personal_data.orders_manager.upsert_order_instance(to_cancel_order_mock)
     async with personal_data.ensure_orders_relevancy(order=order_mock):
         # no change
         pass
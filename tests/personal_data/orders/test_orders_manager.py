@@ -0,0 +1,129 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+
+import mock
+import pytest
+
+import octobot_trading.enums as enums
+import octobot_trading.personal_data as personal_data
+
+from tests import event_loop
+from tests.exchanges import backtesting_trader, backtesting_config, backtesting_exchange_manager, fake_backtesting
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_get_orders(backtesting_trader):
+    _, exchange_manager, trader = backtesting_trader
+    orders_manager = exchange_manager.exchange_personal_data.orders_manager
+    orders = [
+        await _add_order(trader, "1", "BTC/USDT"),
+        await _add_order(trader, "2", "ETH/USDT", tag="tag"),
+        await _add_order(trader, "3", "BTC/USDT", tag="tag"),
+        await _add_order(trader, "4", "BTC/USDT"),
+    ]
+    assert orders_manager.has_order("1")
+    assert not orders_manager.has_order("5")
+    assert orders_manager.get_all_orders() == orders
+    assert orders_manager.get_open_orders() == orders
+    assert orders_manager.get_open_orders(symbol="BTC/USDT") == [orders[0], orders[2], orders[3]]
+    assert orders_manager.get_open_orders(symbol="BTC/USDT", limit=2) == [orders[0], orders[2]]
+    assert orders_manager.get_open_orders(symbol="BTC/USDT", tag="tag") == [orders[2]]
+    assert orders_manager.get_open_orders(tag="tag") == [orders[1], orders[2]]
+    assert orders_manager.get_open_orders(symbol="XRP/USDT") == []
+    assert orders_manager.get_closed_orders() == []
+
+    # indexes are updated when orders change
+    orders[0].status = enums.OrderStatus.CLOSED
+    orders[3].status = enums.OrderStatus.CLOSED
+    assert orders_manager.get_open_orders(symbol="BTC/USDT") == [orders[2]]
+    assert orders_manager.get_closed_orders() == [orders[0], orders[3]]
+    assert orders_manager.get_closed_orders(symbol="ETH/USDT") == []
+    orders[3].status = enums.OrderStatus.OPEN
+    orders[0].status = enums.OrderStatus.OPEN
+    # orders keep their insertion order
+    assert orders_manager.get_open_orders() == orders
+    assert orders_manager.get_closed_orders() == []
+    orders[0].tag = "tag"
+    orders[2].tag = "other_tag"
+    assert orders_manager.get_all_orders(tag="tag") == [orders[0], orders[1]]
+    assert orders_manager.get_all_orders(tag="other_tag") == [orders[2]]
+
+    # removed orders are not returned anymore
+    orders_manager.remove_order_instance(orders[0])
+    assert not orders_manager.has_order("1")
+    assert orders_manager.get_open_orders(symbol="BTC/USDT") == [orders[2], orders[3]]
+    assert orders_manager.get_all_orders(tag="tag") == [orders[1]]
+    # removed orders don't update indexes
+    orders[0].status = enums.OrderStatus.OPEN
+    assert orders_manager.get_open_orders() == orders[1:]
+
+
+async def test_get_order_from_group(backtesting_trader):
+    _, exchange_manager, trader = backtesting_trader
+    orders_manager = exchange_manager.exchange_personal_data.orders_manager
+    group = orders_manager.create_group(personal_data.OneCancelsTheOtherOrderGroup)
+    other_group = orders_manager.create_group(personal_data.OneCancelsTheOtherOrderGroup)
+    order_1 = await _add_order(trader, "1", "BTC/USDT", group=group)
+    order_2 = await _add_order(trader, "2", "BTC/USDT")
+    order_3 = await _add_order(trader, "3", "BTC/USDT", group=other_group)
+    assert orders_manager.get_order_from_group(group.name) == [order_1]
+    order_2.add_to_order_group(group)
+    assert orders_manager.get_order_from_group(group.name) == [order_1, order_2]
+    assert orders_manager.get_order_from_group(other_group.name) == [order_3]
+    assert orders_manager.get_order_from_group("unknown") == []
+
+
+async def test_replace_order(backtesting_trader):
+    _, exchange_manager, trader = backtesting_trader
+    orders_manager = exchange_manager.exchange_personal_data.orders_manager
+    order_1 = await _add_order(trader, "1", "BTC/USDT")
+    order_2 = await _add_order(trader, "2", "BTC/USDT")
+    order_1.order_id = "3"
+    orders_manager.replace_order("1", order_1)
+    assert not orders_manager.has_order("1")
+    assert orders_manager.get_order("3") is order_1
+    assert orders_manager.get_open_orders(symbol="BTC/USDT") == [order_2, order_1]
+
+
+async def test_remove_oldest_orders(backtesting_trader):
+    _, exchange_manager, trader = backtesting_trader
+    orders_manager = exchange_manager.exchange_personal_data.orders_manager
+    with mock.patch.object(orders_manager, "MAX_ORDERS_COUNT", 4):
+        orders = [
+            await _add_order(trader, str(i), "BTC/USDT" if i % 2 else "ETH/USDT")
+            for i in range(7)
+        ]
+    # orders 0 and 1 are removed when adding the 5th one, orders 2 and 3 when adding the 7th one
+    assert orders_manager.get_all_orders() == orders[4:]
+    assert orders_manager.get_open_orders(symbol="BTC/USDT") == [orders[5]]
+    assert orders_manager.get_open_orders(symbol="ETH/USDT") == [orders[4], orders[6]]
+
+
+async def _add_order(trader, order_id, symbol, tag=None, group=None):
+    order = personal_data.BuyLimitOrder(trader)
+    order.update(
+        symbol=symbol,
+        order_id=order_id,
+        order_type=enums.TraderOrderType.BUY_LIMIT,
+        quantity=decimal.Decimal("1"),
+        price=decimal.Decimal("10"),
+        tag=tag,
+        group=group,
+    )
+    await trader.exchange_manager.exchange_personal_data.orders_manager.upsert_order_instance(order)
+    return order
@@ -0,0 +1,102 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import copy
+import decimal
+
+import octobot_trading.constants as constants
+import octobot_trading.personal_data as personal_data
+from octobot_trading.enums import ExchangeConstantsMarketStatusColumns as Ecmsc
+
+
+SYMBOL_MARKET = {
+    Ecmsc.LIMITS.value: {
+        Ecmsc.LIMITS_AMOUNT.value: {
+            Ecmsc.LIMITS_AMOUNT_MIN.value: 0.5,
+            Ecmsc.LIMITS_AMOUNT_MAX.value: 100,
+        },
+        Ecmsc.LIMITS_COST.value: {
+            Ecmsc.LIMITS_COST_MIN.value: "1",
+            Ecmsc.LIMITS_COST_MAX.value: None
+        },
+        Ecmsc.LIMITS_PRICE.value: {
+            Ecmsc.LIMITS_PRICE_MIN.value: 0.5,
+            Ecmsc.LIMITS_PRICE_MAX.value: 50
+        },
+    },
+    Ecmsc.PRECISION.value: {
+        Ecmsc.PRECISION_PRICE.value: 4,
+        Ecmsc.PRECISION_AMOUNT.value: 2
+    }
+}
+
+
+def test_from_market_status():
+    rules = personal_data.SymbolOrderRules.from_market_status(SYMBOL_MARKET)
+    assert rules.price_precision == 4
+    assert rules.amount_precision == 2
+    assert rules.min_quantity == decimal.Decimal("0.5")
+    assert rules.max_quantity == decimal.Decimal("100")
+    assert rules.min_cost == decimal.Decimal("1")
+    assert rules.max_cost is None
+    assert rules.min_price == decimal.Decimal("0.5")
+    assert rules.max_price == decimal.Decimal("50")
+    assert rules.get_min_max_amounts() == (0.5, 100, "1", None, 0.5, 50)
+
+    # missing values: use defaults
+    rules = personal_data.SymbolOrderRules.from_market_status({})
+    assert rules.price_precision == constants.CURRENCY_DEFAULT_MAX_PRICE_DIGITS
+    assert rules.amount_precision == 0
+    assert rules.min_quantity is rules.max_quantity is rules.min_cost is rules.max_cost is None
+    assert rules.min_price is rules.max_price is None
+    assert rules.get_min_max_amounts() == (None, ) * 6
+    assert rules.get_min_max_amounts("xyz") == ("xyz", ) * 6
+
+
+def test_adapt_price_and_quantity():
+    rules = personal_data.SymbolOrderRules.from_market_status(SYMBOL_MARKET)
+    assert rules.adapt_price(decimal.Decimal("56.5128597145")) == decimal.Decimal("56.5128")
+    assert rules.adapt_price(decimal.Decimal("56.5128597145"), False) == decimal.Decimal("56.5129")
+    assert rules.adapt_price(decimal.Decimal("56.51")) == decimal.Decimal("56.51")
+    assert rules.adapt_quantity(decimal.Decimal("1.0051")) == decimal.Decimal("1")
+    assert rules.adapt_quantity(decimal.Decimal("1.0051"), False) == decimal.Decimal("1.01")
+    assert rules.adapt_quantity(decimal.Decimal("1.23E-9")) == decimal.Decimal("0")
+
+    # precision as tick size: can't be used as a number of digits, values are not adapted
+    tick_size_rules = personal_data.SymbolOrderRules.from_market_status(
+        {Ecmsc.PRECISION.value: {Ecmsc.PRECISION_PRICE.value: 0.01}}
+    )
+    assert tick_size_rules.adapt_price(decimal.Decimal("56.5128597145")) == decimal.Decimal("56.5128597145")
+    # no amount precision: adapt to integers
+    assert tick_size_rules.adapt_quantity(decimal.Decimal("56.5128597145")) == decimal.Decimal("56")
+
+
+def test_get_symbol_order_rules():
+    personal_data.clear_symbol_order_rules_cache()
+    symbol_market = copy.deepcopy(SYMBOL_MARKET)
+    rules = personal_data.get_symbol_order_rules(symbol_market)
+    # cached by market status values
+    assert personal_data.get_symbol_order_rules(symbol_market) is rules
+    assert personal_data.get_symbol_order_rules(copy.deepcopy(SYMBOL_MARKET)) is rules
+
+    # updated market status (reloaded or fixed in place) gets its own rules
+    symbol_market[Ecmsc.PRECISION.value][Ecmsc.PRECISION_PRICE.value] = 2
+    updated_rules = personal_data.get_symbol_order_rules(symbol_market)
+    assert updated_rules is not rules
+    assert updated_rules.price_precision == 2
+    assert personal_data.get_symbol_order_rules(SYMBOL_MARKET) is rules
+
+    personal_data.clear_symbol_order_rules_cache()
+    assert personal_data.get_symbol_order_rules(SYMBOL_MARKET) is not rules
@@ -60,3 +60,23 @@ async def test_buy_limit_order_trigger(buy_limit_order):
 
     await wait_asyncio_next_cycle()
     assert buy_limit_order.is_filled()
+
+
+async def test_buy_limit_order_cleared_before_dispatched_fill(buy_limit_order):
+    order_price = decimal_random_price()
+    buy_limit_order.update(
+        price=order_price,
+        quantity=decimal_random_quantity(max_value=DEFAULT_MARKET_QUANTITY / order_price),
+        symbol=DEFAULT_ORDER_SYMBOL,
+        order_type=TraderOrderType.BUY_LIMIT,
+    )
+    buy_limit_order.exchange_manager.is_backtesting = True  # force update_order_status
+    await buy_limit_order.initialize()
+    price_events_manager = buy_limit_order.exchange_manager.exchange_symbols_data.get_exchange_symbol_data(
+        DEFAULT_ORDER_SYMBOL).price_events_manager
+    price_events_manager.handle_recent_trades([decimal_random_recent_trade(price=order_price,
+                                                                           timestamp=buy_limit_order.timestamp)])
+    # on_fill is dispatched but not called yet
+    buy_limit_order.clear()
+    await wait_asyncio_next_cycle()
+    assert not buy_limit_order.is_filled()
@@ -20,8 +20,10 @@ import sortedcontainers
 import decimal
 
 import octobot_commons.enums as commons_enums
+import octobot_commons.databases as commons_databases
 import octobot_trading.personal_data as personal_data
 import octobot_trading.constants as constants
+import octobot_trading.storage as storage
 
 from tests.exchanges import backtesting_trader_with_historical_pf_value_manager, \
     backtesting_trader, backtesting_config, backtesting_exchange_manager, fake_backtesting
@@ -389,6 +391,116 @@ async def test_on_new_values(historical_portfolio_value_manager):
                             sunday_timestamp, sunday_value_by_currency)
 
 
+async def test_save_historical_portfolio_value(historical_portfolio_value_manager):
+    timestamp = 1648462965  # Monday 28 March 2022 10:22:45 UTC
+    friday_timestamp = 1648166400  # Friday 25 March 2022 00:00:00
+    saturday_timestamp = 1648252800  # Saturday 26 March 2022 00:00:00
+    today_timestamp = 1648425600  # Monday 28 March 2022 00:00:00 UTC
+    historical_portfolio_value_manager.portfolio_manager.exchange_manager.exchange.connector.backtesting.\
+        time_manager.current_timestamp = timestamp + 10
+    save_mock = historical_portfolio_value_manager.portfolio_manager.exchange_manager.storage_manager.\
+        portfolio_storage.save_historical_portfolio_value
+    save_mock.reset_mock()
+
+    def _saved_values():
+        assert save_mock.call_count == 1
+        saved_values = save_mock.mock_calls[0].args[1]
+        replace_all = save_mock.mock_calls[0].kwargs["replace_all"]
+        save_mock.reset_mock()
+        return [value["t"] for value in saved_values], replace_all
+
+    await historical_portfolio_value_manager.on_new_values({
+        friday_timestamp: {"BTC": 1},
+        saturday_timestamp: {"BTC": 2},
+    })
+    # first save: rewrite the whole table
+    assert _saved_values() == ([friday_timestamp, saturday_timestamp], True)
+
+    await historical_portfolio_value_manager.on_new_value(timestamp, {"BTC": 3})
+    # only append the new value
+    assert _saved_values() == ([today_timestamp], False)
+
+    await historical_portfolio_value_manager.on_new_values({friday_timestamp: {"BTC": 4}}, force_update=True)
+    # only append the updated value
+    assert _saved_values() == ([friday_timestamp], False)
+
+    # nothing changed
+    await historical_portfolio_value_manager.save_historical_portfolio_value()
+    assert _saved_values() == ([], False)
+
+    # 4 stored values for 3 historical values: adding 3 more changes would require compaction
+    await historical_portfolio_value_manager.on_new_values({
+        friday_timestamp: {"BTC": 5},
+        saturday_timestamp: {"BTC": 6},
+        today_timestamp: {"BTC": 7},
+    }, force_update=True)
+    assert _saved_values() == ([friday_timestamp, saturday_timestamp, today_timestamp], True)
+
+    await historical_portfolio_value_manager.reset_history()
+    assert _saved_values() == ([], True)
+
+
+async def test_load_historical_values(historical_portfolio_value_manager):
+    friday_timestamp = 1648166400  # Friday 25 March 2022 00:00:00
+    saturday_timestamp = 1648252800  # Saturday 26 March 2022 00:00:00
+    sunday_timestamp = 1648339200  # Sunday 27 March 2022 00:00:00
+    historical_portfolio_value_manager.max_history_size = 2
+    historical_portfolio_value_manager._load_historical_values([
+        {"t": friday_timestamp, "v": {"BTC": 1}},
+        {"t": saturday_timestamp, "v": {"BTC": 2}},
+        {"t": sunday_timestamp, "v": {"BTC": 3}},
+        # appended update
+        {"t": saturday_timestamp, "v": {"BTC": 4}},
+    ])
+    # oldest value is removed as max size is reached and the last stored value of each timestamp is used
+    assert list(historical_portfolio_value_manager.historical_portfolio_value.keys()) == [saturday_timestamp,
+                                                                                          sunday_timestamp]
+    assert historical_portfolio_value_manager.get_historical_value(saturday_timestamp).get("BTC") == 4
+
+
+async def test_stop_compacts_stored_values(historical_portfolio_value_manager, tmp_path):
+    friday_timestamp = 1648166400  # Friday 25 March 2022 00:00:00
+    saturday_timestamp = 1648252800  # Saturday 26 March 2022 00:00:00
+    sunday_timestamp = 1648339200  # Sunday 27 March 2022 00:00:00
+    exchange_manager = historical_portfolio_value_manager.portfolio_manager.exchange_manager
+    exchange_manager.exchange.connector.backtesting.time_manager.current_timestamp = sunday_timestamp + 10
+    portfolio_storage = storage.PortfolioStorage(exchange_manager, None)
+    database = commons_databases.DBWriterReader(str(tmp_path / "historical_portfolio_value.json"))
+    historical_portfolio_value_manager.max_history_size = 2
+
+    async def _stored_values():
+        return [
+            (value["t"], value["v"]["BTC"])
+            for value in await database.all(historical_portfolio_value_manager.TABLE_NAME)
+        ]
+
+    try:
+        with mock.patch.object(exchange_manager.storage_manager, "portfolio_storage", portfolio_storage), \
+                mock.patch.object(portfolio_storage, "get_db", mock.Mock(return_value=database)):
+            await historical_portfolio_value_manager.on_new_values({
+                friday_timestamp: {"BTC": 1},
+                saturday_timestamp: {"BTC": 2},
+            })
+            await historical_portfolio_value_manager.on_new_values({saturday_timestamp: {"BTC": 3}},
+                                                                   force_update=True)
+            await historical_portfolio_value_manager.on_new_values({sunday_timestamp: {"BTC": 4}})
+            # updated and removed values are still stored
+            assert await _stored_values() == [
+                (friday_timestamp, 1), (saturday_timestamp, 2), (saturday_timestamp, 3), (sunday_timestamp, 4)
+            ]
+
+            await historical_portfolio_value_manager.stop()
+            # only up-to-date values remain
+            assert await _stored_values() == [(saturday_timestamp, 3), (sunday_timestamp, 4)]
+
+            # nothing to compact
+            with mock.patch.object(database, "replace_all", mock.AsyncMock()) as replace_all_mock:
+                await historical_portfolio_value_manager.stop()
+                replace_all_mock.assert_not_called()
+    finally:
+        await database.close()
+
+
 async def test_get_historical_value(historical_portfolio_value_manager):
     timestamp = 1648462965  # Monday 28 March 2022 10:22:45 UTC
     exchange_time = timestamp + 10
@@ -521,6 +633,53 @@ async def test_get_historical_values(historical_portfolio_value_manager):
         == {}
 
 
+async def test_get_historical_values_array(historical_portfolio_value_manager):
+    timestamp = 1648462965  # Monday 28 March 2022 10:22:45 UTC
+    friday_timestamp = 1648166400  # Friday 25 March 2022 00:00:00
+    saturday_timestamp = 1648252800  # Saturday 26 March 2022 00:00:00
+    sunday_timestamp = 1648339200  # Sunday 27 March 2022 00:00:00
+    today_timestamp = 1648425600  # Monday 28 March 2022 00:00:00 UTC
+    historical_portfolio_value_manager.portfolio_manager.exchange_manager.exchange.connector.backtesting.\
+        time_manager.current_timestamp = timestamp + 10
+    await historical_portfolio_value_manager.on_new_values({
+        friday_timestamp: {"BTC": 1.1, "USD": 3010},
+        saturday_timestamp: {"BTC": 1.3},
+        sunday_timestamp: {"USD": 3000},
+        timestamp: {"ETH": 2},
+    }, save_changes=False)
+    timestamps, values = historical_portfolio_value_manager.get_historical_values_array(
+        "BTC", commons_enums.TimeFrames.ONE_DAY
+    )
+    # sunday and today values can't be converted
+    assert timestamps.tolist() == [friday_timestamp, saturday_timestamp]
+    assert values.tolist() == [1.1, 1.3]
+
+    historical_portfolio_value_manager.portfolio_manager.portfolio_value_holder.last_prices_by_trading_pair[
+        "BTC/USD"] = 3000
+    historical_portfolio_value_manager.portfolio_manager.portfolio_value_holder.last_prices_by_trading_pair[
+        "ETH/BTC"] = decimal.Decimal("0.1")
+    timestamps, values = historical_portfolio_value_manager.get_historical_values_array(
+        "BTC", commons_enums.TimeFrames.ONE_DAY
+    )
+    assert timestamps.tolist() == [friday_timestamp, saturday_timestamp, sunday_timestamp, today_timestamp]
+    assert values.tolist() == pytest.approx([1.1, 1.3, 1, 0.2])
+    historical_values = historical_portfolio_value_manager.get_historical_values("BTC",
+                                                                                 commons_enums.TimeFrames.ONE_DAY)
+    assert list(historical_values) == timestamps.tolist()
+    assert [float(value) for value in historical_values.values()] == pytest.approx(values.tolist())
+
+    # with time select
+    timestamps, values = historical_portfolio_value_manager.get_historical_values_array(
+        "BTC", commons_enums.TimeFrames.ONE_DAY, from_timestamp=saturday_timestamp, to_timestamp=sunday_timestamp
+    )
+    assert timestamps.tolist() == [saturday_timestamp, sunday_timestamp]
+    assert values.tolist() == pytest.approx([1.3, 1])
+    timestamps, values = historical_portfolio_value_manager.get_historical_values_array(
+        "BTC", commons_enums.TimeFrames.ONE_WEEK
+    )
+    assert timestamps.tolist() == values.tolist() == []
+
+
 def _check_historical_value(historical_value, timestamp, value_by_currency):
     assert isinstance(historical_value, personal_data.HistoricalAssetValue)
     assert historical_value.to_dict() == {
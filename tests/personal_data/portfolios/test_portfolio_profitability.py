@@ -14,6 +14,9 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import decimal
+import random
+
+import mock
 import pytest
 
 from tests.test_utils.random_numbers import random_quantity, decimal_random_quantity
@@ -100,3 +103,80 @@ async def test_random_quantity_handle_balance_update(backtesting_trader):
     assert portfolio_profitability.profitability_diff == new_prof_percent_2 - new_prof_percent
     assert portfolio_value_holder.portfolio_origin_value == original_symbol_quantity
     assert portfolio_value_holder.portfolio_current_value == new_btc_total_2
+
+
+async def test_incremental_mark_price_updates(backtesting_trader):
+    config, exchange_manager, trader = backtesting_trader
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+
+    incremental_results = _run_mark_price_updates(exchange_manager)
+    portfolio_manager._reset_portfolio()
+    with mock.patch.object(portfolio_manager.portfolio_value_holder, "update_current_values_from_symbol",
+                           mock.Mock(return_value=None)) as update_current_values_from_symbol_mock:
+        full_recalculation_results = _run_mark_price_updates(exchange_manager)
+        update_current_values_from_symbol_mock.assert_called()
+
+    assert len(incremental_results) == len(full_recalculation_results)
+    for incremental_result, full_recalculation_result in zip(incremental_results, full_recalculation_results):
+        assert incremental_result.keys() == full_recalculation_result.keys()
+        for key, value in incremental_result.items():
+            assert abs(value - full_recalculation_result[key]) <= decimal.Decimal("1e-20"), key
+
+
+def _run_mark_price_updates(exchange_manager):
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    portfolio_profitability = portfolio_manager.portfolio_profitability
+    portfolio_value_holder = portfolio_manager.portfolio_value_holder
+    prices = {
+        "BTC/USDT": decimal.Decimal("20000"),
+        "ETH/BTC": decimal.Decimal("0.07"),
+        "XRP/BTC": decimal.Decimal("0.00002"),
+        "ADA/BTC": decimal.Decimal("0.00003"),
+        "NEO/BTC": decimal.Decimal("0.0005"),
+    }
+    exchange_manager.client_symbols = exchange_manager.client_symbols + [
+        symbol for symbol in prices if symbol not in exchange_manager.client_symbols
+    ]
+    exchange_manager.exchange_config.all_config_symbol_pairs = list(prices)
+    portfolio_manager.portfolio.update_portfolio_from_balance({
+        currency: {'available': decimal.Decimal(quantity), 'total': decimal.Decimal(quantity)}
+        for currency, quantity in (("BTC", "10"), ("USDT", "1000"), ("ETH", "50"), ("XRP", "3000"), ("ADA", "2000"))
+    }, True)
+    for symbol, price in prices.items():
+        portfolio_value_holder.update_origin_crypto_currencies_values(symbol, price)
+    portfolio_manager.handle_balance_updated()
+
+    rand = random.Random(42)
+    results = []
+    for step in range(300):
+        symbol = rand.choice(list(prices))
+        prices[symbol] *= decimal.Decimal(str(round(rand.uniform(0.98, 1.02), 6)))
+        if step % 25 == 0:
+            # holdings update without balance update notification
+            currency = rand.choice(("BTC", "USDT", "ETH", "XRP", "ADA"))
+            quantity = decimal.Decimal(str(round(rand.uniform(1, 5000), 4)))
+            portfolio_manager.portfolio.update_portfolio_from_balance({
+                currency: {'available': quantity, 'total': quantity}
+            }, False)
+        if step == 150:
+            # new currency: requires a full recalculation
+            portfolio_manager.portfolio.update_portfolio_from_balance({
+                "NEO": {'available': decimal.Decimal("20"), 'total': decimal.Decimal("20")}
+            }, False)
+        if step % 100 == 0:
+            portfolio_manager.handle_balance_updated()
+        portfolio_manager.handle_mark_price_update(symbol, prices[symbol])
+        results.append({
+            "portfolio_current_value": portfolio_value_holder.portfolio_current_value,
+            "origin_portfolio_current_value": portfolio_value_holder.origin_portfolio_current_value,
+            "profitability": portfolio_profitability.profitability,
+            "profitability_percent": portfolio_profitability.profitability_percent,
+            "profitability_diff": portfolio_profitability.profitability_diff,
+            "market_profitability_percent": portfolio_profitability.market_profitability_percent,
+            "initial_portfolio_current_profitability": portfolio_profitability.initial_portfolio_current_profitability,
+            **{
+                f"{currency} value": value
+                for currency, value in portfolio_value_holder.current_crypto_currencies_values.items()
+            }
+        })
+    return results
@@ -15,9 +15,11 @@
 #  License along with this library.
 import decimal
 import os
+import mock
 import pytest
 
 import octobot_trading.constants as constants
+import octobot_trading.errors as errors
 from tests.test_utils.random_numbers import decimal_random_quantity, decimal_random_price, random_price
 
 from tests.exchanges import backtesting_trader, backtesting_config, backtesting_exchange_manager, fake_backtesting
@@ -52,15 +54,14 @@ async def test_get_current_crypto_currencies_values(backtesting_trader):
         'USDT': constants.ZERO
     }
 
-    exchange_manager.client_symbols.append("XLM/BTC")
-    exchange_manager.client_symbols.append("XRP/BTC")
+    exchange_manager.client_symbols = exchange_manager.client_symbols + ["XLM/BTC", "XRP/BTC"]
     if not os.getenv('CYTHON_IGNORE'):
         portfolio_value_holder.missing_currency_data_in_exchange.remove("XRP")
         portfolio_manager.handle_mark_price_update("XRP/BTC", decimal.Decimal("0.005"))
-        exchange_manager.client_symbols.append("NANO/BTC")
+        exchange_manager.client_symbols = exchange_manager.client_symbols + ["NANO/BTC"]
         portfolio_value_holder.missing_currency_data_in_exchange.remove("NANO")
         portfolio_manager.handle_mark_price_update("NANO/BTC", decimal.Decimal("0.05"))
-        exchange_manager.client_symbols.append("BTC/USDT")
+        exchange_manager.client_symbols = exchange_manager.client_symbols + ["BTC/USDT"]
 
         assert portfolio_value_holder.get_current_crypto_currencies_values() == {
             'BTC': constants.ONE,
@@ -93,7 +94,7 @@ async def test_get_current_crypto_currencies_values(backtesting_trader):
             'USDT': constants.ONE / usdt_btc_price
         }
         eth_btc_price = decimal_random_price(max_value=constants.ONE)
-        exchange_manager.client_symbols.append("ETH/BTC")
+        exchange_manager.client_symbols = exchange_manager.client_symbols + ["ETH/BTC"]
         portfolio_value_holder.missing_currency_data_in_exchange.remove("ETH")
         portfolio_manager.handle_mark_price_update("ETH/BTC", eth_btc_price)
         assert portfolio_value_holder.get_current_crypto_currencies_values() == {
@@ -111,7 +112,7 @@ async def test_get_current_holdings_values(backtesting_trader):
     portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
     portfolio_value_holder = portfolio_manager.portfolio_value_holder
 
-    exchange_manager.client_symbols.append("ETH/BTC")
+    exchange_manager.client_symbols = exchange_manager.client_symbols + ["ETH/BTC"]
     portfolio_manager.portfolio.update_portfolio_from_balance({
         'BTC': {'available': decimal.Decimal("10"), 'total': decimal.Decimal("10")},
         'ETH': {'available': decimal.Decimal("100"), 'total': decimal.Decimal("100")},
@@ -147,7 +148,7 @@ async def test_get_current_holdings_values(backtesting_trader):
         'USDT': constants.ZERO
     }
     if not os.getenv('CYTHON_IGNORE'):
-        exchange_manager.client_symbols.append("XRP/BTC")
+        exchange_manager.client_symbols = exchange_manager.client_symbols + ["XRP/BTC"]
         portfolio_value_holder.missing_currency_data_in_exchange.remove("XRP")
         portfolio_manager.handle_mark_price_update("XRP/BTC", decimal.Decimal('0.00001'))
         assert portfolio_value_holder.get_current_holdings_values() == {
@@ -156,7 +157,7 @@ async def test_get_current_holdings_values(backtesting_trader):
             'XRP': decimal.Decimal(str(0.1)),
             'USDT': constants.ZERO
         }
-        exchange_manager.client_symbols.append("BTC/USDT")
+        exchange_manager.client_symbols = exchange_manager.client_symbols + ["BTC/USDT"]
         portfolio_value_holder.missing_currency_data_in_exchange.remove("USDT")
         portfolio_manager.handle_mark_price_update("BTC/USDT", 5000)
         assert portfolio_value_holder.get_current_holdings_values() == {
@@ -198,3 +199,124 @@ async def test_update_origin_crypto_currencies_values(backtesting_trader):
     assert portfolio_value_holder.update_origin_crypto_currencies_values("BTC/USDT", decimal.Decimal(str(100))) is True
     assert portfolio_value_holder.origin_crypto_currencies_values["USDT"] == decimal.Decimal(constants.ONE / decimal.Decimal(100))
     assert portfolio_value_holder.last_prices_by_trading_pair["BTC/USDT"] == decimal.Decimal(str(100))
+
+
+async def test_convert_currency_value_using_last_prices(backtesting_trader):
+    config, exchange_manager, trader = backtesting_trader
+    portfolio_value_holder = exchange_manager.exchange_personal_data.portfolio_manager.portfolio_value_holder
+
+    with pytest.raises(errors.MissingPriceDataError):
+        portfolio_value_holder.convert_currency_value_using_last_prices(constants.ONE, "XYZ", "USDT")
+    portfolio_value_holder.update_origin_crypto_currencies_values("XYZ/BTC", decimal.Decimal("0.001"))
+    with pytest.raises(errors.MissingPriceDataError):
+        portfolio_value_holder.convert_currency_value_using_last_prices(constants.ONE, "XYZ", "USDT")
+    portfolio_value_holder.update_origin_crypto_currencies_values("BTC/USDT:USDT", decimal.Decimal("20000"))
+    # through BTC using BTC/USDT:USDT as there is no BTC/USDT price
+    assert portfolio_value_holder.convert_currency_value_using_last_prices(
+        decimal.Decimal("2"), "XYZ", "USDT"
+    ) == decimal.Decimal("40")
+    assert portfolio_value_holder.price_conversion_graph.get_conversion_path("XYZ", "USDT") == ("XYZ", "BTC", "USDT")
+    assert portfolio_value_holder.convert_currency_value_using_last_prices(
+        decimal.Decimal("40"), "USDT", "XYZ"
+    ) == decimal.Decimal("2")
+    portfolio_value_holder.update_origin_crypto_currencies_values("BTC/USDT", decimal.Decimal("10000"))
+    assert portfolio_value_holder.convert_currency_value_using_last_prices(
+        decimal.Decimal("2"), "XYZ", "USDT"
+    ) == decimal.Decimal("20")
+    # direct symbol is used when available
+    portfolio_value_holder.update_origin_crypto_currencies_values("XYZ/USDT", decimal.Decimal("15"))
+    assert portfolio_value_holder.convert_currency_value_using_last_prices(
+        decimal.Decimal("2"), "XYZ", "USDT"
+    ) == decimal.Decimal("30")
+    with pytest.raises(errors.MissingPriceDataError):
+        portfolio_value_holder.convert_currency_value_using_last_prices(constants.ONE, "XYZ", "ETH")
+
+    # replaced last prices dict: conversions use the new dict symbols
+    portfolio_value_holder.last_prices_by_trading_pair = {"XYZ/ETH": decimal.Decimal("3")}
+    assert portfolio_value_holder.convert_currency_value_using_last_prices(
+        decimal.Decimal("2"), "XYZ", "ETH"
+    ) == decimal.Decimal("6")
+    with pytest.raises(errors.MissingPriceDataError):
+        portfolio_value_holder.convert_currency_value_using_last_prices(constants.ONE, "XYZ", "USDT")
+    assert portfolio_value_holder.price_conversion_graph.last_prices_by_trading_pair \
+        is portfolio_value_holder.last_prices_by_trading_pair
+
+
+async def test_get_reference_market_exchange_symbols(backtesting_trader):
+    config, exchange_manager, trader = backtesting_trader
+    portfolio_value_holder = exchange_manager.exchange_personal_data.portfolio_manager.portfolio_value_holder
+
+    exchange_manager.client_symbols = exchange_manager.client_symbols + ["ETH/BTC", "XYZ/ETH", "XYZ/EUR"]
+    assert portfolio_value_holder._get_reference_market_exchange_symbols("ETH") == ["ETH/BTC"]
+    assert portfolio_value_holder._get_reference_market_exchange_symbols("XYZ") == ["XYZ/ETH", "ETH/BTC"]
+    assert portfolio_value_holder._get_reference_market_exchange_symbols("ABC") == []
+    # ETH is already valued: only XYZ/ETH is required
+    portfolio_value_holder.update_origin_crypto_currencies_values("ETH/BTC", decimal.Decimal("0.05"))
+    assert portfolio_value_holder._get_reference_market_exchange_symbols("XYZ") == ["XYZ/ETH"]
+
+async def test_update_current_values_from_symbol(backtesting_trader):
+    config, exchange_manager, trader = backtesting_trader
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    portfolio_value_holder = portfolio_manager.portfolio_value_holder
+
+    # USDT can be valued through ETH/USDT and ETH/BTC
+    exchange_manager.client_symbols = exchange_manager.client_symbols + ["ETH/BTC", "XRP/BTC", "ETH/USDT"]
+    portfolio_manager.portfolio.update_portfolio_from_balance({
+        'BTC': {'available': decimal.Decimal("10"), 'total': decimal.Decimal("10")},
+        'ETH': {'available': decimal.Decimal("100"), 'total': decimal.Decimal("100")},
+        'XRP': {'available': decimal.Decimal("10000"), 'total': decimal.Decimal("10000")},
+        'USDT': {'available': decimal.Decimal("1000"), 'total': decimal.Decimal("1000")}
+    }, True)
+    portfolio_value_holder.update_origin_crypto_currencies_values("ETH/BTC", decimal.Decimal("0.05"))
+    portfolio_value_holder.update_origin_crypto_currencies_values("XRP/BTC", decimal.Decimal("0.00001"))
+    portfolio_value_holder.update_origin_crypto_currencies_values("ADA/EUR", decimal.Decimal("2"))
+    # no full valuation yet
+    assert portfolio_value_holder.update_current_values_from_symbol("ETH/BTC") is None
+    portfolio_manager.handle_balance_updated()
+    assert "USDT" not in portfolio_value_holder.missing_currency_data_in_exchange
+    assert portfolio_value_holder.portfolio_current_value == decimal.Decimal("15.1")
+    assert portfolio_value_holder.origin_portfolio_current_value == decimal.Decimal("15.1")
+
+    # only ETH is reevaluated
+    portfolio_value_holder.update_origin_crypto_currencies_values("ETH/BTC", decimal.Decimal("0.06"))
+    with mock.patch.object(portfolio_value_holder, "_evaluate_value",
+                           mock.Mock(wraps=portfolio_value_holder._evaluate_value)) as _evaluate_value_mock:
+        assert portfolio_value_holder.update_current_values_from_symbol("ETH/BTC") == ["ETH"]
+        _evaluate_value_mock.assert_called_once_with("ETH", constants.ONE)
+    assert portfolio_value_holder.current_crypto_currencies_values["ETH"] == decimal.Decimal("0.06")
+    assert portfolio_value_holder.portfolio_current_value == decimal.Decimal("16.1")
+    assert portfolio_value_holder.origin_portfolio_current_value == decimal.Decimal("16.1")
+
+    # symbol not used to value any currency in reference market
+    portfolio_value_holder.update_origin_crypto_currencies_values("ADA/EUR", decimal.Decimal("3"))
+    assert portfolio_value_holder.update_current_values_from_symbol("ADA/EUR") == []
+    assert portfolio_value_holder.portfolio_current_value == decimal.Decimal("16.1")
+
+    # holdings updated without balance update notification are taken into account
+    portfolio_manager.portfolio.update_portfolio_from_balance({
+        'ETH': {'available': decimal.Decimal("50"), 'total': decimal.Decimal("50")},
+    }, False)
+    assert portfolio_value_holder.update_current_values_from_symbol("ADA/EUR") == []
+    assert portfolio_value_holder.portfolio_current_value == decimal.Decimal("13.1")
+    assert portfolio_value_holder.origin_portfolio_current_value == decimal.Decimal("16.1")
+
+    # new symbol: USDT is now valued through ETH
+    portfolio_value_holder.update_origin_crypto_currencies_values("ETH/USDT", decimal.Decimal("100"))
+    assert portfolio_value_holder.update_current_values_from_symbol("ETH/USDT") is None
+    portfolio_manager.handle_balance_updated()
+    assert portfolio_value_holder.portfolio_current_value == decimal.Decimal("13.7")
+    portfolio_value_holder.update_origin_crypto_currencies_values("ETH/BTC", decimal.Decimal("0.07"))
+    assert sorted(portfolio_value_holder.update_current_values_from_symbol("ETH/BTC")) == ["ETH", "USDT"]
+    assert portfolio_value_holder.portfolio_current_value == decimal.Decimal("14.3")
+
+    # full valuation required
+    portfolio_manager.portfolio.update_portfolio_from_balance({
+        'ETH': {'available': decimal.Decimal("0"), 'total': decimal.Decimal("0")},
+    }, False)
+    assert portfolio_value_holder.update_current_values_from_symbol("ETH/BTC") is None
+    portfolio_manager.handle_balance_updated()
+    assert portfolio_value_holder.portfolio_current_value == decimal.Decimal("10.8")
+    portfolio_manager.portfolio.update_portfolio_from_balance({
+        'NEO': {'available': decimal.Decimal("10"), 'total': decimal.Decimal("10")},
+    }, False)
+    assert portfolio_value_holder.update_current_values_from_symbol("ETH/BTC") is None
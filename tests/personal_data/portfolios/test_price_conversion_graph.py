@@ -0,0 +1,65 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+
+import octobot_trading.personal_data as personal_data
+
+
+def test_get_symbol():
+    last_prices = {"BTC/USDT:USDT": decimal.Decimal(2), "ETH/USDT": decimal.Decimal(1)}
+    price_conversion_graph = personal_data.PriceConversionGraph(last_prices)
+    assert price_conversion_graph.get_symbol("BTC", "USDT") == "BTC/USDT:USDT"
+    assert price_conversion_graph.get_symbol("ETH", "USDT") == "ETH/USDT"
+    assert price_conversion_graph.get_symbol("USDT", "ETH") is None
+    # exact symbol is preferred
+    last_prices["BTC/USDT"] = decimal.Decimal(1)
+    assert price_conversion_graph.get_symbol("BTC", "USDT") == "BTC/USDT"
+    last_prices["BTC/USDT:BTC"] = decimal.Decimal(1)
+    assert price_conversion_graph.get_symbol("BTC", "USDT") == "BTC/USDT"
+
+
+def test_get_conversion_path():
+    last_prices = {"XYZ/ETH": decimal.Decimal(1), "ETH/BTC": decimal.Decimal(1), "ADA/EUR": decimal.Decimal(1)}
+    price_conversion_graph = personal_data.PriceConversionGraph(last_prices)
+    assert price_conversion_graph.get_conversion_path("XYZ", "ETH") == ("XYZ", "ETH")
+    assert price_conversion_graph.get_conversion_path("BTC", "XYZ") == ("BTC", "ETH", "XYZ")
+    assert price_conversion_graph.get_conversion_path("XYZ", "USDT") is None
+    assert price_conversion_graph.get_conversion_path("XYZ", "ADA") is None
+    assert price_conversion_graph.get_conversion_path("XYZ", "XYZ") is None
+
+    # paths are updated when new symbols are added
+    last_prices["BTC/USDT"] = decimal.Decimal(1)
+    assert price_conversion_graph.get_conversion_path("XYZ", "USDT") == ("XYZ", "ETH", "BTC", "USDT")
+    last_prices["XYZ/USDT"] = decimal.Decimal(1)
+    assert price_conversion_graph.get_conversion_path("XYZ", "USDT") == ("XYZ", "USDT")
+    # same length paths: the first added symbols are used
+    assert price_conversion_graph.get_conversion_path("ETH", "USDT") == ("ETH", "XYZ", "USDT")
+    assert price_conversion_graph.pairs_count == 5
+
+    # paths are updated when symbols are removed
+    last_prices.pop("XYZ/USDT")
+    assert price_conversion_graph.get_conversion_path("XYZ", "USDT") == ("XYZ", "ETH", "BTC", "USDT")
+    assert price_conversion_graph.pairs_count == 4
+    # or replaced by other symbols
+    last_prices.pop("ETH/BTC")
+    last_prices["XYZ/BTC"] = decimal.Decimal(1)
+    assert price_conversion_graph.get_conversion_path("XYZ", "USDT") == ("XYZ", "BTC", "USDT")
+    assert price_conversion_graph.get_conversion_path("ETH", "USDT") == ("ETH", "XYZ", "BTC", "USDT")
+    assert price_conversion_graph.get_conversion_path("ETH", "ADA") is None
+    last_prices.pop("ADA/EUR")
+    last_prices["ADA/ETH"] = decimal.Decimal(1)
+    assert price_conversion_graph.get_conversion_path("ETH", "ADA") == ("ETH", "ADA")
+    assert price_conversion_graph.get_conversion_path("ADA", "EUR") is None
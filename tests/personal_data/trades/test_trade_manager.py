@@ -13,11 +13,15 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import decimal
+
+import mock
 import pytest
 
 from tests import event_loop
 from tests.exchanges import simulated_exchange_manager, simulated_trader
 
+import octobot_trading.enums as enums
 import octobot_trading.personal_data as personal_data
 
 pytestmark = pytest.mark.asyncio
@@ -33,17 +37,96 @@ def test_has_closing_trade_with_order_id(trade_manager_and_trader):
     trade_manager, trader = trade_manager_and_trader
     assert trade_manager.has_closing_trade_with_order_id(None) is False
     assert trade_manager.has_closing_trade_with_order_id("None") is False
-    trade = personal_data.Trade(trader)
-    trade.trade_id = "id"
-    trade.is_closing_order = False
-    trade.origin_order_id = "None"
-    trade_manager.trades["id"] = trade
+    trade_manager.upsert_trade_instance(_trade(trader, "id", "None", is_closing_order=False))
     # trade is not closing order not has the right origin_order_id
     assert trade_manager.has_closing_trade_with_order_id("id") is False
     # trade does not has the right origin_order_id
-    trade.is_closing_order = True
+    trade_manager.upsert_trade_instance(_trade(trader, "id2", "None"))
     assert trade_manager.has_closing_trade_with_order_id("id2") is False
     assert trade_manager.has_closing_trade_with_order_id("id") is False
-    trade.origin_order_id = "id"
+    trade_manager.upsert_trade_instance(_trade(trader, "id3", "id"))
     # trade is closing this order
     assert trade_manager.has_closing_trade_with_order_id("id") is True
+
+
+def test_indexes(trade_manager_and_trader):
+    trade_manager, trader = trade_manager_and_trader
+    trades = [
+        _trade(trader, "1", "order_1", symbol="BTC/USDT", executed_time=10),
+        _trade(trader, "2", "order_1", symbol="BTC/USDT", executed_time=30),
+        _trade(trader, "3", "order_2", symbol="ETH/USDT", executed_time=20),
+        _trade(trader, "4", "order_3", symbol="BTC/USDT", executed_time=40),
+    ]
+    for trade in trades:
+        trade_manager.upsert_trade_instance(trade)
+    # already added
+    trade_manager.upsert_trade_instance(_trade(trader, "1", "order_4", symbol="ETH/USDT", executed_time=10))
+    assert trade_manager.get_trades_by_origin_order_id("order_1") == trades[:2]
+    assert trade_manager.get_trades_by_origin_order_id("order_4") == []
+    assert trade_manager.get_symbol_trades("BTC/USDT") == [trades[0], trades[1], trades[3]]
+    assert trade_manager.get_symbol_trades("ETH/BTC") == []
+    assert trade_manager.get_trades_by_executed_time() == [trades[0], trades[2], trades[1], trades[3]]
+    assert trade_manager.get_trades_by_executed_time(from_time=20, to_time=30) == [trades[2], trades[1]]
+    assert trade_manager.get_trades_by_executed_time(from_time=21) == [trades[1], trades[3]]
+    assert trade_manager.get_trades_by_executed_time(to_time=20, symbol="BTC/USDT") == [trades[0]]
+
+
+def test_get_total_paid_fees(trade_manager_and_trader):
+    trade_manager, trader = trade_manager_and_trader
+    assert trade_manager.get_total_paid_fees() == {}
+    trade_manager.upsert_trade_instance(_trade(trader, "1", "order_1", fee=_fee("0.1", "BTC")))
+    trade_manager.upsert_trade_instance(_trade(trader, "2", "order_2", fee=_fee("2", "USDT")))
+    trade_manager.upsert_trade_instance(_trade(trader, "3", "order_3", fee=_fee("0.3", "BTC")))
+    trade_manager.upsert_trade_instance(_trade(trader, "4", "order_4"))
+    assert trade_manager.get_total_paid_fees() == {
+        "BTC": decimal.Decimal("0.4"),
+        "USDT": decimal.Decimal("2"),
+    }
+    # returned fees can't change stored ones
+    trade_manager.get_total_paid_fees()["BTC"] = decimal.Decimal("1")
+    assert trade_manager.get_total_paid_fees()["BTC"] == decimal.Decimal("0.4")
+
+
+def test_remove_oldest_trades(trade_manager_and_trader):
+    trade_manager, trader = trade_manager_and_trader
+    with mock.patch.object(trade_manager, "MAX_TRADES_COUNT", 20):
+        for index in range(25):
+            trade_manager.upsert_trade_instance(
+                _trade(trader, str(index), f"order_{index % 5}", symbol="BTC/USDT" if index % 2 else "ETH/USDT",
+                       executed_time=100 - index, fee=_fee("1", "BTC" if index < 2 else "USDT"))
+            )
+        # the 2 oldest trades are removed each time a 21st trade is added
+        assert list(trade_manager.trades) == [str(index) for index in range(6, 25)]
+    assert [trade.trade_id for trade in trade_manager.get_trades_by_origin_order_id("order_0")] == \
+        ["10", "15", "20"]
+    assert [trade.trade_id for trade in trade_manager.get_symbol_trades("BTC/USDT")] == \
+        [str(index) for index in range(7, 25, 2)]
+    assert [trade.trade_id for trade in trade_manager.get_trades_by_executed_time()] == \
+        [str(index) for index in range(24, 5, -1)]
+    # BTC fees are removed with their trades
+    assert trade_manager.get_total_paid_fees() == {"USDT": decimal.Decimal("19")}
+
+    trade_manager.clear()
+    assert trade_manager.get_trades_by_origin_order_id("order_4") == []
+    assert trade_manager.get_symbol_trades("BTC/USDT") == []
+    assert trade_manager.get_trades_by_executed_time() == []
+    assert trade_manager.get_total_paid_fees() == {}
+
+
+def _trade(trader, trade_id, origin_order_id, is_closing_order=True, symbol="BTC/USDT", executed_time=0, fee=None):
+    trade = personal_data.Trade(trader)
+    trade.trade_id = trade_id
+    trade.origin_order_id = origin_order_id
+    trade.is_closing_order = is_closing_order
+    trade.symbol = symbol
+    trade.executed_time = executed_time
+    trade.fee = fee
+    trade.status = enums.OrderStatus.CANCELED if fee is None else enums.OrderStatus.FILLED
+    return trade
+
+
+def _fee(cost, currency):
+    return {
+        enums.FeePropertyColumns.COST.value: decimal.Decimal(cost),
+        enums.FeePropertyColumns.CURRENCY.value: currency,
+    }
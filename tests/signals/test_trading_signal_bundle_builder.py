@@ -395,3 +395,46 @@ def test_pack_referenced_orders_together(trading_signal_bundle_builder,
            is pre_pack_signals[1].content
     assert trading_signal_bundle_builder.signals[1].content[enums.TradingSignalOrdersAttrs.ADDITIONAL_ORDERS.value][0] \
            is pre_pack_signals[3].content
+
+
+def test_get_order_description_from_local_orders(trading_signal_bundle_builder):
+    shared_signal_order_id_key = enums.TradingSignalOrdersAttrs.SHARED_SIGNAL_ORDER_ID.value
+    for index, shared_signal_order_id in enumerate(("0", "1", "2", "1")):
+        trading_signal_bundle_builder.register_signal(
+            enums.TradingSignalTopics.ORDERS.value, {shared_signal_order_id_key: shared_signal_order_id, "i": index}
+        )
+    assert trading_signal_bundle_builder._get_order_description_from_local_orders("0") == \
+           (0, trading_signal_bundle_builder.signals[0].content)
+    # first registered signal is returned
+    assert trading_signal_bundle_builder._get_order_description_from_local_orders("1") == \
+           (1, trading_signal_bundle_builder.signals[1].content)
+    assert trading_signal_bundle_builder._get_order_description_from_local_orders("2") == \
+           (2, trading_signal_bundle_builder.signals[2].content)
+    with pytest.raises(errors.OrderDescriptionNotFoundError):
+        trading_signal_bundle_builder._get_order_description_from_local_orders("3")
+
+    # removed signals
+    trading_signal_bundle_builder._remove_signal(0)
+    with pytest.raises(errors.OrderDescriptionNotFoundError):
+        trading_signal_bundle_builder._get_order_description_from_local_orders("0")
+    assert trading_signal_bundle_builder._get_order_description_from_local_orders("1") == (0, {
+        shared_signal_order_id_key: "1", "i": 1
+    })
+    assert trading_signal_bundle_builder._get_order_description_from_local_orders("2") == (1, {
+        shared_signal_order_id_key: "2", "i": 2
+    })
+    trading_signal_bundle_builder._remove_signal(0)
+    assert trading_signal_bundle_builder._get_order_description_from_local_orders("1") == (1, {
+        shared_signal_order_id_key: "1", "i": 3
+    })
+
+    # replaced signals
+    trading_signal_bundle_builder.signals = trading_signal_bundle_builder.signals[1:]
+    assert trading_signal_bundle_builder._get_order_description_from_local_orders("1") == (0, {
+        shared_signal_order_id_key: "1", "i": 3
+    })
+    with pytest.raises(errors.OrderDescriptionNotFoundError):
+        trading_signal_bundle_builder._get_order_description_from_local_orders("2")
+    trading_signal_bundle_builder.reset()
+    with pytest.raises(errors.OrderDescriptionNotFoundError):
+        trading_signal_bundle_builder._get_order_description_from_local_orders("1")
@@ -0,0 +1,119 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import mock
+import pytest
+
+import octobot_trading.storage as storage
+
+from tests import event_loop
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+def _database():
+    return mock.Mock(flush=mock.AsyncMock())
+
+
+async def test_request_flush_when_not_running():
+    flusher = storage.DatabasesFlusher()
+    database = _database()
+    await flusher.request_flush(database)
+    database.flush.assert_awaited_once()
+    assert flusher.flush_count == 1
+    await flusher.request_flush(None)
+    assert flusher.flush_count == 1
+
+
+async def test_start_creates_flush_event():
+    flusher = storage.DatabasesFlusher(flush_interval=10, max_pending_databases=1)
+    # not created in constructor as the flusher might be created outside of the running loop
+    assert flusher._flush_event is None
+    database = _database()
+    await flusher.start()
+    try:
+        await flusher.request_flush(database)
+        # stop while the flush task is waking up
+        await asyncio.sleep(0)
+    finally:
+        await asyncio.wait_for(flusher.stop(), 1)
+    database.flush.assert_awaited_once()
+    assert isinstance(flusher._flush_event, asyncio.Event)
+
+
+async def test_request_flush_coalesces_databases():
+    flusher = storage.DatabasesFlusher(flush_interval=0.05, max_pending_databases=10)
+    database_1 = _database()
+    database_2 = _database()
+    await flusher.start()
+    try:
+        for _ in range(5):
+            await flusher.request_flush(database_1)
+            await flusher.request_flush(database_2)
+        database_1.flush.assert_not_awaited()
+        assert flusher.get_stats()["pending_databases_count"] == 2
+        await asyncio.sleep(0.1)
+        database_1.flush.assert_awaited_once()
+        database_2.flush.assert_awaited_once()
+        assert flusher.flush_count == 1
+        assert flusher.flushed_databases_count == 2
+        assert flusher.get_stats()["pending_databases_count"] == 0
+    finally:
+        await flusher.stop()
+
+
+async def test_request_flush_max_pending_databases():
+    flusher = storage.DatabasesFlusher(flush_interval=10, max_pending_databases=2)
+    database_1 = _database()
+    database_2 = _database()
+    await flusher.start()
+    try:
+        await flusher.request_flush(database_1)
+        await asyncio.sleep(0)
+        database_1.flush.assert_not_awaited()
+        await flusher.request_flush(database_2)
+        # let the flush task wake up
+        for _ in range(3):
+            await asyncio.sleep(0)
+        database_1.flush.assert_awaited_once()
+        database_2.flush.assert_awaited_once()
+    finally:
+        await flusher.stop()
+
+
+async def test_stop_flushes_pending_databases():
+    flusher = storage.DatabasesFlusher(flush_interval=10)
+    database = _database()
+    await flusher.start()
+    await flusher.request_flush(database)
+    database.flush.assert_not_awaited()
+    await flusher.stop()
+    database.flush.assert_awaited_once()
+    assert not flusher.is_running()
+
+
+async def test_flush_error():
+    flusher = storage.DatabasesFlusher()
+    database_1 = mock.Mock(flush=mock.AsyncMock(side_effect=RuntimeError))
+    database_2 = _database()
+    await flusher.start()
+    await flusher.request_flush(database_1)
+    await flusher.request_flush(database_2)
+    with mock.patch.object(flusher, "logger", mock.Mock()) as logger_mock:
+        await flusher.stop()
+        logger_mock.exception.assert_called_once()
+    database_2.flush.assert_awaited_once()